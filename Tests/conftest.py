@@ -41,7 +41,15 @@ def _ensure_default_test_db_env() -> None:
         atexit.register(shutil.rmtree, tmp_dir, ignore_errors=True)
 
 
+def _ensure_unthrottled_creative_layer() -> None:
+    # Creative-layer tests substitute the anthropic SDK; the shared client's
+    # token bucket (squadvault.ai.anthropic_client_v1) would pace those fake
+    # calls at production rates. Explicit caller configuration still wins.
+    os.environ.setdefault("SQUADVAULT_ANTHROPIC_RPM", "0")
+
+
 def pytest_configure() -> None:
     _ensure_repo_import_paths()
     _ensure_default_test_db_env()
+    _ensure_unthrottled_creative_layer()
 
@@ -369,6 +369,9 @@ _NON_EMITTING_CONTEXT_MODULES: set[str] = {
     "player_week_context_v1.py",
     "writer_room_context_v1.py",
     "franchise_display_overrides_v1.py",
+    "player_score_store_v1.py",
+    "league_history_cache_v1.py",
+    "league_history_accumulator_v1.py",
 }
 
 
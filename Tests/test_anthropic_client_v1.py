@@ -0,0 +1,155 @@
+"""Tests for Anthropic Messages client v1 (shared, rate-limited, instrumented).
+
+Exercised against fake transports only — no network, no SDK required.
+"""
+from __future__ import annotations
+
+import asyncio
+from datetime import UTC, datetime, timedelta
+from email.utils import format_datetime
+from types import SimpleNamespace
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from squadvault.ai.anthropic_client_v1 import (
+    AsyncMessagesClient,
+    CallStats,
+    MessagesClient,
+    TokenBucket,
+    _retry_delay,
+    shared_messages_client,
+)
+
+
+class _StatusError(Exception):
+    def __init__(self, status_code, headers=None):
+        super().__init__(f"HTTP {status_code}")
+        self.status_code = status_code
+        self.response = SimpleNamespace(headers=headers or {})
+
+
+def _message(text="ok", input_tokens=120, output_tokens=40):
+    return SimpleNamespace(
+        content=[SimpleNamespace(text=text)],
+        usage=SimpleNamespace(input_tokens=input_tokens, output_tokens=output_tokens),
+    )
+
+
+class _FakeTransport:
+    def __init__(self, outcomes):
+        self.outcomes = list(outcomes)
+        self.calls = []
+
+    def create(self, **kwargs):
+        self.calls.append(kwargs)
+        outcome = self.outcomes.pop(0)
+        if isinstance(outcome, Exception):
+            raise outcome
+        return outcome
+
+
+def _client(outcomes, **kw):
+    slept = []
+    client = MessagesClient(
+        _FakeTransport(outcomes), bucket=TokenBucket(0, 1), stats=CallStats(),
+        sleep=slept.append, **kw,
+    )
+    return client, slept
+
+
+class TestTokenBucket:
+    def test_burst_then_refill_rate(self):
+        now = [0.0]
+        bucket = TokenBucket(1.0, 2, clock=lambda: now[0])
+        assert [bucket.reserve() for _ in range(4)] == [0.0, 0.0, 1.0, 2.0]
+        now[0] = 10.0
+        assert [bucket.reserve() for _ in range(3)] == [0.0, 0.0, 1.0]
+
+    def test_zero_rate_never_waits(self):
+        bucket = TokenBucket(0, 1)
+        assert {bucket.reserve() for _ in range(50)} == {0.0}
+
+
+class TestMessagesClient:
+    def test_retry_after_header_is_honored(self):
+        client, slept = _client([_StatusError(429, {"retry-after": "3"}), _message()])
+        assert client.create(model="m", max_tokens=10).content[0].text == "ok"
+        assert slept == [3.0]
+        assert client.transport.calls == [{"model": "m", "max_tokens": 10}] * 2
+        rec = client.stats.recent[-1]
+        assert (rec.ok, rec.attempts, rec.input_tokens, rec.output_tokens) == (True, 2, 120, 40)
+        assert client.stats.summary()["retries"] == 1
+
+    def test_backoff_without_retry_after(self):
+        client, slept = _client([_StatusError(429), _StatusError(529), _StatusError(503), _message()])
+        client.create(model="m")
+        assert slept == [5.0, 3.0, 4.5]
+
+    def test_non_retryable_error_raises_immediately(self):
+        client, slept = _client([_StatusError(400), _message()])
+        with pytest.raises(_StatusError):
+            client.create(model="m")
+        assert slept == []
+        assert client.stats.summary()["failures"] == 1
+
+    def test_retries_are_bounded(self):
+        client, slept = _client([_StatusError(500, {"retry-after": "0"})] * 3, max_retries=2)
+        with pytest.raises(_StatusError):
+            client.create(model="m")
+        assert len(client.transport.calls) == 3
+        assert client.stats.recent[-1].attempts == 3
+
+    def test_retry_after_http_date(self):
+        when = format_datetime(datetime.now(UTC) + timedelta(seconds=30), usegmt=True)
+        assert 25 <= _retry_delay(_StatusError(429, {"retry-after": when}), 1) <= 30
+
+
+class _AsyncFakeTransport:
+    def __init__(self, fail_first=0):
+        self.in_flight = 0
+        self.peak = 0
+        self.fail_first = fail_first
+
+    async def create(self, **kwargs):
+        self.in_flight += 1
+        self.peak = max(self.peak, self.in_flight)
+        try:
+            await asyncio.sleep(0.01)
+            if self.fail_first:
+                self.fail_first -= 1
+                raise _StatusError(529, {"retry-after": "0"})
+            return _message(text=kwargs["messages"][0]["content"])
+        finally:
+            self.in_flight -= 1
+
+
+class TestAsyncMessagesClient:
+    def test_keeps_max_in_flight_requests(self):
+        transport = _AsyncFakeTransport(fail_first=2)
+        client = AsyncMessagesClient(transport, bucket=TokenBucket(0, 1), stats=CallStats(), max_in_flight=3)
+
+        async def run():
+            return await asyncio.gather(*(
+                client.create(model="m", messages=[{"role": "user", "content": f"week {w}"}])
+                for w in range(1, 7)
+            ))
+
+        results = asyncio.run(run())
+        assert [r.content[0].text for r in results] == [f"week {w}" for w in range(1, 7)]
+        assert transport.peak == 3
+        summary = client.stats.summary()
+        assert (summary["calls"], summary["retries"], summary["input_tokens"]) == (6, 2, 720)
+
+
+class TestSharedClient:
+    def test_one_client_per_key_and_sdk(self):
+        sdk = MagicMock()
+        with patch.dict("sys.modules", {"anthropic": sdk}):
+            first = shared_messages_client("key-1")
+            assert shared_messages_client("key-1") is first
+            assert shared_messages_client("key-2") is not first
+        sdk.Anthropic.assert_any_call(api_key="key-1", max_retries=0)
+        assert first.transport is sdk.Anthropic.return_value.messages
+        with patch.dict("sys.modules", {"anthropic": MagicMock()}):
+            assert shared_messages_client("key-1") is not first
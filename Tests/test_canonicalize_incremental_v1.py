@@ -0,0 +1,256 @@
+"""Incremental canonicalization (memory_events high-water mark).
+
+Invariant: canonicalize(..., incremental=True) after any ledger growth leaves
+the same canonical projection a full rebuild would (ids and updated_at aside),
+and verify=True proves it.
+"""
+from __future__ import annotations
+
+import json
+import sqlite3
+from pathlib import Path
+
+import pytest
+
+from squadvault.core.canonicalize.run_canonicalize import canonicalize, canonicalize_all
+from squadvault.errors import CanonicalizationError
+
+SCHEMA_PATH = Path(__file__).parent.parent / "src" / "squadvault" / "core" / "storage" / "schema.sql"
+LEAGUE = "incr_test_league"
+
+
+@pytest.fixture
+def db(tmp_path):
+    """Fresh DB from schema.sql."""
+    db_path = str(tmp_path / "incr_test.sqlite")
+    con = sqlite3.connect(db_path)
+    con.executescript(SCHEMA_PATH.read_text())
+    con.close()
+    return db_path
+
+
+def _insert(db_path, season, event_type, payload, ext_id, occurred_at="2024-10-01T12:00:00Z"):
+    con = sqlite3.connect(db_path)
+    con.execute(
+        """INSERT INTO memory_events
+           (league_id, season, external_source, external_id,
+            event_type, occurred_at, ingested_at, payload_json)
+           VALUES (?, ?, ?, ?, ?, ?, ?, ?)""",
+        (LEAGUE, season, "test", ext_id, event_type, occurred_at,
+         "2024-10-01T13:00:00Z", json.dumps(payload)),
+    )
+    con.commit()
+    con.close()
+
+
+def _projection(db_path, season):
+    con = sqlite3.connect(db_path)
+    rows = con.execute(
+        """SELECT event_type, action_fingerprint, best_memory_event_id, best_score,
+                  selection_version, occurred_at
+           FROM canonical_events WHERE league_id=? AND season=?
+           ORDER BY event_type, action_fingerprint""",
+        (LEAGUE, season),
+    ).fetchall()
+    con.close()
+    return rows
+
+
+def _ids(db_path, season):
+    con = sqlite3.connect(db_path)
+    rows = con.execute(
+        "SELECT action_fingerprint, id FROM canonical_events WHERE league_id=? AND season=?",
+        (LEAGUE, season),
+    ).fetchall()
+    con.close()
+    return dict(rows)
+
+
+def _full_rebuild_projection(db_path, season):
+    con = sqlite3.connect(db_path)
+    con.execute("DELETE FROM canonical_scope_state")
+    con.commit()
+    con.close()
+    canonicalize(league_id=LEAGUE, season=season, db_path=db_path)
+    return _projection(db_path, season)
+
+
+def _week_of_player_scores(db_path, season, week, franchises=("F01", "F02")):
+    for f in franchises:
+        for p in ("P1", "P2"):
+            _insert(db_path, season, "WEEKLY_PLAYER_SCORE", {
+                "week": week, "franchise_id": f, "player_id": f"{f}{p}", "score": 10.5,
+            }, f"wps_{season}_{week}_{f}_{p}")
+    _insert(db_path, season, "WEEKLY_MATCHUP_RESULT", {
+        "week": week, "winner_franchise_id": franchises[0], "loser_franchise_id": franchises[1],
+        "winner_score": "100.0", "loser_score": "90.0", "is_tie": False,
+    }, f"wmr_{season}_{week}")
+
+
+class TestIncrementalCanonicalize:
+    def test_folds_new_rows_identically_to_full_rebuild(self, db):
+        _week_of_player_scores(db, 2019, 1)
+        _insert(db, 2019, "WAIVER_BID_AWARDED", {
+            "franchise_id": "F01", "player_id": "P9", "bid_amount": "5",
+        }, "wba_1")
+        canonicalize(league_id=LEAGUE, season=2019, db_path=db, incremental=True)
+
+        # Next week's ingest, plus a duplicate of an existing waiver award.
+        _week_of_player_scores(db, 2019, 2)
+        _insert(db, 2019, "WAIVER_BID_AWARDED", {
+            "franchise_id": "F01", "player_id": "P9", "bid_amount": "5",
+            "raw_mfl_json": json.dumps({"type": "BBID_WAIVER", "amount": "5"}),
+        }, "wba_1_dup")
+        ids_before = _ids(db, 2019)
+        canonicalize(league_id=LEAGUE, season=2019, db_path=db, incremental=True, verify=True)
+        incremental = _projection(db, 2019)
+        ids_after = _ids(db, 2019)
+
+        # Existing canonical ids are kept stable by an incremental fold.
+        assert all(ids_after[fp] == cid for fp, cid in ids_before.items())
+        assert incremental == _full_rebuild_projection(db, 2019)
+
+    def test_noop_when_ledger_unchanged(self, db, capsys):
+        _week_of_player_scores(db, 2019, 1)
+        canonicalize(league_id=LEAGUE, season=2019, db_path=db)
+        before = _ids(db, 2019)
+        capsys.readouterr()
+
+        canonicalize(league_id=LEAGUE, season=2019, db_path=db, incremental=True)
+        assert "mode = noop" in capsys.readouterr().out
+        assert _ids(db, 2019) == before
+
+    def test_missing_state_falls_back_to_full(self, db, capsys):
+        _week_of_player_scores(db, 2019, 1)
+        canonicalize(league_id=LEAGUE, season=2019, db_path=db, incremental=True)
+        assert "mode = full" in capsys.readouterr().out
+
+    def test_count_drift_falls_back_to_full(self, db, capsys):
+        _week_of_player_scores(db, 2019, 1)
+        canonicalize(league_id=LEAGUE, season=2019, db_path=db)
+        expected = _projection(db, 2019)
+        con = sqlite3.connect(db)
+        con.execute("DELETE FROM canonical_events WHERE event_type='WEEKLY_MATCHUP_RESULT'")
+        con.commit()
+        con.close()
+        capsys.readouterr()
+
+        canonicalize(league_id=LEAGUE, season=2019, db_path=db, incremental=True)
+        assert "mode = full" in capsys.readouterr().out
+        assert _projection(db, 2019) == expected
+
+    def test_scope_without_memberships_is_rebuilt(self, db, capsys):
+        _week_of_player_scores(db, 2019, 1)
+        canonicalize(league_id=LEAGUE, season=2019, db_path=db)
+        con = sqlite3.connect(db)
+        con.execute("DELETE FROM canonical_membership")
+        con.commit()
+        con.close()
+        capsys.readouterr()
+
+        canonicalize(league_id=LEAGUE, season=2019, db_path=db, incremental=True, verify=True)
+        assert "mode = full" in capsys.readouterr().out
+
+    def test_championship_weeks_force_full_rebuild(self, db, capsys):
+        for week in range(15, 18):
+            _week_of_player_scores(db, 2022, week)
+        canonicalize(league_id=LEAGUE, season=2022, db_path=db, incremental=True)
+        capsys.readouterr()
+
+        # MFL's week-18 copy of the week-17 final: an R1 phantom.
+        _week_of_player_scores(db, 2022, 18)
+        canonicalize(league_id=LEAGUE, season=2022, db_path=db, incremental=True, verify=True)
+        out = capsys.readouterr().out
+        assert "mode = full" in out
+        assert "skipped_phantom = 5" in out
+        assert _projection(db, 2022) == _full_rebuild_projection(db, 2022)
+
+    def test_only_changed_scope_is_folded(self, db, capsys):
+        _week_of_player_scores(db, 2018, 1)
+        _week_of_player_scores(db, 2019, 1)
+        canonicalize(league_id=LEAGUE, season=2018, db_path=db)
+        canonicalize(league_id=LEAGUE, season=2019, db_path=db)
+        _week_of_player_scores(db, 2019, 2)
+        capsys.readouterr()
+
+        canonicalize(league_id=LEAGUE, season=2018, db_path=db, incremental=True)
+        assert "mode = noop" in capsys.readouterr().out
+        canonicalize(league_id=LEAGUE, season=2019, db_path=db, incremental=True)
+        out = capsys.readouterr().out
+        assert "mode = incremental" in out
+        assert "memory_events_processed = 5" in out
+
+
+class TestVerifyFlag:
+    def test_verify_passes_and_leaves_projection_untouched(self, db):
+        _week_of_player_scores(db, 2019, 1)
+        canonicalize(league_id=LEAGUE, season=2019, db_path=db)
+        ids = _ids(db, 2019)
+        canonicalize(league_id=LEAGUE, season=2019, db_path=db, incremental=True, verify=True)
+        assert _ids(db, 2019) == ids
+
+    def test_verify_detects_divergence(self, db):
+        _week_of_player_scores(db, 2019, 1)
+        canonicalize(league_id=LEAGUE, season=2019, db_path=db)
+        con = sqlite3.connect(db)
+        con.execute("UPDATE canonical_events SET best_score = best_score + 1 WHERE event_type='WEEKLY_MATCHUP_RESULT'")
+        con.commit()
+        con.close()
+
+        with pytest.raises(CanonicalizationError):
+            canonicalize(league_id=LEAGUE, season=2019, db_path=db, incremental=True, verify=True)
+
+
+class TestCanonicalizeAll:
+    def _seed(self, db_path):
+        for season in (2019, 2020, 2022):
+            for week in range(16, 19):
+                _week_of_player_scores(db_path, season, week)
+            _insert(db_path, season, "WAIVER_BID_AWARDED", {
+                "franchise_id": "F01", "player_id": "P9", "bid_amount": "5",
+            }, f"wba_{season}")
+
+    def _all_rows(self, db_path):
+        con = sqlite3.connect(db_path)
+        events = con.execute(
+            """SELECT id, league_id, season, event_type, action_fingerprint, best_memory_event_id,
+                      best_score, selection_version, occurred_at
+               FROM canonical_events ORDER BY id"""
+        ).fetchall()
+        members = con.execute(
+            "SELECT canonical_event_id, memory_event_id, score FROM canonical_membership ORDER BY 1, 2"
+        ).fetchall()
+        state = con.execute(
+            "SELECT league_id, season, last_memory_event_id, canonical_count FROM canonical_scope_state ORDER BY 1, 2"
+        ).fetchall()
+        con.close()
+        return events, members, state
+
+    def test_parallel_matches_serial_loop(self, db, tmp_path):
+        self._seed(db)
+        serial_db = str(tmp_path / "serial.sqlite")
+        parallel_db = str(tmp_path / "parallel.sqlite")
+        for target in (serial_db, parallel_db):
+            src = sqlite3.connect(db)
+            dst = sqlite3.connect(target)
+            src.backup(dst)
+            src.close()
+            dst.close()
+
+        for season in (2019, 2020, 2022):
+            canonicalize(league_id=LEAGUE, season=season, db_path=serial_db)
+        canonicalize_all(LEAGUE, [2022, 2019, 2020, 2019], db_path=parallel_db, workers=2)
+
+        assert self._all_rows(parallel_db) == self._all_rows(serial_db)
+
+    def test_inline_when_single_worker(self, db):
+        self._seed(db)
+        canonicalize_all(LEAGUE, [2019, 2022], db_path=db, workers=1)
+        # A following incremental run sees the marks canonicalize_all recorded.
+        canonicalize(league_id=LEAGUE, season=2022, db_path=db, incremental=True, verify=True)
+        _events, _members, state = self._all_rows(db)
+        assert [(s[1], s[3] > 0) for s in state] == [(2019, True), (2022, True)]
+
+    def test_missing_db_raises(self, tmp_path):
+        with pytest.raises(FileNotFoundError):
+            canonicalize_all(LEAGUE, [2019], db_path=str(tmp_path / "nope.sqlite"))
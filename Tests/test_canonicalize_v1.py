@@ -12,12 +12,16 @@ from pathlib import Path
 import pytest
 
 from squadvault.core.canonicalize.run_canonicalize import (
+    DecodeStats,
     MemoryEventRow,
     _as_list_str,
+    _phantom_memory_event_ids,
     _parse_free_agent_add_drop_from_raw,
     _stable_ids_key,
     action_fingerprint,
+    build_canonical_groups,
     canonicalize,
+    decode_event_rows,
     norm,
     raw_mfl_obj,
     safe_json_loads,
@@ -371,3 +375,121 @@ class TestCanonicalizeFlow:
         count = con.execute("SELECT COUNT(*) FROM canonical_events").fetchone()[0]
         con.close()
         assert count == 0
+
+
+# ── grouping engine ─────────────────────────────────────────────────
+
+class TestBuildCanonicalGroups:
+    def _dup_rows(self):
+        return decode_event_rows([
+            _row(id=11, payload_json=json.dumps({"franchise_id": "F1", "player_id": "P1", "bid_amount": "25"})),
+            _row(id=12, payload_json=json.dumps({"franchise_id": "F2", "player_id": "P2", "bid_amount": "5"})),
+            _row(id=13, occurred_at="2024-10-01T12:00:00Z",
+                 payload_json=json.dumps({"franchise_id": "F1", "player_id": "P1", "bid_amount": "25"})),
+        ])
+
+    def test_groups_in_first_appearance_order(self):
+        groups, counts = build_canonical_groups(self._dup_rows(), set())
+        assert [g.members[0][0] for g in groups] == [11, 12]
+        assert counts.created == 2
+        assert counts.processed == 3
+
+    def test_last_member_is_best(self):
+        groups, _ = build_canonical_groups(self._dup_rows(), set())
+        g = groups[0]
+        assert [m for m, _ in g.members] == [11, 13]
+        assert g.best_memory_event_id == 13
+        assert g.best_score == g.members[-1][1]
+
+    def test_phantom_and_empty_fingerprint_skipped(self):
+        rows = self._dup_rows() + decode_event_rows([
+            _row(id=14, payload_json=json.dumps({"raw_mfl_json": json.dumps({"type": "BBID_WAIVER"})})),
+        ])
+        groups, counts = build_canonical_groups(rows, {12})
+        assert len(groups) == 1
+        assert counts.skipped_phantom == 1
+        assert counts.skipped_empty_fingerprint == 1
+
+    def test_prior_best_counts_updates_not_creates(self):
+        rows = self._dup_rows()
+        fp = action_fingerprint(rows[0].row, rows[0].payload())
+        _, counts = build_canonical_groups(rows[2:], set(), prior_best={("WAIVER_BID_AWARDED", fp): (11, 0)})
+        assert counts.created == 0
+        assert counts.updated_best == 1
+
+
+class TestDecodedEvents:
+    def _season_rows(self):
+        rows = []
+        for i, (week, et, payload) in enumerate([
+            ("17", "WEEKLY_MATCHUP_RESULT", {"winner_franchise_id": "F1", "loser_franchise_id": "F2",
+                                             "winner_score": "100", "loser_score": "90"}),
+            ("18", "WEEKLY_MATCHUP_RESULT", {"winner_franchise_id": "F1", "loser_franchise_id": "F2",
+                                             "winner_score": "100", "loser_score": "90"}),
+            ("18", "WEEKLY_PLAYER_SCORE", {"franchise_id": "F1", "player_id": "P1", "score": 10}),
+            (None, "WAIVER_BID_AWARDED", {"franchise_id": "F1", "player_id": "P1", "bid_amount": "25",
+                                          "raw_mfl_json": json.dumps({"type": "BBID_WAIVER", "amount": "25"})}),
+        ], start=1):
+            if week is not None:
+                payload = {**payload, "week": week}
+            rows.append(_row(id=i, event_type=et, season=2022, payload_json=json.dumps(payload)))
+        return rows
+
+    def test_each_payload_parsed_once(self):
+        stats = DecodeStats()
+        events = decode_event_rows(self._season_rows(), stats)
+        phantom = _phantom_memory_event_ids(events)
+        build_canonical_groups(events, phantom)
+        # 4 payloads + 1 nested raw_mfl_json, however many readers touched them.
+        assert (stats.payload_parses, stats.raw_parses) == (4, 1)
+        assert stats.reuses > 0
+
+    def test_decoded_results_match_row_level_helpers(self):
+        rows = self._season_rows()
+        for ev in decode_event_rows(rows):
+            payload = safe_json_loads(ev.row.payload_json)
+            assert ev.payload() == payload
+            assert ev.raw() == raw_mfl_obj(payload)
+            assert action_fingerprint(ev.row, ev.payload(), ev.raw) == action_fingerprint(ev.row, payload)
+
+    def test_summary_reports_parse_counts(self, db, capsys):
+        _insert_memory_event(db, "WAIVER_BID_AWARDED", {
+            "franchise_id": "F1", "player_id": "P1", "bid_amount": "25",
+        })
+        canonicalize(league_id=LEAGUE, season=SEASON, db_path=db)
+        out = capsys.readouterr().out
+        assert "json_parses = 2" in out
+        assert "json_parses_saved = 0" in out
+
+
+class TestCanonicalMembership:
+    def test_membership_lists_every_group_member(self, db):
+        for i in range(3):
+            _insert_memory_event(db, "WAIVER_BID_AWARDED", {
+                "franchise_id": "F1", "player_id": "P1", "bid_amount": "25",
+            }, id_suffix=str(i))
+        canonicalize(league_id=LEAGUE, season=SEASON, db_path=db)
+
+        con = sqlite3.connect(db)
+        best = con.execute("SELECT id, best_memory_event_id, best_score FROM canonical_events").fetchall()
+        members = con.execute(
+            "SELECT canonical_event_id, memory_event_id, score FROM canonical_membership ORDER BY memory_event_id"
+        ).fetchall()
+        con.close()
+        assert len(best) == 1
+        canonical_id, best_id, best_score = best[0]
+        assert [m[1] for m in members] == [1, 2, 3]
+        assert {m[0] for m in members} == {canonical_id}
+        assert (best_id, best_score) == members[-1][1:]
+
+    def test_rerun_replaces_membership(self, db):
+        _insert_memory_event(db, "WAIVER_BID_AWARDED", {
+            "franchise_id": "F1", "player_id": "P1", "bid_amount": "25",
+        })
+        canonicalize(league_id=LEAGUE, season=SEASON, db_path=db)
+        canonicalize(league_id=LEAGUE, season=SEASON, db_path=db)
+
+        con = sqlite3.connect(db)
+        n = con.execute("SELECT COUNT(*) FROM canonical_membership").fetchone()[0]
+        con.close()
+        assert n == 1
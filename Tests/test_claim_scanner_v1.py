@@ -0,0 +1,114 @@
+"""Tests for Claim Scanner v1 (single-pass name index).
+
+Invariant: MentionIndex window queries agree with the per-name
+str.find / str.rfind loops they replace in the recap verifier, and
+RecapClaims yields the numbers each check's own finditer would.
+"""
+from __future__ import annotations
+
+import random
+
+from squadvault.core.recaps.verification.claim_scanner_v1 import (
+    NUMBER_PATTERNS,
+    NameIndex,
+    RecapClaims,
+)
+
+VOCAB = ["ana", "anabel", "bel", "jo", "josh allen", "allen", "jos"]
+
+
+def _nearest_by_find(text, vocab, start, end, anchor, min_len=0):
+    window = text[start:end]
+    best, best_dist = None, len(window) + 1
+    for name in vocab:
+        if len(name) <= min_len:
+            continue
+        idx = window.find(name)
+        if idx >= 0 and abs(idx - (anchor - start)) < best_dist:
+            best, best_dist = name, abs(idx - (anchor - start))
+    return best
+
+
+def _closest_before_by_rfind(text, vocab, start, end):
+    window = text[start:end]
+    best, best_dist = None, len(window) + 1
+    for name in vocab:
+        idx = window.rfind(name)
+        if idx >= 0 and len(window) - idx - len(name) < best_dist:
+            best, best_dist = name, len(window) - idx - len(name)
+    return best
+
+
+class TestNameIndex:
+    def test_overlapping_occurrences_are_indexed(self):
+        mentions = NameIndex(VOCAB).scan("anabel met josh allen; anana")
+        assert mentions.positions("ana") == [0, 23, 25]
+        assert mentions.positions("bel") == [3]
+        assert mentions.positions("allen") == [16]
+        assert "josh allen" in mentions and "jos" in mentions
+        assert mentions.names() == ["ana", "anabel", "bel", "jo", "josh allen", "allen", "jos"]
+
+    def test_duplicates_keep_first_rank_and_empty_vocab_scans(self):
+        assert len(NameIndex(["b", "a", "b", ""])) == 2
+        assert len(NameIndex([]).scan("anything")) == 0
+
+    def test_window_queries_match_find_loops(self):
+        rng = random.Random(8)
+        for _ in range(300):
+            text = "".join(rng.choice("anbelosh j") for _ in range(60))
+            mentions = NameIndex(VOCAB).scan(text)
+            start = rng.randrange(0, 40)
+            end = rng.randrange(start, 61)
+            anchor = rng.randrange(start, end + 1)
+            for min_len in (0, 3):
+                assert mentions.nearest(start, end, anchor, min_len=min_len) == (
+                    _nearest_by_find(text, VOCAB, start, end, anchor, min_len)
+                )
+            assert mentions.closest_before(start, end) == (
+                _closest_before_by_rfind(text, VOCAB, start, end)
+            )
+            window = text[start:end]
+            assert mentions.first_within(start, end) == {
+                n: window.find(n) + start for n in VOCAB if n in window
+            }
+
+
+class TestRecapClaims:
+    def test_numbers_match_window_finditer(self):
+        rng = random.Random(18)
+        for _ in range(300):
+            text = "".join(rng.choice("0123456789.$- ab") for _ in range(80))
+            claims = RecapClaims(text)
+            for kind, pattern in NUMBER_PATTERNS.items():
+                assert [(n.start, n.text) for n in claims.numbers(kind)] == [
+                    (m.start(), m.group(1)) for m in pattern.finditer(text)
+                ]
+            # Player-score windows open after a letter, as a name ends.
+            start = text.find("a") + 1
+            end = rng.randrange(start, 81)
+            assert [n.start for n in claims.numbers_within("PLAYER_SCORE", start, end)] == [
+                start + m.start()
+                for m in NUMBER_PATTERNS["PLAYER_SCORE"].finditer(text[start:end])
+            ]
+
+    def test_values_and_kinds(self):
+        claims = RecapClaims("Won 115-107.50; Chase's 24.50 cost $12.5")
+        assert [n.value for n in claims.numbers("SCORE")] == [107.5, 24.5]
+        assert [n.text for n in claims.numbers("INT_SCORE")] == ["115"]
+        assert [n.value for n in claims.numbers("DOLLAR")] == [12.5]
+
+    def test_vocabulary_is_scanned_once(self):
+        claims = RecapClaims("Josh Allen and Allen")
+        vocab = {"allen": "1", "josh allen": "2"}
+        builds = []
+
+        def index():
+            builds.append(1)
+            return NameIndex(vocab)
+
+        first = claims.mentions(vocab, index)
+        assert claims.mentions(vocab, index) is first
+        assert first.positions("allen") == [5, 15]
+        assert claims.mentions(vocab, index, str.upper) is not first
+        assert claims.mentions(dict(vocab), index) is not first
+        assert len(builds) == 3
@@ -27,6 +27,7 @@ CONSUMER_ENTRIES: list[tuple[str, bool]] = [
     ("squadvault.consumers.recap_export_approved", True),
     ("squadvault.consumers.recap_export_narrative_assemblies_approved", True),
     ("squadvault.consumers.recap_export_variants_approved", True),
+    ("squadvault.consumers.recap_stage_timings", True),
     ("squadvault.consumers.recap_week_approve", False),
     ("squadvault.consumers.recap_week_diagnose_empty", False),
     ("squadvault.consumers.recap_week_enrich_artifact", False),
@@ -6,11 +6,20 @@ migration framework (init_and_migrate, apply_migrations).
 from __future__ import annotations
 
 import sqlite3
+import threading
 
 import pytest
 
 from squadvault.core.storage.db_utils import norm_id, table_columns
-from squadvault.core.storage.session import DatabaseSession
+from squadvault.errors import ConfigError
+from squadvault.core.storage.session import (
+    DatabaseSession,
+    active_pool,
+    enable_wal,
+    pooled_sessions,
+    read_snapshot,
+    session_counters,
+)
 
 # ── DatabaseSession ──────────────────────────────────────────────────
 
@@ -65,6 +74,145 @@ class TestDatabaseSession:
             assert row["name"] == "hello"
 
 
+
+class TestPooledSessions:
+    def _db(self, tmp_path):
+        db = str(tmp_path / "pool.sqlite")
+        with DatabaseSession(db) as conn:
+            conn.execute("CREATE TABLE t (id INTEGER)")
+        return db
+
+    def test_reuses_tuned_connection(self, tmp_path):
+        """Sessions inside the block share one tuned connection per thread."""
+        db = self._db(tmp_path)
+        with pooled_sessions() as pool:
+            with DatabaseSession(db) as first:
+                first.execute("INSERT INTO t VALUES (1)")
+            with DatabaseSession(db) as second:
+                assert second is first
+                assert second.execute("PRAGMA journal_mode").fetchone()[0] == "delete"
+                assert second.execute("PRAGMA temp_store").fetchone()[0] == 2
+                assert second.execute("SELECT id FROM t").fetchone()["id"] == 1
+            assert pool.stats()["connections_opened"] == 1
+            assert pool.stats()["sessions"] == 2
+            assert pool.stats()["statements"] >= 2
+        assert active_pool() is None
+        with pytest.raises(sqlite3.ProgrammingError):
+            first.execute("SELECT 1")
+
+    def test_nested_and_threaded_sessions_get_own_connections(self, tmp_path):
+        """A nested session or another thread never shares a held connection."""
+        db = self._db(tmp_path)
+        seen = []
+        with pooled_sessions() as pool:
+            with DatabaseSession(db) as outer:
+                with DatabaseSession(db) as inner:
+                    assert inner is not outer
+                t = threading.Thread(target=lambda: seen.append(pool.acquire(db)))
+                t.start()
+                t.join()
+            assert seen[0] not in (outer, inner)
+            assert pool.stats()["connections_opened"] == 3
+
+    def test_rollback_on_exception(self, tmp_path):
+        """A failed pooled session leaves nothing behind."""
+        db = self._db(tmp_path)
+        with pooled_sessions():
+            with pytest.raises(ValueError):
+                with DatabaseSession(db) as conn:
+                    conn.execute("INSERT INTO t VALUES (99)")
+                    raise ValueError("boom")
+            with DatabaseSession(db) as conn:
+                assert conn.execute("SELECT COUNT(*) FROM t").fetchone()[0] == 0
+
+    def test_counters_track_opens(self, tmp_path):
+        """Process-wide counters show the connections pooling saves."""
+        db = self._db(tmp_path)
+        before = session_counters()
+        for _ in range(3):
+            with DatabaseSession(db):
+                pass
+        with pooled_sessions():
+            for _ in range(3):
+                with DatabaseSession(db):
+                    pass
+        after = session_counters()
+        assert after["sessions"] - before["sessions"] == 6
+        assert after["connections_opened"] - before["connections_opened"] == 4
+
+
+
+class TestReadSnapshot:
+    def _db(self, tmp_path, wal=True):
+        db = str(tmp_path / "snap.sqlite")
+        with DatabaseSession(db) as conn:
+            conn.execute("CREATE TABLE t (id INTEGER)")
+            conn.execute("INSERT INTO t VALUES (1)")
+        if wal:
+            enable_wal(db)
+        return db
+
+    @staticmethod
+    def _journal_mode(db):
+        with DatabaseSession(db) as conn:
+            return conn.execute("PRAGMA journal_mode").fetchone()[0]
+
+    def _count(self, db):
+        with DatabaseSession(db) as conn:
+            conn.commit()  # must not end a snapshot's read transaction
+            return conn.execute("SELECT COUNT(*) FROM t").fetchone()[0]
+
+    def test_sessions_read_one_point_in_time(self, tmp_path):
+        """Writes committed elsewhere stay invisible until the snapshot ends."""
+        db = self._db(tmp_path)
+        other = []
+        with read_snapshot(db):
+            writer = sqlite3.connect(db)
+            writer.execute("INSERT INTO t VALUES (2)")
+            writer.commit()
+            writer.close()
+            assert self._count(db) == 1
+            assert self._count(str(tmp_path / "." / "snap.sqlite")) == 1
+            t = threading.Thread(target=lambda: other.append(self._count(db)))
+            t.start()
+            t.join()
+        assert other == [2]
+        assert self._count(db) == 2
+
+    def test_writes_are_refused(self, tmp_path):
+        """A snapshot is read-only."""
+        db = self._db(tmp_path)
+        with read_snapshot(db), pytest.raises(sqlite3.OperationalError, match="readonly"):
+            with DatabaseSession(db) as conn:
+                conn.execute("INSERT INTO t VALUES (3)")
+
+    def test_missing_database_is_not_created(self, tmp_path):
+        """A snapshot of a path that does not exist fails instead of creating it."""
+        db = tmp_path / "missing.sqlite"
+        with pytest.raises(ConfigError), read_snapshot(db):
+            pass
+        with pytest.raises(ConfigError):
+            enable_wal(db)
+        assert not db.exists()
+
+    def test_wal_is_an_explicit_step(self, tmp_path):
+        """Reading never changes the journal mode; wal=True does, persistently."""
+        db = self._db(tmp_path, wal=False)
+        with pytest.raises(ConfigError, match="enable_wal"), read_snapshot(db):
+            pass
+        assert self._journal_mode(db) == "delete"
+        with read_snapshot(db, wal=True):
+            assert self._count(db) == 1
+        assert self._journal_mode(db) == "wal"
+
+    def test_immutable_snapshot(self, tmp_path):
+        """immutable=True reads a frozen file without switching it to WAL."""
+        db = self._db(tmp_path, wal=False)
+        with read_snapshot(db, immutable=True) as snap:
+            assert self._count(db) == 1
+            assert snap.execute("PRAGMA journal_mode").fetchone()[0] != "wal"
+
+
 # ── db_utils ─────────────────────────────────────────────────────────
 
 class TestTableColumns:
@@ -251,11 +251,11 @@ class TestLifecyclePlayerHighlightsWiring(unittest.TestCase):
 
         from squadvault.recaps import weekly_recap_lifecycle
 
-        source = inspect.getsource(weekly_recap_lifecycle.generate_weekly_recap_draft)
+        source = inspect.getsource(weekly_recap_lifecycle.draft_weekly_recap_narrative)
         self.assertIn(
             "player_highlights=_ctx.player_highlights_text",
             source,
-            "generate_weekly_recap_draft must pass player_highlights from "
+            "draft_weekly_recap_narrative must pass player_highlights from "
             "_PromptContext to draft_narrative_v1. This wiring was lost in "
             "the lifecycle extraction refactor (26b53b0).",
         )
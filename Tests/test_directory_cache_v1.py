@@ -0,0 +1,134 @@
+"""Tests for Directory Cache v1 (shared player/franchise name directories).
+
+Invariants: every view equals what the per-call SQL loaders it replaced
+returned; resolvers built week after week share one load of the
+directories; a directory upsert (new updated_at) is picked up on the next
+lookup; tables missing optional columns or missing entirely degrade to
+empty names.
+"""
+from __future__ import annotations
+
+import io
+import sqlite3
+from contextlib import redirect_stdout
+
+import pytest
+
+from squadvault.core.directory_cache_v1 import name_directory, name_directory_cache
+from squadvault.core.recaps.context.league_history_v1 import (
+    build_cross_season_name_resolver,
+    build_season_scoped_name_map,
+    compute_franchise_tenures,
+)
+from squadvault.core.recaps.verification.recap_verifier_v1 import VerificationFactSnapshot
+from squadvault.core.resolvers import FranchiseResolver, PlayerResolver, build_player_name_map
+from squadvault.core.storage.migrate import init_and_migrate
+from squadvault.core.storage.session import DatabaseSession
+from squadvault.testing.synthetic_league_v1 import SyntheticLeagueSpec, build_synthetic_league
+
+SPEC = SyntheticLeagueSpec(
+    league_id="DIR", teams=4, seasons=2, regular_weeks=2, playoff_weeks=0,
+    roster_size=6, starters=3, faab_claims_per_week=1, free_agent_moves_per_week=1,
+    trades_per_season=0, seed=5,
+)
+SEASON = SPEC.last_season
+
+
+@pytest.fixture()
+def db(tmp_path):
+    db_path = str(tmp_path / "dir.sqlite")
+    init_and_migrate(db_path)
+    with redirect_stdout(io.StringIO()):
+        build_synthetic_league(db_path, SPEC)
+    with DatabaseSession(db_path) as con:
+        con.execute(
+            "UPDATE franchise_directory SET name = 'Renamed' WHERE season = ? AND franchise_id = '0001'",
+            (SEASON,),
+        )
+        con.execute(
+            "INSERT INTO franchise_nicknames (league_id, franchise_id, nickname) VALUES (?, '0002', 'Deuce')",
+            (SPEC.league_id,),
+        )
+    name_directory_cache().clear()
+    return db_path
+
+
+def _rows(db_path, sql, *params):
+    with DatabaseSession(db_path) as con:
+        return con.execute(sql, params).fetchall()
+
+
+def test_views_match_directory_tables(db):
+    latest_players = {}
+    for pid, name in _rows(
+        db, "SELECT player_id, name FROM player_directory WHERE league_id = ? ORDER BY season DESC",
+        SPEC.league_id,
+    ):
+        latest_players.setdefault(pid, name)
+    assert build_player_name_map(db, SPEC.league_id) == latest_players
+
+    history = _rows(
+        db, "SELECT franchise_id, season, name FROM franchise_directory WHERE league_id = ?",
+        SPEC.league_id,
+    )
+    assert build_season_scoped_name_map(db, SPEC.league_id) == {
+        (fid, season): name for fid, season, name in history
+    }
+    latest = build_cross_season_name_resolver(db, SPEC.league_id)
+    assert latest["0001"] == "Renamed"
+    assert compute_franchise_tenures(db, SPEC.league_id)["0001"] == SEASON
+
+    pid, name, pos, team = _rows(
+        db, "SELECT player_id, name, position, team FROM player_directory"
+        " WHERE league_id = ? AND season = ? LIMIT 1", SPEC.league_id, SEASON,
+    )[0]
+    players = PlayerResolver(db, SPEC.league_id, SEASON)
+    players.load_for_ids({pid, "nobody"})
+    assert players.one(pid) == f"{name} ({pos}, {team})"
+    assert players.one("nobody") == "nobody"
+    assert (players.requested, players.resolved) == (2, 1)
+
+
+def test_resolvers_share_one_load_until_directory_changes(db):
+    cache = name_directory_cache()
+    for _week in range(3):
+        franchises = FranchiseResolver(db, SPEC.league_id, SEASON)
+        franchises.load_for_ids({"0001", "0002"})
+        assert franchises.one("0001") == "Renamed"
+    assert (cache.misses, cache.hits) == (1, 2)
+
+    with DatabaseSession(db) as con:
+        con.execute(
+            "UPDATE franchise_directory SET name = 'Upserted', updated_at = '2999-01-01T00:00:00Z'"
+            " WHERE season = ? AND franchise_id = '0001'",
+            (SEASON,),
+        )
+    franchises = FranchiseResolver(db, SPEC.league_id, SEASON)
+    franchises.load_for_ids({"0001"})
+    assert franchises.one("0001") == "Upserted"
+    assert cache.stale == 1
+
+
+def test_verifier_snapshot_reads_the_shared_directory(db):
+    with VerificationFactSnapshot(db, SPEC.league_id, SEASON, 1) as facts:
+        assert facts.franchise_nicknames() == {"0002": "Deuce"}
+        assert facts.reverse_name_map()["deuce"] == "0002"
+        assert facts.player_name_map() == build_player_name_map(db, SPEC.league_id)
+    again = VerificationFactSnapshot(db, SPEC.league_id, SEASON, 2)
+    assert again.reverse_name_map() is facts.reverse_name_map()
+
+
+def test_minimal_and_missing_tables(tmp_path):
+    db_path = str(tmp_path / "minimal.sqlite")
+    con = sqlite3.connect(db_path)
+    con.executescript("""
+        CREATE TABLE player_directory (league_id TEXT, season INTEGER, player_id TEXT, name TEXT);
+        INSERT INTO player_directory VALUES ('L', 2024, 'P1', 'Joe Burrow');
+    """)
+    con.close()
+    directory = name_directory(db_path, "L")
+    assert directory.player_display_names(2024) == {"P1": "Joe Burrow"}
+    assert directory.missing_tables == {"franchise_directory", "franchise_nicknames"}
+    assert build_cross_season_name_resolver(db_path, "L") == {}
+    with pytest.raises(sqlite3.OperationalError):
+        VerificationFactSnapshot(db_path, "L", 2024, 1).franchise_nicknames()
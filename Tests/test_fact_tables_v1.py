@@ -0,0 +1,171 @@
+"""Typed fact tables (fact_matchup, fact_player_score).
+
+Invariant: after any canonical_events write, the fact tables hold exactly one
+typed row per canonical matchup / player-score event, matching what the
+payload_json readers used to decode.
+"""
+from __future__ import annotations
+
+import json
+import sqlite3
+from pathlib import Path
+
+import pytest
+
+from squadvault.core.canonicalize.run_canonicalize import canonicalize
+from squadvault.core.recaps.context.league_history_v1 import load_all_matchups
+from squadvault.core.recaps.context.player_week_context_v1 import _load_player_scores
+from squadvault.core.recaps.verification.recap_verifier_v1 import (
+    _load_all_matchups,
+    _load_player_season_high,
+)
+from squadvault.core.storage.migrate import init_and_migrate
+
+SCHEMA_PATH = Path(__file__).parent.parent / "src" / "squadvault" / "core" / "storage" / "schema.sql"
+LEAGUE = "fact_test_league"
+
+
+@pytest.fixture
+def db(tmp_path):
+    """Fresh DB from schema.sql."""
+    db_path = str(tmp_path / "facts.sqlite")
+    con = sqlite3.connect(db_path)
+    con.executescript(SCHEMA_PATH.read_text())
+    con.close()
+    return db_path
+
+
+def _insert(db_path, season, event_type, payload, ext_id):
+    con = sqlite3.connect(db_path)
+    con.execute(
+        """INSERT INTO memory_events
+           (league_id, season, external_source, external_id,
+            event_type, occurred_at, ingested_at, payload_json)
+           VALUES (?, ?, 'test', ?, ?, '2024-10-01T12:00:00Z', '2024-10-01T13:00:00Z', ?)""",
+        (LEAGUE, season, ext_id, event_type,
+         payload if isinstance(payload, str) else json.dumps(payload)),
+    )
+    con.commit()
+    con.close()
+
+
+def _seed_week(db_path, season, week, winner_score="101.50"):
+    _insert(db_path, season, "WEEKLY_MATCHUP_RESULT", {
+        "week": week, "winner_franchise_id": "F01", "loser_franchise_id": "F02",
+        "winner_score": winner_score, "loser_score": "90.25", "is_tie": False,
+    }, f"wmr_{season}_{week}_{winner_score}")
+    for fid, pid, score, starter in (("F01", "P1", 30.5, True), ("F01", "P2", 4.0, False),
+                                     ("F02", "P3", "12.75", True)):
+        _insert(db_path, season, "WEEKLY_PLAYER_SCORE", {
+            "week": str(week), "franchise_id": fid, "player_id": pid, "score": score,
+            "is_starter": starter, "should_start": not starter,
+        }, f"wps_{season}_{week}_{pid}")
+
+
+def _facts(db_path, table):
+    con = sqlite3.connect(db_path)
+    rows = con.execute(f"SELECT * FROM {table} ORDER BY canonical_event_id").fetchall()
+    con.close()
+    return rows
+
+
+class TestFactMaintenance:
+    def test_canonicalize_populates_typed_rows(self, db):
+        _seed_week(db, 2024, 3)
+        canonicalize(league_id=LEAGUE, season=2024, db_path=db)
+
+        matchups = _facts(db, "fact_matchup")
+        assert [m[1:9] for m in matchups] == [(LEAGUE, 2024, 3, "F01", "F02", 101.5, 90.25, 0)]
+        scores = {(r[4], r[5]): (r[3], r[6], r[7], r[8]) for r in _facts(db, "fact_player_score")}
+        assert scores == {
+            ("F01", "P1"): (3, 30.5, 1, 0),
+            ("F01", "P2"): (3, 4.0, 0, 1),
+            ("F02", "P3"): (3, 12.75, 1, 0),
+        }
+
+    def test_rebuild_replaces_rows(self, db):
+        _seed_week(db, 2024, 1)
+        canonicalize(league_id=LEAGUE, season=2024, db_path=db)
+        canonicalize(league_id=LEAGUE, season=2024, db_path=db)
+        assert len(_facts(db, "fact_matchup")) == 1
+        assert len(_facts(db, "fact_player_score")) == 3
+
+    def test_facts_track_incremental_folds(self, db):
+        _seed_week(db, 2024, 1)
+        canonicalize(league_id=LEAGUE, season=2024, db_path=db, incremental=True)
+        _seed_week(db, 2024, 2)
+        canonicalize(league_id=LEAGUE, season=2024, db_path=db, incremental=True)
+        assert sorted(m[3] for m in _facts(db, "fact_matchup")) == [1, 2]
+
+    def test_repointed_best_event_is_rederived(self, db):
+        _seed_week(db, 2024, 1)
+        canonicalize(league_id=LEAGUE, season=2024, db_path=db)
+        con = sqlite3.connect(db)
+        con.execute(
+            """UPDATE canonical_events SET best_memory_event_id = (
+                 SELECT id FROM memory_events WHERE external_id = 'wps_2024_1_P2')
+               WHERE best_memory_event_id = (
+                 SELECT id FROM memory_events WHERE external_id = 'wps_2024_1_P1')"""
+        )
+        con.commit()
+        con.close()
+        players = sorted(r[5] for r in _facts(db, "fact_player_score"))
+        assert players == ["P2", "P2", "P3"]
+
+    def test_malformed_payloads_do_not_break_canonicalize(self, db):
+        _insert(db, 2024, "WEEKLY_PLAYER_SCORE", "not json", "bad_1")
+        _insert(db, 2024, "WEEKLY_MATCHUP_RESULT", {"week": 1, "winner_score": "1"}, "bad_2")
+        canonicalize(league_id=LEAGUE, season=2024, db_path=db)
+        assert _facts(db, "fact_matchup") == []
+        assert _facts(db, "fact_player_score") == []
+
+    def test_init_and_migrate_backfills_existing_rows(self, db):
+        _seed_week(db, 2024, 1)
+        canonicalize(league_id=LEAGUE, season=2024, db_path=db)
+        con = sqlite3.connect(db)
+        con.execute("DELETE FROM fact_matchup")
+        con.execute("DELETE FROM fact_player_score")
+        con.commit()
+        con.close()
+
+        init_and_migrate(db)
+        assert len(_facts(db, "fact_matchup")) == 1
+        assert len(_facts(db, "fact_player_score")) == 3
+
+
+class TestFactReaders:
+    def test_matchup_cutoff_applied_in_sql(self, db):
+        for season, weeks in ((2023, (16, 17)), (2024, (1, 2, 3))):
+            for w in weeks:
+                _seed_week(db, season, w)
+            canonicalize(league_id=LEAGUE, season=season, db_path=db)
+
+        history = load_all_matchups(db, LEAGUE, as_of_season=2024, as_of_week=2)
+        assert [(m.season, m.week) for m in history] == [(2023, 16), (2023, 17), (2024, 1), (2024, 2)]
+        assert history[0].margin == 11.25
+        verifier = _load_all_matchups(db, LEAGUE, as_of_season=2024, as_of_week=2)
+        assert [(m.season, m.week) for m in verifier] == [(m.season, m.week) for m in history]
+
+    def test_player_scores_for_week(self, db):
+        _seed_week(db, 2024, 1)
+        _seed_week(db, 2024, 2)
+        canonicalize(league_id=LEAGUE, season=2024, db_path=db)
+
+        rows = _load_player_scores(db, LEAGUE, 2024, 2)
+        assert [(p["franchise_id"], p["player_id"], p["week"]) for p in rows] == [
+            ("F01", "P1", 2), ("F01", "P2", 2), ("F02", "P3", 2),
+        ]
+        assert rows[1]["is_starter"] is False and rows[1]["should_start"] is True
+
+    def test_starter_high_excludes_bench_and_later_weeks(self, db):
+        _seed_week(db, 2024, 1)
+        _insert(db, 2024, "WEEKLY_PLAYER_SCORE", {
+            "week": 2, "franchise_id": "F02", "player_id": "P9", "score": 55.0, "is_starter": True,
+        }, "wps_high")
+        _insert(db, 2024, "WEEKLY_PLAYER_SCORE", {
+            "week": 1, "franchise_id": "F02", "player_id": "P8", "score": 70.0, "is_starter": False,
+        }, "wps_bench")
+        canonicalize(league_id=LEAGUE, season=2024, db_path=db)
+
+        assert _load_player_season_high(db, LEAGUE, 2024, through_week=1) == 30.5
+        assert _load_player_season_high(db, LEAGUE, 2024) == 55.0
@@ -89,9 +89,10 @@ class TestTenureInPrompt:
         assert "FRANCHISE TENURE" in _SYSTEM_PROMPT
 
     def test_tenure_import_in_lifecycle(self):
-        """Lifecycle must import compute_franchise_tenures."""
+        """Lifecycle must read tenures (compute_franchise_tenures via the history cache)."""
         import inspect
 
+        import squadvault.core.recaps.context.league_history_cache_v1 as hc
         import squadvault.recaps.weekly_recap_lifecycle as lc
-        source = inspect.getsource(lc)
-        assert "compute_franchise_tenures" in source
+        assert "_league.tenure_map()" in inspect.getsource(lc)
+        assert "compute_franchise_tenures" in inspect.getsource(hc.LeagueHistoryCache.tenure_map)
@@ -0,0 +1,68 @@
+"""Tests for League History Accumulator v1 (league history snapshotted per week).
+
+Invariant: every cutoff read equals the from-scratch derivation over the
+matchups at or before that (season, week) — league history, head-to-head,
+verifier series records and Hall of Fame season records alike.
+"""
+from __future__ import annotations
+
+import random
+
+from squadvault.core.recaps.context.hall_of_fame_aggregations_v1 import (
+    compute_all_season_records,
+    sort_worst_first,
+)
+from squadvault.core.recaps.context.league_history_accumulator_v1 import (
+    LeagueHistoryAccumulator,
+)
+from squadvault.core.recaps.context.league_history_v1 import (
+    HistoricalMatchup,
+    compute_head_to_head,
+    derive_league_history_from_matchups,
+)
+from squadvault.core.recaps.verification.recap_verifier_v1 import (
+    _compute_series_records,
+)
+
+
+def _random_league(seed: int) -> tuple[list[str], list[HistoricalMatchup]]:
+    rng = random.Random(seed)
+    fids = [f"F{i}" for i in range(rng.randint(2, 6))]
+    matchups = []
+    for season in range(2018, 2018 + rng.randint(1, 3)):
+        for week in range(1, rng.randint(2, 8)):
+            for _ in range(rng.randint(0, 3)):
+                a, b = rng.sample(fids, 2)
+                ws = rng.choice([round(rng.uniform(50, 150), 2), 100.0, 90.1, 0.0])
+                ls = ws if rng.random() < 0.15 else round(rng.uniform(0, ws), 2)
+                matchups.append(HistoricalMatchup(
+                    season, week, a, b, ws, ls, ws == ls, round(abs(ws - ls), 2),
+                ))
+    matchups.sort(key=lambda m: (m.season, m.week, m.winner_id, m.loser_id))
+    return fids, matchups
+
+
+class TestLeagueHistoryAccumulator:
+    def test_every_cutoff_matches_rederivation(self):
+        for seed in range(60):
+            fids, matchups = _random_league(seed)
+            acc = LeagueHistoryAccumulator("L", matchups)
+            cutoffs = {(m.season, m.week) for m in matchups}
+            cutoffs |= {(m.season, m.week + 1) for m in matchups}
+            cutoffs |= {(2017, 1), (2018, 0), (2030, 1)}
+            for cutoff in sorted(cutoffs):
+                prefix = [m for m in matchups if (m.season, m.week) <= cutoff]
+                assert acc.as_of(*cutoff) == derive_league_history_from_matchups("L", prefix)
+                for a in fids[:3]:
+                    for b in fids[:3]:
+                        assert acc.head_to_head(a, b, *cutoff) == compute_head_to_head(prefix, a, b)
+                series = acc.series_records(*cutoff)
+                expected = _compute_series_records(prefix)  # type: ignore[arg-type]
+                assert series == expected and list(series) == list(expected)
+            assert sort_worst_first(acc.season_records()) == compute_all_season_records(matchups)
+
+    def test_empty_history(self):
+        acc = LeagueHistoryAccumulator("L", [])
+        assert acc.as_of(2024, 5) == derive_league_history_from_matchups("L", [])
+        assert acc.series_records(2024, 5) == {}
+        assert acc.season_records() == []
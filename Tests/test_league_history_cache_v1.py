@@ -0,0 +1,121 @@
+"""Tests for League History Cache v1 (league history loaded once, read as of a week).
+
+Invariants: as-of views equal the loaders' SQL cutoffs; a league's history
+loads once per ledger state; a ledger change yields a fresh cache.
+"""
+from __future__ import annotations
+
+import json
+import random
+import sqlite3
+from pathlib import Path
+
+import pytest
+
+from squadvault.core.recaps.context.league_history_cache_v1 import (
+    LeagueHistoryCaches,
+)
+from squadvault.core.recaps.context.league_history_v1 import (
+    build_cross_season_name_resolver,
+    compute_franchise_tenures,
+    derive_league_history_v1,
+    load_all_matchups,
+)
+
+SCHEMA_PATH = Path(__file__).parent.parent / "src" / "squadvault" / "core" / "storage" / "schema.sql"
+LEAGUE = "history_cache_league"
+
+
+def _insert_matchup(con, season, week, winner, loser, ws, ls, n):
+    occurred_at = f"{season}-10-{week:02d}T12:00:00Z"
+    payload = {
+        "week": week, "winner_franchise_id": winner, "loser_franchise_id": loser,
+        "winner_score": f"{ws:.2f}", "loser_score": f"{ls:.2f}", "is_tie": ws == ls,
+    }
+    me_id = con.execute(
+        """INSERT INTO memory_events
+           (league_id, season, external_source, external_id, event_type,
+            occurred_at, ingested_at, payload_json)
+           VALUES (?, ?, 'test', ?, 'WEEKLY_MATCHUP_RESULT', ?, ?, ?)""",
+        (LEAGUE, season, f"m{n}", occurred_at, occurred_at, json.dumps(payload)),
+    ).lastrowid
+    con.execute(
+        """INSERT INTO canonical_events
+           (league_id, season, event_type, action_fingerprint,
+            best_memory_event_id, best_score, updated_at, occurred_at)
+           VALUES (?, ?, 'WEEKLY_MATCHUP_RESULT', ?, ?, 100, ?, ?)""",
+        (LEAGUE, season, f"fp{n}", me_id, occurred_at, occurred_at),
+    )
+
+
+@pytest.fixture
+def db(tmp_path):
+    db_path = str(tmp_path / "history.sqlite")
+    con = sqlite3.connect(db_path)
+    con.executescript(SCHEMA_PATH.read_text())
+    rng = random.Random(13)
+    n = 0
+    for season in (2022, 2023, 2024):
+        for week in range(1, 7):
+            teams = ["A", "B", "C", "D"]
+            rng.shuffle(teams)
+            for winner, loser in (teams[:2], teams[2:]):
+                ws = round(rng.uniform(80, 150), 2)
+                _insert_matchup(con, season, week, winner, loser, ws, rng.choice([ws, ws - 12.5]), n)
+                n += 1
+        for fid in "ABCD":
+            con.execute(
+                "INSERT INTO franchise_directory (league_id, season, franchise_id, name) VALUES (?,?,?,?)",
+                (LEAGUE, season, fid, f"{fid} {'Old' if season < 2024 and fid == 'B' else 'Team'}"),
+            )
+    con.commit()
+    con.close()
+    return db_path
+
+
+class TestLeagueHistoryCache:
+    def test_as_of_views_match_loaders(self, db):
+        league = LeagueHistoryCaches().get(db, LEAGUE)
+        for season, week in ((2021, 9), (2022, 1), (2023, 0), (2023, 4), (2024, 6), (2025, 1)):
+            assert league.matchups_as_of(season, week) == load_all_matchups(
+                db, LEAGUE, as_of_season=season, as_of_week=week,
+            )
+            assert league.league_history_as_of(season, week) == derive_league_history_v1(
+                db_path=db, league_id=LEAGUE, as_of_season=season, as_of_week=week,
+            )
+        assert league.matchups() == load_all_matchups(db, LEAGUE)
+        assert league.name_map() == build_cross_season_name_resolver(db, LEAGUE)
+        assert league.tenure_map() == compute_franchise_tenures(db, LEAGUE) == {
+            "A": 2022, "B": 2024, "C": 2022, "D": 2022,
+        }
+
+    def test_range_run_loads_history_once(self, db):
+        caches = LeagueHistoryCaches()
+        for week in range(1, 7):
+            league = caches.get(db, LEAGUE)
+            league.league_history_as_of(2024, week)
+            league.tenure_map()
+            league.name_map()
+        assert (caches.hits, caches.misses) == (5, 1)
+        assert league.loads == 4  # matchups, accumulator, tenure map, name map
+
+    def test_ledger_change_invalidates(self, db):
+        caches = LeagueHistoryCaches()
+        before = caches.get(db, LEAGUE)
+        assert before.league_history_as_of(2024, 6).total_matchups_all_time == 36
+
+        con = sqlite3.connect(db)
+        _insert_matchup(con, 2024, 7, "A", "B", 101.0, 99.0, 999)
+        con.commit()
+        con.close()
+
+        after = caches.get(db, LEAGUE)
+        assert after is not before
+        assert caches.stale == 1
+        assert after.league_history_as_of(2024, 7).total_matchups_all_time == 37
+        assert after.league_history_as_of(2024, 6) == before.league_history_as_of(2024, 6)
+
+    def test_disabled_registry_returns_fresh_caches(self, db):
+        off = LeagueHistoryCaches(max_entries=0)
+        assert off.get(db, LEAGUE) is not off.get(db, LEAGUE)
+        assert len(off) == 0
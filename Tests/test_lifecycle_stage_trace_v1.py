@@ -0,0 +1,154 @@
+"""Tests for Lifecycle Stage Trace v1 (per-stage timings of recap drafting).
+
+Invariants: with SQUADVAULT_LIFECYCLE_TRACE unset nothing is observed or
+written; with it set, one draft run appends one trace whose stages cover
+prepare, every detector family, the creative call, verification and the
+write, with inclusive counters; sessions hand back untouched connections.
+"""
+from __future__ import annotations
+
+import sqlite3
+
+import pytest
+
+from squadvault.consumers import recap_stage_timings
+from squadvault.core.recaps.recap_runs import RecapRunRecord, upsert_recap_run
+from squadvault.core.recaps.selection.weekly_selection_v1 import (
+    select_weekly_recap_events_v1,
+)
+from squadvault.core.storage.migrate import init_and_migrate
+from squadvault.core.storage.session import DatabaseSession, pooled_sessions
+from squadvault.recaps import weekly_recap_lifecycle
+from squadvault.recaps.lifecycle_trace_v1 import (
+    TRACE_ENV_VAR,
+    stage,
+    stage_trace,
+    summarize_stage_timings,
+)
+from squadvault.recaps.weekly_recap_lifecycle import (
+    generate_weekly_recap_draft,
+    prepare_weekly_recap_draft,
+)
+from squadvault.testing.synthetic_league_v1 import SyntheticLeagueSpec, build_synthetic_league
+
+SPEC = SyntheticLeagueSpec(
+    league_id="TRACE", teams=4, seasons=1, regular_weeks=3, playoff_weeks=0,
+    roster_size=8, starters=4, faab_claims_per_week=1, free_agent_moves_per_week=1,
+    trades_per_season=1, seed=3,
+)
+SEASON = SPEC.last_season
+WEEK = 2
+
+
+@pytest.fixture()
+def db(tmp_path, monkeypatch):
+    monkeypatch.delenv(TRACE_ENV_VAR, raising=False)
+    monkeypatch.delenv("ANTHROPIC_API_KEY", raising=False)
+    db_path = str(tmp_path / "trace.sqlite")
+    init_and_migrate(db_path)
+    build_synthetic_league(db_path, SPEC)
+    sel = select_weekly_recap_events_v1(
+        db_path=db_path, league_id=SPEC.league_id, season=SEASON, week_index=WEEK,
+    )
+    upsert_recap_run(db_path, RecapRunRecord(
+        league_id=SPEC.league_id, season=SEASON, week_index=WEEK, state="ELIGIBLE",
+        window_mode=sel.window.mode, window_start=sel.window.window_start,
+        window_end=sel.window.window_end, selection_fingerprint=sel.fingerprint,
+        canonical_ids=[str(c) for c in sel.canonical_ids],
+        counts_by_type=sel.counts_by_type,
+    ))
+    return db_path
+
+
+def _timings(db_path):
+    with DatabaseSession(db_path) as con:
+        return con.execute(
+            "SELECT trace_id, seq, stage, queries, rows_read, json_payloads, angles"
+            " FROM recap_stage_timings ORDER BY seq"
+        ).fetchall()
+
+
+def _generate(db_path):
+    return generate_weekly_recap_draft(
+        db_path=db_path, league_id=SPEC.league_id, season=SEASON, week_index=WEEK,
+        reason="trace test",
+    )
+
+
+class TestDisabled:
+    def test_noop_when_env_unset(self, db):
+        assert stage("anything").__enter__() is stage("other")
+        with stage_trace("prepare") as trace:
+            assert trace is None
+            with DatabaseSession(db) as con:
+                assert con.row_factory is sqlite3.Row
+        prepared = prepare_weekly_recap_draft(
+            db_path=db, league_id=SPEC.league_id, season=SEASON, week_index=WEEK,
+        )
+        assert prepared.stage_timings == ()
+        _generate(db)
+        assert _timings(db) == []
+
+
+class TestEnabled:
+    def test_draft_run_persists_one_inclusive_trace(self, db, monkeypatch):
+        monkeypatch.setenv(TRACE_ENV_VAR, "1")
+        monkeypatch.setattr(
+            weekly_recap_lifecycle, "draft_narrative_v1",
+            lambda **_kw: "A quiet week around the league.",
+        )
+        _generate(db)
+        rows = _timings(db)
+        assert len({r["trace_id"] for r in rows}) == 1
+        assert [r["seq"] for r in rows] == list(range(len(rows)))
+        by_stage = {r["stage"]: r for r in rows}
+        for name in (
+            "prepare", "prepare/render_facts", "prepare/eal",
+            "prepare/prompt_context.cache_lookup", "prepare/prompt_context",
+            "prepare/prompt_context/context.season", "prepare/prompt_context/angles.player",
+            "prepare/prompt_context/angles.franchise_deep",
+            "draft", "draft/creative_call", "draft/verify", "write",
+        ):
+            assert name in by_stage, name
+        prepare = by_stage["prepare"]
+        context = by_stage["prepare/prompt_context"]
+        assert prepare["queries"] >= context["queries"] > 0
+        assert prepare["rows_read"] >= context["rows_read"] > 0
+        assert by_stage["prepare/render_facts"]["json_payloads"] > 0
+        detector_angles = sum(
+            r["angles"] for r in rows if r["stage"].startswith("prepare/prompt_context/angles.")
+            and not r["stage"].endswith(".budget")
+        )
+        assert context["angles"] <= detector_angles
+
+    def test_summary_and_cli(self, db, monkeypatch, capsys):
+        monkeypatch.setenv(TRACE_ENV_VAR, "1")
+        _generate(db)
+        _generate(db)
+        latest = summarize_stage_timings(db, league_id=SPEC.league_id, season=SEASON)
+        every = summarize_stage_timings(
+            db, league_id=SPEC.league_id, season=SEASON, latest_only=False,
+        )
+        assert [r["total_ms"] for r in latest] == sorted(
+            (r["total_ms"] for r in latest), reverse=True,
+        )
+        top = {r["stage"]: r for r in latest}
+        assert top["prepare"]["runs"] == 1 and top["prepare"]["slowest_week"] == WEEK
+        assert {r["stage"]: r["runs"] for r in every}["prepare"] == 2
+        assert recap_stage_timings.main([
+            "--db", db, "--league-id", SPEC.league_id, "--season", str(SEASON), "--limit", "5",
+        ]) == 0
+        assert "prepare" in capsys.readouterr().out
+
+    def test_pooled_connection_returns_untouched(self, db):
+        with pooled_sessions() as pool:
+            with stage_trace("prepare", enabled=True) as trace:
+                with DatabaseSession(db) as con:
+                    con.execute("SELECT payload_json FROM v_canonical_best_events LIMIT 3").fetchall()
+            assert trace is not None
+            assert (trace.queries, trace.rows_read, trace.json_payloads) == (1, 3, 3)
+            before = pool.stats()["statements"]
+            with DatabaseSession(db) as con:
+                assert con.row_factory is sqlite3.Row
+                con.execute("SELECT 1").fetchone()
+            assert pool.stats()["statements"] > before
@@ -12,6 +12,8 @@ import tempfile
 from pathlib import Path
 from unittest.mock import MagicMock
 
+import pytest
+
 from squadvault.mfl.discovery import (
     DiscoveryReport,
     HistoryEntry,
@@ -26,7 +28,10 @@ from squadvault.mfl.historical_ingest import (
     CategoryResult,
     SeasonIngestResult,
     _ingest_franchise_info,
+    _ingest_matchup_results,
+    _ingest_player_scores,
     _ingest_transactions_and_bids,
+    _WeeklyResults,
 )
 
 # ── Discovery data structures ───────────────────────────────────────
@@ -562,6 +567,64 @@ class TestIngestTransactionsAndBids:
         Path(db_path).unlink(missing_ok=True)
 
 
+class TestSharedWeeklyResults:
+    """MATCHUP_RESULTS and PLAYER_SCORES share one weeklyResults fetch per week."""
+
+    @staticmethod
+    def _weekly_json(week: int) -> dict:
+        def franchise(fid, score, result, pid):
+            return {
+                "id": fid, "score": score, "result": result, "starters": pid,
+                "player": [{"id": pid, "score": score, "status": "starter"}],
+            }
+        return {"weeklyResults": {"week": str(week), "matchup": [{"franchise": [
+            franchise("0001", "101.50", "W", f"1{week}"),
+            franchise("0002", "90.25", "L", f"2{week}"),
+        ]}]}}
+
+    def test_each_week_fetched_once(self, tmp_path):
+        db_path = str(tmp_path / "weekly.sqlite")
+        conn = sqlite3.connect(db_path)
+        conn.executescript(Path("src/squadvault/core/storage/schema.sql").read_text())
+        conn.close()
+
+        from squadvault.core.storage.sqlite_store import SQLiteStore
+
+        store = SQLiteStore(Path(db_path))
+        mock_client = MagicMock()
+        mock_client.get_weekly_results.side_effect = lambda year, week: (
+            self._weekly_json(week), f"https://example.com/{year}/{week}",
+        )
+        weekly = _WeeklyResults(mock_client)
+
+        matchups = _ingest_matchup_results(
+            mock_client, store, "70985", 2024,
+            max_weeks=3, request_delay_s=0.0, weekly=weekly,
+        )
+        scores = _ingest_player_scores(
+            mock_client, store, "70985", 2024,
+            max_weeks=3, request_delay_s=0.0, weekly=weekly,
+        )
+
+        assert matchups.inserted == 3
+        assert scores.inserted == 6
+        assert mock_client.get_weekly_results.call_count == 3
+        assert weekly.requests == 3
+
+    def test_failed_fetch_is_retried(self):
+        mock_client = MagicMock()
+        mock_client.get_weekly_results.side_effect = [
+            RuntimeError("HTTP 500"), ({"weeklyResults": {}}, "u"),
+        ]
+        weekly = _WeeklyResults(mock_client)
+
+        with pytest.raises(RuntimeError):
+            weekly.get(2024, 1)
+        assert not weekly.is_cached(2024, 1)
+        assert weekly.get(2024, 1) == ({"weeklyResults": {}}, "u")
+        assert weekly.is_cached(2024, 1)
+
+
 # ── MflClient additions ─────────────────────────────────────────────
 
 
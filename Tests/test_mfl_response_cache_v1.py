@@ -0,0 +1,144 @@
+"""Tests for squadvault.mfl.response_cache and MflClient cache/offline replay.
+
+Invariants: closed past seasons are fetched at most once; offline mode
+never issues HTTP and fails loudly on a cache miss.
+"""
+
+from __future__ import annotations
+
+from datetime import datetime
+from unittest.mock import MagicMock
+
+import pytest
+
+import squadvault.mfl.client as client_mod
+from squadvault.errors import ConfigError, OfflineCacheMissError
+from squadvault.mfl.client import MflClient
+from squadvault.mfl.discovery import DiscoveryReport, SeasonAvailability
+from squadvault.mfl.response_cache import MflResponseCache, season_is_closed
+
+BODY = {"weeklyResults": {"week": "3", "matchup": [{"franchise": []}]}}
+
+
+@pytest.fixture
+def http(monkeypatch):
+    """Replace the HTTP layer with a counting fake returning BODY."""
+    calls = []
+
+    def fake(session, method, url, **kwargs):
+        calls.append(url)
+        resp = MagicMock(status_code=200)
+        resp.json.return_value = BODY
+        return resp
+
+    monkeypatch.setattr(client_mod, "http_request_with_retries", fake)
+    return calls
+
+
+class TestMflResponseCache:
+    def test_roundtrip_and_content_addressing(self, tmp_path):
+        cache = MflResponseCache(tmp_path)
+        sha_a = cache.put("70985", "weeklyResults", 2020, 3, BODY, "u1", fetched_at="t1")
+        sha_b = cache.put("70985", "weeklyResults", 2020, 4, dict(BODY), "u2")
+
+        assert sha_a == sha_b
+        assert len(list((tmp_path / "objects").rglob("*.json.gz"))) == 1
+        hit = cache.get("70985", "weeklyResults", 2020, 3)
+        assert hit is not None
+        assert (hit.body, hit.source_url, hit.fetched_at) == (BODY, "u1", "t1")
+        assert cache.get("70985", "weeklyResults", 2020, 5) is None
+        assert cache.get("70985", "weeklyResults", 2021, 3) is None
+
+    def test_corrupt_blob_is_a_miss(self, tmp_path):
+        cache = MflResponseCache(tmp_path)
+        cache.put("70985", "league", 2020, None, BODY, "u")
+        blob = next((tmp_path / "objects").rglob("*.json.gz"))
+        blob.write_bytes(b"not gzip")
+        assert cache.get("70985", "league", 2020) is None
+
+    def test_season_is_closed(self):
+        assert season_is_closed(2023, datetime(2024, 3, 1))
+        assert not season_is_closed(2023, datetime(2024, 2, 28))
+        assert not season_is_closed(2024, datetime(2024, 12, 1))
+
+
+class TestMflClientResponseCache:
+    def test_closed_season_fetched_once(self, tmp_path, http):
+        cache = MflResponseCache(tmp_path)
+        client = MflClient(server="44", league_id="70985", response_cache=cache)
+
+        first = client.get_weekly_results(year=2015, week=3)
+        second = client.get_weekly_results(year=2015, week=3)
+
+        assert first == second == (BODY, client.export_url(2015, "weeklyResults") + "&W=3")
+        assert len(http) == 1
+
+    def test_error_body_is_not_cached(self, tmp_path, monkeypatch):
+        bodies = [{"error": {"$t": "API requests limit exceeded"}}, BODY]
+
+        def fake(session, method, url, **kwargs):
+            resp = MagicMock(status_code=200)
+            resp.json.return_value = bodies.pop(0)
+            return resp
+
+        monkeypatch.setattr(client_mod, "http_request_with_retries", fake)
+        cache = MflResponseCache(tmp_path)
+        client = MflClient(server="44", league_id="70985", response_cache=cache)
+
+        assert "error" in client.get_weekly_results(year=2015, week=3)[0]
+        assert cache.get("70985", "weeklyResults", 2015, 3) is None
+        assert client.get_weekly_results(year=2015, week=3)[0] == BODY
+        assert bodies == []
+
+    def test_stored_error_body_is_refetched(self, tmp_path, http):
+        cache = MflResponseCache(tmp_path)
+        cache.put("70985", "weeklyResults", 2015, 3, {"error": {"$t": "x"}}, "u")
+        client = MflClient(server="44", league_id="70985", response_cache=cache)
+
+        assert client.get_weekly_results(year=2015, week=3)[0] == BODY
+        assert cache.get("70985", "weeklyResults", 2015, 3).body == BODY
+        assert len(http) == 1
+
+    def test_open_season_is_refetched(self, tmp_path, http):
+        cache = MflResponseCache(tmp_path)
+        client = MflClient(server="44", league_id="70985", response_cache=cache)
+        year = datetime.now().year + 1
+
+        client.get_weekly_results(year=year, week=1)
+        client.get_weekly_results(year=year, week=1)
+
+        assert len(http) == 2
+        assert cache.get("70985", "weeklyResults", year, 1) is not None
+
+    def test_offline_replays_without_http(self, tmp_path, http):
+        cache = MflResponseCache(tmp_path)
+        year = datetime.now().year
+        MflClient(server="44", league_id="70985", response_cache=cache).get_rules(year)
+        MflClient(server="44", league_id="70985", response_cache=cache).get_nfl_bye_weeks(year)
+        assert len(http) == 2
+
+        offline = MflClient(
+            server="44", league_id="70985", response_cache=cache, offline=True,
+        )
+        assert offline.get_rules(year)[0] == BODY
+        assert offline.get_nfl_bye_weeks(year)[0] == BODY
+        with pytest.raises(OfflineCacheMissError):
+            offline.get_transactions(year)
+        assert len(http) == 2
+
+    def test_offline_requires_cache(self):
+        with pytest.raises(ConfigError):
+            MflClient(server="44", league_id="70985", offline=True)
+
+
+class TestDiscoveryReportRoundtrip:
+    def test_to_dict_from_dict(self):
+        report = DiscoveryReport(league_id="70985", probed_range=(2009, 2024))
+        report.seasons = [
+            SeasonAvailability(
+                season=2009, server="www48.myfantasyleague.com", franchise_count=10,
+                categories=["MATCHUP_RESULTS"], mfl_league_id="50536",
+                raw_franchises=[{"id": "0001", "name": "A"}],
+            ),
+        ]
+        assert DiscoveryReport.from_dict(report.to_dict()) == report
@@ -0,0 +1,190 @@
+"""Tests for Player Score Store v1 (columnar WEEKLY_PLAYER_SCORE rows).
+
+Invariant: the store is the record list the loaders always returned, in
+(season, week, franchise_id, player_id) order; its week, player and
+franchise slices select exactly what the equivalent list scans select.
+"""
+from __future__ import annotations
+
+import json
+import random
+import sqlite3
+from pathlib import Path
+
+import pytest
+
+from squadvault.core.canonicalize.run_canonicalize import canonicalize
+from squadvault.core.recaps.context.franchise_deep_angles_v1 import (
+    _load_season_player_scores_flat,
+)
+from squadvault.core.recaps.context.player_narrative_angles_v1 import (
+    _load_all_seasons_player_scores,
+    _load_season_player_scores,
+)
+from squadvault.core.recaps.context.player_score_store_v1 import (
+    CrossSeasonRecord,
+    PlayerScoreStore,
+    PlayerWeekRecord,
+    StarterWeekColumns,
+    load_player_score_store,
+)
+
+SCHEMA_PATH = Path(__file__).parent.parent / "src" / "squadvault" / "core" / "storage" / "schema.sql"
+LEAGUE = "store_test_league"
+
+
+def _random_records(seed: int) -> list[CrossSeasonRecord]:
+    rng = random.Random(seed)
+    keys = {
+        (rng.randint(2019, 2022), rng.randint(1, 6), f"F{rng.randint(1, 4)}", f"P{rng.randint(1, 20)}")
+        for _ in range(300)
+    }
+    return [
+        CrossSeasonRecord(s, w, f, p, round(rng.uniform(0, 40), 2), rng.random() < 0.6)
+        for s, w, f, p in keys
+    ]
+
+
+class TestPlayerScoreStore:
+    def test_sequence_is_canonical_record_order(self):
+        records = _random_records(1)
+        store = PlayerScoreStore.from_records(records)
+        expected = sorted(records, key=lambda r: (r.season, r.week, r.franchise_id, r.player_id))
+        assert list(store) == expected
+        assert len(store) == len(expected)
+        assert store[0] == expected[0] and store[-1] == expected[-1]
+        assert store[2:5] == expected[2:5]
+        assert store.seasons() == sorted({r.season for r in records})
+
+    def test_slices_match_list_scans(self):
+        records = list(PlayerScoreStore.from_records(_random_records(2)))
+        store = PlayerScoreStore.from_records(records)
+        for season in (2018, 2019, 2021, 2023):
+            assert [r for r in records if r.season == season] == store.records(store.season_rows(season))
+            for week in (1, 3, 6):
+                key = (season, week)
+                assert store.records(store.week_rows(season, week)) == [
+                    r for r in records if (r.season, r.week) == key
+                ]
+                assert store.records(store.rows_before(season, week)) == [
+                    r for r in records if (r.season, r.week) < key
+                ]
+                assert store.records(store.rows_through(season, week)) == [
+                    r for r in records if (r.season, r.week) <= key
+                ]
+        for pid in ("P1", "P7", "P99"):
+            assert store.records(store.player_rows(pid)) == [r for r in records if r.player_id == pid]
+        for fid in ("F2", "F9"):
+            assert store.records(store.franchise_rows(fid)) == [r for r in records if r.franchise_id == fid]
+
+    def test_empty_store(self):
+        store = PlayerScoreStore([])
+        assert list(store) == []
+        assert store.seasons() == []
+        assert store.week_rows(2024, 1) == range(0)
+        assert store.player_rows("P1") == ()
+        with pytest.raises(IndexError):
+            store[0]
+
+
+def _trailing_run_by_week_map(records, key, through_week, threshold, below):
+    week_score = {
+        r.week: r.score for r in sorted(records, key=lambda r: r.week)
+        if (r.franchise_id, r.player_id) == key and r.is_starter and r.week <= through_week
+    }
+    run, week = 0, through_week
+    while week >= 1 and week in week_score and (
+        week_score[week] < threshold if below else week_score[week] >= threshold
+    ):
+        run, week = run + 1, week - 1
+    return run
+
+
+class TestStarterWeekColumns:
+    def test_trailing_runs_match_week_map_walk(self):
+        rng = random.Random(12)
+        for _ in range(200):
+            records = [
+                PlayerWeekRecord(rng.randint(0, 8), f"F{rng.randint(1, 2)}", f"P{rng.randint(1, 4)}",
+                                 rng.choice([2.0, 30.0, rng.uniform(0, 40)]), rng.random() < 0.8)
+                for _ in range(rng.randint(0, 40))
+            ]
+            through = rng.randint(1, 8)
+            columns = StarterWeekColumns(records, through)
+            for below, threshold in ((False, 25.0), (True, 8.0)):
+                runs = columns.trailing_runs(threshold, below=below)
+                assert list(runs) == [
+                    _trailing_run_by_week_map(records, key, through, threshold, below)
+                    for key in columns.keys
+                ]
+
+    def test_duplicate_weeks(self):
+        records = [
+            PlayerWeekRecord(2, "F1", "P1", 30.0, True),
+            PlayerWeekRecord(3, "F1", "P1", 31.0, True),
+            PlayerWeekRecord(3, "F1", "P1", 3.0, True),
+            PlayerWeekRecord(1, "F1", "P1", 40.0, True),
+            PlayerWeekRecord(3, "F1", "P2", 9.0, False),
+        ]
+        columns = StarterWeekColumns(records, 3)
+        assert columns.keys == [("F1", "P1")]
+        assert list(columns.trailing_runs(25.0)) == [0]  # last week-3 row decides
+        assert columns.latest_score(0) == 3.0
+        assert columns.recent_starts(0, 2) == (31.0, [30.0, 40.0])
+        assert StarterWeekColumns(records, 4).recent_starts(0, 2) is None
+        assert columns.best_this_week == records[1]
+        assert columns.prior_best == 40.0
+        assert StarterWeekColumns(records, 1).prior_best is None
+
+
+class TestLoadPlayerScoreStore:
+    @pytest.fixture
+    def db(self, tmp_path):
+        db_path = str(tmp_path / "store.sqlite")
+        con = sqlite3.connect(db_path)
+        con.executescript(SCHEMA_PATH.read_text())
+        payloads = [
+            (2023, {"week": 17, "franchise_id": "F02", "player_id": "P9", "score": "41.5", "is_starter": True}),
+            (2024, {"week": "2", "franchise_id": "F01", "player_id": "P1", "score": 12.0,
+                    "is_starter": False, "should_start": True}),
+            (2024, {"week": 1, "franchise_id": "F01", "player_id": "P1", "score": 20.25, "is_starter": True}),
+            (2024, {"week": 1, "franchise_id": "F01", "player_id": "P2"}),
+            (2024, {"week": 0, "franchise_id": "F01", "player_id": "P3", "score": 5.0}),
+            (2024, {"week": 1, "franchise_id": "", "player_id": "P4", "score": 5.0}),
+        ]
+        for i, (season, payload) in enumerate(payloads):
+            con.execute(
+                """INSERT INTO memory_events
+                   (league_id, season, external_source, external_id,
+                    event_type, occurred_at, ingested_at, payload_json)
+                   VALUES (?, ?, 'test', ?, 'WEEKLY_PLAYER_SCORE',
+                           '2024-10-01T12:00:00Z', '2024-10-01T13:00:00Z', ?)""",
+                (LEAGUE, season, f"wps_{i}", json.dumps(payload)),
+            )
+        con.commit()
+        con.close()
+        for season in (2023, 2024):
+            canonicalize(league_id=LEAGUE, season=season, db_path=db_path)
+        return db_path
+
+    def test_loads_typed_rows(self, db):
+        store = load_player_score_store(db, LEAGUE)
+        assert list(store) == [
+            CrossSeasonRecord(2023, 17, "F02", "P9", 41.5, True),
+            CrossSeasonRecord(2024, 1, "F01", "P1", 20.25, True),
+            CrossSeasonRecord(2024, 1, "F01", "P2", 0.0, False),
+            CrossSeasonRecord(2024, 2, "F01", "P1", 12.0, False),
+        ]
+        assert _load_all_seasons_player_scores(db, LEAGUE) == list(store)
+        assert len(load_player_score_store(db, LEAGUE, season=2023)) == 1
+
+    def test_season_views(self, db):
+        records = _load_season_player_scores(db, LEAGUE, 2024)
+        assert [(r.week, r.player_id, r.score) for r in records] == [
+            (1, "P1", 20.25), (1, "P2", 0.0), (2, "P1", 12.0),
+        ]
+        payloads = _load_season_player_scores_flat(db, LEAGUE, 2024)
+        assert payloads[-1] == {
+            "week": 2, "franchise_id": "F01", "player_id": "P1", "score": 12.0,
+            "is_starter": False, "should_start": True,
+        }
@@ -0,0 +1,235 @@
+"""Tests for Prompt Context Cache v1 (persisted prompt context per week).
+
+Invariants: prepare never writes; the write stage stores a freshly derived
+context; a later prepare with the same key serves it without re-deriving;
+any change to the ledger, governed rows or selection is a different key,
+and every module the context code imports is hashed into the code version.
+"""
+from __future__ import annotations
+
+import ast
+import json
+import sqlite3
+from pathlib import Path
+
+import pytest
+
+import squadvault
+from squadvault.core.canonicalize.run_canonicalize import canonicalize
+from squadvault.core.recaps.context.narrative_angles_v1 import NarrativeAngle
+from squadvault.core.recaps.recap_runs import RecapRunRecord, upsert_recap_run
+from squadvault.core.recaps.selection.weekly_selection_v1 import (
+    select_weekly_recap_events_v1,
+)
+from squadvault.core.storage.migrate import init_and_migrate
+from squadvault.core.storage.sqlite_store import SQLiteStore
+from squadvault.recaps import weekly_recap_lifecycle
+from squadvault.recaps.prompt_context_cache_v1 import (
+    _CODE_PATHS,
+    prompt_context_cache_key,
+)
+from squadvault.recaps.weekly_recap_lifecycle import (
+    _PromptContext,
+    draft_weekly_recap_narrative,
+    prepare_weekly_recap_draft,
+    write_weekly_recap_draft,
+)
+
+LEAGUE = "ctx_cache_league"
+SEASON = 2024
+
+# Modules the hashed code imports that cannot change the context text:
+# connection plumbing, and the lifecycle's other stages (write, creative,
+# verification, tracing), which never run inside _derive_prompt_context.
+_NOT_CONTEXT_SHAPING = {
+    "squadvault.core.storage.db_utils",
+    "squadvault.core.storage.session",
+    "squadvault.errors",
+    "squadvault.ai.creative_layer_v1",
+    "squadvault.core.eal.consume_v1",
+    "squadvault.core.eal.editorial_attunement_v1",
+    "squadvault.core.recaps.recap_artifacts",
+    "squadvault.core.recaps.recap_runs",
+    "squadvault.core.recaps.render.deterministic_bullets_v1",
+    "squadvault.core.recaps.render.presentation_lint_v1",
+    "squadvault.core.recaps.render.render_recap_text_v1",
+    "squadvault.core.recaps.verification.recap_verifier_v1",
+    "squadvault.recaps.lifecycle_trace_v1",
+    "squadvault.recaps.preflight",
+    "squadvault.recaps.prompt_context_cache_v1",
+    "squadvault.recaps.writing_room.prompt_audit_v1",
+}
+
+
+def _event(uid, event_type, ts, payload):
+    return {
+        "league_id": LEAGUE, "season": SEASON, "external_source": "ctx_cache_test",
+        "external_id": uid, "event_type": event_type, "occurred_at": ts, "payload": payload,
+    }
+
+
+def _add_week(db_path, week, winner_score):
+    day = 6 + 7 * (week - 1)
+    SQLiteStore(db_path=Path(db_path)).append_events([
+        _event(f"lock{week}", "TRANSACTION_LOCK_ALL_PLAYERS", f"2024-09-{day - 1:02d}T12:00:00Z",
+               {"type": "LOCK_ALL_PLAYERS", "week": week}),
+        _event(f"lock{week + 1}", "TRANSACTION_LOCK_ALL_PLAYERS", f"2024-09-{day + 6:02d}T12:00:00Z",
+               {"type": "LOCK_ALL_PLAYERS", "week": week + 1}),
+        _event(f"m{week}", "WEEKLY_MATCHUP_RESULT", f"2024-09-{day:02d}T10:00:00Z", {
+            "week": week, "winner_franchise_id": "0001", "loser_franchise_id": "0002",
+            "winner_score": winner_score, "loser_score": "99.00", "is_tie": False,
+        }),
+    ])
+    canonicalize(league_id=LEAGUE, season=SEASON, db_path=db_path)
+    sel = select_weekly_recap_events_v1(
+        db_path=db_path, league_id=LEAGUE, season=SEASON, week_index=week,
+    )
+    upsert_recap_run(db_path, RecapRunRecord(
+        league_id=LEAGUE, season=SEASON, week_index=week, state="ELIGIBLE",
+        window_mode=sel.window.mode, window_start=sel.window.window_start,
+        window_end=sel.window.window_end, selection_fingerprint=sel.fingerprint,
+        canonical_ids=[str(c) for c in sel.canonical_ids], counts_by_type=sel.counts_by_type,
+    ))
+
+
+@pytest.fixture
+def db(tmp_path):
+    db_path = str(tmp_path / "ctx_cache.sqlite")
+    init_and_migrate(db_path)
+    _add_week(db_path, 1, "121.50")
+    return db_path
+
+
+@pytest.fixture
+def derivations(monkeypatch):
+    calls = []
+    real = weekly_recap_lifecycle._derive_prompt_context
+
+    def _counting(**kwargs):
+        calls.append(kwargs["week_index"])
+        return real(**kwargs)
+
+    monkeypatch.setattr(weekly_recap_lifecycle, "_derive_prompt_context", _counting)
+    return calls
+
+
+def _cache_rows(db_path):
+    con = sqlite3.connect(db_path)
+    rows = con.execute(
+        "SELECT week_index, cache_key FROM prompt_context_cache ORDER BY week_index"
+    ).fetchall()
+    con.close()
+    return rows
+
+
+def _prepare(db_path, week=1):
+    return prepare_weekly_recap_draft(
+        db_path=db_path, league_id=LEAGUE, season=SEASON, week_index=week,
+    )
+
+
+def _write(prepared):
+    write_weekly_recap_draft(
+        prepared, draft_weekly_recap_narrative(prepared), reason="test", force=True,
+    )
+
+
+class TestPromptContextCache:
+    def test_write_stores_and_prepare_serves(self, db, derivations):
+        first = _prepare(db)
+        assert not first.prompt_context_cached
+        assert _cache_rows(db) == []
+        _write(first)
+        assert _cache_rows(db) == [(1, first.prompt_context_key)]
+
+        second = _prepare(db)
+        assert second.prompt_context_cached
+        assert second.prompt_context == first.prompt_context
+        assert derivations == [1]
+
+    def test_ledger_change_invalidates(self, db, derivations):
+        first = _prepare(db)
+        _write(first)
+        _add_week(db, 2, "130.00")
+        again = _prepare(db)
+        assert again.prompt_context_key != first.prompt_context_key
+        assert not again.prompt_context_cached
+        assert derivations == [1, 1]
+        _write(again)
+        assert _cache_rows(db) == [(1, again.prompt_context_key)]
+
+    def test_key_covers_governed_rows_and_selection(self, db):
+        key = dict(
+            db_path=db, league_id=LEAGUE, season=SEASON, week_index=1,
+            selection_fingerprint="abc", window_end="2024-09-12T12:00:00Z",
+        )
+        base = prompt_context_cache_key(**key)
+        assert prompt_context_cache_key(**key) == base
+        assert prompt_context_cache_key(**{**key, "selection_fingerprint": "abd"}) != base
+        con = sqlite3.connect(db)
+        con.execute(
+            "INSERT INTO league_tone_profiles (league_id, tone_preset, set_by, created_at)"
+            " VALUES (?, 'POINTED', 'test', '2024-09-01T00:00:00Z')",
+            (LEAGUE,),
+        )
+        con.commit()
+        con.close()
+        assert prompt_context_cache_key(**key) != base
+
+
+    def test_changed_table_shape_is_never_keyed(self, db):
+        key = dict(
+            db_path=db, league_id=LEAGUE, season=SEASON, week_index=1,
+            selection_fingerprint="abc", window_end="2024-09-12T12:00:00Z",
+        )
+        base = prompt_context_cache_key(**key)
+        con = sqlite3.connect(db)
+        con.execute("DROP TABLE nfl_bye_weeks")
+        con.commit()
+        assert prompt_context_cache_key(**key) == base  # no such table: no rows
+        con.execute("ALTER TABLE league_voice_profiles RENAME COLUMN profile_text TO voice_text")
+        con.commit()
+        con.close()
+        assert prompt_context_cache_key(**key) is None
+
+
+def _squadvault_imports(path):
+    """Every squadvault module path imports, lazy imports included."""
+    found = set()
+    for node in ast.walk(ast.parse(path.read_text(encoding="utf-8"))):
+        if isinstance(node, ast.ImportFrom) and node.module:
+            found.add(node.module)
+        elif isinstance(node, ast.Import):
+            found.update(alias.name for alias in node.names)
+    return {m for m in found if m.split(".")[0] == "squadvault"}
+
+
+def test_code_version_hashes_every_imported_context_module():
+    root = Path(squadvault.__file__).parent
+    hashed = set()
+    for rel in _CODE_PATHS:
+        path = root / rel
+        hashed.update(sorted(path.glob("*.py")) if path.is_dir() else [path])
+    assert all(f.exists() for f in hashed)
+
+    unhashed = set()
+    for f in hashed:
+        for module in _squadvault_imports(f) - _NOT_CONTEXT_SHAPING:
+            rel = Path(*module.split(".")[1:])
+            target = root / rel.with_suffix(".py")
+            if not target.exists():
+                target = root / rel / "__init__.py"
+            if target not in hashed:
+                unhashed.add(module)
+    assert unhashed == set()
+
+
+def test_prompt_context_json_round_trip():
+    angle = NarrativeAngle("UPSET", "Underdog wins", "by 3", 2, ("0001", "0002"))
+    ctx = _PromptContext(
+        season_context_text="s", league_history_text="h", narrative_angles_text="n",
+        writer_room_text="w", player_highlights_text="p", manager_identity_text="m",
+        tone_preset="dry", voice_profile="", seasons_count=3,
+        all_angles=[angle], budgeted=[angle],
+    )
+    assert _PromptContext.from_json(json.loads(json.dumps(ctx.to_json()))) == ctx
@@ -14,10 +14,15 @@ from __future__ import annotations
 import json
 import os
 import sqlite3
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 
 import pytest
 
 from squadvault.core.recaps.verification.recap_verifier_v1 import (
+    VerificationFactCache,
+    VerificationFactSnapshot,
     VerificationFailure,
     VerificationResult,
     _build_reverse_name_map,
@@ -32,6 +37,7 @@ from squadvault.core.recaps.verification.recap_verifier_v1 import (
     verify_cross_week_consistency,
     verify_faab_claims,
     verify_player_franchise,
+    verify_player_scores,
     verify_recap_v1,
     verify_record_claim_anchoring,
     verify_scores,
@@ -7224,3 +7230,221 @@ class TestFaabClaimUnitF1Adversarial:
             f"DEF passes), got {[(f.claim, f.evidence) for f in faab]}"
         )
         assert "$39" in faab[0].claim
+
+
+# ── VerificationFactSnapshot: shared per-pass fact loading ──────────
+
+
+class TestVerificationFactSnapshot:
+    """verify_recap_v1 loads each canonical fact once, over one connection."""
+
+    def _build_db(self, tmp_path):
+        db_path = _fresh_db(tmp_path)
+        con = sqlite3.connect(db_path)
+        _insert_franchise(con, league_id=LEAGUE, season=SEASON,
+                          franchise_id="F1", name="Alpha Team")
+        _insert_franchise(con, league_id=LEAGUE, season=SEASON,
+                          franchise_id="F2", name="Beta Squad")
+        for week, score in ((1, 24.10), (2, 26.40), (3, 31.25)):
+            _insert_matchup(con, league_id=LEAGUE, season=SEASON, week=week,
+                            winner_id="F1", loser_id="F2",
+                            winner_score=120.50 + week, loser_score=100.20)
+            _insert_player_score(con, league_id=LEAGUE, season=SEASON, week=week,
+                                 franchise_id="F1", player_id="P1", score=score)
+        _f1_player(con, season=SEASON, player_id="P1", name="Allen, Josh", position="QB")
+        _insert_faab_bid(con, league_id=LEAGUE, season=SEASON, franchise_id="F1",
+                         player_id="P1", bid_amount=12)
+        con.commit()
+        con.close()
+        return db_path
+
+    _TEXT = (
+        "--- SHAREABLE RECAP ---\n"
+        "Alpha Team beat Beta Squad 123.50 to 100.20. Josh Allen scored "
+        "31.25 for Alpha Team, averaging 27.25 points, his third straight "
+        "20+ point game since the $12 waiver claim.\n"
+        "--- END SHAREABLE RECAP ---\n"
+    )
+
+    def test_pipeline_uses_one_connection(self, tmp_path, monkeypatch):
+        db_path = self._build_db(tmp_path)
+        opened = []
+        real_connect = sqlite3.connect
+
+        def counting_connect(*args, **kwargs):
+            opened.append(args)
+            return real_connect(*args, **kwargs)
+
+        monkeypatch.setattr(sqlite3, "connect", counting_connect)
+        result = verify_recap_v1(self._TEXT, db_path=db_path, league_id=LEAGUE,
+                                 season=SEASON, week=3)
+        assert result.passed is True, result.hard_failures
+        assert len(opened) == 1
+
+    def test_shared_facts_are_loaded_once(self, tmp_path):
+        db_path = self._build_db(tmp_path)
+        with VerificationFactSnapshot(db_path, LEAGUE, SEASON, 3) as facts:
+            first = facts.player_name_map()
+            assert facts.player_name_map() is first
+            verify_player_scores(self._TEXT, db_path=db_path, league_id=LEAGUE,
+                                 season=SEASON, week=3, facts=facts)
+            verify_player_avg_claims(self._TEXT, db_path=db_path, league_id=LEAGUE,
+                                     season=SEASON, week=3, facts=facts)
+        assert facts.player_name_map() is first
+        assert set(facts.load_timings) == {
+            "player_name_map", "week_player_scores", "player_all_season_scores",
+            "season_matchups", "player_season_averages",
+        }
+
+    def test_checks_without_claims_load_nothing(self, tmp_path):
+        db_path = self._build_db(tmp_path)
+        text = "Alpha Team rolled again; nobody on Beta Squad showed up."
+        facts = VerificationFactSnapshot(db_path, LEAGUE, SEASON, 3)
+        for check in (verify_player_scores, verify_player_avg_claims,
+                      verify_player_scoring_streaks):
+            assert check(text, db_path=db_path, league_id=LEAGUE, season=SEASON,
+                         week=3, facts=facts) == []
+        assert verify_faab_claims(text, db_path=db_path, league_id=LEAGUE,
+                                  season=SEASON, facts=facts) == []
+        assert facts.load_timings == {}
+
+    def test_results_and_timings(self, tmp_path):
+        db_path = self._build_db(tmp_path)
+        wrong = self._TEXT.replace("third straight", "fifth straight")
+        shared = verify_recap_v1(wrong, db_path=db_path, league_id=LEAGUE,
+                                 season=SEASON, week=3)
+        standalone = verify_player_scoring_streaks(
+            wrong, db_path=db_path, league_id=LEAGUE, season=SEASON, week=3,
+        )
+        assert len(standalone) == 1
+        assert [f for f in shared.hard_failures
+                if f.category == "PLAYER_STREAK_CLAIM"] == standalone
+        names = [name for name, _ in shared.check_timings]
+        assert len(names) == shared.checks_run
+        assert names[0] == "SCORE" and "PLAYER_STREAK_CLAIM" in names
+        assert all(seconds >= 0 for _, seconds in shared.check_timings)
+        # Timings are diagnostic and never affect result equality.
+        again = verify_recap_v1(wrong, db_path=db_path, league_id=LEAGUE,
+                                season=SEASON, week=3)
+        assert again == shared
+
+
+# ── VerificationFactCache: facts reused across passes until the ledger moves ──
+
+
+class TestVerificationFactCache:
+    """Repeat verifications of a week reuse facts; ledger changes invalidate."""
+
+    def _build_db(self, tmp_path):
+        db_path = _fresh_db(tmp_path)
+        con = sqlite3.connect(db_path)
+        _insert_franchise(con, league_id=LEAGUE, season=SEASON,
+                          franchise_id="F1", name="Alpha Team")
+        _insert_franchise(con, league_id=LEAGUE, season=SEASON,
+                          franchise_id="F2", name="Beta Squad")
+        for week in (1, 2, 3):
+            _insert_matchup(con, league_id=LEAGUE, season=SEASON, week=week,
+                            winner_id="F1", loser_id="F2",
+                            winner_score=110.00 + week, loser_score=90.00)
+        con.commit()
+        con.close()
+        return db_path
+
+    @staticmethod
+    def _recap(score):
+        return (
+            "--- SHAREABLE RECAP ---\n"
+            f"Alpha Team beat Beta Squad {score:.2f} to 90.00, their third "
+            "straight win in the all-time series.\n"
+            "--- END SHAREABLE RECAP ---\n"
+        )
+
+    def _verify(self, db_path, cache, week=3, score=113.00):
+        return verify_recap_v1(self._recap(score), db_path=db_path, league_id=LEAGUE,
+                               season=SEASON, week=week, fact_cache=cache)
+
+    def test_repeat_verification_reuses_facts(self, tmp_path):
+        db_path = self._build_db(tmp_path)
+        cache = VerificationFactCache()
+        first = self._verify(db_path, cache)
+        with cache.snapshot(db_path, LEAGUE, SEASON, 3) as facts:
+            streaks = facts.streaks(3)
+            series = facts.series_records()
+            assert facts.load_timings == {}
+        second = self._verify(db_path, cache)
+
+        assert first == second and first.passed
+        assert (cache.hits, cache.misses, cache.stale) == (2, 1, 0)
+        assert streaks == {"F1": 3, "F2": -3}
+        assert series[frozenset({"F1", "F2"})][:3] == (3, 0, 0)
+
+    def test_canonical_repoint_invalidates_entry(self, tmp_path):
+        db_path = self._build_db(tmp_path)
+        cache = VerificationFactCache()
+        assert self._verify(db_path, cache, score=113.00).passed
+
+        # A corrected week-3 result folds in: the canonical row is repointed
+        # at a new ledger event, exactly as an incremental canonicalize does.
+        con = sqlite3.connect(db_path)
+        payload = json.dumps({
+            "week": 3, "winner_franchise_id": "F1", "loser_franchise_id": "F2",
+            "winner_score": "125.00", "loser_score": "90.00", "is_tie": False,
+        })
+        con.execute(
+            """INSERT INTO memory_events (league_id, season, external_source, external_id,
+               event_type, occurred_at, ingested_at, payload_json)
+               VALUES (?, ?, 'test', 'm_corrected', 'WEEKLY_MATCHUP_RESULT',
+                       '2024-10-03T12:00:00Z', '2024-10-04T12:00:00Z', ?)""",
+            (LEAGUE, SEASON, payload))
+        con.execute(
+            """UPDATE canonical_events
+               SET best_memory_event_id = last_insert_rowid(), updated_at = '2024-10-04T12:00:00Z'
+               WHERE action_fingerprint = ?""",
+            (f"fp_m_{LEAGUE}_{SEASON}_3_F1_F2",))
+        con.commit()
+        con.close()
+
+        assert not self._verify(db_path, cache, score=113.00).passed
+        assert self._verify(db_path, cache, score=125.00).passed
+        assert cache.stale == 1
+
+    def test_lru_eviction_and_disabled_cache(self, tmp_path):
+        db_path = self._build_db(tmp_path)
+        cache = VerificationFactCache(max_entries=2)
+        for week in (1, 2, 3):
+            self._verify(db_path, cache, week=week)
+        assert len(cache) == 2
+        self._verify(db_path, cache, week=1)
+        assert cache.hits == 0 and cache.misses == 4
+
+        off = VerificationFactCache(max_entries=0)
+        self._verify(db_path, off)
+        self._verify(db_path, off)
+        assert len(off) == 0 and off.hits == 0
+
+    def test_concurrent_lookups_and_evictions(self, tmp_path):
+        """Threads racing hits, stale drops and evictions keep the LRU intact."""
+
+        class YieldingLRU(OrderedDict):
+            # Hand the GIL over between each step of a lookup, so unguarded
+            # get / move_to_end / del sequences interleave across threads.
+            def get(self, *args):
+                time.sleep(0)
+                return super().get(*args)
+
+            def move_to_end(self, *args, **kwargs):
+                time.sleep(0)
+                return super().move_to_end(*args, **kwargs)
+
+        db_path = self._build_db(tmp_path)
+        cache = VerificationFactCache(max_entries=2)
+        cache._entries = YieldingLRU()
+        with ThreadPoolExecutor(max_workers=8) as pool:
+            list(pool.map(
+                lambda i: cache._entry(("db", LEAGUE, SEASON, i % 3), (i % 2,)),
+                range(4000),
+            ))
+            results = list(pool.map(lambda _: self._verify(db_path, cache), range(24)))
+        assert len(cache) == 2
+        assert cache.hits + cache.misses == 4000 + len(results)
+        assert all(r.passed for r in results)
@@ -0,0 +1,108 @@
+"""Tests for the season lock index and batch weekly selection.
+
+Invariants: season_windows and select_season_recap_events_v1 return exactly
+what the per-week calls return (including the week-keyed fallback and
+season_end capping); the lock index serves repeat lookups and picks up a
+lock added by canonicalize.
+"""
+from __future__ import annotations
+
+import io
+from contextlib import redirect_stdout
+from pathlib import Path
+
+import pytest
+
+from squadvault.core.canonicalize.run_canonicalize import canonicalize
+from squadvault.core.recaps.selection.weekly_selection_v1 import (
+    select_season_recap_events_v1,
+    select_weekly_recap_events_v1,
+)
+from squadvault.core.recaps.selection.weekly_windows_v1 import (
+    LOCK_EVENT_TYPE,
+    lock_index_cache,
+    season_windows,
+    window_for_week_index,
+)
+from squadvault.core.storage.migrate import init_and_migrate
+from squadvault.core.storage.session import DatabaseSession
+from squadvault.core.storage.sqlite_store import SQLiteStore
+from squadvault.testing.synthetic_league_v1 import SyntheticLeagueSpec, build_synthetic_league
+
+SPEC = SyntheticLeagueSpec(
+    league_id="BATCH", teams=4, seasons=1, regular_weeks=4, playoff_weeks=1,
+    roster_size=6, starters=3, faab_claims_per_week=1, free_agent_moves_per_week=1,
+    trades_per_season=1, seed=11,
+)
+SEASON = SPEC.last_season
+WEEKS = range(0, SPEC.weeks + 3)
+
+
+@pytest.fixture()
+def db(tmp_path):
+    db_path = str(tmp_path / "batch.sqlite")
+    init_and_migrate(db_path)
+    with redirect_stdout(io.StringIO()):
+        build_synthetic_league(db_path, SPEC)
+    return db_path
+
+
+def _per_week(db_path, **kwargs):
+    return [
+        select_weekly_recap_events_v1(db_path, SPEC.league_id, SEASON, w, **kwargs)
+        for w in WEEKS
+    ]
+
+
+@pytest.mark.parametrize("season_end", [None, "2026-01-20T00:00:00Z"])
+def test_batch_matches_per_week(db, season_end):
+    batch = select_season_recap_events_v1(
+        db, SPEC.league_id, SEASON, weeks=WEEKS, season_end=season_end,
+    )
+    assert batch == _per_week(db, season_end=season_end)
+    assert any(sel.canonical_ids for sel in batch)
+    windows = season_windows(db, SPEC.league_id, SEASON, weeks=WEEKS, season_end=season_end)
+    assert windows == [
+        window_for_week_index(db, SPEC.league_id, SEASON, w, season_end=season_end) for w in WEEKS
+    ]
+
+
+def test_batch_matches_week_keyed_fallback(db):
+    with DatabaseSession(db) as con:
+        con.execute(
+            "UPDATE canonical_events SET occurred_at = NULL WHERE event_type = 'WEEKLY_MATCHUP_RESULT'"
+        )
+    batch = select_season_recap_events_v1(db, SPEC.league_id, SEASON, weeks=WEEKS)
+    assert batch == _per_week(db)
+    assert batch[1].counts_by_type["WEEKLY_MATCHUP_RESULT"] == SPEC.teams // 2
+
+
+def test_default_weeks_are_lock_weeks(db):
+    batch = select_season_recap_events_v1(db, SPEC.league_id, SEASON)
+    with DatabaseSession(db) as con:
+        locks = con.execute(
+            "SELECT COUNT(DISTINCT occurred_at) FROM canonical_events WHERE season = ? AND event_type = ?",
+            (SEASON, LOCK_EVENT_TYPE),
+        ).fetchone()[0]
+    assert [sel.week_index for sel in batch] == list(range(1, locks + 1))
+
+
+def test_lock_index_serves_repeats_and_sees_new_locks(db):
+    index = lock_index_cache()
+    index.clear()
+    last = window_for_week_index(db, SPEC.league_id, SEASON, SPEC.weeks + 1)
+    assert last.mode == "LOCK_PLUS_7D_CAP"
+    season_windows(db, SPEC.league_id, SEASON)
+    assert (index.misses, index.hits) == (1, 1)
+
+    SQLiteStore(db_path=Path(db)).append_events([{
+        "league_id": SPEC.league_id, "season": SEASON, "external_source": "test",
+        "external_id": "late_lock", "event_type": LOCK_EVENT_TYPE,
+        "occurred_at": "2026-02-01T18:00:00Z", "payload": {"type": "LOCK_ALL_PLAYERS"},
+    }])
+    with redirect_stdout(io.StringIO()):
+        canonicalize(league_id=SPEC.league_id, season=SEASON, db_path=db)
+    relocked = window_for_week_index(db, SPEC.league_id, SEASON, SPEC.weeks + 1)
+    assert relocked.mode == "LOCK_TO_LOCK"
+    assert relocked.window_end == "2026-02-01T18:00:00Z"
+    assert index.stale == 1
@@ -5,6 +5,7 @@ event_queries filter functions.
 """
 from __future__ import annotations
 
+import sqlite3
 from pathlib import Path
 
 import pytest
@@ -78,6 +79,37 @@ class TestSQLiteStore:
         inserted, _ = store.append_events(events)
         assert inserted == 3
 
+    def test_bulk_append_counts_and_single_ingested_at(self, store, monkeypatch):
+        """Chunked bulk append skips in-batch and stored duplicates, one ingested_at."""
+        monkeypatch.setattr("squadvault.core.storage.sqlite_store.APPEND_CHUNK_SIZE", 2)
+        store.append_events([_event("DRAFT_PICK", "e1")])
+        batch = [_event("DRAFT_PICK", f"e{i}") for i in range(1, 6)] + [_event("DRAFT_PICK", "e3")]
+        inserted, skipped = store.append_events(iter(batch))
+        assert (inserted, skipped) == (4, 2)
+        events = store.fetch_events(league_id=LEAGUE, season=SEASON, use_canonical=False)
+        assert len(events) == 5
+        assert len({e["ingested_at"] for e in events[1:]}) == 1
+
+    def test_duplicate_probe_fits_old_variable_limit(self, store):
+        """A full chunk re-ingests under the pre-3.32 limit of 999 bound parameters."""
+
+        class LimitedStore(SQLiteStore):
+            def connect(self):
+                conn = super().connect()
+                conn.setlimit(sqlite3.SQLITE_LIMIT_VARIABLE_NUMBER, 999)
+                return conn
+
+        limited = LimitedStore(db_path=store.db_path)
+        batch = [_event("DRAFT_PICK", f"e{i}") for i in range(2500)]
+        assert limited.append_events(batch) == (2500, 0)
+        assert limited.append_events(batch) == (0, 2500)
+
+    def test_constraint_violation_is_skipped(self, store):
+        """A row violating NOT NULL is skipped like a duplicate, not raised."""
+        bad = {**_event("DRAFT_PICK", "e2"), "external_id": None}
+        inserted, skipped = store.append_events([_event("DRAFT_PICK", "e1"), bad])
+        assert (inserted, skipped) == (1, 1)
+
     def test_fetch_respects_league_season(self, store):
         """Fetch filters by league_id and season."""
         store.append_events([_event("DRAFT_PICK", "e1")])
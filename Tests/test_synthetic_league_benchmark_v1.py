@@ -0,0 +1,75 @@
+"""Tests for the synthetic league generator and the pipeline benchmark harness.
+
+Invariants: one spec always yields the same ledger; envelopes are what the
+real ingest derivations produce; the benchmark times every stage and
+writes a comparable JSON result.
+"""
+from __future__ import annotations
+
+import json
+from collections import Counter
+
+from squadvault.testing.benchmark_v1 import compare_to_baseline, main, run_benchmark
+from squadvault.testing.synthetic_league_v1 import (
+    SyntheticLeagueSpec,
+    synthesize_league_events,
+)
+
+SMALL = SyntheticLeagueSpec(
+    league_id="SYN_T", teams=4, seasons=2, regular_weeks=3, playoff_weeks=1,
+    roster_size=8, starters=4, faab_claims_per_week=1, free_agent_moves_per_week=1,
+    trades_per_season=1, seed=7,
+)
+
+
+class TestSyntheticLeague:
+    def test_deterministic_per_seed(self):
+        first = list(synthesize_league_events(SMALL))
+        assert first == list(synthesize_league_events(SMALL))
+        other = SyntheticLeagueSpec(**{**SMALL.__dict__, "seed": 8})
+        assert first != list(synthesize_league_events(other))
+
+    def test_covers_every_event_family_in_mfl_shape(self):
+        events = list(synthesize_league_events(SMALL))
+        by_type = Counter(e["event_type"] for e in events)
+        weeks = SMALL.weeks * SMALL.seasons
+        assert by_type["DRAFT_PICK"] == SMALL.teams * SMALL.roster_size * SMALL.seasons
+        assert by_type["TRANSACTION_LOCK_ALL_PLAYERS"] == weeks + SMALL.seasons
+        assert by_type["WAIVER_BID_AWARDED"] == weeks
+        assert by_type["TRANSACTION_FREE_AGENT"] == weeks
+        assert by_type["TRANSACTION_TRADE"] == SMALL.seasons
+        # Four teams: two games every regular week, a two-game playoff round.
+        assert by_type["WEEKLY_MATCHUP_RESULT"] == (2 * SMALL.regular_weeks + 2) * SMALL.seasons
+        assert by_type["WEEKLY_PLAYER_SCORE"] > 0
+        assert {e["external_source"] for e in events} == {"MFL"}
+        assert len({e["external_id"] for e in events}) == len(events)
+        trade = next(e for e in events if e["event_type"] == "TRANSACTION_TRADE")
+        assert len(trade["payload"]["trade_franchise_a_gave_up"]) == 1
+
+
+class TestBenchmark:
+    def test_times_every_stage(self, tmp_path):
+        result = run_benchmark(SMALL, db_path=str(tmp_path / "b.sqlite"))
+        assert result["schema"] == "squadvault.benchmark.v1"
+        stages = result["stages"]
+        assert stages["canonicalize"]["count"] == SMALL.seasons
+        assert stages["select_weekly_recap_events_v1"]["count"] == SMALL.weeks * SMALL.seasons
+        assert stages["select_season_recap_events_v1"]["count"] == SMALL.seasons
+        assert stages["derive_prompt_context"]["count"] == SMALL.weeks
+        assert stages["verify_recap_v1"]["count"] == SMALL.weeks
+        assert result["counts"]["memory_events"] == result["counts"]["canonical_events"]
+        assert result["counts"]["verify_hard_failures"] == 0
+
+    def test_cli_writes_json_and_compares(self, tmp_path, capsys):
+        out = tmp_path / "bench.json"
+        argv = ["--league-id", "SYN_T", "--teams", "4", "--seasons", "1",
+                "--regular-weeks", "2", "--playoff-weeks", "0", "--roster-size", "6",
+                "--starters", "3", "--derive-seasons", "0", "--out", str(out)]
+        assert main(argv) == 0
+        first = json.loads(out.read_text())
+        assert "derive_prompt_context" not in first["stages"]
+        assert main([*argv, "--baseline", str(out)]) == 0
+        second = json.loads(out.read_text())
+        assert set(second["baseline_ratio"]) == set(second["stages"])
+        assert compare_to_baseline(second, {"stages": {}}) == dict.fromkeys(second["stages"])
+        assert "canonicalize" in capsys.readouterr().err
@@ -0,0 +1,237 @@
+"""Tests for Weekly Recap Range v1 (pipelined DRAFT generation for many weeks).
+
+Invariants: a range run writes exactly what serial generate_weekly_recap_draft
+calls write, in week order; creative calls overlap up to the concurrency
+bound and their starts are spaced; one failing week never stops the others.
+"""
+from __future__ import annotations
+
+import shutil
+import sqlite3
+import threading
+from pathlib import Path
+
+import pytest
+
+from squadvault.core.canonicalize.run_canonicalize import canonicalize
+from squadvault.core.recaps.recap_runs import RecapRunRecord, upsert_recap_run
+from squadvault.core.recaps.selection.weekly_selection_v1 import (
+    select_weekly_recap_events_v1,
+)
+from squadvault.core.recaps.verification import recap_verifier_v1
+from squadvault.core.recaps.verification.recap_verifier_v1 import VerificationFactCache
+from squadvault.core.storage.migrate import init_and_migrate
+from squadvault.core.storage.sqlite_store import SQLiteStore
+from squadvault.errors import RecapNotFoundError
+from squadvault.recaps import weekly_recap_lifecycle
+from squadvault.recaps.weekly_recap_lifecycle import generate_weekly_recap_draft
+from squadvault.recaps.weekly_recap_range_v1 import (
+    _CallSpacing,
+    generate_weekly_recap_drafts_v1,
+)
+
+LEAGUE = "range_test_league"
+SEASON = 2024
+WEEKS = (1, 2, 3, 4)
+
+
+def _event(uid, event_type, ts, payload):
+    return {
+        "league_id": LEAGUE, "season": SEASON, "external_source": "range_test",
+        "external_id": uid, "event_type": event_type, "occurred_at": ts, "payload": payload,
+    }
+
+
+@pytest.fixture
+def db(tmp_path):
+    db_path = str(tmp_path / "range.sqlite")
+    init_and_migrate(db_path)
+    events = []
+    for week in range(1, 6):
+        day = 5 + 7 * (week - 1)
+        events.append(_event(f"lock{week}", "TRANSACTION_LOCK_ALL_PLAYERS",
+                             f"2024-09-{day:02d}T12:00:00Z" if day < 31 else f"2024-10-{day - 30:02d}T12:00:00Z",
+                             {"type": "LOCK_ALL_PLAYERS", "week": week}))
+    for week in WEEKS:
+        day = 6 + 7 * (week - 1)
+        ts = f"2024-09-{day:02d}T10:00:00Z"
+        events.append(_event(f"m{week}", "WEEKLY_MATCHUP_RESULT", ts, {
+            "week": week, "winner_franchise_id": "0001", "loser_franchise_id": "0002",
+            "winner_score": f"{120 + week}.50", "loser_score": "99.00", "is_tie": False,
+        }))
+        events.append(_event(f"w{week}", "WAIVER_BID_AWARDED", ts.replace("T10", "T11"), {
+            "franchise_id": "0002", "player_id": f"P{week}", "bid_amount": str(week),
+        }))
+    SQLiteStore(db_path=Path(db_path)).append_events(events)
+    canonicalize(league_id=LEAGUE, season=SEASON, db_path=db_path)
+    for week in WEEKS:
+        sel = select_weekly_recap_events_v1(
+            db_path=db_path, league_id=LEAGUE, season=SEASON, week_index=week,
+        )
+        upsert_recap_run(db_path, RecapRunRecord(
+            league_id=LEAGUE, season=SEASON, week_index=week, state="ELIGIBLE",
+            window_mode=sel.window.mode, window_start=sel.window.window_start,
+            window_end=sel.window.window_end, selection_fingerprint=sel.fingerprint,
+            canonical_ids=[str(c) for c in sel.canonical_ids], counts_by_type=sel.counts_by_type,
+        ))
+    return db_path
+
+
+def _artifacts(db_path):
+    con = sqlite3.connect(db_path)
+    rows = con.execute(
+        """SELECT week_index, version, state, selection_fingerprint, rendered_text
+           FROM recap_artifacts ORDER BY week_index, version"""
+    ).fetchall()
+    runs = con.execute(
+        "SELECT week_index, state, editorial_attunement_v1 FROM recap_runs ORDER BY week_index"
+    ).fetchall()
+    con.close()
+    return rows, runs
+
+
+class _FakeCreative:
+    """Deterministic creative layer; once armed, its next two calls must overlap."""
+
+    def __init__(self):
+        self.calls = []
+        self._armed_at = None
+        self._overlap = threading.Barrier(2, timeout=10)
+        self._lock = threading.Lock()
+
+    def arm(self):
+        self._armed_at = len(self.calls)
+
+    def __call__(self, **kwargs):
+        with self._lock:
+            self.calls.append(kwargs["week_index"])
+            must_overlap = self._armed_at is not None and len(self.calls) - self._armed_at <= 2
+        if must_overlap:
+            self._overlap.wait()
+        return f"The winners put up {120 + kwargs['week_index']}.50 to 99.00."
+
+
+@pytest.fixture
+def fake_creative(monkeypatch):
+    fake = _FakeCreative()
+    monkeypatch.setattr(weekly_recap_lifecycle, "draft_narrative_v1", fake)
+    return fake
+
+
+class TestRangeGeneration:
+    def test_range_matches_serial_generation(self, db, tmp_path, fake_creative):
+        serial_db = str(tmp_path / "serial.sqlite")
+        shutil.copyfile(db, serial_db)
+        for _ in range(2):
+            for week in WEEKS:
+                generate_weekly_recap_draft(
+                    db_path=serial_db, league_id=LEAGUE, season=SEASON,
+                    week_index=week, reason="serial", force=True,
+                )
+        fake_creative.arm()
+
+        seen = []
+        for _ in range(2):
+            outcomes = generate_weekly_recap_drafts_v1(
+                db_path=db, league_id=LEAGUE, season=SEASON, week_indices=reversed(WEEKS),
+                reason="range", force=True, workers=2, concurrency=3,
+                on_outcome=seen.append,
+            )
+            assert [o.week_index for o in outcomes] == list(WEEKS)
+            assert all(o.error is None and o.result is not None for o in outcomes)
+        assert [o.week_index for o in seen] == list(WEEKS) * 2
+        assert [o.result.version for o in outcomes] == [2, 2, 2, 2]
+        assert "--- SHAREABLE RECAP ---" in _artifacts(db)[0][0][4]
+        assert _artifacts(db) == _artifacts(serial_db)
+
+    def test_failing_week_does_not_stop_range(self, db, fake_creative):
+        outcomes = generate_weekly_recap_drafts_v1(
+            db_path=db, league_id=LEAGUE, season=SEASON, week_indices=[1, 2, 9],
+            reason="range", concurrency=2,
+        )
+        assert [o.week_index for o in outcomes] == [1, 2, 9]
+        assert isinstance(outcomes[2].error, RecapNotFoundError)
+        assert [o.result.version for o in outcomes[:2]] == [1, 1]
+
+    def test_pooled_snapshot_range_matches_serial(self, db, tmp_path, fake_creative):
+        serial_db = str(tmp_path / "serial.sqlite")
+        shutil.copyfile(db, serial_db)
+        for week in WEEKS:
+            generate_weekly_recap_draft(
+                db_path=serial_db, league_id=LEAGUE, season=SEASON,
+                week_index=week, reason="serial",
+            )
+        outcomes = generate_weekly_recap_drafts_v1(
+            db_path=db, league_id=LEAGUE, season=SEASON, week_indices=WEEKS,
+            reason="range", concurrency=2, pooled=True, snapshot=True,
+        )
+        assert all(o.error is None for o in outcomes)
+        assert _artifacts(db) == _artifacts(serial_db)
+
+    def test_pooled_range_switches_to_wal_explicitly(self, db, fake_creative):
+        def journal_mode():
+            con = sqlite3.connect(db)
+            try:
+                return con.execute("PRAGMA journal_mode").fetchone()[0]
+            finally:
+                con.close()
+
+        assert journal_mode() == "delete"
+        outcomes = generate_weekly_recap_drafts_v1(
+            db_path=db, league_id=LEAGUE, season=SEASON, week_indices=[1],
+            reason="range", pooled=True,
+        )
+        assert outcomes[0].error is None
+        assert journal_mode() == "wal"
+
+    def test_concurrent_verification_outgrows_fact_cache(self, db, fake_creative, monkeypatch):
+        cache = VerificationFactCache(max_entries=2)
+        monkeypatch.setattr(recap_verifier_v1, "_FACT_CACHE", cache)
+        verify = weekly_recap_lifecycle.verify_recap_v1
+        results, errors = [], []
+
+        def recording_verify(*args, **kwargs):
+            try:
+                result = verify(*args, **kwargs)
+            except Exception as e:
+                errors.append(e)
+                raise
+            results.append(result)
+            return result
+
+        monkeypatch.setattr(weekly_recap_lifecycle, "verify_recap_v1", recording_verify)
+        for _ in range(3):
+            outcomes = generate_weekly_recap_drafts_v1(
+                db_path=db, league_id=LEAGUE, season=SEASON, week_indices=WEEKS,
+                reason="range", force=True, concurrency=len(WEEKS),
+            )
+            assert all(o.error is None for o in outcomes)
+        assert errors == []
+        assert len(results) == 3 * len(WEEKS) and all(r.passed for r in results)
+        assert len(cache) == 2 < len(WEEKS)
+        assert cache.misses >= len(WEEKS)
+
+    def test_empty_range(self, db):
+        assert generate_weekly_recap_drafts_v1(
+            db_path=db, league_id=LEAGUE, season=SEASON, week_indices=[], reason="range",
+        ) == []
+
+
+class TestCallSpacing:
+    def test_starts_are_spaced(self):
+        now = [100.0]
+        slept = []
+        spacing = _CallSpacing(2.0, clock=lambda: now[0], sleep=slept.append)
+        for _ in range(3):
+            spacing.wait()
+        assert slept == [2.0, 4.0]
+        now[0] = 110.0
+        spacing.wait()
+        assert slept == [2.0, 4.0]
+
+    def test_zero_interval_never_waits(self):
+        slept = []
+        spacing = _CallSpacing(0, clock=lambda: 0.0, sleep=slept.append)
+        spacing.wait()
+        spacing.wait()
+        assert slept == []
@@ -21,6 +21,9 @@ ALLOWLIST=(
   "src/squadvault/consumers/recap_week_diagnose_empty.py"
   "src/squadvault/ops/run_ingest_then_canonicalize.py"
   "src/squadvault/core/canonicalize/run_canonicalize.py"
+  # The ledger's own writer: append_events probes stored source ids to skip
+  # duplicates before encoding them. Not a downstream read.
+  "src/squadvault/core/storage/sqlite_store.py"
 )
 
 # Build a grep -v -f filter file from the allowlist (exact path matches)
@@ -5,8 +5,8 @@ This script wires the aggregation + render layers (per A1 spec
 `_observations/OBSERVATIONS_2026_05_11_PHASE_11_A1_SPECIFICATION.md`
 §§4.3 / 5.1 / 5.4) into one operational unit:
 
-  load_all_matchups (substrate)
-    → compute_championship_roll / compute_all_season_records /
+  league_history_cache (substrate: matchups + accumulated season records)
+    → compute_championship_roll / sort_worst_first /
       compute_blowouts_hall (aggregation)
     → render_*_markdown (presentation)
     → archive/hall_of_fame_and_shame/*.md (operational truth)
@@ -47,14 +47,15 @@ from pathlib import Path
 from typing import Final
 
 from squadvault.core.recaps.context.hall_of_fame_aggregations_v1 import (
-    compute_all_season_records,
     compute_blowouts_hall,
     compute_championship_roll,
+    sort_worst_first,
+)
+from squadvault.core.recaps.context.league_history_cache_v1 import (
+    league_history_cache,
 )
 from squadvault.core.recaps.context.league_history_v1 import (
-    build_cross_season_name_resolver,
     build_season_scoped_name_map,
-    load_all_matchups,
 )
 from squadvault.core.recaps.render.hall_of_fame_render_v1 import (
     render_blowouts_hall_markdown,
@@ -120,19 +121,18 @@ def _render_all_pages(
     *, db_path: str, league_id: str, top_n: int,
 ) -> dict[str, str]:
     """Load, aggregate, and render. Returns filename → markdown content."""
-    matchups = load_all_matchups(db_path=db_path, league_id=league_id)
+    league = league_history_cache(db_path, league_id)
+    matchups = league.matchups()
     if not matchups:
         return {}
 
-    name_map = build_cross_season_name_resolver(
-        db_path=db_path, league_id=league_id,
-    )
+    name_map = league.name_map()
     season_map = build_season_scoped_name_map(
         db_path=db_path, league_id=league_id,
     )
 
     champ_roll = compute_championship_roll(matchups)
-    season_records = compute_all_season_records(matchups)
+    season_records = sort_worst_first(league.accumulator().season_records())
     blowouts = compute_blowouts_hall(matchups, top_n=top_n)
 
     return {
@@ -9,8 +9,11 @@ Usage:
         --reason "v2-pipeline-backfill"
 
 Dry-run by default. Add --execute to actually write changes.
-Each week calls generate_weekly_recap_draft with force=True,
-which creates a new DRAFT artifact version (superseding any prior).
+Each week gets what generate_weekly_recap_draft(force=True) writes: a new
+DRAFT artifact version (superseding any prior). Weeks are pipelined by
+generate_weekly_recap_drafts_v1: context derivation in --workers processes,
+up to --concurrency creative-layer calls in flight (starts spaced --delay
+seconds apart), artifacts written one week at a time in week order.
 
 The creative layer requires ANTHROPIC_API_KEY in the environment.
 Without it, drafts will contain deterministic facts only (no prose).
@@ -22,12 +25,12 @@ import os
 import sys
 import time
 
-from squadvault.recaps.weekly_recap_lifecycle import (
-    GenerateDraftResult,
-    generate_weekly_recap_draft,
+from squadvault.recaps.weekly_recap_range_v1 import (
+    WeekDraftOutcome,
+    generate_weekly_recap_drafts_v1,
 )
 from squadvault.core.recaps.recap_runs import get_recap_run_state
-from squadvault.core.storage.session import DatabaseSession
+from squadvault.core.storage.session import DatabaseSession, session_counters
 from squadvault.errors import RecapDataError, RecapNotFoundError
 
 
@@ -62,7 +65,14 @@ def main() -> int:
                     help="Audit reason for regeneration (e.g. 'v2-pipeline-backfill')")
     ap.add_argument("--created-by", default="system")
     ap.add_argument("--delay", type=float, default=2.0,
-                    help="Seconds to wait between API calls (default: 2.0)")
+                    help="Minimum seconds between API call starts (default: 2.0)")
+    ap.add_argument("--workers", type=int, default=1,
+                    help="Processes deriving week contexts in parallel (default: 1)")
+    ap.add_argument("--concurrency", type=int, default=4,
+                    help="Creative-layer calls in flight at once (default: 4)")
+    ap.add_argument("--pooled", action="store_true",
+                    help="Reuse tuned per-thread DB connections (larger cache, mmap); "
+                         "switches the database to WAL journaling, persistently")
     ap.add_argument("--execute", action="store_true",
                     help="Actually write changes (default is dry-run)")
     args = ap.parse_args()
@@ -80,7 +90,8 @@ def main() -> int:
     print(f"Reason     : {args.reason}")
     print(f"Created by : {args.created_by}")
     print(f"API key    : {'SET' if has_key else 'NOT SET (facts-only drafts)'}")
-    print(f"Delay      : {args.delay}s between weeks")
+    print(f"Delay      : {args.delay}s between API call starts")
+    print(f"Parallel   : {args.workers} worker(s), {args.concurrency} call(s) in flight")
     print()
 
     if not has_key:
@@ -88,6 +99,7 @@ def main() -> int:
         print()
 
     summary: dict[str, list] = {"regenerated": [], "skipped": [], "errors": []}
+    pending: list[int] = []
 
     for w in range(args.start_week, args.end_week + 1):
         run_state = get_recap_run_state(args.db, args.league_id, args.season, w)
@@ -108,18 +120,24 @@ def main() -> int:
             summary["regenerated"].append(w)
             continue
 
-        try:
-            t0 = time.monotonic()
-            res: GenerateDraftResult = generate_weekly_recap_draft(
-                db_path=args.db,
-                league_id=args.league_id,
-                season=args.season,
-                week_index=w,
-                reason=args.reason,
-                force=True,
-                created_by=args.created_by,
-            )
+        pending.append(w)
+
+    if pending:
+        t0 = time.monotonic()
+
+        def _report(outcome: WeekDraftOutcome) -> None:
+            """Print one written week as the pipeline's writer reaches it."""
+            w = outcome.week_index
             elapsed = time.monotonic() - t0
+            res = outcome.result
+            if res is None:
+                e = outcome.error
+                if isinstance(e, (RecapNotFoundError, RecapDataError)):
+                    print(f"  week {w:2d}: ERROR -- {e}")
+                else:
+                    print(f"  week {w:2d}: ERROR -- {type(e).__name__}: {e}")
+                summary["errors"].append((w, str(e)))
+                return
 
             status = "NEW" if res.created_new else "IDEMPOTENT"
             superseded_msg = ""
@@ -133,16 +151,20 @@ def main() -> int:
             )
             summary["regenerated"].append(w)
 
-            # Delay between API calls to respect rate limits
-            if w < args.end_week and args.delay > 0:
-                time.sleep(args.delay)
-
-        except (RecapNotFoundError, RecapDataError) as e:
-            print(f"  week {w:2d}: ERROR -- {e}")
-            summary["errors"].append((w, str(e)))
-        except Exception as e:
-            print(f"  week {w:2d}: ERROR -- {type(e).__name__}: {e}")
-            summary["errors"].append((w, str(e)))
+        generate_weekly_recap_drafts_v1(
+            db_path=args.db,
+            league_id=args.league_id,
+            season=args.season,
+            week_indices=pending,
+            reason=args.reason,
+            force=True,
+            created_by=args.created_by,
+            workers=args.workers,
+            concurrency=args.concurrency,
+            min_call_interval=args.delay,
+            on_outcome=_report,
+            pooled=args.pooled,
+        )
 
     print()
     print(f"=== Summary ({mode}) ===")
@@ -154,6 +176,8 @@ def main() -> int:
         print(f"  Errors     : {len(summary['errors'])}")
         for w, e in summary["errors"]:
             print(f"               week {w}: {e}")
+    db = session_counters()
+    print(f"  DB         : {db['sessions']} sessions, {db['connections_opened']} connections opened")
 
     return 1 if summary["errors"] else 0
 
@@ -10,17 +10,18 @@ Usage:
         --reason "competitive-rivalry-regen"
 
 Generates a new DRAFT version for each week (force=True).
-Reports verification results per week.
+Reports verification results per week. Weeks are pipelined by
+generate_weekly_recap_drafts_v1 (see --workers / --concurrency / --delay).
 """
 from __future__ import annotations
 
 import argparse
-import time
 
-from squadvault.recaps.weekly_recap_lifecycle import (
-    GenerateDraftResult,
-    RecapNotFoundError,
-    generate_weekly_recap_draft,
+from squadvault.core.storage.session import session_counters
+from squadvault.recaps.weekly_recap_lifecycle import RecapNotFoundError
+from squadvault.recaps.weekly_recap_range_v1 import (
+    WeekDraftOutcome,
+    generate_weekly_recap_drafts_v1,
 )
 
 
@@ -34,7 +35,14 @@ def main() -> int:
     ap.add_argument("--reason", required=True)
     ap.add_argument("--created-by", default="system")
     ap.add_argument("--delay", type=float, default=2.0,
-                    help="Seconds between API calls (rate-limit safety)")
+                    help="Minimum seconds between API call starts (rate-limit safety)")
+    ap.add_argument("--workers", type=int, default=1,
+                    help="Processes deriving week contexts in parallel")
+    ap.add_argument("--concurrency", type=int, default=4,
+                    help="Creative-layer calls in flight at once")
+    ap.add_argument("--pooled", action="store_true",
+                    help="Reuse tuned per-thread DB connections (larger cache, mmap); "
+                         "switches the database to WAL journaling, persistently")
     args = ap.parse_args()
 
     print("=== Batch regenerate ===")
@@ -43,7 +51,8 @@ def main() -> int:
     print(f"Season     : {args.season}")
     print(f"Weeks      : {args.start_week}-{args.end_week}")
     print(f"Reason     : {args.reason}")
-    print(f"Delay      : {args.delay}s between weeks")
+    print(f"Delay      : {args.delay}s between API call starts")
+    print(f"Parallel   : {args.workers} worker(s), {args.concurrency} call(s) in flight")
     print()
 
     results: dict[str, list[int]] = {
@@ -53,44 +62,49 @@ def main() -> int:
         "verification_warn": [],
     }
 
-    for w in range(args.start_week, args.end_week + 1):
-        try:
-            res: GenerateDraftResult = generate_weekly_recap_draft(
-                db_path=args.db,
-                league_id=args.league_id,
-                season=args.season,
-                week_index=w,
-                reason=args.reason,
-                force=True,
-                created_by=args.created_by,
-            )
-
-            v_status = "—"
-            if res.verification_result is not None:
-                hard = len(res.verification_result.hard_failures)
-                soft = len(res.verification_result.soft_failures)
-                v_status = f"hard={hard} soft={soft}"
-                if hard > 0:
-                    results["verification_warn"].append(w)
-
-            attempts = res.verification_attempts
-            print(
-                f"  week {w:2d}: v{res.version} "
-                f"(attempts={attempts}, verification: {v_status})"
-            )
-            results["generated"].append(w)
-
-        except RecapNotFoundError:
-            print(f"  week {w:2d}: SKIP — no recap_runs data")
-            results["skipped"].append(w)
-
-        except Exception as e:
-            print(f"  week {w:2d}: FAIL — {type(e).__name__}: {e}")
-            results["failed"].append(w)
-
-        # Rate-limit delay between API calls
-        if w < args.end_week:
-            time.sleep(args.delay)
+    def _report(outcome: WeekDraftOutcome) -> None:
+        """Print one written week as the pipeline's writer reaches it."""
+        w = outcome.week_index
+        res = outcome.result
+        if res is None:
+            if isinstance(outcome.error, RecapNotFoundError):
+                print(f"  week {w:2d}: SKIP — no recap_runs data")
+                results["skipped"].append(w)
+            else:
+                e = outcome.error
+                print(f"  week {w:2d}: FAIL — {type(e).__name__}: {e}")
+                results["failed"].append(w)
+            return
+
+        v_status = "—"
+        if res.verification_result is not None:
+            hard = len(res.verification_result.hard_failures)
+            soft = len(res.verification_result.soft_failures)
+            v_status = f"hard={hard} soft={soft}"
+            if hard > 0:
+                results["verification_warn"].append(w)
+
+        attempts = res.verification_attempts
+        print(
+            f"  week {w:2d}: v{res.version} "
+            f"(attempts={attempts}, verification: {v_status})"
+        )
+        results["generated"].append(w)
+
+    generate_weekly_recap_drafts_v1(
+        db_path=args.db,
+        league_id=args.league_id,
+        season=args.season,
+        week_indices=range(args.start_week, args.end_week + 1),
+        reason=args.reason,
+        force=True,
+        created_by=args.created_by,
+        workers=args.workers,
+        concurrency=args.concurrency,
+        min_call_interval=args.delay,
+        on_outcome=_report,
+        pooled=args.pooled,
+    )
 
     print()
     print("=== Summary ===")
@@ -99,6 +113,8 @@ def main() -> int:
     print(f"  Failed    : {len(results['failed'])} weeks {results['failed']}")
     if results["verification_warn"]:
         print(f"  V-warnings: {results['verification_warn']}")
+    db = session_counters()
+    print(f"  DB        : {db['sessions']} sessions, {db['connections_opened']} connections opened")
 
     return 1 if results["failed"] else 0
 
@@ -10,8 +10,8 @@ Usage:
         --end-week 18
 
 This script:
-1. For each week, runs select_weekly_recap_events_v1 (includes all allowlisted
-   event types, including WEEKLY_MATCHUP_RESULT)
+1. Selects every week in one pass via select_season_recap_events_v1 (includes
+   all allowlisted event types, including WEEKLY_MATCHUP_RESULT)
 2. Upserts recap_runs with the new selection data
 3. Regenerates draft artifacts via generate_weekly_recap_draft
 4. Weeks with zero eligible events are marked WITHHELD
@@ -24,7 +24,7 @@ import argparse
 import json
 import sys
 
-from squadvault.core.recaps.selection.weekly_selection_v1 import select_weekly_recap_events_v1
+from squadvault.core.recaps.selection.weekly_selection_v1 import select_season_recap_events_v1
 from squadvault.core.recaps.recap_runs import RecapRunRecord, upsert_recap_run, get_recap_run_state
 from squadvault.recaps.weekly_recap_lifecycle import generate_weekly_recap_draft
 
@@ -59,12 +59,14 @@ def main() -> int:
 
     summary = {"drafted": [], "withheld": [], "errors": []}
 
-    for w in range(args.start_week, args.end_week + 1):
-        # 1. Re-select with full allowlist (includes WEEKLY_MATCHUP_RESULT)
-        sel = select_weekly_recap_events_v1(
-            args.db, args.league_id, args.season, w,
-            season_end=args.season_end,
-        )
+    # 1. Re-select every week with full allowlist (includes WEEKLY_MATCHUP_RESULT)
+    selections = select_season_recap_events_v1(
+        args.db, args.league_id, args.season,
+        weeks=range(args.start_week, args.end_week + 1),
+        season_end=args.season_end,
+    )
+    for sel in selections:
+        w = sel.week_index
 
         window_ok = (
             sel.window.mode in _SAFE_MODES
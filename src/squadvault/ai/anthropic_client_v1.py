@@ -0,0 +1,392 @@
+"""Anthropic Messages client v1 — shared, rate-limited, instrumented.
+
+The creative layers used to build a fresh anthropic.Anthropic per draft and
+make one blocking messages.create through the SDK's own retry policy. This
+module gives them one client per process instead:
+
+- Pooled: one SDK client (and so one HTTP connection pool) per API key,
+  shared by every caller and thread. AsyncMessagesClient is the asyncio
+  variant for batch paths that keep several drafts in flight.
+- Rate-limited: every request, retries included, first takes a token
+  from a process-wide TokenBucket (SQUADVAULT_ANTHROPIC_RPM requests per
+  minute, bursts of SQUADVAULT_ANTHROPIC_BURST; defaults 50 and 5).
+- Retry-After aware: 429 / 5xx / 529 responses are retried after the
+  server's Retry-After (seconds or HTTP date), else after the same linear
+  backoff utils.http uses. The SDK's own retries are disabled.
+- Instrumented: each request's latency, attempts and token usage are
+  recorded in a CallStats (see client_stats()) and logged at DEBUG.
+
+The transport is anything with a messages-style create(**kwargs): the SDK's
+client.messages in production, a fake in tests. The SDK stays an optional
+dependency; shared_messages_client raises ImportError without it.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import os
+import threading
+import time
+from collections import deque
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass
+from datetime import UTC, datetime
+from email.utils import parsedate_to_datetime
+from typing import Any, Protocol
+
+logger = logging.getLogger(__name__)
+
+RPM_ENV_VAR = "SQUADVAULT_ANTHROPIC_RPM"
+BURST_ENV_VAR = "SQUADVAULT_ANTHROPIC_BURST"
+_DEFAULT_RPM = 50.0
+_DEFAULT_BURST = 5.0
+
+# HTTP statuses worth retrying: rate limit, transient server errors, overload.
+_RETRY_STATUSES = frozenset({429, 500, 502, 503, 504, 529})
+# SDK exception types that carry no status but are transient.
+_RETRY_ERROR_NAMES = frozenset({"APIConnectionError", "APITimeoutError"})
+_MAX_RETRIES = 3
+_BACKOFF_SECONDS = 1.5
+_RATE_LIMIT_BACKOFF_SECONDS = 5.0
+_MAX_RETRY_AFTER_SECONDS = 60.0
+
+
+class MessagesTransport(Protocol):
+    """The slice of the SDK's client.messages the creative layers use."""
+
+    def create(self, **kwargs: Any) -> Any:
+        """Send one Messages API request and return the response."""
+        ...
+
+
+class AsyncMessagesTransport(Protocol):
+    """The slice of the SDK's AsyncAnthropic().messages the clients use."""
+
+    def create(self, **kwargs: Any) -> Awaitable[Any]:
+        """Send one Messages API request and await the response."""
+        ...
+
+
+class TokenBucket:
+    """Thread-safe token bucket; callers reserve a token and wait for it.
+
+    Reservations may drive the balance negative, so concurrent callers are
+    queued in arrival order rather than racing for the next refill.
+    """
+
+    def __init__(
+        self,
+        rate_per_second: float,
+        capacity: float,
+        *,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        """Create a full bucket; rate_per_second <= 0 disables limiting."""
+        self.rate = float(rate_per_second)
+        self.capacity = max(1.0, float(capacity))
+        self._clock = clock
+        self._tokens = self.capacity
+        self._updated = clock()
+        self._lock = threading.Lock()
+
+    def reserve(self) -> float:
+        """Take one token; return the seconds to wait before using it."""
+        if self.rate <= 0:
+            return 0.0
+        with self._lock:
+            now = self._clock()
+            self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+            self._updated = now
+            self._tokens -= 1.0
+            return 0.0 if self._tokens >= 0 else -self._tokens / self.rate
+
+    def acquire(self, sleep: Callable[[float], None] = time.sleep) -> float:
+        """Block until a token is available; return the seconds waited."""
+        wait = self.reserve()
+        if wait > 0:
+            sleep(wait)
+        return wait
+
+    async def acquire_async(self) -> float:
+        """Await until a token is available; return the seconds waited."""
+        wait = self.reserve()
+        if wait > 0:
+            await asyncio.sleep(wait)
+        return wait
+
+
+@dataclass(frozen=True)
+class CallRecord:
+    """One request as seen by the caller, retries included."""
+
+    model: str
+    ok: bool
+    attempts: int
+    latency_s: float
+    throttled_s: float
+    input_tokens: int
+    output_tokens: int
+
+
+class CallStats:
+    """Running totals plus the most recent CallRecords."""
+
+    def __init__(self, keep: int = 256) -> None:
+        """Create empty stats keeping at most `keep` recent records."""
+        self.calls = 0
+        self.failures = 0
+        self.retries = 0
+        self.input_tokens = 0
+        self.output_tokens = 0
+        self.latency_s = 0.0
+        self.throttled_s = 0.0
+        self.recent: deque[CallRecord] = deque(maxlen=keep)
+        self._lock = threading.Lock()
+
+    def record(self, rec: CallRecord) -> None:
+        """Add one finished request."""
+        with self._lock:
+            self.calls += 1
+            self.failures += 0 if rec.ok else 1
+            self.retries += rec.attempts - 1
+            self.input_tokens += rec.input_tokens
+            self.output_tokens += rec.output_tokens
+            self.latency_s += rec.latency_s
+            self.throttled_s += rec.throttled_s
+            self.recent.append(rec)
+
+    def summary(self) -> dict[str, Any]:
+        """Totals as a plain dict (for logs and benchmark output)."""
+        with self._lock:
+            return {
+                "calls": self.calls,
+                "failures": self.failures,
+                "retries": self.retries,
+                "input_tokens": self.input_tokens,
+                "output_tokens": self.output_tokens,
+                "latency_s": round(self.latency_s, 3),
+                "mean_latency_s": round(self.latency_s / self.calls, 3) if self.calls else 0.0,
+                "throttled_s": round(self.throttled_s, 3),
+            }
+
+
+def _usage_tokens(message: Any) -> tuple[int, int]:
+    """(input_tokens, output_tokens) from a response's usage, 0 when absent."""
+    usage = getattr(message, "usage", None)
+    counts = []
+    for name in ("input_tokens", "output_tokens"):
+        value = getattr(usage, name, 0)
+        counts.append(value if isinstance(value, int) else 0)
+    return counts[0], counts[1]
+
+
+def _retry_delay(exc: Exception, attempt: int) -> float | None:
+    """Seconds to wait before retrying after exc, or None if not retryable."""
+    status = getattr(exc, "status_code", None)
+    if status not in _RETRY_STATUSES and type(exc).__name__ not in _RETRY_ERROR_NAMES:
+        return None
+    headers = getattr(getattr(exc, "response", None), "headers", None) or {}
+    raw = headers.get("retry-after")
+    if raw is not None:
+        try:
+            return min(_MAX_RETRY_AFTER_SECONDS, max(0.0, float(raw)))
+        except ValueError:
+            pass
+        try:
+            when = parsedate_to_datetime(str(raw))
+            return min(_MAX_RETRY_AFTER_SECONDS, max(0.0, (when - datetime.now(UTC)).total_seconds()))
+        except (TypeError, ValueError):
+            pass
+    base = _RATE_LIMIT_BACKOFF_SECONDS if status == 429 else _BACKOFF_SECONDS
+    return base * attempt
+
+
+class _ClientBase:
+    """Shared bookkeeping for the sync and async clients."""
+
+    def __init__(
+        self,
+        *,
+        bucket: TokenBucket | None,
+        stats: CallStats | None,
+        max_retries: int,
+        clock: Callable[[], float],
+    ) -> None:
+        """Attach the (process-wide by default) bucket and stats."""
+        self.bucket = bucket if bucket is not None else _shared_bucket()
+        self.stats = stats if stats is not None else _STATS
+        self.max_retries = int(max_retries)
+        self._clock = clock
+
+    def _finish(
+        self, kwargs: dict[str, Any], message: Any, *, ok: bool,
+        attempts: int, started: float, throttled: float,
+    ) -> None:
+        """Record and log one finished request."""
+        input_tokens, output_tokens = _usage_tokens(message)
+        rec = CallRecord(
+            model=str(kwargs.get("model", "")), ok=ok, attempts=attempts,
+            latency_s=self._clock() - started, throttled_s=throttled,
+            input_tokens=input_tokens, output_tokens=output_tokens,
+        )
+        self.stats.record(rec)
+        logger.debug(
+            "anthropic_client_v1: %s %s in %.2fs (%d attempt(s), %.2fs throttled, %d in / %d out tokens)",
+            rec.model, "ok" if ok else "failed", rec.latency_s, attempts,
+            throttled, input_tokens, output_tokens,
+        )
+
+
+class MessagesClient(_ClientBase):
+    """Blocking Messages client: token bucket, Retry-After retries, stats."""
+
+    def __init__(
+        self,
+        transport: MessagesTransport,
+        *,
+        bucket: TokenBucket | None = None,
+        stats: CallStats | None = None,
+        max_retries: int = _MAX_RETRIES,
+        sleep: Callable[[float], None] = time.sleep,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        """Wrap a transport; bucket and stats default to the process-wide ones."""
+        super().__init__(bucket=bucket, stats=stats, max_retries=max_retries, clock=clock)
+        self.transport = transport
+        self._sleep = sleep
+
+    def create(self, **kwargs: Any) -> Any:
+        """messages.create with rate limiting and retries; raises the last error."""
+        started = self._clock()
+        throttled = 0.0
+        attempt = 0
+        while True:
+            attempt += 1
+            throttled += self.bucket.acquire(self._sleep)
+            try:
+                message = self.transport.create(**kwargs)
+            except Exception as exc:
+                delay = _retry_delay(exc, attempt)
+                if delay is None or attempt > self.max_retries:
+                    self._finish(kwargs, None, ok=False, attempts=attempt, started=started, throttled=throttled)
+                    raise
+                logger.warning(
+                    "anthropic_client_v1: %s (attempt %d/%d) — retrying in %.1fs",
+                    exc, attempt, self.max_retries + 1, delay,
+                )
+                self._sleep(delay)
+                continue
+            self._finish(kwargs, message, ok=True, attempts=attempt, started=started, throttled=throttled)
+            return message
+
+
+class AsyncMessagesClient(_ClientBase):
+    """asyncio Messages client with the same limits, retries and stats."""
+
+    def __init__(
+        self,
+        transport: AsyncMessagesTransport,
+        *,
+        bucket: TokenBucket | None = None,
+        stats: CallStats | None = None,
+        max_retries: int = _MAX_RETRIES,
+        max_in_flight: int = 4,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        """Wrap an async transport allowing max_in_flight concurrent requests."""
+        super().__init__(bucket=bucket, stats=stats, max_retries=max_retries, clock=clock)
+        self.transport = transport
+        self.max_in_flight = max(1, int(max_in_flight))
+        self._slots: asyncio.Semaphore | None = None
+
+    async def create(self, **kwargs: Any) -> Any:
+        """Awaitable messages.create; at most max_in_flight run at once."""
+        if self._slots is None:
+            self._slots = asyncio.Semaphore(self.max_in_flight)
+        async with self._slots:
+            started = self._clock()
+            throttled = 0.0
+            attempt = 0
+            while True:
+                attempt += 1
+                throttled += await self.bucket.acquire_async()
+                try:
+                    message = await self.transport.create(**kwargs)
+                except Exception as exc:
+                    delay = _retry_delay(exc, attempt)
+                    if delay is None or attempt > self.max_retries:
+                        self._finish(kwargs, None, ok=False, attempts=attempt, started=started, throttled=throttled)
+                        raise
+                    logger.warning(
+                        "anthropic_client_v1: %s (attempt %d/%d) — retrying in %.1fs",
+                        exc, attempt, self.max_retries + 1, delay,
+                    )
+                    await asyncio.sleep(delay)
+                    continue
+                self._finish(kwargs, message, ok=True, attempts=attempt, started=started, throttled=throttled)
+                return message
+
+
+# ---------------------------------------------------------------------------
+# Process-wide client, bucket and stats
+# ---------------------------------------------------------------------------
+
+_STATS = CallStats()
+_BUCKET: TokenBucket | None = None
+# api_key -> (SDK client class, MessagesClient); a different class (e.g. a
+# reloaded or substituted SDK) replaces the entry.
+_CLIENTS: dict[str, tuple[Any, MessagesClient]] = {}
+_LOCK = threading.Lock()
+
+
+def _env_float(name: str, default: float) -> float:
+    """Float env var, falling back to default when unset or malformed."""
+    try:
+        return float(os.environ.get(name, "").strip() or default)
+    except ValueError:
+        return default
+
+
+def _shared_bucket() -> TokenBucket:
+    """The process-wide TokenBucket, configured from the environment once."""
+    global _BUCKET
+    with _LOCK:
+        if _BUCKET is None:
+            _BUCKET = TokenBucket(
+                _env_float(RPM_ENV_VAR, _DEFAULT_RPM) / 60.0,
+                _env_float(BURST_ENV_VAR, _DEFAULT_BURST),
+            )
+        return _BUCKET
+
+
+def client_stats() -> CallStats:
+    """Process-wide request stats of every shared and default-built client."""
+    return _STATS
+
+
+def shared_messages_client(api_key: str) -> MessagesClient:
+    """The process-wide MessagesClient for api_key (ImportError without the SDK)."""
+    import anthropic  # local import: optional dependency
+
+    with _LOCK:
+        cached = _CLIENTS.get(api_key)
+        if cached is not None and cached[0] is anthropic.Anthropic:
+            return cached[1]
+    transport = anthropic.Anthropic(api_key=api_key, max_retries=0).messages
+    client = MessagesClient(transport)
+    with _LOCK:
+        _CLIENTS[api_key] = (anthropic.Anthropic, client)
+    return client
+
+
+def async_messages_client(api_key: str, *, max_in_flight: int = 4) -> AsyncMessagesClient:
+    """A new AsyncMessagesClient for api_key, sharing the process bucket and stats.
+
+    Async SDK clients are bound to the event loop that first uses them, so
+    each batch run builds its own (ImportError without the SDK).
+    """
+    import anthropic  # local import: optional dependency
+
+    transport = anthropic.AsyncAnthropic(api_key=api_key, max_retries=0).messages
+    return AsyncMessagesClient(transport, max_in_flight=max_in_flight)
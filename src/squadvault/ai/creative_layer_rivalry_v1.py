@@ -26,6 +26,7 @@ import os
 import warnings
 from collections.abc import Sequence
 
+from squadvault.ai.anthropic_client_v1 import shared_messages_client
 from squadvault.chronicle.matchup_facts_v1 import MatchupFactV1
 from squadvault.core.eal.editorial_attunement_v1 import EAL_AMBIGUITY_PREFER_SILENCE
 
@@ -220,10 +221,8 @@ def draft_rivalry_narrative_v1(
     )
 
     try:
-        import anthropic  # local import: optional dependency
-
-        client = anthropic.Anthropic(api_key=api_key)
-        message = client.messages.create(
+        client = shared_messages_client(api_key)  # ImportError without the SDK
+        message = client.create(
             model=_MODEL,
             max_tokens=1024,
             temperature=0,
@@ -7,6 +7,8 @@ Contract (Creative Layer Contract Card v1.0):
 - Requires ANTHROPIC_API_KEY in environment; absent key -> None (silent fallback).
 - AMBIGUITY_PREFER_SILENCE directive -> None (silence preferred, no API call made).
 - Any API error -> None (silent fallback to deterministic facts-only text).
+- Requests go through the shared anthropic_client_v1 client (rate limit,
+  Retry-After retries, latency/token stats); errors after retries -> None.
 
 Human approval is a hard gate for all canonical artifacts. This layer
 produces drafts only and has no authority over publication.
@@ -18,6 +20,7 @@ import logging
 import os
 import warnings
 
+from squadvault.ai.anthropic_client_v1 import shared_messages_client
 from squadvault.core.eal.editorial_attunement_v1 import EAL_AMBIGUITY_PREFER_SILENCE
 
 logger = logging.getLogger(__name__)
@@ -506,16 +509,14 @@ def draft_narrative_v1(
     )
 
     try:
-        import anthropic  # local import: optional dependency
-
-        client = anthropic.Anthropic(api_key=api_key)
+        client = shared_messages_client(api_key)  # ImportError without the SDK
         system_prompt = _build_system_prompt(tone_preset, voice_profile=voice_profile)
         # SV_NO_WEB_SEARCH: Web search removed to prevent unverified NFL
         # commentary from being injected into league recaps. The creative
         # layer must work only with league-sourced data. Per governance:
         # silence over fabrication. Web search may be re-added later with
         # proper attribution and verification guardrails.
-        message = client.messages.create(
+        message = client.create(
             model=_MODEL,
             max_tokens=_MAX_TOKENS,
             temperature=temperature,
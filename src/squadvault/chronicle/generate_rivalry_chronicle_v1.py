@@ -8,7 +8,6 @@ from __future__ import annotations
 import hashlib
 import json
 import logging
-import sqlite3
 from collections.abc import Sequence
 from dataclasses import dataclass
 
@@ -24,13 +23,14 @@ from squadvault.chronicle.input_contract_v1 import (
     RivalryChronicleInputV1,
 )
 from squadvault.chronicle.matchup_facts_v1 import (
+    MatchupFactV1,
     facts_block_hash_v1,
     query_head_to_head_matchups_multi_season_v1,
     query_head_to_head_matchups_v1,
 )
+from squadvault.core.directory_cache_v1 import name_directory
 from squadvault.core.exports.approved_weekly_recap_export_v1 import fetch_latest_approved_weekly_recap
 from squadvault.core.recaps.recap_artifacts import ARTIFACT_TYPE_WEEKLY_RECAP
-from squadvault.core.storage.session import DatabaseSession
 
 logger = logging.getLogger(__name__)
 
@@ -79,21 +79,13 @@ class RivalryChronicleGeneratedV1:
 def _resolve_team_name(db_path: str, league_id: int, season: int, franchise_id: str) -> str:
     """Resolve a franchise ID to its display name. Falls back to raw ID."""
     try:
-        with DatabaseSession(db_path) as conn:
-            conn.row_factory = sqlite3.Row
-            row = conn.execute(
-                "SELECT name FROM franchise_directory "
-                "WHERE league_id=? AND season=? AND franchise_id=? LIMIT 1",
-                (str(league_id), int(season), str(franchise_id)),
-            ).fetchone()
-            if row and row["name"]:
-                return str(row["name"]).strip()
+        entry = name_directory(db_path, str(league_id)).franchises(season).get(str(franchise_id))
+        if entry and entry[0]:
+            return entry[0]
     except Exception as exc:
         logger.debug("%s", exc)
-        pass
     return str(franchise_id)
 
-
 def generate_rivalry_chronicle_v1(
     *,
     db_path: str,
@@ -266,21 +258,26 @@ def generate_rivalry_chronicle_multi_season_v1(
     team_a_id: str,
     team_b_id: str,
     created_at_utc: str,
+    matchup_facts: Sequence[MatchupFactV1] | None = None,
 ) -> RivalryChronicleGeneratedV1:
     """Generate a multi-season rivalry chronicle for a team pair.
 
     Covers all head-to-head matchups between team_a and team_b from
     start_season through end_season (inclusive). Week indices are not
     applicable across seasons; the scope is the full season range.
+
+    matchup_facts: the pair's facts when the caller already holds them
+    (query_all_head_to_head_matchups_multi_season_v1); queried otherwise.
     """
-    matchup_facts = query_head_to_head_matchups_multi_season_v1(
-        db_path=db_path,
-        league_id=str(league_id),
-        team_a_id=str(team_a_id),
-        team_b_id=str(team_b_id),
-        start_season=int(start_season),
-        end_season=int(end_season),
-    )
+    if matchup_facts is None:
+        matchup_facts = query_head_to_head_matchups_multi_season_v1(
+            db_path=db_path,
+            league_id=str(league_id),
+            team_a_id=str(team_a_id),
+            team_b_id=str(team_b_id),
+            start_season=int(start_season),
+            end_season=int(end_season),
+        )
 
     # Resolve display names from the most recent season available
     name_season = end_season
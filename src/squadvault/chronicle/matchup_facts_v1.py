@@ -4,10 +4,11 @@ from __future__ import annotations
 
 import hashlib
 import json
-import sqlite3
-from collections.abc import Sequence
+from collections.abc import Callable, Sequence
 from dataclasses import dataclass
+from typing import Any
 
+from squadvault.core.directory_cache_v1 import name_directory
 from squadvault.core.storage.session import DatabaseSession
 
 
@@ -26,21 +27,105 @@ class MatchupFactV1:
     canonical_event_fingerprint: str
 
 
-def _resolve_franchise_name(
-    conn: sqlite3.Connection,
-    league_id: str,
+# Head-to-head pair key, spelled exactly as idx_fact_matchup_pair (migration
+# 0015) so SQLite serves pair lookups from the index.
+_PAIR_LO = "min(fm.winner_franchise_id, fm.loser_franchise_id)"
+_PAIR_HI = "max(fm.winner_franchise_id, fm.loser_franchise_id)"
+
+# Canonical matchups of one league and season range, read through the pair
+# index; callers append the pair filter and ORDER BY.
+_PAIR_MATCHUPS_SQL = """
+    SELECT
+        ce.season,
+        ce.action_fingerprint,
+        me.payload_json
+    FROM fact_matchup fm
+    JOIN canonical_events ce ON ce.id = fm.canonical_event_id
+    JOIN memory_events me ON me.id = ce.best_memory_event_id
+    WHERE fm.league_id = ?
+      AND fm.season BETWEEN ? AND ?
+"""
+
+FranchisePair = tuple[str, str]
+
+
+def _season_names(
+    db_path: str, league_id: str,
+) -> Callable[[int, str], str]:
+    """Batched franchise name lookup: (season, franchise_id) -> name or raw ID."""
+    directory = name_directory(db_path, league_id)
+
+    def name(season: int, franchise_id: str) -> str:
+        """Name of franchise_id in season via franchise_directory; raw ID if unnamed."""
+        entry = directory.franchises(season).get(franchise_id)
+        return entry[0] if entry and entry[0] else franchise_id
+
+    return name
+
+
+def _matchup_fact(
     season: int,
-    franchise_id: str,
-) -> str:
-    """Resolve franchise_id to name via franchise_directory. Falls back to raw ID."""
-    row = conn.execute(
-        "SELECT name FROM franchise_directory "
-        "WHERE league_id=? AND season=? AND franchise_id=? LIMIT 1",
-        (str(league_id), int(season), str(franchise_id)),
-    ).fetchone()
-    if row and row[0]:
-        return str(row[0]).strip()
-    return str(franchise_id)
+    action_fingerprint: str,
+    payload: dict[str, Any],
+    name: Callable[[int, str], str],
+) -> MatchupFactV1:
+    """MatchupFactV1 from a canonical WEEKLY_MATCHUP_RESULT payload."""
+    winner_fid = str(payload.get("winner_franchise_id", ""))
+    loser_fid = str(payload.get("loser_franchise_id", ""))
+    return MatchupFactV1(
+        season=int(season),
+        week=int(payload.get("week", 0)),
+        winner_franchise_id=winner_fid,
+        loser_franchise_id=loser_fid,
+        winner_name=name(season, winner_fid),
+        loser_name=name(season, loser_fid),
+        winner_score=str(payload.get("winner_score", "")),
+        loser_score=str(payload.get("loser_score", "")),
+        is_tie=bool(payload.get("is_tie", False)),
+        canonical_event_fingerprint=str(action_fingerprint),
+    )
+
+
+def _payload_pair(payload: dict[str, Any]) -> FranchisePair:
+    """Sorted (winner, loser) franchise IDs exactly as the payload spells them."""
+    lo, hi = sorted([
+        str(payload.get("winner_franchise_id", "")),
+        str(payload.get("loser_franchise_id", "")),
+    ])
+    return lo, hi
+
+
+def _pair_matchups(
+    *,
+    db_path: str,
+    league_id: str,
+    team_a_id: str,
+    team_b_id: str,
+    start_season: int,
+    end_season: int,
+) -> list[MatchupFactV1]:
+    """Canonical matchups of one franchise pair, read through the pair index.
+
+    Reads and decodes only the pair's own games. The index key is the
+    trimmed fact_matchup projection; the payload pair is re-checked so
+    results are exactly the payload matches of a full scan. Ordered by
+    (season, occurred_at, action_fingerprint).
+    """
+    pair = tuple(sorted([str(team_a_id), str(team_b_id)]))
+    with DatabaseSession(db_path) as conn:
+        rows = conn.execute(
+            _PAIR_MATCHUPS_SQL
+            + f"  AND {_PAIR_LO} = ? AND {_PAIR_HI} = ?"
+            + " ORDER BY ce.season, me.occurred_at, ce.action_fingerprint",
+            (str(league_id), int(start_season), int(end_season), *pair),
+        ).fetchall()
+    name = _season_names(db_path, league_id)
+    facts: list[MatchupFactV1] = []
+    for season, action_fingerprint, payload_json in rows:
+        payload = json.loads(payload_json)
+        if _payload_pair(payload) == pair:
+            facts.append(_matchup_fact(int(season), action_fingerprint, payload, name))
+    return facts
 
 
 def query_head_to_head_matchups_v1(
@@ -59,80 +144,16 @@ def query_head_to_head_matchups_v1(
 
     If week_indices is provided, only those weeks are considered.
     """
-    sorted_pair = tuple(sorted([str(team_a_id), str(team_b_id)]))
-
-    with DatabaseSession(db_path) as conn:
-        conn.row_factory = sqlite3.Row
-
-        # Check if franchise_directory exists for name resolution
-        tables = {
-            r[0] for r in conn.execute(
-                "SELECT name FROM sqlite_master WHERE type='table'"
-            ).fetchall()
-        }
-        has_franchise_dir = "franchise_directory" in tables
-
-        # Query canonical matchup events for this team pair.
-        # The action_fingerprint contains sorted franchise IDs:
-        #   WEEKLY_MATCHUP_RESULT:{league_id}:{season}:W{week}:{id1}_{id2}
-        # We filter by matching both franchise IDs in the payload.
-        rows = conn.execute(
-            """
-            SELECT
-                ce.action_fingerprint,
-                me.payload_json
-            FROM canonical_events ce
-            JOIN memory_events me ON me.id = ce.best_memory_event_id
-            WHERE ce.league_id = ?
-              AND ce.season = ?
-              AND ce.event_type = 'WEEKLY_MATCHUP_RESULT'
-            ORDER BY me.occurred_at, ce.action_fingerprint
-            """,
-            (str(league_id), int(season)),
-        ).fetchall()
-
-        facts: list[MatchupFactV1] = []
-        for row in rows:
-            payload = json.loads(row["payload_json"])
-            winner_fid = str(payload.get("winner_franchise_id", ""))
-            loser_fid = str(payload.get("loser_franchise_id", ""))
-
-            # Filter: both teams must be in this matchup
-            matchup_pair = tuple(sorted([winner_fid, loser_fid]))
-            if matchup_pair != sorted_pair:
-                continue
-
-            week = int(payload.get("week", 0))
-
-            # Filter by requested weeks if specified
-            if week_indices is not None and week not in week_indices:
-                continue
-
-            # Resolve names
-            if has_franchise_dir:
-                winner_name = _resolve_franchise_name(conn, league_id, season, winner_fid)
-                loser_name = _resolve_franchise_name(conn, league_id, season, loser_fid)
-            else:
-                winner_name = winner_fid
-                loser_name = loser_fid
-
-            facts.append(MatchupFactV1(
-                season=int(season),
-                week=week,
-                winner_franchise_id=winner_fid,
-                loser_franchise_id=loser_fid,
-                winner_name=winner_name,
-                loser_name=loser_name,
-                winner_score=str(payload.get("winner_score", "")),
-                loser_score=str(payload.get("loser_score", "")),
-                is_tie=bool(payload.get("is_tie", False)),
-                canonical_event_fingerprint=str(row["action_fingerprint"]),
-            ))
-
-        # Order by week (chronological)
-        facts.sort(key=lambda f: f.week)
-        return facts
-
+    facts = [
+        f for f in _pair_matchups(
+            db_path=db_path, league_id=league_id, team_a_id=team_a_id,
+            team_b_id=team_b_id, start_season=season, end_season=season,
+        )
+        if week_indices is None or f.week in week_indices
+    ]
+    # Order by week (chronological)
+    facts.sort(key=lambda f: f.week)
+    return facts
 
 
 def query_head_to_head_matchups_multi_season_v1(
@@ -149,64 +170,46 @@ def query_head_to_head_matchups_multi_season_v1(
     Returns matchup facts ordered chronologically (season, then week).
     Only includes weeks where team_a and team_b faced each other.
     """
-    sorted_pair = tuple(sorted([str(team_a_id), str(team_b_id)]))
+    facts = _pair_matchups(
+        db_path=db_path, league_id=league_id, team_a_id=team_a_id,
+        team_b_id=team_b_id, start_season=start_season, end_season=end_season,
+    )
+    facts.sort(key=lambda f: (f.season, f.week))
+    return facts
+
+
+def query_all_head_to_head_matchups_multi_season_v1(
+    *,
+    db_path: str,
+    league_id: str,
+    start_season: int,
+    end_season: int,
+) -> dict[FranchisePair, list[MatchupFactV1]]:
+    """Every franchise pair's head-to-head matchups over a season range.
+
+    One ordered pass over the range's matchups. Keys are sorted (lower, higher)
+    franchise ID pairs in key order, and only pairs that met are present.
+    Each value equals query_head_to_head_matchups_multi_season_v1 for that
+    pair.
+    """
     with DatabaseSession(db_path) as conn:
-        conn.row_factory = sqlite3.Row
-        tables = {
-            r[0] for r in conn.execute(
-                "SELECT name FROM sqlite_master WHERE type='table'"
-            ).fetchall()
-        }
-        has_franchise_dir = "franchise_directory" in tables
         rows = conn.execute(
-            """
-            SELECT
-                ce.action_fingerprint,
-                ce.season,
-                me.payload_json
-            FROM canonical_events ce
-            JOIN memory_events me ON me.id = ce.best_memory_event_id
-            WHERE ce.league_id = ?
-              AND ce.season BETWEEN ? AND ?
-              AND ce.event_type = 'WEEKLY_MATCHUP_RESULT'
-            ORDER BY ce.season, me.occurred_at, ce.action_fingerprint
-            """,
+            _PAIR_MATCHUPS_SQL
+            + f" ORDER BY {_PAIR_LO}, {_PAIR_HI},"
+            + " ce.season, me.occurred_at, ce.action_fingerprint",
             (str(league_id), int(start_season), int(end_season)),
         ).fetchall()
-        facts: list[MatchupFactV1] = []
-        for row in rows:
-            payload = json.loads(row["payload_json"])
-            winner_fid = str(payload.get("winner_franchise_id", ""))
-            loser_fid = str(payload.get("loser_franchise_id", ""))
-            matchup_pair = tuple(sorted([winner_fid, loser_fid]))
-            if matchup_pair != sorted_pair:
-                continue
-            season = int(row["season"])
-            week = int(payload.get("week", 0))
-            if has_franchise_dir:
-                winner_name = _resolve_franchise_name(
-                    conn, league_id, season, winner_fid
-                )
-                loser_name = _resolve_franchise_name(
-                    conn, league_id, season, loser_fid
-                )
-            else:
-                winner_name = winner_fid
-                loser_name = loser_fid
-            facts.append(MatchupFactV1(
-                season=season,
-                week=week,
-                winner_franchise_id=winner_fid,
-                loser_franchise_id=loser_fid,
-                winner_name=winner_name,
-                loser_name=loser_name,
-                winner_score=str(payload.get("winner_score", "")),
-                loser_score=str(payload.get("loser_score", "")),
-                is_tie=bool(payload.get("is_tie", False)),
-                canonical_event_fingerprint=str(row["action_fingerprint"]),
-            ))
+    name = _season_names(db_path, league_id)
+    by_pair: dict[FranchisePair, list[MatchupFactV1]] = {}
+    for season, action_fingerprint, payload_json in rows:
+        payload = json.loads(payload_json)
+        by_pair.setdefault(_payload_pair(payload), []).append(
+            _matchup_fact(int(season), action_fingerprint, payload, name),
+        )
+    for facts in by_pair.values():
         facts.sort(key=lambda f: (f.season, f.week))
-        return facts
+    return dict(sorted(by_pair.items()))
+
 
 def facts_block_hash_v1(facts: Sequence[MatchupFactV1]) -> str:
     """Compute deterministic SHA256 hash of the facts block."""
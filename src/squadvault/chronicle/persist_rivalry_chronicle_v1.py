@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import sqlite3
+from collections.abc import Sequence
 from dataclasses import dataclass
 
 from squadvault.chronicle.generate_rivalry_chronicle_v1 import (
@@ -11,6 +12,10 @@ from squadvault.chronicle.generate_rivalry_chronicle_v1 import (
     generate_rivalry_chronicle_v1,
 )
 from squadvault.chronicle.input_contract_v1 import MissingWeeksPolicy
+from squadvault.chronicle.matchup_facts_v1 import (
+    MatchupFactV1,
+    query_all_head_to_head_matchups_multi_season_v1,
+)
 from squadvault.core.recaps.recap_artifacts import ARTIFACT_TYPE_RIVALRY_CHRONICLE_V1
 from squadvault.core.storage.db_utils import table_columns as _table_columns
 from squadvault.core.storage.session import DatabaseSession
@@ -223,6 +228,7 @@ def persist_rivalry_chronicle_multi_season_v1(
     team_a_id: str,
     team_b_id: str,
     created_at_utc: str,
+    matchup_facts: Sequence[MatchupFactV1] | None = None,
 ) -> PersistedChronicleV1:
     """Persist a multi-season rivalry chronicle as a versioned DRAFT artifact."""
     gen: RivalryChronicleGeneratedV1 = generate_rivalry_chronicle_multi_season_v1(
@@ -233,6 +239,7 @@ def persist_rivalry_chronicle_multi_season_v1(
         team_a_id=team_a_id,
         team_b_id=team_b_id,
         created_at_utc=created_at_utc,
+        matchup_facts=matchup_facts,
     )
     season = int(end_season)
     with DatabaseSession(db_path) as conn:
@@ -284,3 +291,38 @@ def persist_rivalry_chronicle_multi_season_v1(
             version=int(new_v),
             created_new=True,
         )
+
+
+def persist_rivalry_chronicles_all_pairs_multi_season_v1(
+    *,
+    db_path: str,
+    league_id: int,
+    start_season: int,
+    end_season: int,
+    created_at_utc: str,
+) -> list[PersistedChronicleV1]:
+    """Persist a multi-season chronicle for every franchise pair that met.
+
+    Matchups for all pairs come from one query; each pair is then
+    generated and persisted like persist_rivalry_chronicle_multi_season_v1,
+    in sorted pair order.
+    """
+    by_pair = query_all_head_to_head_matchups_multi_season_v1(
+        db_path=db_path,
+        league_id=str(league_id),
+        start_season=int(start_season),
+        end_season=int(end_season),
+    )
+    return [
+        persist_rivalry_chronicle_multi_season_v1(
+            db_path=db_path,
+            league_id=league_id,
+            start_season=start_season,
+            end_season=end_season,
+            team_a_id=team_a_id,
+            team_b_id=team_b_id,
+            created_at_utc=created_at_utc,
+            matchup_facts=facts,
+        )
+        for (team_a_id, team_b_id), facts in by_pair.items()
+    ]
@@ -94,7 +94,7 @@ def main() -> int:
 
     # Import here so PYTHONPATH=src works and we stay aligned with the live selection logic.
     from squadvault.core.recaps.render.deterministic_bullets_v1 import QUIET_WEEK_MIN_EVENTS
-    from squadvault.core.recaps.selection.weekly_selection_v1 import select_weekly_recap_events_v1
+    from squadvault.core.recaps.selection.weekly_selection_v1 import select_season_recap_events_v1
     threshold = QUIET_WEEK_MIN_EVENTS if args.min_events_for_facts is None else int(args.min_events_for_facts)
 
     with DatabaseSession(args.db) as conn:
@@ -103,13 +103,14 @@ def main() -> int:
         mismatch_count = 0
         no_artifact_count = 0
 
-        for wk in range(args.start_week, args.end_week + 1):
-            sel = select_weekly_recap_events_v1(
-                db_path=args.db,
-                league_id=args.league_id,
-                season=args.season,
-                week_index=wk,
-            )
+        selections = select_season_recap_events_v1(
+            args.db,
+            args.league_id,
+            args.season,
+            weeks=range(args.start_week, args.end_week + 1),
+        )
+        for sel in selections:
+            wk = sel.week_index
             selected_events = len(sel.canonical_ids)
             expected_has_facts = selected_events >= threshold
 
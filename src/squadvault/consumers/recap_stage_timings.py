@@ -0,0 +1,61 @@
+"""Summarize the slowest traced recap lifecycle stages of a season.
+
+Reads recap_stage_timings, which is only written while
+SQUADVAULT_LIFECYCLE_TRACE=1 (see squadvault.recaps.lifecycle_trace_v1).
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import sys
+
+from squadvault.recaps.lifecycle_trace_v1 import TRACE_ENV_VAR, summarize_stage_timings
+
+
+def main(argv: list[str]) -> int:
+    """CLI entrypoint: print per-stage aggregates, slowest total first."""
+    ap = argparse.ArgumentParser(description="Show the slowest recap lifecycle stages of a season")
+    ap.add_argument("--db", required=True)
+    ap.add_argument("--league-id", required=True)
+    ap.add_argument("--season", type=int, required=True)
+    ap.add_argument("--limit", type=int, default=20, help="Stages to show (0: all)")
+    ap.add_argument(
+        "--all-runs", action="store_true",
+        help="Include every traced run, not only each week's latest",
+    )
+    ap.add_argument("--json", action="store_true", help="Print JSON instead of a table")
+    args = ap.parse_args(argv)
+
+    rows = summarize_stage_timings(
+        args.db, league_id=args.league_id, season=args.season,
+        latest_only=not args.all_runs,
+    )
+    if args.limit > 0:
+        rows = rows[:args.limit]
+
+    if args.json:
+        print(json.dumps(rows, indent=2, sort_keys=True))
+        return 0
+    if not rows:
+        print(f"(no stage timings recorded; run drafts with {TRACE_ENV_VAR}=1)")
+        return 0
+
+    print("")
+    print(f"Slowest lifecycle stages — League {args.league_id} — Season {args.season}")
+    print(
+        f"{'stage':52s} {'runs':>5s} {'total ms':>10s} {'mean ms':>9s} {'max ms':>9s}"
+        f" {'wk':>3s} {'queries':>8s} {'rows':>8s} {'json':>7s} {'angles':>6s}"
+    )
+    for r in rows:
+        print(
+            f"{r['stage']:52s} {r['runs']:5d} {r['total_ms']:10.1f} {r['mean_ms']:9.1f}"
+            f" {r['max_ms']:9.1f} {r['slowest_week'] or '-':>3} {r['queries']:8d}"
+            f" {r['rows_read']:8d} {r['json_payloads']:7d} {r['angles']:6d}"
+        )
+    print("")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main(sys.argv[1:]))
@@ -49,6 +49,10 @@ def main(argv: Sequence[str] | None = None) -> int:
     # Team pair (contract-compliant path)
     ap.add_argument("--team-a-id", type=str, default=None, help="Franchise ID for Team A")
     ap.add_argument("--team-b-id", type=str, default=None, help="Franchise ID for Team B")
+    ap.add_argument(
+        "--all-pairs", action="store_true",
+        help="Multi-season only: one chronicle per franchise pair that met (instead of --team-a-id/--team-b-id)",
+    )
 
     # Week selection: either --start-week/--end-week or --week-range or --weeks
     week_group = ap.add_mutually_exclusive_group(required=False)
@@ -104,6 +108,22 @@ def main(argv: Sequence[str] | None = None) -> int:
     if args.start_season is not None:
         if args.end_season is None:
             raise SystemExit("ERROR: --start-season requires --end-season")
+        if args.all_pairs:
+            if team_a_id is not None:
+                raise SystemExit("ERROR: --all-pairs replaces --team-a-id/--team-b-id")
+            from squadvault.chronicle.persist_rivalry_chronicle_v1 import (
+                persist_rivalry_chronicles_all_pairs_multi_season_v1,
+            )
+            results = persist_rivalry_chronicles_all_pairs_multi_season_v1(
+                db_path=args.db,
+                league_id=int(args.league_id),
+                start_season=int(args.start_season),
+                end_season=int(args.end_season),
+                created_at_utc=str(created_at_utc),
+            )
+            created = sum(1 for r in results if r.created_new)
+            _debug(f"OK multi-season all pairs: pairs={len(results)} created_new={created}")
+            return 0
         if team_a_id is None or team_b_id is None:
             raise SystemExit("ERROR: --team-a-id and --team-b-id required for multi-season")
         from squadvault.chronicle.persist_rivalry_chronicle_v1 import persist_rivalry_chronicle_multi_season_v1
@@ -119,6 +139,9 @@ def main(argv: Sequence[str] | None = None) -> int:
         _debug(f"OK multi-season: v={res.version} created_new={res.created_new}")
         return 0
 
+    if args.all_pairs:
+        raise SystemExit("ERROR: --all-pairs requires --start-season/--end-season")
+
     # Single-season path
     if not week_indices:
         raise SystemExit("ERROR: single-season mode requires week selection (--week-range, --weeks, or --start-week/--end-week)")
@@ -10,12 +10,15 @@ import hashlib
 import json
 import os
 from collections import defaultdict
+from collections.abc import Callable, Iterable
+from concurrent.futures import ProcessPoolExecutor
 from dataclasses import dataclass
 from datetime import UTC, datetime
 from pathlib import Path
 from typing import Any
 
 from squadvault.core.storage.session import DatabaseSession
+from squadvault.errors import CanonicalizationError
 
 DEFAULT_DB_PATH = Path(os.environ.get("SQUADVAULT_DB", ".local_squadvault.sqlite"))  # type: ignore[name-defined]
 
@@ -83,6 +86,63 @@ def raw_mfl_obj(payload: dict[str, Any]) -> dict[str, Any]:
     return {}
 
 
+# ---------------------------------------------------------------------------
+# Decoded-event layer
+#
+# A canonicalize pass reads each payload from several places (R1 phantom detection, the
+# incremental R1 trigger check, fingerprinting, scoring). DecodedEvent parses payload_json,
+# and the nested raw_mfl_json string, at most once per row and hands every caller the same
+# dict. Decoded dicts are shared: callers must treat them as read-only.
+# ---------------------------------------------------------------------------
+
+
+@dataclass
+class DecodeStats:
+    """JSON parse counters for one canonicalize pass."""
+
+    payload_parses: int = 0
+    raw_parses: int = 0
+    reuses: int = 0  # reads served from an earlier parse (parses saved)
+
+
+class DecodedEvent:
+    """A memory event whose payload (and nested raw MFL object) is parsed on first use only."""
+
+    __slots__ = ("row", "_stats", "_payload", "_raw")
+
+    def __init__(self, row: MemoryEventRow, stats: DecodeStats) -> None:
+        """Wrap a ledger row; nothing is parsed until first access."""
+        self.row = row
+        self._stats = stats
+        self._payload: dict[str, Any] | None = None
+        self._raw: dict[str, Any] | None = None
+
+    def payload(self) -> dict[str, Any]:
+        """safe_json_loads(row.payload_json), parsed once."""
+        if self._payload is None:
+            self._payload = safe_json_loads(self.row.payload_json)
+            self._stats.payload_parses += 1
+        else:
+            self._stats.reuses += 1
+        return self._payload
+
+    def raw(self) -> dict[str, Any]:
+        """raw_mfl_obj(payload), parsed once."""
+        if self._raw is None:
+            payload = self._payload if self._payload is not None else self.payload()
+            self._raw = raw_mfl_obj(payload)
+            self._stats.raw_parses += 1
+        else:
+            self._stats.reuses += 1
+        return self._raw
+
+
+def decode_event_rows(event_rows: list[MemoryEventRow], stats: DecodeStats | None = None) -> list[DecodedEvent]:
+    """Wrap ledger rows for parse-once access, sharing one DecodeStats."""
+    shared = stats if stats is not None else DecodeStats()
+    return [DecodedEvent(r, shared) for r in event_rows]
+
+
 def _as_list_str(v: Any) -> list[str]:
     """
     Accepts:
@@ -126,7 +186,9 @@ def _stable_ids_key(ids: list[str]) -> str:
     return ",".join(uniq)
 
 
-def _parse_free_agent_add_drop_from_raw(payload: dict[str, Any]) -> tuple[list[str], list[str]]:
+def _parse_free_agent_add_drop_from_raw(
+    payload: dict[str, Any], raw: dict[str, Any] | None = None,
+) -> tuple[list[str], list[str]]:
     """
     Try to parse add/drop player ids from raw MFL transaction field.
 
@@ -134,9 +196,11 @@ def _parse_free_agent_add_drop_from_raw(payload: dict[str, Any]) -> tuple[list[s
       "<add_ids>|<drop_ids>"
       e.g. "16207,|14108,"
 
-    Returns (added_ids, dropped_ids), possibly empty lists.
+    Returns (added_ids, dropped_ids), possibly empty lists. `raw` is the already
+    decoded raw_mfl_json object, when the caller has one.
     """
-    raw = raw_mfl_obj(payload)
+    if raw is None:
+        raw = raw_mfl_obj(payload)
     txn_field = raw.get("transaction") if isinstance(raw, dict) else None
     if not isinstance(txn_field, str) or not txn_field:
         return ([], [])
@@ -156,13 +220,20 @@ def _parse_free_agent_add_drop_from_raw(payload: dict[str, Any]) -> tuple[list[s
     return (split_ids(add_part), split_ids(drop_part))
 
 
-def action_fingerprint(row: MemoryEventRow, payload: dict[str, Any]) -> str:
+def action_fingerprint(
+    row: MemoryEventRow,
+    payload: dict[str, Any],
+    raw_loader: Callable[[], dict[str, Any]] | None = None,
+) -> str:
     """
     Deterministic canonical action key.
 
     - WAIVER_BID_AWARDED: dedupe + skip stub rows
     - TRANSACTION_FREE_AGENT: dedupe by occurred_at+franchise+add/drop (parsed or raw)
     - Other types: safe default 1:1 by memory_event_id (incremental rollout)
+
+    raw_loader, when given, returns the decoded raw_mfl_json object (e.g.
+    DecodedEvent.raw); it is only called by the branches that need it.
     """
     et = row.event_type
     occurred_at = norm(row.occurred_at)
@@ -178,7 +249,7 @@ def action_fingerprint(row: MemoryEventRow, payload: dict[str, Any]) -> str:
 
         # Detect and drop stub "award" rows that are actually BBID_WAIVER transaction records.
         # These have no award-level fields, but raw_mfl_json.type == "BBID_WAIVER".
-        raw_obj = raw_mfl_obj(payload)
+        raw_obj = raw_loader() if raw_loader is not None else raw_mfl_obj(payload)
         raw_type = norm(raw_obj.get("type"))
 
         if (not player_id) and (not bid_amount) and (not added) and (raw_type == "BBID_WAIVER"):
@@ -217,7 +288,9 @@ def action_fingerprint(row: MemoryEventRow, payload: dict[str, Any]) -> str:
 
         # If missing, try to parse from raw_mfl_json.transaction
         if not added_ids and not dropped_ids:
-            ra, rd = _parse_free_agent_add_drop_from_raw(payload)
+            ra, rd = _parse_free_agent_add_drop_from_raw(
+                payload, raw_loader() if raw_loader is not None else None,
+            )
             if ra or rd:
                 added_ids = ra
                 dropped_ids = rd
@@ -361,50 +434,487 @@ def _matchup_identity(payload: dict[str, Any]) -> tuple[tuple[str, str], str, st
     return (pair, norm(payload.get("winner_score")), norm(payload.get("loser_score")), norm(payload.get("is_tie")))  # type: ignore[return-value]
 
 
-def _phantom_memory_event_ids(event_rows: list[MemoryEventRow]) -> set[int]:
+def _phantom_memory_event_ids(events: list[DecodedEvent]) -> set[int]:
     """Memory-event ids of the 2021+ week-18 championship phantom (see R1 above).
 
     Per season (>= 2021): a week-18 matchup identical to a week-17 matchup is a phantom; its
     matchup row and the week-18 player rows for those two franchises are returned for skipping.
     """
     phantom: set[int] = set()
-    by_season: dict[int, list[MemoryEventRow]] = defaultdict(list)
-    for r in event_rows:
-        by_season[r.season].append(r)
+    by_season: dict[int, list[DecodedEvent]] = defaultdict(list)
+    for ev in events:
+        by_season[ev.row.season].append(ev)
 
-    for season, srows in by_season.items():
+    for season, sevents in by_season.items():
         if season < _PHANTOM_ERA_START:
             continue
+        matchups = [ev for ev in sevents if ev.row.event_type == "WEEKLY_MATCHUP_RESULT"]
         wk17_matchups: set[tuple[tuple[str, str], str, str, str]] = set()
-        for r in srows:
-            if r.event_type == "WEEKLY_MATCHUP_RESULT":
-                p = safe_json_loads(r.payload_json)
-                if norm(p.get("week")) == "17":
-                    wk17_matchups.add(_matchup_identity(p))
+        for ev in matchups:
+            p = ev.payload()
+            if norm(p.get("week")) == "17":
+                wk17_matchups.add(_matchup_identity(p))
         phantom_franchises: set[str] = set()
-        for r in srows:
-            if r.event_type == "WEEKLY_MATCHUP_RESULT":
-                p = safe_json_loads(r.payload_json)
-                if norm(p.get("week")) == "18" and _matchup_identity(p) in wk17_matchups:
-                    phantom.add(r.id)
-                    phantom_franchises.add(norm(p.get("winner_franchise_id")))
-                    phantom_franchises.add(norm(p.get("loser_franchise_id")))
+        for ev in matchups:
+            p = ev.payload()
+            if norm(p.get("week")) == "18" and _matchup_identity(p) in wk17_matchups:
+                phantom.add(ev.row.id)
+                phantom_franchises.add(norm(p.get("winner_franchise_id")))
+                phantom_franchises.add(norm(p.get("loser_franchise_id")))
         if phantom_franchises:
-            for r in srows:
-                if r.event_type == "WEEKLY_PLAYER_SCORE":
-                    p = safe_json_loads(r.payload_json)
+            for ev in sevents:
+                if ev.row.event_type == "WEEKLY_PLAYER_SCORE":
+                    p = ev.payload()
                     if norm(p.get("week")) == "18" and norm(p.get("franchise_id")) in phantom_franchises:
-                        phantom.add(r.id)
+                        phantom.add(ev.row.id)
     return phantom
 
 
-def canonicalize(league_id: str, season: int, db_path: str | Path | None = None) -> None:
+# ---------------------------------------------------------------------------
+# Incremental canonicalization (memory_events high-water mark)
+#
+# canonical_scope_state records, per (league_id, season), the highest memory_events.id
+# already folded into canonical_events and the canonical row count left behind. An
+# incremental run folds only ledger rows above that mark into the existing groups.
+#
+# This is exact, not approximate, because the fold is order-dependent only through
+# memory_events.id: rows are folded in id order, AUTOINCREMENT ids only grow, so folding
+# the new tail onto the stored projection reaches the same state a full rebuild would.
+# The one cross-row rule is R1; new rows that could change the season's phantom set
+# (2021+ week-17/18 matchups, week-18 player scores) force a full rebuild of that scope.
+#
+# Canonical row ids and updated_at are the only columns that may differ from a full
+# rebuild (an incremental run keeps existing ids stable). `verify=True` proves the rest.
+# ---------------------------------------------------------------------------
+
+_PROJECTION_COLUMNS = (
+    "event_type, action_fingerprint, best_memory_event_id, best_score, selection_version, occurred_at"
+)
+
+
+@dataclass
+class _FoldCounts:
+    """Per-run counters reported by canonicalize()."""
+
+    processed: int = 0
+    created: int = 0
+    updated_best: int = 0
+    skipped_empty_fingerprint: int = 0
+    skipped_phantom: int = 0
+
+
+def _load_memory_event_rows(
+    conn: Any, league_id: str, season: int, after_id: int = 0,
+) -> list[MemoryEventRow]:
+    """Load ledger rows for a scope with id > after_id, in id order."""
+    rows = conn.execute(
+        """
+        SELECT id, league_id, season, event_type, occurred_at, ingested_at, payload_json
+        FROM memory_events
+        WHERE league_id = ? AND season = ? AND id > ?
+        ORDER BY id
+        """,
+        (league_id, season, int(after_id)),
+    ).fetchall()
+
+    return [
+        MemoryEventRow(
+            id=int(id_),
+            league_id=str(lg),
+            season=int(yr),
+            event_type=str(et),
+            occurred_at=occ,
+            ingested_at=str(ing),
+            payload_json=str(payload_json),
+        )
+        for (id_, lg, yr, et, occ, ing, payload_json) in rows
+    ]
+
+
+def _delete_scope(conn: Any, league_id: str, season: int) -> None:
+    """Delete canonical rows (memberships first) for a (league_id, season) scope."""
+    # Delete memberships first (safe even without cascading FKs)
+    conn.execute(
+        """
+        DELETE FROM canonical_membership
+        WHERE canonical_event_id IN (
+          SELECT id
+          FROM canonical_events
+          WHERE league_id = ? AND season = ?
+        )
+        """,
+        (league_id, season),
+    )
+
+    # Delete canonical rows for this scope
+    conn.execute(
+        """
+        DELETE FROM canonical_events
+        WHERE league_id = ? AND season = ?
+        """,
+        (league_id, season),
+    )
+
+
+# ---------------------------------------------------------------------------
+# Grouping engine
+#
+# A season is grouped in memory: every row is fingerprinted and scored once, groups are
+# keyed on (event_type, action_fingerprint), and the results are written with executemany.
+# Canonical rows are inserted in order of each group's first memory event, so ids come out
+# exactly as the per-row loop assigned them.
+#
+# Winner rule (unchanged): the best event of a group is its LAST member in memory_events.id
+# order, carrying that member's own score and occurred_at. The original per-row loop compared
+# (score, id) to decide whether to count a "best update", but then unconditionally overwrote
+# the pointer with the row just folded; that effective behaviour is what every existing
+# projection encodes, so it is kept bit-for-bit. Moving to a score-ranked winner is a
+# canonicalization rule change, not an optimization.
+# ---------------------------------------------------------------------------
+
+
+@dataclass(frozen=True)
+class CanonicalGroup:
+    """One canonical event computed in memory: its winner and every member with its score."""
+
+    event_type: str
+    action_fingerprint: str
+    best_memory_event_id: int
+    best_score: int
+    occurred_at: str | None
+    members: tuple[tuple[int, int], ...]  # (memory_event_id, score) in id order
+
+
+def build_canonical_groups(
+    events: list[DecodedEvent],
+    phantom_ids: set[int],
+    prior_best: dict[tuple[str, str], tuple[int, int]] | None = None,
+) -> tuple[list[CanonicalGroup], _FoldCounts]:
+    """Group decoded ledger rows (in id order) into canonical events, without touching the DB.
+
+    prior_best maps (event_type, action_fingerprint) -> (best_memory_event_id, best_score)
+    for groups already in canonical_events (incremental folds); it only affects the
+    created / best-updated counters, never the resulting winners.
+    """
+    counts = _FoldCounts()
+    prior = prior_best or {}
+    order: list[tuple[str, str]] = []
+    members: dict[tuple[str, str], list[tuple[int, int]]] = {}
+    last: dict[tuple[str, str], MemoryEventRow] = {}
+
+    for ev in events:
+        row = ev.row
+        if row.id in phantom_ids:
+            counts.skipped_phantom += 1
+            continue
+
+        payload = ev.payload()
+        fp = action_fingerprint(row, payload, ev.raw)
+
+        # Skip events we intentionally do not canonicalize (e.g., stub waiver "awards")
+        if not fp:
+            counts.skipped_empty_fingerprint += 1
+            continue
+
+        sc = score_event(payload, row.id)
+        key = (row.event_type, fp)
+
+        group = members.get(key)
+        if group is None:
+            previous = prior.get(key)
+            if previous is None:
+                counts.created += 1
+            elif (sc > previous[1]) or (sc == previous[1] and row.id > previous[0]):
+                counts.updated_best += 1
+            group = members[key] = []
+            order.append(key)
+        else:
+            best_id, best_score = group[-1]
+            if (sc > best_score) or (sc == best_score and row.id > best_id):
+                counts.updated_best += 1
+
+        group.append((row.id, sc))
+        last[key] = row
+        counts.processed += 1
+
+    groups = [
+        CanonicalGroup(
+            event_type=key[0],
+            action_fingerprint=key[1],
+            best_memory_event_id=members[key][-1][0],
+            best_score=members[key][-1][1],
+            occurred_at=last[key].occurred_at,
+            members=tuple(members[key]),
+        )
+        for key in order
+    ]
+    return groups, counts
+
+
+def _canonical_ids(conn: Any, league_id: str, season: int) -> dict[tuple[str, str], tuple[int, int, int]]:
+    """Map (event_type, action_fingerprint) -> (id, best_memory_event_id, best_score) for a scope."""
+    rows = conn.execute(
+        """
+        SELECT event_type, action_fingerprint, id, best_memory_event_id, best_score
+        FROM canonical_events
+        WHERE league_id=? AND season=?
+        """,
+        (league_id, season),
+    ).fetchall()
+    return {(str(et), str(fp)): (int(cid), int(bid), int(bs)) for (et, fp, cid, bid, bs) in rows}
+
+
+def _write_canonical_groups(
+    conn: Any,
+    league_id: str,
+    season: int,
+    groups: list[CanonicalGroup],
+    existing: dict[tuple[str, str], tuple[int, int, int]],
+) -> None:
+    """Bulk-write groups: insert new canonical rows, repoint existing ones, add memberships."""
+    updated_at = now_iso_z()
+    inserts = []
+    updates = []
+    for g in groups:
+        key = (g.event_type, g.action_fingerprint)
+        if key in existing:
+            updates.append((g.best_memory_event_id, g.best_score, updated_at, g.occurred_at, existing[key][0]))
+        else:
+            inserts.append((
+                league_id, season, g.event_type, g.action_fingerprint,
+                g.best_memory_event_id, g.best_score, updated_at, g.occurred_at,
+            ))
+
+    conn.executemany(
+        """
+        INSERT INTO canonical_events (
+          league_id, season, event_type, action_fingerprint,
+          best_memory_event_id, best_score,
+          selection_version, updated_at,
+          occurred_at
+        ) VALUES (?, ?, ?, ?, ?, ?, 1, ?, ?)
+        """,
+        inserts,
+    )
+    conn.executemany(
+        """
+        UPDATE canonical_events
+        SET best_memory_event_id=?,
+            best_score=?,
+            selection_version=1,
+            updated_at=?,
+            occurred_at=?
+        WHERE id=?
+        """,
+        updates,
+    )
+
+    ids = _canonical_ids(conn, league_id, season) if inserts else existing
+    conn.executemany(
+        """
+        INSERT OR REPLACE INTO canonical_membership (canonical_event_id, memory_event_id, score)
+        VALUES (?, ?, ?)
+        """,
+        [
+            (ids[(g.event_type, g.action_fingerprint)][0], memory_event_id, score)
+            for g in groups
+            for (memory_event_id, score) in g.members
+        ],
+    )
+
+
+def _fold_event_rows(
+    conn: Any, league_id: str, season: int, events: list[DecodedEvent], phantom_ids: set[int],
+) -> _FoldCounts:
+    """Fold decoded ledger rows (in id order) into canonical_events / canonical_membership for a scope."""
+    existing = _canonical_ids(conn, league_id, season)
+    groups, counts = build_canonical_groups(
+        events,
+        phantom_ids,
+        prior_best={k: (bid, bs) for k, (_cid, bid, bs) in existing.items()},
+    )
+    _write_canonical_groups(conn, league_id, season, groups, existing)
+    return counts
+
+
+def _canonical_count(conn: Any, league_id: str, season: int) -> int:
+    """Number of canonical_events rows in a scope."""
+    row = conn.execute(
+        "SELECT COUNT(*) FROM canonical_events WHERE league_id=? AND season=?",
+        (league_id, season),
+    ).fetchone()
+    return int(row[0])
+
+
+def _membership_count(conn: Any, league_id: str, season: int) -> int:
+    """Number of canonical_membership rows in a scope."""
+    row = conn.execute(
+        """
+        SELECT COUNT(*)
+        FROM canonical_membership cm
+        JOIN canonical_events ce ON ce.id = cm.canonical_event_id
+        WHERE ce.league_id=? AND ce.season=?
+        """,
+        (league_id, season),
+    ).fetchone()
+    return int(row[0])
+
+
+def _read_scope_state(conn: Any, league_id: str, season: int) -> tuple[int, int] | None:
+    """Return (last_memory_event_id, canonical_count) for a scope, or None."""
+    row = conn.execute(
+        """
+        SELECT last_memory_event_id, canonical_count
+        FROM canonical_scope_state
+        WHERE league_id=? AND season=?
+        """,
+        (league_id, season),
+    ).fetchone()
+    if row is None:
+        return None
+    return (int(row[0]), int(row[1]))
+
+
+def _write_scope_state(conn: Any, league_id: str, season: int, last_memory_event_id: int) -> None:
+    """Record the high-water mark and resulting canonical row count for a scope."""
+    conn.execute(
+        """
+        INSERT INTO canonical_scope_state (
+          league_id, season, last_memory_event_id, canonical_count, updated_at
+        ) VALUES (?, ?, ?, ?, ?)
+        ON CONFLICT (league_id, season) DO UPDATE SET
+          last_memory_event_id = excluded.last_memory_event_id,
+          canonical_count = excluded.canonical_count,
+          updated_at = excluded.updated_at
+        """,
+        (league_id, season, int(last_memory_event_id), _canonical_count(conn, league_id, season), now_iso_z()),
+    )
+
+
+def _touches_phantom_rule(season: int, events: list[DecodedEvent]) -> bool:
+    """True if any row could change the season's R1 phantom set (see R1 above)."""
+    if season < _PHANTOM_ERA_START:
+        return False
+    for ev in events:
+        if ev.row.event_type == "WEEKLY_MATCHUP_RESULT":
+            if norm(ev.payload().get("week")) in ("17", "18"):
+                return True
+        elif ev.row.event_type == "WEEKLY_PLAYER_SCORE":
+            if norm(ev.payload().get("week")) == "18":
+                return True
+    return False
+
+
+def _projection_snapshot(conn: Any, league_id: str, season: int) -> list[tuple[Any, ...]]:
+    """Canonical projection + memberships for a scope, minus ids and updated_at, in a stable order."""
+    rows = conn.execute(
+        f"""
+        SELECT {_PROJECTION_COLUMNS}
+        FROM canonical_events
+        WHERE league_id=? AND season=?
+        ORDER BY event_type, action_fingerprint
+        """,
+        (league_id, season),
+    ).fetchall()
+    members = conn.execute(
+        """
+        SELECT ce.event_type, ce.action_fingerprint, cm.memory_event_id, cm.score
+        FROM canonical_membership cm
+        JOIN canonical_events ce ON ce.id = cm.canonical_event_id
+        WHERE ce.league_id=? AND ce.season=?
+        ORDER BY ce.event_type, ce.action_fingerprint, cm.memory_event_id
+        """,
+        (league_id, season),
+    ).fetchall()
+    return [("event", *r) for r in rows] + [("member", *m) for m in members]
+
+
+def _verify_against_full_rebuild(conn: Any, league_id: str, season: int) -> int:
+    """Rebuild the scope inside a rolled-back savepoint and compare projections.
+
+    Returns the number of canonical + membership rows compared. Raises CanonicalizationError
+    on any difference. The stored projection is left untouched.
+    """
+    stored = _projection_snapshot(conn, league_id, season)
+
+    conn.execute("SAVEPOINT canonicalize_verify;")
+    try:
+        _delete_scope(conn, league_id, season)
+        events = decode_event_rows(_load_memory_event_rows(conn, league_id, season))
+        _fold_event_rows(conn, league_id, season, events, _phantom_memory_event_ids(events))
+        rebuilt = _projection_snapshot(conn, league_id, season)
+    finally:
+        conn.execute("ROLLBACK TO canonicalize_verify;")
+        conn.execute("RELEASE canonicalize_verify;")
+
+    if stored != rebuilt:
+        stored_set, rebuilt_set = set(stored), set(rebuilt)
+        only_stored = [r for r in stored if r not in rebuilt_set]
+        only_rebuilt = [r for r in rebuilt if r not in stored_set]
+        raise CanonicalizationError(
+            f"canonical projection for league_id={league_id} season={season} differs from a full rebuild: "
+            f"{len(only_stored)} stored-only row(s), {len(only_rebuilt)} rebuilt-only row(s); "
+            f"first stored-only={only_stored[:1]} first rebuilt-only={only_rebuilt[:1]}"
+        )
+    return len(stored)
+
+
+def _print_summary(
+    conn: Any,
+    league_id: str,
+    season: int,
+    db: Path,
+    mode: str,
+    last_id: int,
+    counts: _FoldCounts,
+    decode: DecodeStats,
+) -> None:
+    """Print the per-scope canonicalize report."""
+    print("canonicalize_done")
+    print("league_id =", league_id, "season =", season)
+    print("db_path =", str(db))
+    print("mode =", mode)
+    print("last_memory_event_id =", last_id)
+    print("memory_events_processed =", counts.processed)
+    print("skipped_empty_fingerprint =", counts.skipped_empty_fingerprint)
+    print("skipped_phantom =", counts.skipped_phantom)
+    print("canonical_events_created =", counts.created)
+    print("canonical_best_updated =", counts.updated_best)
+    print("json_parses =", decode.payload_parses + decode.raw_parses)
+    print("json_parses_saved =", decode.reuses)
+
+    totals = conn.execute(
+        """
+        SELECT event_type, COUNT(*) AS n
+        FROM canonical_events
+        WHERE league_id=? AND season=?
+        GROUP BY event_type
+        ORDER BY n DESC
+        """,
+        (league_id, season),
+    ).fetchall()
+    print("canonical_by_type =", {et: int(n) for (et, n) in totals})
+
+
+def canonicalize(
+    league_id: str,
+    season: int,
+    db_path: str | Path | None = None,
+    *,
+    incremental: bool = False,
+    verify: bool = False,
+) -> None:
     """
     Canonicalize memory_events into canonical_events for a (league_id, season) scope.
 
     IMPORTANT:
     - Uses the provided db_path when given.
     - Falls back to env SQUADVAULT_DB, then .local_squadvault.sqlite.
+    - incremental=True folds only ledger rows above the scope's high-water mark
+      (canonical_scope_state); falls back to a full rebuild when no usable mark
+      exists or the new rows touch the R1 phantom rule.
+    - verify=True rebuilds the scope in a rolled-back savepoint afterwards and
+      raises CanonicalizationError if the stored projection differs.
     """
     resolved_db = Path(db_path) if db_path is not None else DEFAULT_DB_PATH
 
@@ -414,178 +924,127 @@ def canonicalize(league_id: str, season: int, db_path: str | Path | None = None)
     with DatabaseSession(str(resolved_db)) as conn:
         conn.execute("PRAGMA foreign_keys = ON;")
 
-        # ---------------------------------------------------------------------
-        # MVP INVARIANT:
-        # canonical_events represents CURRENT truth for (league_id, season).
-        # It is rebuilt deterministically each run. No accumulated versions.
-        # ---------------------------------------------------------------------
-        conn.execute("BEGIN;")
-
-        # Delete memberships first (safe even without cascading FKs)
-        conn.execute(
-            """
-            DELETE FROM canonical_membership
-            WHERE canonical_event_id IN (
-              SELECT id
-              FROM canonical_events
-              WHERE league_id = ? AND season = ?
+        mode = "full"
+        decode = DecodeStats()
+        new_events: list[DecodedEvent] = []
+        state = _read_scope_state(conn, league_id, season) if incremental else None
+        # Every canonical row has at least one member; a scope folded before memberships
+        # were recorded (or otherwise edited behind our back) is rebuilt in full.
+        if (
+            state is not None
+            and state[1] == _canonical_count(conn, league_id, season)
+            and _membership_count(conn, league_id, season) >= state[1]
+        ):
+            new_events = decode_event_rows(
+                _load_memory_event_rows(conn, league_id, season, after_id=state[0]), decode,
             )
-            """,
-            (league_id, season),
-        )
+            if not new_events:
+                mode = "noop"
+            elif not _touches_phantom_rule(season, new_events):
+                mode = "incremental"
+
+        if mode == "full":
+            # ---------------------------------------------------------------------
+            # MVP INVARIANT:
+            # canonical_events represents CURRENT truth for (league_id, season).
+            # A full run rebuilds it deterministically. No accumulated versions.
+            # ---------------------------------------------------------------------
+            conn.execute("BEGIN;")
+            _delete_scope(conn, league_id, season)
+            conn.execute("COMMIT;")
+
+            # Now rebuild (single transaction for determinism and speed)
+            conn.execute("BEGIN;")
+            events = decode_event_rows(_load_memory_event_rows(conn, league_id, season), decode)
+
+            # R1: suppress the 2021+ week-18 championship phantom from the canonical projection
+            # (ledger untouched; byte-identical-only; deterministic). See the rule doc above.
+            phantom_ids = _phantom_memory_event_ids(events)
+            counts = _fold_event_rows(conn, league_id, season, events, phantom_ids)
+            last_id = events[-1].row.id if events else 0
+        else:
+            conn.execute("BEGIN;")
+            # New rows never contain an R1 phantom here (_touches_phantom_rule was False).
+            counts = _fold_event_rows(conn, league_id, season, new_events, set())
+            last_id = new_events[-1].row.id if new_events else state[0]  # type: ignore[index]
 
-        # Delete canonical rows for this scope
-        conn.execute(
-            """
-            DELETE FROM canonical_events
-            WHERE league_id = ? AND season = ?
-            """,
-            (league_id, season),
-        )
+        _write_scope_state(conn, league_id, season, last_id)
         conn.execute("COMMIT;")
 
-        # Now rebuild (single transaction for determinism and speed)
-        conn.execute("BEGIN;")
-
-        rows = conn.execute(
-            """
-            SELECT id, league_id, season, event_type, occurred_at, ingested_at, payload_json
-            FROM memory_events
-            WHERE league_id = ? AND season = ?
-            ORDER BY id
-            """,
-            (league_id, season),
-        ).fetchall()
-
-        event_rows = [
-            MemoryEventRow(
-                id=int(id_),
-                league_id=str(lg),
-                season=int(yr),
-                event_type=str(et),
-                occurred_at=occ,
-                ingested_at=str(ing),
-                payload_json=str(payload_json),
-            )
-            for (id_, lg, yr, et, occ, ing, payload_json) in rows
-        ]
-
-        # R1: suppress the 2021+ week-18 championship phantom from the canonical projection
-        # (ledger untouched; byte-identical-only; deterministic). See the rule doc above.
-        phantom_ids = _phantom_memory_event_ids(event_rows)
-
-        processed = 0
-        created = 0
-        updated_best = 0
-        skipped_empty_fingerprint = 0
-        skipped_phantom = 0
-
-        for row in event_rows:
-            if row.id in phantom_ids:
-                skipped_phantom += 1
-                continue
-
-            payload = safe_json_loads(row.payload_json)
-            fp = action_fingerprint(row, payload)
-
-            # Skip events we intentionally do not canonicalize (e.g., stub waiver "awards")
-            if not fp:
-                skipped_empty_fingerprint += 1
-                continue
-
-            sc = score_event(payload, row.id)
-
-            existing = conn.execute(
-                """
-                SELECT id, best_memory_event_id, best_score
-                FROM canonical_events
-                WHERE league_id=? AND season=? AND event_type=? AND action_fingerprint=?
-                """,
-                (row.league_id, row.season, row.event_type, fp),
-            ).fetchone()
-
-            if existing is None:
-                cur = conn.execute(
-                    """
-                    INSERT INTO canonical_events (
-                      league_id, season, event_type, action_fingerprint,
-                      best_memory_event_id, best_score,
-                      selection_version, updated_at,
-                      occurred_at
-                    ) VALUES (?, ?, ?, ?, ?, ?, 1, ?, ?)
-                    """,
-                    (
-                        row.league_id,
-                        row.season,
-                        row.event_type,
-                        fp,
-                        row.id,
-                        sc,
-                        now_iso_z(),
-                        row.occurred_at,
-                    ),
-                )
-                canonical_id = int(cur.lastrowid or 0)
-                created += 1
-            else:
-                canonical_id, best_id, best_score = existing
-                canonical_id = int(canonical_id)
-                best_id = int(best_id)
-                best_score = int(best_score)
-
-                better = (sc > best_score) or (sc == best_score and row.id > best_id)
-                if better:
-                    conn.execute(
-                        """
-                        UPDATE canonical_events
-                        SET best_memory_event_id=?,
-                            best_score=?,
-                            selection_version=1,
-                            updated_at=?
-                        WHERE id=?
-                        """,
-                        (row.id, sc, now_iso_z(), canonical_id),
-                    )
-                    updated_best += 1
-
-            # Always set occurred_at (and keep deterministic metadata fresh)
-            conn.execute(
-                """
-                UPDATE canonical_events
-                SET best_memory_event_id=?,
-                    best_score=?,
-                    selection_version=1,
-                    updated_at=?,
-                    occurred_at=?
-                WHERE id=?
-                """,
-                (row.id, sc, now_iso_z(), row.occurred_at, canonical_id),
-            )
+        _print_summary(conn, league_id, season, resolved_db, mode, last_id, counts, decode)
 
-            processed += 1
+        if verify:
+            compared = _verify_against_full_rebuild(conn, league_id, season)
+            print("verify_full_rebuild = identical", f"({compared} canonical + membership rows)")
 
-        conn.execute("COMMIT;")
 
-        print("canonicalize_done")
-        print("league_id =", league_id, "season =", season)
-        print("db_path =", str(resolved_db))
-        print("memory_events_processed =", processed)
-        print("skipped_empty_fingerprint =", skipped_empty_fingerprint)
-        print("skipped_phantom =", skipped_phantom)
-        print("canonical_events_created =", created)
-        print("canonical_best_updated =", updated_best)
-
-        totals = conn.execute(
-            """
-            SELECT event_type, COUNT(*) AS n
-            FROM canonical_events
-            WHERE league_id=? AND season=?
-            GROUP BY event_type
-            ORDER BY n DESC
-            """,
-            (league_id, season),
-        ).fetchall()
-        print("canonical_by_type =", {et: int(n) for (et, n) in totals})
+# ---------------------------------------------------------------------------
+# Multi-season canonicalization
+#
+# The expensive part of a rebuild is pure Python (payload parsing, fingerprinting, R1), and
+# each season is independent, so canonicalize_all() computes season projections in a process
+# pool. Workers only read the ledger; the calling process is the single writer and commits
+# the seasons in ascending order, so canonical ids come out exactly as a serial loop of
+# canonicalize() calls would assign them.
+# ---------------------------------------------------------------------------
+
+
+def _compute_season_projection(
+    db_path: str, league_id: str, season: int,
+) -> tuple[int, list[CanonicalGroup], _FoldCounts, DecodeStats, int]:
+    """Worker: read one season's ledger and group it. Returns (season, groups, counts, decode, last_id)."""
+    decode = DecodeStats()
+    with DatabaseSession(db_path) as conn:
+        events = decode_event_rows(_load_memory_event_rows(conn, league_id, season), decode)
+    groups, counts = build_canonical_groups(events, _phantom_memory_event_ids(events))
+    return season, groups, counts, decode, (events[-1].row.id if events else 0)
+
+
+def canonicalize_all(
+    league_id: str,
+    seasons: Iterable[int],
+    db_path: str | Path | None = None,
+    *,
+    workers: int = 1,
+) -> None:
+    """
+    Fully rebuild canonical_events for many seasons of one league.
+
+    Season projections are computed by up to `workers` processes (workers <= 1 runs
+    inline); this process writes them in ascending season order, one transaction per
+    season. The result is identical to calling canonicalize() for each season in turn.
+    """
+    resolved_db = Path(db_path) if db_path is not None else DEFAULT_DB_PATH
+
+    if not resolved_db.exists():
+        raise FileNotFoundError(f"SQLite DB not found at {resolved_db.resolve()}")
+
+    ordered = sorted({int(s) for s in seasons})
+    args = [(str(resolved_db), league_id, s) for s in ordered]
+
+    with DatabaseSession(str(resolved_db)) as conn:
+        conn.execute("PRAGMA foreign_keys = ON;")
+
+        def _write(result: tuple[int, list[CanonicalGroup], _FoldCounts, DecodeStats, int]) -> None:
+            """Single writer: replace one season's projection and record its mark."""
+            season, groups, counts, decode, last_id = result
+            conn.execute("BEGIN;")
+            _delete_scope(conn, league_id, season)
+            _write_canonical_groups(conn, league_id, season, groups, {})
+            _write_scope_state(conn, league_id, season, last_id)
+            conn.execute("COMMIT;")
+            _print_summary(conn, league_id, season, resolved_db, "full", last_id, counts, decode)
+
+        if workers <= 1 or len(ordered) <= 1:
+            for a in args:
+                _write(_compute_season_projection(*a))
+            return
+
+        with ProcessPoolExecutor(max_workers=min(workers, len(ordered))) as pool:
+            # map() yields in submission order: seasons are committed in order while
+            # later seasons are still being computed.
+            for result in pool.map(_compute_season_projection, *zip(*args, strict=True)):
+                _write(result)
 
 
 if __name__ == "__main__":
@@ -595,9 +1054,26 @@ if __name__ == "__main__":
     p.add_argument("--db", default=os.environ.get("SQUADVAULT_DB", ".local_squadvault.sqlite"))
     p.add_argument("--league-id", default=os.environ.get("MFL_LEAGUE_ID", "").strip())
     p.add_argument("--season", type=int, default=int(os.environ.get("SQUADVAULT_YEAR", "2024")))
+    p.add_argument("--seasons", type=int, nargs="+", default=None,
+                   help="Fully rebuild several seasons (overrides --season; see --workers)")
+    p.add_argument("--workers", type=int, default=1,
+                   help="Processes computing season projections in parallel with --seasons (default: 1)")
+    p.add_argument("--incremental", action="store_true",
+                   help="Fold only memory events above the scope's high-water mark (falls back to full rebuild)")
+    p.add_argument("--verify", action="store_true",
+                   help="After canonicalizing, prove the projection equals a full rebuild (rolled back)")
     args = p.parse_args()
 
     if not args.league_id:
         raise RuntimeError("MFL_LEAGUE_ID env var required (or pass --league-id)")
 
-    canonicalize(league_id=args.league_id, season=args.season, db_path=args.db)
+    if args.seasons:
+        canonicalize_all(league_id=args.league_id, seasons=args.seasons, db_path=args.db, workers=args.workers)
+    else:
+        canonicalize(
+            league_id=args.league_id,
+            season=args.season,
+            db_path=args.db,
+            incremental=args.incremental,
+            verify=args.verify,
+        )
@@ -0,0 +1,295 @@
+"""Directory Cache v1 — a league's name directories loaded once per process.
+
+Contract:
+- Derived-only: every view is what the directory tables say; the cache
+  never writes back.
+- Non-authoritative: invalidated by db_utils.directory_fingerprint (row
+  count and MAX(updated_at) of franchise_directory, player_directory and
+  franchise_nicknames); a changed directory starts a fresh load.
+
+Name resolution used to re-read the directories at every turn: each
+PlayerResolver / FranchiseResolver probed sqlite_master and ran IN (...)
+lookups, the lifecycle built new resolvers for every week (and again for
+player highlights and the creative layer), and build_player_name_map,
+build_cross_season_name_resolver, build_season_scoped_name_map and the
+verifier's name maps each reloaded the tables. NameDirectory loads all
+three tables for a league in one pass into per-season dicts of interned
+strings (ids, positions, NFL teams and names repeat across seasons) and
+hands out season-scoped and cross-season views built once on first use.
+A range build touches the directory tables once; every later lookup
+costs the fingerprint check.
+
+Views are shared between callers and must not be mutated. The public
+builders in resolvers and league_history_v1 return copies. Edits that
+bypass the directory writers without stamping updated_at (hand-run SQL)
+need name_directory_cache().clear().
+"""
+
+from __future__ import annotations
+
+import sqlite3
+import threading
+from collections import OrderedDict
+from collections.abc import Callable
+from pathlib import Path
+from sys import intern
+from typing import Any, TypeVar
+
+from squadvault.core.storage.db_utils import directory_fingerprint, table_columns
+from squadvault.core.storage.session import DatabaseSession
+
+T = TypeVar("T")
+
+# (name, position, team) of one player in one season; "" when NULL.
+PlayerEntry = tuple[str, str, str]
+# (name, owner_name) of one franchise in one season; "" when NULL.
+FranchiseEntry = tuple[str, str]
+
+
+def _text(value: Any) -> str:
+    """Stripped, interned text of a directory column ("" for NULL)."""
+    return intern(str(value).strip()) if value is not None else ""
+
+
+class NameDirectory:
+    """Player and franchise names of one league at one directory state."""
+
+    def __init__(
+        self,
+        db_path: str,
+        league_id: str,
+        fingerprint: tuple[Any, ...] | None = None,
+    ) -> None:
+        """Create an unloaded directory; load() reads the tables."""
+        self.db_path = db_path
+        self.league_id = str(league_id)
+        self.fingerprint = fingerprint
+        self.missing_tables: frozenset[str] = frozenset()
+        self._players: dict[int, dict[str, PlayerEntry]] = {}
+        self._franchises: dict[int, dict[str, FranchiseEntry]] = {}
+        self._nicknames: dict[str, str] = {}
+        self._views: dict[Any, Any] = {}
+        self._lock = threading.RLock()
+
+    def load(self, con: sqlite3.Connection) -> NameDirectory:
+        """Read the league's rows of all three directory tables."""
+        missing: set[str] = set()
+        lid = self.league_id
+
+        def rows(table: str, keys: tuple[str, ...], columns: tuple[str, ...]) -> list[Any]:
+            """(*keys, *columns) rows of one table in key order.
+
+            Absent optional columns read as NULL; a missing table has no rows.
+            """
+            present = table_columns(con, table)
+            if not present:
+                missing.add(table)
+                return []
+            select = ", ".join([*keys, *(c if c in present else "NULL" for c in columns)])
+            return con.execute(
+                f"SELECT {select} FROM {table} WHERE league_id = ? ORDER BY {', '.join(keys)}",
+                (lid,),
+            ).fetchall()
+
+        for row in rows("player_directory", ("season", "player_id"), ("name", "position", "team")):
+            pid = _text(row[1])
+            if pid:
+                self._players.setdefault(int(row[0]), {})[pid] = (
+                    _text(row[2]), _text(row[3]), _text(row[4]),
+                )
+        for row in rows("franchise_directory", ("season", "franchise_id"), ("name", "owner_name")):
+            fid = _text(row[1])
+            if fid:
+                self._franchises.setdefault(int(row[0]), {})[fid] = (
+                    _text(row[2]), _text(row[3]),
+                )
+        for row in rows("franchise_nicknames", ("franchise_id",), ("nickname",)):
+            fid, nickname = _text(row[0]), _text(row[1])
+            if fid and nickname:
+                self._nicknames[fid] = nickname
+        self.missing_tables = frozenset(missing)
+        return self
+
+    def memo(self, key: Any, build: Callable[[], T]) -> T:
+        """Return the view stored under key, building it on first use.
+
+        Also for structures derived from the directory elsewhere (the
+        verifier's reverse alias map), which then live as long as it does.
+        """
+        with self._lock:
+            if key not in self._views:
+                self._views[key] = build()
+            value: T = self._views[key]
+            return value
+
+    # Raw rows
+
+    def seasons(self) -> tuple[int, ...]:
+        """Seasons with player or franchise rows, ascending."""
+        return tuple(sorted(self._players.keys() | self._franchises.keys()))
+
+    def players(self, season: int) -> dict[str, PlayerEntry]:
+        """player_id -> (name, position, team) for the season."""
+        return self._players.get(int(season), {})
+
+    def franchises(self, season: int) -> dict[str, FranchiseEntry]:
+        """franchise_id -> (name, owner_name) for the season."""
+        return self._franchises.get(int(season), {})
+
+    def franchise_nicknames(self) -> dict[str, str]:
+        """franchise_id -> curated nickname (league-wide)."""
+        return self._nicknames
+
+    # Season-scoped views
+
+    def player_display_names(self, season: int) -> dict[str, str]:
+        """player_id -> "Name (Pos, Team)" for the season (PlayerResolver format)."""
+
+        def build() -> dict[str, str]:
+            """Display names of the season's players."""
+            out: dict[str, str] = {}
+            for pid, (name, pos, team) in self.players(season).items():
+                extra = ", ".join(x for x in (pos, team) if x)
+                out[pid] = f"{name} ({extra})" if (name and extra) else (name or pid)
+            return out
+
+        return self.memo(("player_display_names", int(season)), build)
+
+    def franchise_names(self, season: int) -> dict[str, str]:
+        """franchise_id -> name for the season's franchises that have one."""
+        return self.memo(
+            ("franchise_names", int(season)),
+            lambda: {fid: name for fid, (name, _) in self.franchises(season).items() if name},
+        )
+
+    def franchise_owner_names(self, season: int) -> dict[str, str]:
+        """franchise_id -> owner_name for the season's franchises that have one."""
+        return self.memo(
+            ("franchise_owner_names", int(season)),
+            lambda: {fid: owner for fid, (_, owner) in self.franchises(season).items() if owner},
+        )
+
+    # Cross-season views
+
+    def latest_player_names(self) -> dict[str, str]:
+        """player_id -> name from the most recent season that names the player."""
+
+        def build() -> dict[str, str]:
+            """Walk seasons newest first; the first name seen wins."""
+            out: dict[str, str] = {}
+            for season in sorted(self._players, reverse=True):
+                for pid, (name, _, _) in self._players[season].items():
+                    if name and pid not in out:
+                        out[pid] = name
+            return out
+
+        return self.memo("latest_player_names", build)
+
+    def latest_franchise_names(self) -> dict[str, str]:
+        """franchise_id -> most recent season's name (the id if unnamed)."""
+
+        def build() -> dict[str, str]:
+            """Walk seasons newest first; the first row seen wins."""
+            out: dict[str, str] = {}
+            for season in sorted(self._franchises, reverse=True):
+                for fid, (name, _) in self._franchises[season].items():
+                    out.setdefault(fid, name or fid)
+            return out
+
+        return self.memo("latest_franchise_names", build)
+
+    def franchise_name_history(self) -> dict[str, list[tuple[int, str]]]:
+        """franchise_id -> [(season, name or id), ...] in season order."""
+
+        def build() -> dict[str, list[tuple[int, str]]]:
+            """Every franchise row, grouped by franchise."""
+            out: dict[str, list[tuple[int, str]]] = {}
+            for season in sorted(self._franchises):
+                for fid, (name, _) in self._franchises[season].items():
+                    out.setdefault(fid, []).append((season, name or fid))
+            return dict(sorted(out.items()))
+
+        return self.memo("franchise_name_history", build)
+
+
+class NameDirectoryCache:
+    """LRU of NameDirectory per (database, league), checked per lookup.
+
+    get() recomputes the directory fingerprint (three aggregate queries)
+    and returns the loaded directory only while it still matches;
+    otherwise the league's tables are read again.
+
+    max_entries=0 disables caching (every lookup loads a fresh directory).
+    """
+
+    def __init__(self, max_entries: int = 4) -> None:
+        """Create an empty registry holding at most max_entries leagues."""
+        self.max_entries = int(max_entries)
+        self.hits = 0
+        self.misses = 0
+        self.stale = 0
+        self._entries: OrderedDict[tuple[str, str], NameDirectory] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        """Number of cached leagues."""
+        return len(self._entries)
+
+    def clear(self) -> None:
+        """Drop every entry and reset the counters."""
+        with self._lock:
+            self._entries.clear()
+            self.hits = self.misses = self.stale = 0
+
+    def get(
+        self,
+        db_path: str,
+        league_id: str,
+        con: sqlite3.Connection | None = None,
+    ) -> NameDirectory:
+        """Return the league's directory as of its current fingerprint.
+
+        con: an open connection to db_path to read through (for callers
+        holding a session); by default a DatabaseSession of its own.
+        """
+        if con is None:
+            with DatabaseSession(db_path) as own:
+                return self.get(db_path, league_id, own)
+        scope = (str(db_path), str(league_id))
+        fingerprint = directory_fingerprint(con, league_id)
+        with self._lock:
+            cached = self._entries.get(scope)
+            if cached is not None and cached.fingerprint == fingerprint:
+                self.hits += 1
+                self._entries.move_to_end(scope)
+                return cached
+        fresh = NameDirectory(str(db_path), league_id, fingerprint).load(con)
+        with self._lock:
+            self.misses += 1
+            if scope in self._entries:
+                self.stale += 1
+                del self._entries[scope]
+            if self.max_entries > 0:
+                self._entries[scope] = fresh
+                while len(self._entries) > self.max_entries:
+                    self._entries.popitem(last=False)
+        return fresh
+
+
+# Process-wide registry used by name_directory().
+_DIRECTORIES = NameDirectoryCache()
+
+
+def name_directory_cache() -> NameDirectoryCache:
+    """The process-wide NameDirectoryCache (for counters and clear())."""
+    return _DIRECTORIES
+
+
+def name_directory(
+    db_path: str | Path,
+    league_id: str,
+    *,
+    con: sqlite3.Connection | None = None,
+) -> NameDirectory:
+    """Process-wide NameDirectory for the league's current directory state."""
+    return _DIRECTORIES.get(str(db_path), league_id, con)
@@ -45,6 +45,10 @@ from collections.abc import Sequence
 
 from squadvault.core.recaps.context.league_history_v1 import HistoricalMatchup
 from squadvault.core.recaps.context.narrative_angles_v1 import NarrativeAngle
+from squadvault.core.recaps.context.player_score_store_v1 import (
+    PlayerScoreStore,
+    load_player_score_store,
+)
 from squadvault.core.recaps.render.streak_strings_v1 import format_streak_phrase
 from squadvault.core.resolvers import NameFn
 from squadvault.core.resolvers import identity as _identity
@@ -56,22 +60,13 @@ from squadvault.core.storage.session import DatabaseSession
 def _load_season_player_scores_flat(
     db_path: str, league_id: str, season: int,
 ) -> list[dict]:
-    """Load WEEKLY_PLAYER_SCORE payloads for a season. Returns raw dicts."""
-    out: list[dict] = []
-    with DatabaseSession(db_path) as con:
-        rows = con.execute(
-            """SELECT payload_json FROM v_canonical_best_events
-               WHERE league_id = ? AND season = ? AND event_type = 'WEEKLY_PLAYER_SCORE'""",
-            (str(league_id), int(season)),
-        ).fetchall()
-    for row in rows:
-        try:
-            p = json.loads(row[0]) if isinstance(row[0], str) else row[0]
-        except (ValueError, TypeError):
-            continue
-        if isinstance(p, dict):
-            out.append(p)
-    return out
+    """Load WEEKLY_PLAYER_SCORE payloads for a season.
+
+    Returns payload-shaped dicts (week, franchise_id, player_id, score,
+    is_starter, should_start) built from the columnar player score store.
+    """
+    store = load_player_score_store(db_path, league_id, season=season)
+    return store.season_payloads(season)
 
 
 def _load_player_positions(
@@ -1536,16 +1531,26 @@ def detect_franchise_deep_angles_v1(
     tenure_map: dict[str, int] | None = None,
     pname: NameFn = _identity,
     fname: NameFn = _identity,
+    score_store: PlayerScoreStore | None = None,
+    all_matchups: list[HistoricalMatchup] | None = None,
 ) -> list[NarrativeAngle]:
     """Detect all Dimension 7-9 franchise deep angles for a given week.
 
+    score_store: the league's player score store when the caller already
+        holds it; all_matchups: matchups already scoped to (season, week).
+        Each is loaded here when omitted.
+
     Returns angles sorted by strength descending then category ascending.
     Returns empty list when insufficient data exists.
     """
-    score_payloads = _load_season_player_scores_flat(db_path, league_id, season)
-    all_matchups = _load_all_matchups_flat(
-        db_path, league_id, as_of_season=season, as_of_week=week,
-    )
+    if score_store is not None:
+        score_payloads = score_store.season_payloads(season)
+    else:
+        score_payloads = _load_season_player_scores_flat(db_path, league_id, season)
+    if all_matchups is None:
+        all_matchups = _load_all_matchups_flat(
+            db_path, league_id, as_of_season=season, as_of_week=week,
+        )
     positions = _load_player_positions(db_path, league_id, season)
 
     all_angles: list[NarrativeAngle] = []
@@ -49,7 +49,7 @@ Governance:
 
 from __future__ import annotations
 
-from collections.abc import Sequence
+from collections.abc import Iterable, Sequence
 from dataclasses import dataclass
 from typing import Any
 
@@ -219,8 +219,18 @@ def compute_all_season_records(
         for (fid, season), d in key_data.items()
     ]
 
-    records.sort(key=lambda r: (-r.losses, r.points_for, r.season, r.franchise_id))
-    return tuple(records)
+    return sort_worst_first(records)
+
+
+def sort_worst_first(records: Iterable[SeasonRecord]) -> tuple[SeasonRecord, ...]:
+    """Season records in compute_all_season_records' worst-first order.
+
+    Lets callers holding precomputed records (e.g. the league-history
+    accumulator's season_records()) share the sub-shape's ordering.
+    """
+    return tuple(sorted(
+        records, key=lambda r: (-r.losses, r.points_for, r.season, r.franchise_id),
+    ))
 
 
 # ── Derivation: Championship Roll (spec §3.3) ────────────────────────
@@ -0,0 +1,426 @@
+"""League History Accumulator v1 — league history snapshotted at every week.
+
+Contract:
+- Derived-only: advances over HistoricalMatchup rows; never writes back.
+- Deterministic: every snapshot equals what league_history_v1 derives from
+  the matchups at or before that (season, week), including tie-breaks and
+  float rounding.
+- Temporally scoped: as_of(season, week) reads the state inclusive of that
+  week, exclusive of every later one (Weekly Recap Context Temporal
+  Scoping Addendum v1.0).
+
+league_history_v1 derives all-time W/L/T, longest streaks, scoring records
+and best/worst seasons by walking every matchup through the cutoff, and
+compute_head_to_head walks them again per pairing. Over a season range
+that is quadratic in league history. The accumulator walks the history
+once, one week at a time, and keeps:
+
+- a LeagueHistoryContextV1 snapshot at the end of every week with games;
+- a per-pairing meeting index with cumulative win/tie counts;
+- the per-(franchise, season) season records.
+
+Any cutoff is then a bisection over the snapshot keys. The state lives for
+as long as its owner keeps it (see league_history_cache_v1, which keys it
+on the ledger fingerprint).
+"""
+
+from __future__ import annotations
+
+import math
+from bisect import bisect_right
+from collections.abc import Sequence
+from dataclasses import dataclass, field
+
+from squadvault.core.recaps.context.league_history_v1 import (
+    AllTimeRecord,
+    HeadToHeadRecord,
+    HistoricalMatchup,
+    LeagueHistoryContextV1,
+    ScoringRecord,
+    SeasonRecord,
+    StreakRecord,
+)
+
+# Python 3.12 made sum() of floats compensated (Neumaier). The running
+# league average must match sum() on the interpreter in use.
+_SUM_IS_COMPENSATED = sum([1.0, 1e100, 1.0, -1e100]) == 2.0
+
+
+class _RunningSum:
+    """Incremental float sum equal to sum() over the same values in order."""
+
+    __slots__ = ("_total", "_compensation")
+
+    def __init__(self) -> None:
+        """Start at zero."""
+        self._total = 0.0
+        self._compensation = 0.0
+
+    def add(self, x: float) -> None:
+        """Add one value."""
+        total = self._total + x
+        if _SUM_IS_COMPENSATED:
+            if abs(self._total) >= abs(x):
+                self._compensation += (self._total - total) + x
+            else:
+                self._compensation += (x - total) + self._total
+        self._total = total
+
+    def value(self) -> float:
+        """Current sum."""
+        c = self._compensation
+        if c and math.isfinite(c):
+            return self._total + c
+        return self._total
+
+
+@dataclass
+class _FranchiseState:
+    """Running all-time totals and streaks for one franchise."""
+
+    wins: int = 0
+    losses: int = 0
+    ties: int = 0
+    points_for: float = 0.0
+    points_against: float = 0.0
+    seasons: set[int] = field(default_factory=set)
+    # Current run: result ("W", "L", "T"), length, first and last game.
+    run_result: str = ""
+    run_length: int = 0
+    run_start: tuple[int, int] = (0, 0)
+    run_end: tuple[int, int] = (0, 0)
+    # First longest completed run of each kind.
+    best_win: StreakRecord | None = None
+    best_loss: StreakRecord | None = None
+
+
+@dataclass
+class _SeasonState:
+    """Running record of one franchise in one season."""
+
+    wins: int = 0
+    losses: int = 0
+    ties: int = 0
+    points_for: float = 0.0
+
+
+@dataclass
+class _PairIndex:
+    """Meetings of one pairing with cumulative counts after each meeting."""
+
+    first_winner: str
+    first_loser: str
+    keys: list[tuple[int, int]] = field(default_factory=list)
+    meetings: list[HistoricalMatchup] = field(default_factory=list)
+    first_winner_wins: list[int] = field(default_factory=list)
+    ties: list[int] = field(default_factory=list)
+
+
+def _best_key(r: SeasonRecord) -> tuple[int, float, int, str]:
+    """Best-season order: most wins, then PF desc, season, franchise."""
+    return (-r.wins, -r.points_for, r.season, r.franchise_id)
+
+
+def _worst_key(r: SeasonRecord) -> tuple[int, float, int, str]:
+    """Worst-season order: most losses, then PF asc, season, franchise."""
+    return (-r.losses, r.points_for, r.season, r.franchise_id)
+
+
+def _streak(fid: str, kind: str, state: _FranchiseState) -> StreakRecord:
+    """StreakRecord for a franchise's current run."""
+    return StreakRecord(
+        franchise_id=fid,
+        streak_type=kind,
+        length=state.run_length,
+        start_season=state.run_start[0],
+        start_week=state.run_start[1],
+        end_season=state.run_end[0],
+        end_week=state.run_end[1],
+    )
+
+
+class LeagueHistoryAccumulator:
+    """League history advanced week by week, with a snapshot per week."""
+
+    def __init__(self, league_id: str, matchups: Sequence[HistoricalMatchup]) -> None:
+        """Accumulate matchups in (season, week) order; ties keep input order.
+
+        Pass matchups as load_all_matchups returns them (sorted by season,
+        week, winner and loser) for snapshots identical to
+        derive_league_history_v1.
+        """
+        self.league_id = str(league_id)
+        self._franchises: dict[str, _FranchiseState] = {}
+        self._season_states: dict[tuple[str, int], _SeasonState] = {}
+        self._pairs: dict[frozenset[str], _PairIndex] = {}
+        self._pair_order: list[frozenset[str]] = []
+        self._pair_first_keys: list[tuple[int, int]] = []
+        self._seasons: list[int] = []
+        self._matchup_count = 0
+        self._score_sum = _RunningSum()
+        self._high: tuple[float, int, int, str] | None = None
+        self._low: tuple[float, int, int, str] | None = None
+        # Best/worst records of seasons already complete, and their seasons.
+        self._closed_best: SeasonRecord | None = None
+        self._closed_worst: SeasonRecord | None = None
+        self._season_fids: dict[int, list[str]] = {}
+
+        self._keys: list[tuple[int, int]] = []
+        self._snapshots: list[LeagueHistoryContextV1] = []
+
+        ordered = sorted(matchups, key=lambda m: (m.season, m.week))
+        for i, m in enumerate(ordered):
+            if self._seasons and m.season != self._seasons[-1]:
+                self._close_season(self._seasons[-1])
+            self._add(m)
+            if i + 1 == len(ordered) or (
+                (ordered[i + 1].season, ordered[i + 1].week) != (m.season, m.week)
+            ):
+                self._keys.append((m.season, m.week))
+                self._snapshots.append(self._snapshot())
+
+    # Accumulation
+
+    def _add(self, m: HistoricalMatchup) -> None:
+        """Fold one matchup into every running total."""
+        key = (m.season, m.week)
+        if not self._seasons or self._seasons[-1] != m.season:
+            self._seasons.append(m.season)
+        self._matchup_count += 1
+
+        for fid, scored, allowed, won in (
+            (m.winner_id, m.winner_score, m.loser_score, True),
+            (m.loser_id, m.loser_score, m.winner_score, False),
+        ):
+            state = self._franchises.get(fid)
+            if state is None:
+                state = self._franchises[fid] = _FranchiseState()
+            state.seasons.add(m.season)
+            result = "T" if m.is_tie else ("W" if won else "L")
+            if m.is_tie:
+                state.ties += 1
+            elif won:
+                state.wins += 1
+            else:
+                state.losses += 1
+            state.points_for += scored
+            state.points_against += allowed
+            self._advance_run(fid, state, result, key)
+
+            season_key = (fid, m.season)
+            season_state = self._season_states.get(season_key)
+            if season_state is None:
+                season_state = self._season_states[season_key] = _SeasonState()
+                self._season_fids.setdefault(m.season, []).append(fid)
+            if m.is_tie:
+                season_state.ties += 1
+            elif won:
+                season_state.wins += 1
+            else:
+                season_state.losses += 1
+            season_state.points_for += scored
+
+            self._score_sum.add(scored)
+            high = (-scored, m.season, m.week, fid)
+            if self._high is None or high < self._high:
+                self._high = high
+            low = (scored, m.season, m.week, fid)
+            if self._low is None or low < self._low:
+                self._low = low
+
+        pair = frozenset({m.winner_id, m.loser_id})
+        index = self._pairs.get(pair)
+        if index is None:
+            index = self._pairs[pair] = _PairIndex(m.winner_id, m.loser_id)
+            self._pair_order.append(pair)
+            self._pair_first_keys.append(key)
+        prior_wins = index.first_winner_wins[-1] if index.meetings else 0
+        prior_ties = index.ties[-1] if index.meetings else 0
+        index.keys.append(key)
+        index.meetings.append(m)
+        index.first_winner_wins.append(
+            prior_wins + (not m.is_tie and m.winner_id == index.first_winner),
+        )
+        index.ties.append(prior_ties + m.is_tie)
+
+    @staticmethod
+    def _advance_run(
+        fid: str, state: _FranchiseState, result: str, key: tuple[int, int],
+    ) -> None:
+        """Extend or restart a franchise's run; a tie never extends one."""
+        if state.run_length and result == state.run_result and result != "T":
+            state.run_length += 1
+            state.run_end = key
+            return
+        if state.run_result == "W" and (
+            state.best_win is None or state.run_length > state.best_win.length
+        ):
+            state.best_win = _streak(fid, "win", state)
+        elif state.run_result == "L" and (
+            state.best_loss is None or state.run_length > state.best_loss.length
+        ):
+            state.best_loss = _streak(fid, "loss", state)
+        state.run_result = result
+        state.run_length = 1
+        state.run_start = state.run_end = key
+
+    def _season_records_of(self, season: int) -> list[SeasonRecord]:
+        """SeasonRecord of every franchise with games in season."""
+        records = []
+        for fid in self._season_fids.get(season, []):
+            s = self._season_states[(fid, season)]
+            records.append(SeasonRecord(
+                franchise_id=fid,
+                season=season,
+                wins=s.wins,
+                losses=s.losses,
+                ties=s.ties,
+                points_for=round(s.points_for, 2),
+            ))
+        return records
+
+    def _close_season(self, season: int) -> None:
+        """Fold a finished season into the closed best/worst records."""
+        for r in self._season_records_of(season):
+            if self._closed_best is None or _best_key(r) < _best_key(self._closed_best):
+                self._closed_best = r
+            if self._closed_worst is None or _worst_key(r) < _worst_key(self._closed_worst):
+                self._closed_worst = r
+
+    def _longest_streaks(self) -> tuple[StreakRecord | None, StreakRecord | None]:
+        """First longest win and loss streak, current runs included."""
+        best_win: StreakRecord | None = None
+        best_loss: StreakRecord | None = None
+        for fid, state in self._franchises.items():
+            win, loss = state.best_win, state.best_loss
+            if state.run_result == "W" and (win is None or state.run_length > win.length):
+                win = _streak(fid, "win", state)
+            elif state.run_result == "L" and (loss is None or state.run_length > loss.length):
+                loss = _streak(fid, "loss", state)
+            if win is not None and (best_win is None or win.length > best_win.length):
+                best_win = win
+            if loss is not None and (best_loss is None or loss.length > best_loss.length):
+                best_loss = loss
+        return best_win, best_loss
+
+    def _snapshot(self) -> LeagueHistoryContextV1:
+        """LeagueHistoryContextV1 of everything accumulated so far."""
+        records = tuple(sorted(
+            (
+                AllTimeRecord(
+                    franchise_id=fid,
+                    seasons_active=tuple(sorted(s.seasons)),
+                    total_wins=s.wins,
+                    total_losses=s.losses,
+                    total_ties=s.ties,
+                    total_points_for=round(s.points_for, 2),
+                    total_points_against=round(s.points_against, 2),
+                )
+                for fid, s in self._franchises.items()
+            ),
+            key=lambda r: (-r.total_wins, -r.total_points_for, r.franchise_id),
+        ))
+
+        high = low = None
+        if self._high is not None and self._low is not None:
+            score, season, week, fid = self._high
+            high = ScoringRecord(fid, season, week, -score, "all_time_high")
+            score, season, week, fid = self._low
+            low = ScoringRecord(fid, season, week, score, "all_time_low")
+        avg = round(self._score_sum.value() / (2 * self._matchup_count), 2)
+
+        best, worst = self._closed_best, self._closed_worst
+        for r in self._season_records_of(self._seasons[-1]):
+            if best is None or _best_key(r) < _best_key(best):
+                best = r
+            if worst is None or _worst_key(r) < _worst_key(worst):
+                worst = r
+
+        win_streak, loss_streak = self._longest_streaks()
+        return LeagueHistoryContextV1(
+            league_id=self.league_id,
+            seasons_available=tuple(self._seasons),
+            total_matchups_all_time=self._matchup_count,
+            all_time_records=records,
+            all_time_high=high,
+            all_time_low=low,
+            all_time_avg_score=avg,
+            longest_win_streak=win_streak,
+            longest_loss_streak=loss_streak,
+            best_season_record=best,
+            worst_season_record=worst,
+        )
+
+    # Queries
+
+    def as_of(self, season: int, week: int) -> LeagueHistoryContextV1:
+        """derive_league_history_v1 for (season, week)."""
+        i = bisect_right(self._keys, (int(season), int(week)))
+        if i:
+            return self._snapshots[i - 1]
+        return LeagueHistoryContextV1(
+            league_id=self.league_id,
+            seasons_available=(),
+            total_matchups_all_time=0,
+            all_time_records=(),
+            all_time_high=None,
+            all_time_low=None,
+            all_time_avg_score=None,
+            longest_win_streak=None,
+            longest_loss_streak=None,
+            best_season_record=None,
+            worst_season_record=None,
+        )
+
+    def head_to_head(
+        self, franchise_a: str, franchise_b: str, season: int, week: int,
+    ) -> HeadToHeadRecord:
+        """compute_head_to_head over the matchups through (season, week)."""
+        a = str(franchise_a).strip()
+        b = str(franchise_b).strip()
+        index = self._pairs.get(frozenset({a, b}))
+        n = bisect_right(index.keys, (int(season), int(week))) if index else 0
+        if index is None or n == 0:
+            return HeadToHeadRecord(a, b, 0, 0, 0, ())
+        ties = index.ties[n - 1]
+        first_wins = index.first_winner_wins[n - 1]
+        if a == index.first_winner:
+            a_wins = first_wins
+        elif a == index.first_loser:
+            a_wins = n - ties - first_wins
+        else:
+            a_wins = 0
+        return HeadToHeadRecord(
+            franchise_a=a,
+            franchise_b=b,
+            a_wins=a_wins,
+            b_wins=n - ties - a_wins,
+            ties=ties,
+            meetings=tuple(index.meetings[:n]),
+        )
+
+    def series_records(
+        self, season: int, week: int,
+    ) -> dict[frozenset[str], tuple[int, int, int, str, str]]:
+        """Every pairing's record through (season, week).
+
+        frozenset({a, b}) -> (first winner's wins, other side's wins, ties,
+        first winner, first loser), oriented on the pairing's first meeting,
+        in first-meeting order.
+        """
+        cutoff = (int(season), int(week))
+        table: dict[frozenset[str], tuple[int, int, int, str, str]] = {}
+        for pair in self._pair_order[:bisect_right(self._pair_first_keys, cutoff)]:
+            index = self._pairs[pair]
+            n = bisect_right(index.keys, cutoff)
+            ties = index.ties[n - 1]
+            wins = index.first_winner_wins[n - 1]
+            table[pair] = (wins, n - ties - wins, ties, index.first_winner, index.first_loser)
+        return table
+
+    def season_records(self) -> list[SeasonRecord]:
+        """Every (franchise, season) record over the whole history."""
+        records: list[SeasonRecord] = []
+        for season in self._seasons:
+            records.extend(self._season_records_of(season))
+        return records
@@ -0,0 +1,209 @@
+"""League History Cache v1 — league-wide history loaded once, read as of a week.
+
+Contract:
+- Derived-only: every value is what the underlying loader returns; the
+  cache never writes back and never changes a derivation's inputs.
+- Temporally scoped: as-of reads are prefix views over chronologically
+  sorted history, identical to the loaders' SQL cutoffs (Weekly Recap
+  Context Temporal Scoping Addendum v1.0).
+- Non-authoritative: invalidated by the ledger fingerprint
+  (db_utils.ledger_fingerprint); a changed ledger starts a fresh cache.
+
+Each weekly prompt-context derivation used to reload the league's whole
+history: every matchup, the franchise name and tenure maps, the player
+name map, every WEEKLY_PLAYER_SCORE and the all-time zero-starter count.
+A season regeneration repeated that 17 times, a backfill once per week of
+every season. LeagueHistoryCache loads each of those once per (database,
+league, ledger fingerprint); range runs pay the history cost once. League
+history itself is read from a LeagueHistoryAccumulator, which snapshots it
+at every week, so any as-of view is a lookup.
+
+Values handed out are shared between callers and must not be mutated,
+except matchups_as_of results, which are fresh lists.
+"""
+
+from __future__ import annotations
+
+import threading
+from bisect import bisect_right
+from collections import OrderedDict
+from collections.abc import Callable
+from typing import Any, TypeVar
+
+from squadvault.core.recaps.context.league_history_accumulator_v1 import (
+    LeagueHistoryAccumulator,
+)
+from squadvault.core.recaps.context.league_history_v1 import (
+    HistoricalMatchup,
+    LeagueHistoryContextV1,
+    build_cross_season_name_resolver,
+    compute_franchise_tenures,
+    load_all_matchups,
+)
+from squadvault.core.recaps.context.player_narrative_angles_v1 import (
+    _load_all_seasons_starter_zeros,
+)
+from squadvault.core.recaps.context.player_score_store_v1 import (
+    PlayerScoreStore,
+    load_player_score_store,
+)
+from squadvault.core.resolvers import build_player_name_map
+from squadvault.core.storage.db_utils import ledger_fingerprint
+from squadvault.core.storage.session import DatabaseSession
+
+T = TypeVar("T")
+
+
+class LeagueHistoryCache:
+    """League-wide history for one (database, league) at one ledger state."""
+
+    def __init__(
+        self,
+        db_path: str,
+        league_id: str,
+        fingerprint: tuple[Any, ...] | None = None,
+    ) -> None:
+        """Create an empty cache; every value loads on first use."""
+        self.db_path = db_path
+        self.league_id = str(league_id)
+        self.fingerprint = fingerprint
+        self.loads = 0
+        self._values: dict[str, Any] = {}
+        self._lock = threading.RLock()
+
+    def _value(self, name: str, load: Callable[[], T]) -> T:
+        """Return the cached value for name, loading it on first use."""
+        with self._lock:
+            if name not in self._values:
+                self._values[name] = load()
+                self.loads += 1
+            value: T = self._values[name]
+            return value
+
+    # League-wide values
+
+    def matchups(self) -> list[HistoricalMatchup]:
+        """Every matchup, sorted by (season, week, winner_id, loser_id)."""
+        return self._value(
+            "matchups", lambda: load_all_matchups(self.db_path, self.league_id),
+        )
+
+    def _matchup_keys(self) -> list[tuple[int, int]]:
+        """(season, week) of each matchup, for cutoff bisection."""
+        return self._value(
+            "matchup_keys", lambda: [(m.season, m.week) for m in self.matchups()],
+        )
+
+    def accumulator(self) -> LeagueHistoryAccumulator:
+        """Week-by-week history snapshots over every matchup."""
+        return self._value(
+            "accumulator",
+            lambda: LeagueHistoryAccumulator(self.league_id, self.matchups()),
+        )
+
+    def name_map(self) -> dict[str, str]:
+        """franchise_id -> most recent franchise name."""
+        return self._value(
+            "name_map",
+            lambda: build_cross_season_name_resolver(self.db_path, self.league_id),
+        )
+
+    def player_name_map(self) -> dict[str, str]:
+        """player_id -> display name."""
+        return self._value(
+            "player_name_map",
+            lambda: build_player_name_map(self.db_path, self.league_id),
+        )
+
+    def tenure_map(self) -> dict[str, int]:
+        """franchise_id -> first season with the current franchise name."""
+        return self._value(
+            "tenure_map",
+            lambda: compute_franchise_tenures(self.db_path, self.league_id),
+        )
+
+    def player_score_store(self) -> PlayerScoreStore:
+        """Every WEEKLY_PLAYER_SCORE row of the league."""
+        return self._value(
+            "player_score_store",
+            lambda: load_player_score_store(self.db_path, self.league_id),
+        )
+
+    def starter_zero_count(self) -> int:
+        """All-time count of zero-point starter scores."""
+        return self._value(
+            "starter_zero_count",
+            lambda: _load_all_seasons_starter_zeros(self.db_path, self.league_id),
+        )
+
+    # As-of views
+
+    def matchups_as_of(self, season: int, week: int) -> list[HistoricalMatchup]:
+        """Matchups at or before (season, week); equals load_all_matchups' cutoff."""
+        end = bisect_right(self._matchup_keys(), (int(season), int(week)))
+        return self.matchups()[:end]
+
+    def league_history_as_of(self, season: int, week: int) -> LeagueHistoryContextV1:
+        """derive_league_history_v1 for (season, week): a snapshot lookup."""
+        return self.accumulator().as_of(season, week)
+
+
+class LeagueHistoryCaches:
+    """LRU of LeagueHistoryCache per (database, league), checked per lookup.
+
+    get() recomputes the ledger fingerprint (a handful of aggregate
+    queries) and returns the cached history only while it still matches;
+    otherwise the stale entry is replaced with an empty cache.
+
+    max_entries=0 disables caching (every lookup returns a fresh cache).
+    """
+
+    def __init__(self, max_entries: int = 4) -> None:
+        """Create an empty registry holding at most max_entries leagues."""
+        self.max_entries = int(max_entries)
+        self.hits = 0
+        self.misses = 0
+        self.stale = 0
+        self._entries: OrderedDict[tuple[str, str], LeagueHistoryCache] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        """Number of cached leagues."""
+        return len(self._entries)
+
+    def clear(self) -> None:
+        """Drop every entry and reset the counters."""
+        with self._lock:
+            self._entries.clear()
+            self.hits = self.misses = self.stale = 0
+
+    def get(self, db_path: str, league_id: str) -> LeagueHistoryCache:
+        """Return the history cache for the league's current ledger state."""
+        with DatabaseSession(db_path) as con:
+            fingerprint = ledger_fingerprint(con, league_id)
+        scope = (str(db_path), str(league_id))
+        with self._lock:
+            cached = self._entries.get(scope)
+            if cached is not None and cached.fingerprint == fingerprint:
+                self.hits += 1
+                self._entries.move_to_end(scope)
+                return cached
+            self.misses += 1
+            if cached is not None:
+                self.stale += 1
+                del self._entries[scope]
+            fresh = LeagueHistoryCache(db_path, league_id, fingerprint)
+            if self.max_entries > 0:
+                self._entries[scope] = fresh
+                while len(self._entries) > self.max_entries:
+                    self._entries.popitem(last=False)
+            return fresh
+
+
+# Process-wide registry used by league_history_cache().
+_HISTORY_CACHES = LeagueHistoryCaches()
+
+
+def league_history_cache(db_path: str, league_id: str) -> LeagueHistoryCache:
+    """Process-wide LeagueHistoryCache for the league's current ledger state."""
+    return _HISTORY_CACHES.get(db_path, league_id)
@@ -31,11 +31,11 @@ Governance:
 
 from __future__ import annotations
 
-import json
 from collections.abc import Sequence
 from dataclasses import dataclass
 from typing import Any
 
+from squadvault.core.directory_cache_v1 import name_directory
 from squadvault.core.storage.session import DatabaseSession
 
 # ── Data classes ─────────────────────────────────────────────────────
@@ -168,49 +168,6 @@ class LeagueHistoryContextV1:
 # ── Loading ──────────────────────────────────────────────────────────
 
 
-def _parse_matchup(payload_json: str, season: int, fallback_week: int) -> HistoricalMatchup | None:
-    """Parse a WEEKLY_MATCHUP_RESULT payload into a HistoricalMatchup."""
-    try:
-        p = json.loads(payload_json) if isinstance(payload_json, str) else payload_json
-    except (ValueError, TypeError):
-        return None
-
-    if not isinstance(p, dict):
-        return None
-
-    winner_id = p.get("winner_franchise_id") or p.get("winner_team_id")
-    loser_id = p.get("loser_franchise_id") or p.get("loser_team_id")
-    if not winner_id or not loser_id:
-        return None
-
-    try:
-        winner_score = float(p.get("winner_score", 0))
-        loser_score = float(p.get("loser_score", 0))
-    except (ValueError, TypeError):
-        return None
-
-    week = fallback_week
-    if "week" in p:
-        try:
-            week = int(p["week"])
-        except (ValueError, TypeError):
-            pass
-
-    is_tie = bool(p.get("is_tie", False))
-    margin = round(abs(winner_score - loser_score), 2)
-
-    return HistoricalMatchup(
-        season=season,
-        week=week,
-        winner_id=str(winner_id).strip(),
-        loser_id=str(loser_id).strip(),
-        winner_score=winner_score,
-        loser_score=loser_score,
-        is_tie=is_tie,
-        margin=margin,
-    )
-
-
 def load_all_matchups(
     db_path: str,
     league_id: str,
@@ -231,8 +188,7 @@ def load_all_matchups(
         the full history. Supplying exactly one of the two is a caller error
         and raises ValueError.
 
-    Cutoff filtering is applied post-parse (the week is inside payload_json,
-    so a SQL cutoff would require v_canonical_best_events changes).
+    Rows come from the typed fact_matchup table; the cutoff is applied in SQL.
     """
     if (as_of_season is None) != (as_of_week is None):
         raise ValueError(
@@ -240,33 +196,33 @@ def load_all_matchups(
             f"got as_of_season={as_of_season!r}, as_of_week={as_of_week!r}"
         )
 
-    matchups: list[HistoricalMatchup] = []
-
-    with DatabaseSession(db_path) as con:
-        rows = con.execute(
-            """SELECT season, payload_json
-               FROM v_canonical_best_events
-               WHERE league_id = ?
-                 AND event_type = 'WEEKLY_MATCHUP_RESULT'
-               ORDER BY season ASC, occurred_at ASC NULLS LAST""",
-            (str(league_id),),
-        ).fetchall()
-
-    for row in rows:
-        season = int(row[0])
-        m = _parse_matchup(row[1], season=season, fallback_week=0)
-        if m is not None:
-            matchups.append(m)
-
+    sql = """SELECT season, week, winner_franchise_id, loser_franchise_id,
+                    COALESCE(winner_score, 0), COALESCE(loser_score, 0), is_tie
+             FROM fact_matchup
+             WHERE league_id = ?"""
+    params: list[Any] = [str(league_id)]
     if as_of_season is not None and as_of_week is not None:
-        cutoff_season = int(as_of_season)
-        cutoff_week = int(as_of_week)
-        matchups = [
-            m for m in matchups
-            if m.season < cutoff_season
-            or (m.season == cutoff_season and m.week <= cutoff_week)
-        ]
+        sql += " AND (season < ? OR (season = ? AND week <= ?))"
+        params += [int(as_of_season), int(as_of_season), int(as_of_week)]
+
+    sql += " ORDER BY season ASC, occurred_at ASC NULLS LAST, canonical_event_id ASC"
 
+    with DatabaseSession(db_path) as con:
+        rows = con.execute(sql, params).fetchall()
+
+    matchups = [
+        HistoricalMatchup(
+            season=int(season),
+            week=int(week),
+            winner_id=str(winner_id),
+            loser_id=str(loser_id),
+            winner_score=float(winner_score),
+            loser_score=float(loser_score),
+            is_tie=bool(is_tie),
+            margin=round(abs(float(winner_score) - float(loser_score)), 2),
+        )
+        for (season, week, winner_id, loser_id, winner_score, loser_score, is_tie) in rows
+    ]
     matchups.sort(key=lambda m: (m.season, m.week, m.winner_id, m.loser_id))
     return matchups
 
@@ -541,19 +497,12 @@ def resolve_franchise_name_any_season(
 ) -> str:
     """Resolve a franchise ID to its most recent display name.
 
-    Queries franchise_directory across all seasons, preferring the most
-    recent season's name. Returns the raw franchise_id if not found.
+    Reads franchise_directory (via the shared NameDirectory) across all
+    seasons, preferring the most recent season's name. Returns the raw
+    franchise_id if not found.
     """
-    with DatabaseSession(db_path) as con:
-        row = con.execute(
-            """SELECT name FROM franchise_directory
-               WHERE league_id = ? AND franchise_id = ?
-               ORDER BY season DESC LIMIT 1""",
-            (str(league_id), str(franchise_id)),
-        ).fetchone()
-    if row and row[0]:
-        return str(row[0]).strip()
-    return franchise_id
+    names = name_directory(db_path, league_id).latest_franchise_names()
+    return names.get(str(franchise_id), franchise_id)
 
 
 def build_cross_season_name_resolver(
@@ -564,21 +513,7 @@ def build_cross_season_name_resolver(
 
     Returns a dict suitable for use as a lookup or wrapped in a lambda.
     """
-    name_map: dict[str, str] = {}
-    with DatabaseSession(db_path) as con:
-        rows = con.execute(
-            """SELECT franchise_id, name, season FROM franchise_directory
-               WHERE league_id = ?
-               ORDER BY season DESC""",
-            (str(league_id),),
-        ).fetchall()
-    for row in rows:
-        fid = str(row[0]).strip()
-        name = str(row[1]).strip() if row[1] else fid
-        # First seen = most recent season (ordered DESC)
-        if fid not in name_map:
-            name_map[fid] = name
-    return name_map
+    return dict(name_directory(db_path, league_id).latest_franchise_names())
 
 
 def build_season_scoped_name_map(
@@ -593,20 +528,11 @@ def build_season_scoped_name_map(
     ownership across eras (e.g. the same slot number held by
     different owners in different seasons).
     """
-    season_map: dict[tuple[str, int], str] = {}
-    with DatabaseSession(db_path) as con:
-        rows = con.execute(
-            """SELECT franchise_id, season, name FROM franchise_directory
-               WHERE league_id = ?
-               ORDER BY franchise_id, season ASC""",
-            (str(league_id),),
-        ).fetchall()
-    for row in rows:
-        fid = str(row[0]).strip()
-        season = int(row[1])
-        name = str(row[2]).strip() if row[2] else fid
-        season_map[(fid, season)] = name
-    return season_map
+    return {
+        (fid, season): name
+        for fid, history in name_directory(db_path, league_id).franchise_name_history().items()
+        for season, name in history
+    }
 
 
 # ── Franchise tenure ──────────────────────────────────────────────────
@@ -625,25 +551,8 @@ def compute_franchise_tenures(
     the all-time series 19-8" is misleading if Brandon only joined in
     2023 — that's the franchise SLOT's record, not the current owner's.
     """
-    # Step 1: get the current (most recent) name for each franchise
-    all_names: dict[str, list[tuple[int, str]]] = {}  # fid -> [(season, name), ...]
-
-    with DatabaseSession(db_path) as con:
-        rows = con.execute(
-            """SELECT franchise_id, season, name FROM franchise_directory
-               WHERE league_id = ?
-               ORDER BY franchise_id, season ASC""",
-            (str(league_id),),
-        ).fetchall()
-
-    for row in rows:
-        fid = str(row[0]).strip()
-        season = int(row[1])
-        name = str(row[2]).strip() if row[2] else fid
-
-        if fid not in all_names:
-            all_names[fid] = []
-        all_names[fid].append((season, name))
+    # Step 1: every (season, name) of each franchise, in season order
+    all_names = name_directory(db_path, league_id).franchise_name_history()
 
     # Step 2: for each franchise, find when the current name first appeared
     tenures: dict[str, int] = {}
@@ -694,7 +603,18 @@ def derive_league_history_v1(
         as_of_season=as_of_season,
         as_of_week=as_of_week,
     )
+    return derive_league_history_from_matchups(league_id, all_matchups)
+
 
+def derive_league_history_from_matchups(
+    league_id: str,
+    all_matchups: Sequence[HistoricalMatchup],
+) -> LeagueHistoryContextV1:
+    """Derive LeagueHistoryContextV1 from already-loaded matchups.
+
+    all_matchups must already be scoped to the as-of window (see
+    load_all_matchups); derive_league_history_v1 is this plus the load.
+    """
     if not all_matchups:
         return LeagueHistoryContextV1(
             league_id=str(league_id),
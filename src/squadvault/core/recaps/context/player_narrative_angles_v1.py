@@ -42,9 +42,21 @@ Reuses the NarrativeAngle dataclass from narrative_angles_v1.
 from __future__ import annotations
 
 import json
+from collections.abc import Sequence
 from dataclasses import dataclass
 
 from squadvault.core.recaps.context.narrative_angles_v1 import NarrativeAngle
+from squadvault.core.recaps.context.player_score_store_v1 import (
+    CrossSeasonRecord as _CrossSeasonRecord,
+)
+from squadvault.core.recaps.context.player_score_store_v1 import (
+    PlayerScoreStore,
+    StarterWeekColumns,
+    load_player_score_store,
+)
+from squadvault.core.recaps.context.player_score_store_v1 import (
+    PlayerWeekRecord as _PlayerWeekRecord,
+)
 from squadvault.core.resolvers import NameFn
 from squadvault.core.resolvers import identity as _identity
 from squadvault.core.storage.session import DatabaseSession
@@ -52,16 +64,6 @@ from squadvault.core.storage.session import DatabaseSession
 # ── Data loading ─────────────────────────────────────────────────────
 
 
-@dataclass(frozen=True)
-class _PlayerWeekRecord:
-    """Minimal record for a player's scoring in a single week."""
-    week: int
-    franchise_id: str
-    player_id: str
-    score: float
-    is_starter: bool
-
-
 def _load_season_player_scores(
     db_path: str,
     league_id: str,
@@ -71,57 +73,8 @@ def _load_season_player_scores(
 
     Returns records sorted by (week, franchise_id, player_id) for determinism.
     """
-    records: list[_PlayerWeekRecord] = []
-
-    with DatabaseSession(db_path) as con:
-        rows = con.execute(
-            """SELECT payload_json
-               FROM v_canonical_best_events
-               WHERE league_id = ? AND season = ?
-                 AND event_type = 'WEEKLY_PLAYER_SCORE'
-               ORDER BY payload_json ASC""",
-            (str(league_id), int(season)),
-        ).fetchall()
-
-    for row in rows:
-        try:
-            p = json.loads(row[0]) if isinstance(row[0], str) else row[0]
-        except (ValueError, TypeError):
-            continue
-
-        if not isinstance(p, dict):
-            continue
-
-        try:
-            week = int(p.get("week", -1))
-        except (ValueError, TypeError):
-            continue
-        if week < 1:
-            continue
-
-        player_id = str(p.get("player_id", "")).strip()
-        franchise_id = str(p.get("franchise_id", "")).strip()
-        if not player_id or not franchise_id:
-            continue
-
-        try:
-            score = float(p.get("score", 0))
-        except (ValueError, TypeError):
-            score = 0.0
-
-        is_starter = bool(p.get("is_starter", False))
-
-        records.append(_PlayerWeekRecord(
-            week=week,
-            franchise_id=franchise_id,
-            player_id=player_id,
-            score=score,
-            is_starter=is_starter,
-        ))
-
-    # Deterministic sort
-    records.sort(key=lambda r: (r.week, r.franchise_id, r.player_id))
-    return records
+    store = load_player_score_store(db_path, league_id, season=season)
+    return store.season_records(season)
 
 
 def _load_all_seasons_starter_zeros(
@@ -170,17 +123,6 @@ def _load_all_seasons_starter_zeros(
     return count
 
 
-@dataclass(frozen=True)
-class _CrossSeasonRecord:
-    """Player scoring record with season context for cross-season detectors."""
-    season: int
-    week: int
-    franchise_id: str
-    player_id: str
-    score: float
-    is_starter: bool
-
-
 def _load_all_seasons_player_scores(
     db_path: str,
     league_id: str,
@@ -188,64 +130,40 @@ def _load_all_seasons_player_scores(
     """Load all WEEKLY_PLAYER_SCORE events across all seasons.
 
     Returns records sorted by (season, week, franchise_id, player_id) for determinism.
-    Used by Dimension 2 detectors for cross-season analysis.
+    The detectors take the PlayerScoreStore itself; this list form is kept
+    for callers that want plain records.
     """
-    records: list[_CrossSeasonRecord] = []
-
-    with DatabaseSession(db_path) as con:
-        rows = con.execute(
-            """SELECT season, payload_json
-               FROM v_canonical_best_events
-               WHERE league_id = ?
-                 AND event_type = 'WEEKLY_PLAYER_SCORE'
-               ORDER BY season ASC, payload_json ASC""",
-            (str(league_id),),
-        ).fetchall()
-
-    for row in rows:
-        try:
-            row_season = int(row[0])
-        except (ValueError, TypeError):
-            continue
-
-        try:
-            p = json.loads(row[1]) if isinstance(row[1], str) else row[1]
-        except (ValueError, TypeError):
-            continue
-
-        if not isinstance(p, dict):
-            continue
+    return list(load_player_score_store(db_path, league_id))
 
-        try:
-            week = int(p.get("week", -1))
-        except (ValueError, TypeError):
-            continue
-        if week < 1:
-            continue
 
-        player_id = str(p.get("player_id", "")).strip()
-        franchise_id = str(p.get("franchise_id", "")).strip()
-        if not player_id or not franchise_id:
-            continue
+def _as_store(all_records: Sequence[_CrossSeasonRecord]) -> PlayerScoreStore:
+    """Columnar view of all_records (free when it already is a store)."""
+    if isinstance(all_records, PlayerScoreStore):
+        return all_records
+    return PlayerScoreStore.from_records(all_records)
 
-        try:
-            score = float(p.get("score", 0))
-        except (ValueError, TypeError):
-            score = 0.0
-
-        is_starter = bool(p.get("is_starter", False))
 
-        records.append(_CrossSeasonRecord(
-            season=row_season,
-            week=week,
-            franchise_id=franchise_id,
-            player_id=player_id,
-            score=score,
-            is_starter=is_starter,
-        ))
+def _player_season_records(
+    store: PlayerScoreStore,
+    player_id: str,
+    franchise_id: str | None,
+    season: int,
+    through_week: int,
+) -> list[_CrossSeasonRecord]:
+    """One player's rows in season through through_week, in canonical order.
 
-    records.sort(key=lambda r: (r.season, r.week, r.franchise_id, r.player_id))
-    return records
+    franchise_id, when given, restricts to rows on that franchise.
+    """
+    code = None
+    if franchise_id is not None:
+        code = store.franchise_code(franchise_id)
+        if code is None:
+            return []
+    return store.records(
+        row for row in store.player_rows(player_id)
+        if store.season[row] == season and store.week[row] <= through_week
+        and (code is None or store.franchise[row] == code)
+    )
 
 
 def _load_all_matchup_opponents(
@@ -699,6 +617,17 @@ def _build_week_scores(
     return [r for r in records if r.week == week]
 
 
+def _starter_columns(
+    records: Sequence[_PlayerWeekRecord],
+    target_week: int,
+    starters: StarterWeekColumns | None,
+) -> StarterWeekColumns:
+    """Reuse prebuilt starter columns for target_week, or build them."""
+    if starters is not None and starters.through_week == target_week:
+        return starters
+    return StarterWeekColumns(records, target_week)
+
+
 # ── Detector 1: PLAYER_HOT_STREAK ───────────────────────────────────
 
 
@@ -709,35 +638,18 @@ def detect_player_hot_streak(
     threshold: float = 25.0,
     pname: NameFn = _identity,
     fname: NameFn = _identity,
+    starters: StarterWeekColumns | None = None,
 ) -> list[NarrativeAngle]:
     """Detect players scoring above threshold for consecutive weeks ending at target_week.
 
     Thresholds: 3 weeks = MINOR, 4 = NOTABLE, 5+ = HEADLINE.
     Only counts weeks where the player was a starter.
+    starters: optional columns prebuilt from records for target_week.
     """
-    index = _build_player_franchise_weeks(records, target_week)
+    columns = _starter_columns(records, target_week, starters)
     angles: list[NarrativeAngle] = []
 
-    for (franchise_id, player_id), player_records in sorted(index.items()):
-        # Only consider starters — a hot streak is a starter phenomenon
-        starter_records = [r for r in player_records if r.is_starter]
-        if not starter_records:
-            continue
-
-        # Count consecutive weeks ending at target_week where score >= threshold
-        # Walk backwards from target_week
-        streak = 0
-        week_cursor = target_week
-        # Build a week -> score map for this player's starter appearances
-        week_score_map = {r.week: r.score for r in starter_records}
-
-        while week_cursor >= 1:
-            if week_cursor in week_score_map and week_score_map[week_cursor] >= threshold:
-                streak += 1
-                week_cursor -= 1
-            else:
-                break
-
+    for group, streak in enumerate(columns.trailing_runs(threshold)):
         if streak >= 3:
             if streak >= 5:
                 strength = 3  # HEADLINE
@@ -746,7 +658,8 @@ def detect_player_hot_streak(
             else:
                 strength = 1  # MINOR
 
-            latest_score = week_score_map.get(target_week, 0.0)
+            franchise_id, player_id = columns.keys[group]
+            latest_score = columns.latest_score(group)
             angles.append(NarrativeAngle(
                 category="PLAYER_HOT_STREAK",
                 headline=(
@@ -771,34 +684,22 @@ def detect_player_cold_streak(
     threshold: float = 8.0,
     pname: NameFn = _identity,
     fname: NameFn = _identity,
+    starters: StarterWeekColumns | None = None,
 ) -> list[NarrativeAngle]:
     """Detect starters scoring below threshold for consecutive weeks ending at target_week.
 
     Thresholds: 3 weeks = NOTABLE, 4+ = HEADLINE.
     Only starters — a cold streak for a benched player is not newsworthy.
+    starters: optional columns prebuilt from records for target_week.
     """
-    index = _build_player_franchise_weeks(records, target_week)
+    columns = _starter_columns(records, target_week, starters)
     angles: list[NarrativeAngle] = []
 
-    for (franchise_id, player_id), player_records in sorted(index.items()):
-        starter_records = [r for r in player_records if r.is_starter]
-        if not starter_records:
-            continue
-
-        week_score_map = {r.week: r.score for r in starter_records}
-
-        streak = 0
-        week_cursor = target_week
-        while week_cursor >= 1:
-            if week_cursor in week_score_map and week_score_map[week_cursor] < threshold:
-                streak += 1
-                week_cursor -= 1
-            else:
-                break
-
+    for group, streak in enumerate(columns.trailing_runs(threshold, below=True)):
         if streak >= 3:
             strength = 3 if streak >= 4 else 2  # 4+ = HEADLINE, 3 = NOTABLE
-            latest_score = week_score_map.get(target_week, 0.0)
+            franchise_id, player_id = columns.keys[group]
+            latest_score = columns.latest_score(group)
             angles.append(NarrativeAngle(
                 category="PLAYER_COLD_STREAK",
                 headline=(
@@ -822,35 +723,25 @@ def detect_player_season_high(
     *,
     pname: NameFn = _identity,
     fname: NameFn = _identity,
+    starters: StarterWeekColumns | None = None,
 ) -> list[NarrativeAngle]:
     """Detect if a player posted the highest individual score of the season this week.
 
     Only starters. Compares the highest score in target_week against
     all prior weeks in the season.
+    starters: optional columns prebuilt from records for target_week.
     """
-    all_through_week = [r for r in records if r.week <= target_week and r.is_starter]
-    this_week = [r for r in all_through_week if r.week == target_week]
-    prior_weeks = [r for r in all_through_week if r.week < target_week]
+    columns = _starter_columns(records, target_week, starters)
+    best_this_week = columns.best_this_week
 
-    if not this_week:
+    # Week 1 edge case: no prior data, so every score is the season high.
+    # Only flag if there are prior weeks to compare against.
+    if best_this_week is None or columns.prior_best is None:
         return []
-
-    # Find the highest score this week
-    this_week_sorted = sorted(this_week, key=lambda r: (-r.score, r.franchise_id, r.player_id))
-    best_this_week = this_week_sorted[0]
-
-    # Find the highest score in all prior weeks
-    prior_best = max((r.score for r in prior_weeks), default=0.0)
+    prior_best = columns.prior_best
 
     if best_this_week.score > prior_best and best_this_week.score > 0.0:
-        angles: list[NarrativeAngle] = []
-
-        # Week 1 edge case: no prior data, so every score is the season high.
-        # Only flag if there are prior weeks to compare against.
-        if not prior_weeks:
-            return []
-
-        angles.append(NarrativeAngle(
+        return [NarrativeAngle(
             category="PLAYER_SEASON_HIGH",
             headline=(
                 f"{pname(best_this_week.player_id)}'s {best_this_week.score:.2f} points "
@@ -862,8 +753,7 @@ def detect_player_season_high(
             ),
             strength=3,  # Always HEADLINE
             franchise_ids=(best_this_week.franchise_id,),
-        ))
-        return angles
+        )]
 
     return []
 
@@ -880,35 +770,29 @@ def detect_player_boom_bust(
     min_prior_weeks: int = 4,
     pname: NameFn = _identity,
     fname: NameFn = _identity,
+    starters: StarterWeekColumns | None = None,
 ) -> list[NarrativeAngle]:
     """Detect starters who dramatically outperformed or underperformed their recent average.
 
     Boom: score >= boom_multiplier × 4-week average.
     Bust: score <= bust_multiplier × 4-week average.
     Requires min_prior_weeks of starter data before target_week. Fewer = silence.
+    starters: optional columns prebuilt from records for target_week.
     """
-    index = _build_player_franchise_weeks(records, target_week)
+    columns = _starter_columns(records, target_week, starters)
     angles: list[NarrativeAngle] = []
 
-    for (franchise_id, player_id), player_records in sorted(index.items()):
+    for group, (franchise_id, player_id) in enumerate(columns.keys):
         # Target week must be a starter appearance
-        target_records = [r for r in player_records if r.week == target_week and r.is_starter]
-        if not target_records:
+        window = columns.recent_starts(group, min_prior_weeks)
+        if window is None:
             continue
-        target_score = target_records[0].score
-
-        # Collect prior starter weeks (up to 4 most recent before target_week)
-        prior_starter = [
-            r for r in player_records
-            if r.week < target_week and r.is_starter
-        ]
-        prior_starter.sort(key=lambda r: r.week, reverse=True)
-        recent_prior = prior_starter[:min_prior_weeks]
+        target_score, recent_prior = window
 
         if len(recent_prior) < min_prior_weeks:
             continue  # Silence — not enough data
 
-        avg_score = sum(r.score for r in recent_prior) / len(recent_prior)
+        avg_score = sum(recent_prior) / len(recent_prior)
 
         # Avoid division by zero and trivially low averages
         if avg_score < 1.0:
@@ -917,29 +801,22 @@ def detect_player_boom_bust(
         ratio = target_score / avg_score
 
         if ratio >= boom_multiplier:
-            angles.append(NarrativeAngle(
-                category="PLAYER_BOOM_BUST",
-                headline=(
-                    f"{pname(player_id)}'s {target_score:.2f} points is "
-                    f"{ratio:.1f}x their {len(recent_prior)}-week average "
-                    f"of {avg_score:.2f} for {fname(franchise_id)}"
-                ),
-                detail=f"Boom performance in Week {target_week}.",
-                strength=1,  # Always MINOR per spec
-                franchise_ids=(franchise_id,),
-            ))
+            kind = "Boom"
         elif ratio <= bust_multiplier:
-            angles.append(NarrativeAngle(
-                category="PLAYER_BOOM_BUST",
-                headline=(
-                    f"{pname(player_id)}'s {target_score:.2f} points is "
-                    f"{ratio:.1f}x their {len(recent_prior)}-week average "
-                    f"of {avg_score:.2f} for {fname(franchise_id)}"
-                ),
-                detail=f"Bust performance in Week {target_week}.",
-                strength=1,  # Always MINOR per spec
-                franchise_ids=(franchise_id,),
-            ))
+            kind = "Bust"
+        else:
+            continue
+        angles.append(NarrativeAngle(
+            category="PLAYER_BOOM_BUST",
+            headline=(
+                f"{pname(player_id)}'s {target_score:.2f} points is "
+                f"{ratio:.1f}x their {len(recent_prior)}-week average "
+                f"of {avg_score:.2f} for {fname(franchise_id)}"
+            ),
+            detail=f"{kind} performance in Week {target_week}.",
+            strength=1,  # Always MINOR per spec
+            franchise_ids=(franchise_id,),
+        ))
 
     return angles
 
@@ -1055,7 +932,7 @@ def _ordinal(n: int) -> str:
 
 
 def detect_player_alltime_high(
-    all_records: list[_CrossSeasonRecord],
+    all_records: Sequence[_CrossSeasonRecord],
     current_season: int,
     target_week: int,
     *,
@@ -1066,38 +943,29 @@ def detect_player_alltime_high(
 
     Only starters. Only surfaces when history depth > 1 season (per spec).
     """
-    seasons_present = {r.season for r in all_records}
+    store = _as_store(all_records)
+    seasons_present = store.seasons()
     if len(seasons_present) < 2:
         return []
 
-    # All starter scores up through the target week of the current season
-    eligible = [
-        r for r in all_records
-        if r.is_starter and (
-            r.season < current_season
-            or (r.season == current_season and r.week <= target_week)
-        )
-    ]
-    if not eligible:
-        return []
-
     # This week's starters
     this_week = [
-        r for r in eligible
-        if r.season == current_season and r.week == target_week
+        r for r in store.records(store.week_rows(current_season, target_week))
+        if r.is_starter
     ]
     if not this_week:
         return []
 
-    # Prior history (everything except this week)
+    # Prior starter history (everything before this week)
     prior = [
-        r for r in eligible
-        if not (r.season == current_season and r.week == target_week)
+        store.score[row]
+        for row in store.rows_before(current_season, target_week)
+        if store.is_starter[row]
     ]
     if not prior:
         return []
 
-    prior_best_score = max(r.score for r in prior)
+    prior_best_score = max(prior)
 
     # Find the best scorer this week
     this_week_sorted = sorted(this_week, key=lambda r: (-r.score, r.franchise_id, r.player_id))
@@ -1123,7 +991,7 @@ def detect_player_alltime_high(
 
 
 def detect_player_franchise_record(
-    all_records: list[_CrossSeasonRecord],
+    all_records: Sequence[_CrossSeasonRecord],
     current_season: int,
     target_week: int,
     *,
@@ -1136,15 +1004,18 @@ def detect_player_franchise_record(
     Scoped to current owner's tenure (via tenure_map). Only starters.
     Only surfaces when there's at least 1 prior season of franchise history.
     """
+    store = _as_store(all_records)
+
     # This week's starters on the current season
     this_week = [
-        r for r in all_records
-        if r.season == current_season and r.week == target_week and r.is_starter
+        r for r in store.records(store.week_rows(current_season, target_week))
+        if r.is_starter
     ]
     if not this_week:
         return []
 
     angles: list[NarrativeAngle] = []
+    before = store.rows_before(current_season, target_week).stop
 
     # Group this week's records by franchise
     franchises_this_week: dict[str, list[_CrossSeasonRecord]] = {}
@@ -1157,28 +1028,21 @@ def detect_player_franchise_record(
         # Determine tenure start
         tenure_start = tenure_map.get(franchise_id) if tenure_map else None
 
-        # All starter records for this franchise within tenure
-        franchise_records = [
-            r for r in all_records
-            if r.franchise_id == franchise_id and r.is_starter
-            and (tenure_start is None or r.season >= tenure_start)
-            and (r.season < current_season or (r.season == current_season and r.week <= target_week))
-        ]
-
-        # Must have prior history (not just this week)
-        prior_records = [
-            r for r in franchise_records
-            if not (r.season == current_season and r.week == target_week)
+        # Prior starter rows for this franchise within tenure (not this week)
+        prior_rows = [
+            row for row in store.franchise_rows(franchise_id)
+            if row < before and store.is_starter[row]
+            and (tenure_start is None or store.season[row] >= tenure_start)
         ]
-        if not prior_records:
+        if not prior_rows:
             continue
 
         # Need at least 1 prior season for this to be meaningful
-        prior_seasons = {r.season for r in prior_records}
+        prior_seasons = {store.season[row] for row in prior_rows}
         if current_season not in prior_seasons and len(prior_seasons) < 1:
             continue
 
-        prior_best = max(r.score for r in prior_records)
+        prior_best = max(store.score[row] for row in prior_rows)
 
         # Best this week for this franchise
         week_records = sorted(
@@ -1215,7 +1079,7 @@ _CAREER_MILESTONES = [2000, 1500, 1000]  # checked high to low; 500 too low for
 
 
 def detect_career_milestone(
-    all_records: list[_CrossSeasonRecord],
+    all_records: Sequence[_CrossSeasonRecord],
     current_season: int,
     target_week: int,
     *,
@@ -1227,26 +1091,32 @@ def detect_career_milestone(
     Milestones: 500, 1000, 1500, 2000 career points on the same franchise.
     Only checks when the milestone was crossed THIS week (not previously).
     """
-    # Group all records by (franchise_id, player_id) up through target week
-    career_index: dict[tuple[str, str], list[_CrossSeasonRecord]] = {}
-    for r in all_records:
-        if r.season < current_season or (r.season == current_season and r.week <= target_week):
-            key = (r.franchise_id, r.player_id)
-            if key not in career_index:
-                career_index[key] = []
-            career_index[key].append(r)
+    store = _as_store(all_records)
+    before = store.rows_before(current_season, target_week).stop
+    through = store.rows_through(current_season, target_week).stop
+
+    # Group scores by (franchise, player) code up through target week. Codes
+    # follow id order, so sorting codes sorts by (franchise_id, player_id).
+    career_index: dict[tuple[int, int], list[float]] = {}
+    prior_index: dict[tuple[int, int], list[float]] = {}
+    for row in range(through):
+        key = (store.franchise[row], store.player[row])
+        career_index.setdefault(key, []).append(store.score[row])
+        prior_scores = prior_index.setdefault(key, [])
+        if row < before:
+            prior_scores.append(store.score[row])
 
     angles: list[NarrativeAngle] = []
 
-    for (franchise_id, player_id), records in sorted(career_index.items()):
+    for (franchise_code, player_code), scores in sorted(career_index.items()):
+        franchise_id = store.franchise_ids[franchise_code]
+        player_id = store.player_ids[player_code]
+
         # Total career points on this franchise
-        total = sum(r.score for r in records)
+        total = sum(scores)
 
         # Points BEFORE this week
-        prior = sum(
-            r.score for r in records
-            if not (r.season == current_season and r.week == target_week)
-        )
+        prior = sum(prior_index[(franchise_code, player_code)])
 
         # Check each milestone (high to low) — report only the highest one crossed
         for milestone in _CAREER_MILESTONES:
@@ -1270,7 +1140,7 @@ def detect_career_milestone(
 
 
 def detect_player_franchise_tenure(
-    all_records: list[_CrossSeasonRecord],
+    all_records: Sequence[_CrossSeasonRecord],
     current_season: int,
     target_week: int,
     *,
@@ -1285,14 +1155,17 @@ def detect_player_franchise_tenure(
     if target_week != 1:
         return []
 
+    store = _as_store(all_records)
+
     # Build: (franchise_id, player_id) -> set of seasons they appeared
-    roster_seasons: dict[tuple[str, str], set] = {}
-    for r in all_records:
-        if r.season <= current_season:
-            key = (r.franchise_id, r.player_id)
-            if key not in roster_seasons:
-                roster_seasons[key] = set()
-            roster_seasons[key].add(r.season)
+    roster_codes: dict[tuple[int, int], set[int]] = {}
+    for row in range(store.season_rows(current_season).stop):
+        key = (store.franchise[row], store.player[row])
+        roster_codes.setdefault(key, set()).add(store.season[row])
+    roster_seasons = {
+        (store.franchise_ids[f], store.player_ids[p]): seasons
+        for (f, p), seasons in roster_codes.items()
+    }
 
     angles: list[NarrativeAngle] = []
 
@@ -1343,7 +1216,7 @@ def detect_player_franchise_tenure(
 
 
 def detect_player_journey(
-    all_records: list[_CrossSeasonRecord],
+    all_records: Sequence[_CrossSeasonRecord],
     current_season: int,
     target_week: int,
     *,
@@ -1358,33 +1231,29 @@ def detect_player_journey(
     if target_week != 1:
         return []
 
+    store = _as_store(all_records)
+
     # This week's active players
     active_this_week = {
-        r.player_id for r in all_records
-        if r.season == current_season and r.week == target_week
+        store.player_ids[store.player[row]]
+        for row in store.week_rows(current_season, target_week)
     }
 
     if not active_this_week:
         return []
 
-    # Build: player_id -> set of franchise_ids across all seasons
-    player_franchises: dict[str, set] = {}
-    for r in all_records:
-        if r.season <= current_season:
-            if r.player_id not in player_franchises:
-                player_franchises[r.player_id] = set()
-            player_franchises[r.player_id].add(r.franchise_id)
-
     angles: list[NarrativeAngle] = []
 
     for player_id in sorted(active_this_week):
-        franchises = player_franchises.get(player_id, set())
+        player_rows = store.player_rows(player_id)
+        # Franchises across all seasons through the current one
+        franchises = {
+            store.franchise_ids[store.franchise[row]]
+            for row in player_rows if store.season[row] <= current_season
+        }
         if len(franchises) >= 3:
-            # Find earliest season for this player
-            player_seasons = {
-                r.season for r in all_records if r.player_id == player_id
-            }
-            earliest = min(player_seasons) if player_seasons else current_season
+            # Find earliest season for this player (rows are season-ordered)
+            earliest = store.season[player_rows[0]]
 
             angles.append(NarrativeAngle(
                 category="PLAYER_JOURNEY",
@@ -1404,7 +1273,7 @@ def detect_player_journey(
 
 
 def detect_player_vs_opponent(
-    all_records: list[_CrossSeasonRecord],
+    all_records: Sequence[_CrossSeasonRecord],
     current_season: int,
     target_week: int,
     opponent_index: dict[tuple[int, int, str], str],
@@ -1431,10 +1300,12 @@ def detect_player_vs_opponent(
       - 3 total: MINOR (e.g. 2 prior + this week)
       - 4+ total: NOTABLE
     """
+    store = _as_store(all_records)
+
     # This week's starters
     this_week = [
-        r for r in all_records
-        if r.season == current_season and r.week == target_week and r.is_starter
+        r for r in store.records(store.week_rows(current_season, target_week))
+        if r.is_starter
     ]
     if not this_week:
         return []
@@ -1455,8 +1326,8 @@ def detect_player_vs_opponent(
         # Find all prior career meetings (same player, same franchise,
         # same opponent, starter only)
         prior_scores: list[float] = []
-        for hr in all_records:
-            if hr.player_id != r.player_id or hr.franchise_id != r.franchise_id:
+        for hr in store.records(store.player_rows(r.player_id)):
+            if hr.franchise_id != r.franchise_id:
                 continue
             if hr.season == current_season and hr.week >= target_week:
                 continue  # exclude this week and future
@@ -1498,7 +1369,7 @@ def detect_player_vs_opponent(
 
 
 def detect_revenge_game(
-    all_records: list[_CrossSeasonRecord],
+    all_records: Sequence[_CrossSeasonRecord],
     current_season: int,
     target_week: int,
     opponent_index: dict[tuple[int, int, str], str],
@@ -1517,22 +1388,25 @@ def detect_revenge_game(
     Detection is from player score history (the most reliable signal).
     Only starters with meaningful scores (>= min_score) are flagged.
     """
+    store = _as_store(all_records)
+
     # This week's starters with meaningful scores
     this_week = [
-        r for r in all_records
-        if r.season == current_season and r.week == target_week
-        and r.is_starter and r.score >= min_score
+        r for r in store.records(store.week_rows(current_season, target_week))
+        if r.is_starter and r.score >= min_score
     ]
     if not this_week:
         return []
 
     # Build lookup: player_id -> set of franchise_ids they've been on (prior history)
-    player_prior_franchises: dict[str, set] = {}
-    for r in all_records:
-        if r.season < current_season or (r.season == current_season and r.week < target_week):
-            if r.player_id not in player_prior_franchises:
-                player_prior_franchises[r.player_id] = set()
-            player_prior_franchises[r.player_id].add(r.franchise_id)
+    before = store.rows_before(current_season, target_week).stop
+    player_prior_franchises: dict[str, set] = {
+        r.player_id: {
+            store.franchise_ids[store.franchise[row]]
+            for row in store.player_rows(r.player_id) if row < before
+        }
+        for r in this_week
+    }
 
     angles: list[NarrativeAngle] = []
 
@@ -1561,7 +1435,7 @@ def detect_revenge_game(
 
 
 def detect_player_duel(
-    all_records: list[_CrossSeasonRecord],
+    all_records: Sequence[_CrossSeasonRecord],
     current_season: int,
     target_week: int,
     opponent_index: dict[tuple[int, int, str], str],
@@ -1582,10 +1456,12 @@ def detect_player_duel(
     is not in WEEKLY_PLAYER_SCORE. We surface based on meeting frequency and let
     the creative layer decide which to highlight.
     """
+    store = _as_store(all_records)
+
     # This week's starters
     this_week = [
-        r for r in all_records
-        if r.season == current_season and r.week == target_week and r.is_starter
+        r for r in store.records(store.week_rows(current_season, target_week))
+        if r.is_starter
     ]
     if not this_week:
         return []
@@ -1597,11 +1473,13 @@ def detect_player_duel(
             by_franchise[r.franchise_id] = []
         by_franchise[r.franchise_id].append(r)
 
-    # Build index: (season, week, franchise_id, player_id) -> score
+    # Build index: (season, week, franchise_id, player_id) -> score, for
+    # this week's starters (the only players a duel can involve)
     score_index: dict[tuple[int, int, str, str], float] = {}
-    for r in all_records:
-        if r.is_starter:
-            score_index[(r.season, r.week, r.franchise_id, r.player_id)] = r.score
+    for player_id in sorted({r.player_id for r in this_week}):
+        for hr in store.records(store.player_rows(player_id)):
+            if hr.is_starter:
+                score_index[(hr.season, hr.week, hr.franchise_id, hr.player_id)] = hr.score
 
     angles: list[NarrativeAngle] = []
     seen_pairs: set = set()  # avoid duplicate duel angles (A vs B == B vs A)
@@ -1688,7 +1566,7 @@ def detect_player_duel(
 
 
 def detect_trade_outcome(
-    all_records: list[_CrossSeasonRecord],
+    all_records: Sequence[_CrossSeasonRecord],
     trades: list[_Trade],
     current_season: int,
     target_week: int,
@@ -1722,6 +1600,7 @@ def detect_trade_outcome(
     if not trades:
         return []
 
+    store = _as_store(all_records)
     angles: list[NarrativeAngle] = []
 
     for trade in trades:
@@ -1736,20 +1615,12 @@ def detect_trade_outcome(
 
         # Post-trade scoring on the receiving franchise within the current
         # season, up through the target week.
-        scores_a = [
-            r for r in all_records
-            if r.player_id == player_to_a
-            and r.franchise_id == trade.franchise_a_id
-            and r.season == current_season
-            and r.week <= target_week
-        ]
-        scores_b = [
-            r for r in all_records
-            if r.player_id == player_to_b
-            and r.franchise_id == trade.franchise_b_id
-            and r.season == current_season
-            and r.week <= target_week
-        ]
+        scores_a = _player_season_records(
+            store, player_to_a, trade.franchise_a_id, current_season, target_week,
+        )
+        scores_b = _player_season_records(
+            store, player_to_b, trade.franchise_b_id, current_season, target_week,
+        )
 
         if len(scores_a) < min_post_trade_weeks or len(scores_b) < min_post_trade_weeks:
             continue
@@ -1799,7 +1670,7 @@ def detect_trade_outcome(
 
 
 def detect_the_one_that_got_away(
-    all_records: list[_CrossSeasonRecord],
+    all_records: Sequence[_CrossSeasonRecord],
     drops: list[_PlayerDrop],
     current_season: int,
     target_week: int,
@@ -1820,13 +1691,7 @@ def detect_the_one_that_got_away(
     if not drops:
         return []
 
-    # Build index: player_id -> list of (season, week, franchise_id, score)
-    player_history: dict[str, list[_CrossSeasonRecord]] = {}
-    for r in all_records:
-        if r.season == current_season and r.week <= target_week:
-            if r.player_id not in player_history:
-                player_history[r.player_id] = []
-            player_history[r.player_id].append(r)
+    store = _as_store(all_records)
 
     angles: list[NarrativeAngle] = []
     seen_players: set = set()  # avoid duplicate angles for same player dropped multiple times
@@ -1841,7 +1706,9 @@ def detect_the_one_that_got_away(
         if player_id in seen_players:
             continue
 
-        history = player_history.get(player_id, [])
+        history = _player_season_records(
+            store, player_id, None, current_season, target_week,
+        )
         if not history:
             continue
 
@@ -1888,7 +1755,7 @@ def detect_the_one_that_got_away(
 
 
 def detect_faab_roi(
-    all_records: list[_CrossSeasonRecord],
+    all_records: Sequence[_CrossSeasonRecord],
     faab_acquisitions: list[_FaabAcquisition],
     current_season: int,
     target_week: int,
@@ -1908,6 +1775,7 @@ def detect_faab_roi(
     if not faab_acquisitions:
         return []
 
+    store = _as_store(all_records)
     angles: list[NarrativeAngle] = []
 
     for acq in faab_acquisitions:
@@ -1915,13 +1783,9 @@ def detect_faab_roi(
             continue
 
         # Find all scoring weeks for this player on this franchise
-        player_scores = [
-            r for r in all_records
-            if r.player_id == acq.player_id
-            and r.franchise_id == acq.franchise_id
-            and r.season == current_season
-            and r.week <= target_week
-        ]
+        player_scores = _player_season_records(
+            store, acq.player_id, acq.franchise_id, current_season, target_week,
+        )
 
         if len(player_scores) < min_weeks:
             continue
@@ -1950,7 +1814,7 @@ def detect_faab_roi(
 
 
 def detect_faab_franchise_efficiency(
-    all_records: list[_CrossSeasonRecord],
+    all_records: Sequence[_CrossSeasonRecord],
     faab_acquisitions: list[_FaabAcquisition],
     current_season: int,
     target_week: int,
@@ -1971,16 +1835,14 @@ def detect_faab_franchise_efficiency(
     if not current_faab:
         return []
 
+    store = _as_store(all_records)
+
     # Build franchise -> total FAAB pickup scoring
     franchise_faab_pts: dict[str, float] = {}
     for acq in current_faab:
-        player_scores = [
-            r for r in all_records
-            if r.player_id == acq.player_id
-            and r.franchise_id == acq.franchise_id
-            and r.season == current_season
-            and r.week <= target_week
-        ]
+        player_scores = _player_season_records(
+            store, acq.player_id, acq.franchise_id, current_season, target_week,
+        )
         total = sum(r.score for r in player_scores)
         franchise_faab_pts[acq.franchise_id] = franchise_faab_pts.get(acq.franchise_id, 0.0) + total
 
@@ -2014,7 +1876,7 @@ def detect_faab_franchise_efficiency(
 
 
 def detect_waiver_dependency(
-    all_records: list[_CrossSeasonRecord],
+    all_records: Sequence[_CrossSeasonRecord],
     drafted_players: dict[str, set],
     current_season: int,
     target_week: int,
@@ -2038,9 +1900,11 @@ def detect_waiver_dependency(
     franchise_totals: dict[str, float] = {}
     franchise_nondrafted: dict[str, float] = {}
 
-    for r in all_records:
-        if r.season != current_season or r.week > target_week:
-            continue
+    store = _as_store(all_records)
+    season_start = store.season_rows(current_season).start
+    through = store.rows_through(current_season, target_week).stop
+
+    for r in store.records(range(season_start, max(season_start, through))):
         if not r.is_starter:
             continue
 
@@ -2089,6 +1953,8 @@ def detect_player_narrative_angles_v1(
     tenure_map: dict[str, int] | None = None,
     pname: NameFn = _identity,
     fname: NameFn = _identity,
+    score_store: PlayerScoreStore | None = None,
+    alltime_zero_count: int | None = None,
 ) -> list[NarrativeAngle]:
     """Detect all Dimension 1-5 player narrative angles for a given week.
 
@@ -2102,50 +1968,66 @@ def detect_player_narrative_angles_v1(
         Used by PLAYER_FRANCHISE_RECORD for tenure-scoped attribution.
     pname: callable resolving player_id -> display name (default: identity).
     fname: callable resolving franchise_id -> display name (default: identity).
+    score_store / alltime_zero_count: the league's full player score store
+        and all-time zero-starter count when the caller already holds them
+        (see league_history_cache_v1); loaded here otherwise.
 
     Returns angles sorted by strength descending then category ascending
     for determinism. Returns an empty list when no player scoring data
     exists (silence over fabrication).
     """
-    season_records = _load_season_player_scores(db_path, league_id, season)
+    # One columnar load serves every season and cross-season detector.
+    store = score_store if score_store is not None else load_player_score_store(db_path, league_id)
+    season_records = store.season_records(season)
 
     if not season_records:
         return []
 
     # Check if we have any data for the target week
-    target_week_data = [r for r in season_records if r.week == week]
-    if not target_week_data:
+    if not store.week_rows(season, week):
         return []
 
     all_angles: list[NarrativeAngle] = []
 
     # ── Dimension 1: Short-horizon (current season only) ──
 
+    # Detectors 1-4 read one shared set of starter columns.
+    starters = StarterWeekColumns(season_records, week)
+
     # Detector 1: Hot streaks
-    all_angles.extend(detect_player_hot_streak(season_records, week, pname=pname, fname=fname))
+    all_angles.extend(detect_player_hot_streak(
+        season_records, week, pname=pname, fname=fname, starters=starters,
+    ))
 
     # Detector 2: Cold streaks
-    all_angles.extend(detect_player_cold_streak(season_records, week, pname=pname, fname=fname))
+    all_angles.extend(detect_player_cold_streak(
+        season_records, week, pname=pname, fname=fname, starters=starters,
+    ))
 
     # Detector 3: Season high
-    all_angles.extend(detect_player_season_high(season_records, week, pname=pname, fname=fname))
+    all_angles.extend(detect_player_season_high(
+        season_records, week, pname=pname, fname=fname, starters=starters,
+    ))
 
     # Detector 4: Boom/bust
-    all_angles.extend(detect_player_boom_bust(season_records, week, pname=pname, fname=fname))
+    all_angles.extend(detect_player_boom_bust(
+        season_records, week, pname=pname, fname=fname, starters=starters,
+    ))
 
     # Detector 5: Breakout
     all_angles.extend(detect_player_breakout(season_records, week, pname=pname, fname=fname))
 
     # Detector 6: Zero-point starters
-    alltime_zeros = _load_all_seasons_starter_zeros(db_path, league_id)
+    alltime_zeros = alltime_zero_count
+    if alltime_zeros is None:
+        alltime_zeros = _load_all_seasons_starter_zeros(db_path, league_id)
     all_angles.extend(detect_zero_point_starter(
         season_records, week, alltime_zero_count=alltime_zeros, pname=pname, fname=fname,
     ))
 
     # ── Dimension 2: Long-horizon (cross-season) ──
 
-    # Load all seasons lazily — only if we get this far
-    all_seasons_records = _load_all_seasons_player_scores(db_path, league_id)
+    all_seasons_records = store
 
     if all_seasons_records:
         # Detector 7: All-time high
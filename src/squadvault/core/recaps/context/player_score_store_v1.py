@@ -0,0 +1,384 @@
+"""Player Score Store v1 — columnar WEEKLY_PLAYER_SCORE rows for one league.
+
+Contract:
+- Derived-only: built from the typed fact_player_score projection of the
+  canonical best events; never written back.
+- Deterministic: rows are held in (season, week, franchise_id, player_id)
+  order, the order the record-list loaders have always returned.
+- Non-authoritative: a read-side cache for the angle detectors.
+
+Every weekly recap used to decode every WEEKLY_PLAYER_SCORE in league
+history into a Python object per row, and detectors then re-scanned that
+list with comprehensions for each week, player or franchise they needed.
+The store keeps one typed array per column (season, week, franchise and
+player codes, score, starter flags) plus two precomputed orders:
+
+- rows are sorted by (season, week), so any "through week W of season S"
+  or "this week" filter is a contiguous row range found by bisection;
+- per-player and per-franchise row permutations with group offsets, so a
+  detector slices one player's or franchise's rows without scanning.
+
+Record objects are materialized only for the rows a detector asks for.
+A 15-season league (~70k rows) occupies about 2 MB.
+"""
+
+from __future__ import annotations
+
+from array import array
+from bisect import bisect_left, bisect_right
+from collections.abc import Iterable, Iterator, Sequence
+from dataclasses import dataclass
+from typing import Any, overload
+
+from squadvault.core.storage.session import DatabaseSession
+
+# ── Records ──────────────────────────────────────────────────────────
+
+
+@dataclass(frozen=True)
+class PlayerWeekRecord:
+    """Minimal record for a player's scoring in a single week."""
+    week: int
+    franchise_id: str
+    player_id: str
+    score: float
+    is_starter: bool
+
+
+@dataclass(frozen=True)
+class CrossSeasonRecord:
+    """Player scoring record with season context for cross-season detectors."""
+    season: int
+    week: int
+    franchise_id: str
+    player_id: str
+    score: float
+    is_starter: bool
+
+
+# (season, week, franchise_id, player_id, score, is_starter, should_start)
+ScoreRow = tuple[int, int, str, str, float, bool, bool]
+
+
+def _season_week_key(season: int, week: int) -> int:
+    """Pack (season, week) into one sortable integer."""
+    return (int(season) << 16) | (int(week) & 0xFFFF)
+
+
+def _group(codes: array, n_groups: int) -> tuple[array, array]:
+    """Counting sort: rows grouped by code, ascending row order within a group.
+
+    Returns (order, offsets): rows of group g are
+    order[offsets[g]:offsets[g + 1]].
+    """
+    offsets = array("I", [0]) * (n_groups + 1)
+    for code in codes:
+        offsets[code + 1] += 1
+    for g in range(n_groups):
+        offsets[g + 1] += offsets[g]
+    fill = array("I", offsets[:-1])
+    order = array("I", [0]) * len(codes)
+    for row, code in enumerate(codes):
+        order[fill[code]] = row
+        fill[code] += 1
+    return order, offsets
+
+
+# ── Store ────────────────────────────────────────────────────────────
+
+
+class PlayerScoreStore(Sequence[CrossSeasonRecord]):
+    """Array-backed WEEKLY_PLAYER_SCORE rows with week/player/franchise slicing.
+
+    Behaves as a read-only sequence of CrossSeasonRecord in canonical
+    order, so code written against record lists keeps working.
+    """
+
+    def __init__(self, rows: Iterable[ScoreRow]) -> None:
+        """Build from score rows in any order; ties keep their input order."""
+        ordered = sorted(rows, key=lambda r: (r[0], r[1], r[2], r[3]))
+
+        self.franchise_ids: list[str] = sorted({r[2] for r in ordered})
+        self.player_ids: list[str] = sorted({r[3] for r in ordered})
+        self._franchise_code = {fid: i for i, fid in enumerate(self.franchise_ids)}
+        self._player_code = {pid: i for i, pid in enumerate(self.player_ids)}
+
+        self.season = array("H", (r[0] for r in ordered))
+        self.week = array("H", (r[1] for r in ordered))
+        self.franchise = array("H", (self._franchise_code[r[2]] for r in ordered))
+        self.player = array("I", (self._player_code[r[3]] for r in ordered))
+        self.score = array("d", (r[4] for r in ordered))
+        self.is_starter = array("B", (bool(r[5]) for r in ordered))
+        self.should_start = array("B", (bool(r[6]) for r in ordered))
+        self._season_week = array(
+            "L", (_season_week_key(r[0], r[1]) for r in ordered),
+        )
+
+        self._by_player, self._player_offsets = _group(self.player, len(self.player_ids))
+        self._by_franchise, self._franchise_offsets = _group(
+            self.franchise, len(self.franchise_ids),
+        )
+
+    @classmethod
+    def from_records(cls, records: Iterable[CrossSeasonRecord]) -> PlayerScoreStore:
+        """Build from CrossSeasonRecord objects (should_start unknown: False)."""
+        return cls(
+            (r.season, r.week, r.franchise_id, r.player_id, r.score, r.is_starter, False)
+            for r in records
+        )
+
+    # Sequence protocol
+
+    def __len__(self) -> int:
+        """Number of rows."""
+        return len(self.score)
+
+    @overload
+    def __getitem__(self, index: int) -> CrossSeasonRecord: ...
+
+    @overload
+    def __getitem__(self, index: slice) -> list[CrossSeasonRecord]: ...
+
+    def __getitem__(self, index: int | slice) -> CrossSeasonRecord | list[CrossSeasonRecord]:
+        """Row index -> record; slice -> list of records."""
+        if isinstance(index, slice):
+            return self.records(range(len(self))[index])
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError(index)
+        return self.record(index)
+
+    def __iter__(self) -> Iterator[CrossSeasonRecord]:
+        """Records in canonical order, materialized one at a time."""
+        return (self.record(row) for row in range(len(self)))
+
+    # Row selection
+
+    def seasons(self) -> list[int]:
+        """Distinct seasons present, ascending."""
+        return sorted(set(self.season))
+
+    def week_rows(self, season: int, week: int) -> range:
+        """Rows of one (season, week)."""
+        key = _season_week_key(season, week)
+        return range(
+            bisect_left(self._season_week, key), bisect_right(self._season_week, key),
+        )
+
+    def rows_before(self, season: int, week: int) -> range:
+        """Rows strictly before (season, week)."""
+        return range(bisect_left(self._season_week, _season_week_key(season, week)))
+
+    def rows_through(self, season: int, week: int) -> range:
+        """Rows up to and including (season, week)."""
+        return range(bisect_right(self._season_week, _season_week_key(season, week)))
+
+    def season_rows(self, season: int) -> range:
+        """Rows of one season."""
+        return range(
+            bisect_left(self._season_week, _season_week_key(season, 0)),
+            bisect_right(self._season_week, _season_week_key(season, 0xFFFF)),
+        )
+
+    def franchise_code(self, franchise_id: str) -> int | None:
+        """Column code of franchise_id (None when absent)."""
+        return self._franchise_code.get(franchise_id)
+
+    def player_rows(self, player_id: str) -> Sequence[int]:
+        """Rows of one player, in canonical order."""
+        code = self._player_code.get(player_id)
+        if code is None:
+            return ()
+        offsets = self._player_offsets
+        return self._by_player[offsets[code]:offsets[code + 1]]
+
+    def franchise_rows(self, franchise_id: str) -> Sequence[int]:
+        """Rows of one franchise, in canonical order."""
+        code = self._franchise_code.get(franchise_id)
+        if code is None:
+            return ()
+        offsets = self._franchise_offsets
+        return self._by_franchise[offsets[code]:offsets[code + 1]]
+
+    # Materialization
+
+    def record(self, row: int) -> CrossSeasonRecord:
+        """One row as a CrossSeasonRecord."""
+        return CrossSeasonRecord(
+            season=self.season[row],
+            week=self.week[row],
+            franchise_id=self.franchise_ids[self.franchise[row]],
+            player_id=self.player_ids[self.player[row]],
+            score=self.score[row],
+            is_starter=bool(self.is_starter[row]),
+        )
+
+    def records(self, rows: Iterable[int]) -> list[CrossSeasonRecord]:
+        """Selected rows as CrossSeasonRecord objects."""
+        return [self.record(row) for row in rows]
+
+    def season_records(self, season: int) -> list[PlayerWeekRecord]:
+        """One season's rows as PlayerWeekRecord objects, in canonical order."""
+        fids, pids = self.franchise_ids, self.player_ids
+        return [
+            PlayerWeekRecord(
+                week=self.week[row],
+                franchise_id=fids[self.franchise[row]],
+                player_id=pids[self.player[row]],
+                score=self.score[row],
+                is_starter=bool(self.is_starter[row]),
+            )
+            for row in self.season_rows(season)
+        ]
+
+    def season_payloads(self, season: int) -> list[dict[str, Any]]:
+        """One season's rows as WEEKLY_PLAYER_SCORE payload-shaped dicts."""
+        fids, pids = self.franchise_ids, self.player_ids
+        return [
+            {
+                "week": self.week[row],
+                "franchise_id": fids[self.franchise[row]],
+                "player_id": pids[self.player[row]],
+                "score": self.score[row],
+                "is_starter": bool(self.is_starter[row]),
+                "should_start": bool(self.should_start[row]),
+            }
+            for row in self.season_rows(season)
+        ]
+
+
+# ── Starter week columns ─────────────────────────────────────────────
+
+
+class StarterWeekColumns:
+    """One season's starter rows through a target week, grouped for kernels.
+
+    Rows are held group by group in (franchise_id, player_id) order and by
+    week within a group; rows sharing a week keep their input order. The
+    short-horizon detectors read trailing streaks, recent-start windows and
+    the season high from these columns instead of rebuilding a per-player
+    week map for every (franchise, player) pair.
+
+    Built once per (season, target week) and shared by every detector that
+    only looks at starters.
+    """
+
+    def __init__(self, records: Sequence[PlayerWeekRecord], through_week: int) -> None:
+        """Select starter rows with week <= through_week from records."""
+        self.through_week = through_week
+        starters = [r for r in records if r.is_starter and r.week <= through_week]
+
+        # Season-high inputs, computed in input order with max()/sorted()
+        # tie semantics: the first maximal prior score, the first best row.
+        prior_best: float | None = None
+        best: PlayerWeekRecord | None = None
+        for r in starters:
+            if r.week < through_week:
+                if prior_best is None or r.score > prior_best:
+                    prior_best = r.score
+            elif best is None or (-r.score, r.franchise_id, r.player_id) < (
+                -best.score, best.franchise_id, best.player_id,
+            ):
+                best = r
+        self.prior_best = prior_best
+        self.best_this_week = best
+
+        starters.sort(key=lambda r: (r.franchise_id, r.player_id, r.week))
+        self.keys: list[tuple[str, str]] = []
+        self.offsets = array("I", [0])
+        self.week = array("q", (r.week for r in starters))
+        self.score = array("d", (r.score for r in starters))
+        for row, r in enumerate(starters):
+            key = (r.franchise_id, r.player_id)
+            if not self.keys or self.keys[-1] != key:
+                if row:
+                    self.offsets.append(row)
+                self.keys.append(key)
+        if self.keys:
+            self.offsets.append(len(starters))
+
+    def trailing_runs(self, threshold: float, *, below: bool = False) -> array:
+        """Per group: consecutive weeks ending at through_week past threshold.
+
+        A week counts when its starter score is >= threshold (or < threshold
+        when below). When a week has several rows, the last one decides.
+        """
+        weeks, scores, offsets = self.week, self.score, self.offsets
+        runs = array("I", [0]) * len(self.keys)
+        for g in range(len(self.keys)):
+            lo, i = offsets[g], offsets[g + 1] - 1
+            expect, run = self.through_week, 0
+            while i >= lo and expect >= 1 and weeks[i] == expect:
+                score = scores[i]
+                if not (score < threshold if below else score >= threshold):
+                    break
+                run += 1
+                expect -= 1
+                while i >= lo and weeks[i] > expect:
+                    i -= 1
+            runs[g] = run
+        return runs
+
+    def latest_score(self, group: int) -> float:
+        """Score of a group's through_week start (last row wins), else 0.0."""
+        last = self.offsets[group + 1] - 1
+        return self.score[last] if self.week[last] == self.through_week else 0.0
+
+    def recent_starts(self, group: int, count: int) -> tuple[float, list[float]] | None:
+        """A group's through_week score and up to count prior starter scores.
+
+        The through_week score is that week's first row; prior scores run
+        from the most recent week back, rows of one week in input order.
+        None when the group did not start in through_week.
+        """
+        weeks, offsets = self.week, self.offsets
+        lo, end = offsets[group], offsets[group + 1]
+        first = end
+        while first > lo and weeks[first - 1] == self.through_week:
+            first -= 1
+        if first == end:
+            return None
+
+        prior: list[float] = []
+        j = first
+        while j > lo and len(prior) < count:
+            k = j - 1
+            while k > lo and weeks[k - 1] == weeks[j - 1]:
+                k -= 1
+            prior.extend(self.score[k:j])
+            j = k
+        return self.score[first], prior[:count]
+
+
+# ── Loading ──────────────────────────────────────────────────────────
+
+
+def load_player_score_store(
+    db_path: str,
+    league_id: str,
+    *,
+    season: int | None = None,
+) -> PlayerScoreStore:
+    """Load WEEKLY_PLAYER_SCORE rows for a league (optionally one season).
+
+    Rows without a positive week, franchise_id or player_id are skipped;
+    a missing score reads as 0.0, matching the payload readers.
+    """
+    sql = """SELECT season, week, franchise_id, player_id,
+                    COALESCE(score, 0.0), is_starter, should_start
+             FROM fact_player_score
+             WHERE league_id = ? AND week >= 1
+               AND franchise_id <> '' AND player_id <> ''"""
+    params: list[Any] = [str(league_id)]
+    if season is not None:
+        sql += " AND season = ?"
+        params.append(int(season))
+    sql += " ORDER BY season, week, franchise_id, player_id, canonical_event_id"
+
+    with DatabaseSession(db_path) as con:
+        rows = con.execute(sql, params).fetchall()
+    return PlayerScoreStore(
+        (int(r[0]), int(r[1]), str(r[2]), str(r[3]), float(r[4]), bool(r[5]), bool(r[6]))
+        for r in rows
+    )
@@ -191,45 +191,30 @@ def _load_player_scores(
     season: int,
     week: int,
 ) -> list[dict[str, Any]]:
-    """Load WEEKLY_PLAYER_SCORE events from canonical_events for a given week.
+    """Load WEEKLY_PLAYER_SCORE facts (fact_player_score) for a given week.
 
-    Returns raw payload dicts sorted by (franchise_id, player_id).
+    Returns payload-shaped dicts sorted by (franchise_id, player_id).
     """
-    payloads: list[dict[str, Any]] = []
-
     with DatabaseSession(db_path) as con:
         rows = con.execute(
-            """SELECT payload_json
-               FROM v_canonical_best_events
-               WHERE league_id = ? AND season = ?
-                 AND event_type = 'WEEKLY_PLAYER_SCORE'
-               ORDER BY payload_json ASC""",
-            (str(league_id), int(season)),
+            """SELECT week, franchise_id, player_id, score, is_starter, should_start
+               FROM fact_player_score
+               WHERE league_id = ? AND season = ? AND week = ?
+               ORDER BY franchise_id ASC, player_id ASC, canonical_event_id ASC""",
+            (str(league_id), int(season), int(week)),
         ).fetchall()
 
-    for row in rows:
-        try:
-            p = json.loads(row[0]) if isinstance(row[0], str) else row[0]
-        except (ValueError, TypeError):
-            continue
-
-        if not isinstance(p, dict):
-            continue
-
-        # Filter to the requested week
-        try:
-            payload_week = int(p.get("week", -1))
-        except (ValueError, TypeError):
-            continue
-
-        if payload_week != week:
-            continue
-
-        payloads.append(p)
-
-    # Deterministic sort
-    payloads.sort(key=lambda p: (str(p.get("franchise_id", "")), str(p.get("player_id", ""))))
-    return payloads
+    return [
+        {
+            "week": int(w),
+            "franchise_id": franchise_id,
+            "player_id": player_id,
+            "score": score if score is not None else 0.0,
+            "is_starter": bool(is_starter),
+            "should_start": bool(should_start),
+        }
+        for (w, franchise_id, player_id, score, is_starter, should_start) in rows
+    ]
 
 
 def _load_faab_awards(
@@ -286,46 +271,18 @@ def _load_season_player_history(
 
     with DatabaseSession(db_path) as con:
         rows = con.execute(
-            """SELECT payload_json
-               FROM v_canonical_best_events
-               WHERE league_id = ? AND season = ?
-                 AND event_type = 'WEEKLY_PLAYER_SCORE'
-               ORDER BY payload_json ASC""",
+            """SELECT franchise_id, player_id, week, COALESCE(score, 0), is_starter
+               FROM fact_player_score
+               WHERE league_id = ? AND season = ? AND week >= 0
+                 AND franchise_id <> '' AND player_id <> ''
+               ORDER BY canonical_event_id ASC""",
             (str(league_id), int(season)),
         ).fetchall()
 
-    for row in rows:
-        try:
-            p = json.loads(row[0]) if isinstance(row[0], str) else row[0]
-        except (ValueError, TypeError):
-            continue
-
-        if not isinstance(p, dict):
-            continue
-
-        franchise_id = str(p.get("franchise_id", "")).strip()
-        player_id = str(p.get("player_id", "")).strip()
-        if not franchise_id or not player_id:
-            continue
-
-        try:
-            week = int(p.get("week", -1))
-        except (ValueError, TypeError):
-            continue
-        if week < 0:
-            continue
-
-        try:
-            score = float(p.get("score", 0))
-        except (ValueError, TypeError):
-            score = 0.0
-
-        is_starter = bool(p.get("is_starter", False))
-
-        key = (franchise_id, player_id)
-        if key not in raw:
-            raw[key] = []
-        raw[key].append((week, score, is_starter))
+    for franchise_id, player_id, week, score, is_starter in rows:
+        raw.setdefault((franchise_id, player_id), []).append(
+            (int(week), float(score), bool(is_starter))
+        )
 
     # Sort each player's history by week ascending for determinism
     for key in raw:
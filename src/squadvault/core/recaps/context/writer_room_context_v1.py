@@ -20,6 +20,7 @@ import json
 from collections.abc import Sequence
 from dataclasses import dataclass
 
+from squadvault.core.directory_cache_v1 import name_directory
 from squadvault.core.storage.session import DatabaseSession
 
 # ── Scoring Deltas ───────────────────────────────────────────────────
@@ -537,37 +538,13 @@ def derive_manager_identities(
     name_map: optional pre-built franchise_id -> display_name dict; if None,
     team names are loaded from franchise_directory.
     """
-    with DatabaseSession(db_path) as con:
-        # Owner names from franchise_directory
-        owner_rows = con.execute(
-            """SELECT franchise_id, name, owner_name
-               FROM franchise_directory
-               WHERE league_id = ? AND season = ?""",
-            (str(league_id), int(season)),
-        ).fetchall()
-
-        # Curated nicknames from franchise_nicknames
-        nick_rows = con.execute(
-            """SELECT franchise_id, nickname
-               FROM franchise_nicknames
-               WHERE league_id = ?""",
-            (str(league_id),),
-        ).fetchall()
-
-    nick_map: dict[str, str] = {
-        str(r[0]).strip(): str(r[1]).strip()
-        for r in nick_rows
-        if r[0] and r[1] and str(r[1]).strip()
-    }
+    directory = name_directory(db_path, league_id)
+    nick_map = directory.franchise_nicknames()
 
     identities: list[ManagerIdentity] = []
-    for row in owner_rows:
-        fid = str(row[0]).strip()
-        if not fid:
-            continue
-
-        team = name_map.get(fid, str(row[1] or fid).strip()) if name_map else str(row[1] or fid).strip()
-        raw_owner = str(row[2]).strip() if row[2] else None
+    for fid, (name, owner) in directory.franchises(season).items():
+        team = name_map.get(fid, name or fid) if name_map else (name or fid)
+        raw_owner = owner or None
         owner_first = raw_owner.split()[0] if raw_owner and raw_owner.split() else None
         nickname = nick_map.get(fid)
 
@@ -5,6 +5,7 @@ from __future__ import annotations
 import json
 from typing import Any
 
+from squadvault.core.directory_cache_v1 import NameDirectory, name_directory
 from squadvault.core.recaps.render.deterministic_bullets_v1 import (
     QUIET_WEEK_MIN_EVENTS,
     CanonicalEventRow,
@@ -105,6 +106,7 @@ class _NameLookup:
         self.season = season
         self._player_cache: dict[str, str] = {}
         self._franchise_cache: dict[str, str] = {}
+        self._names: NameDirectory | None = None
 
     def franchise_name(self, fid_raw: Any) -> str:
         """Resolve franchise ID to display name with normalized fallback."""
@@ -142,37 +144,19 @@ class _NameLookup:
         self._player_cache[key] = out
         return out
 
+    def _directory(self) -> NameDirectory:
+        """The league's shared NameDirectory, looked up on first use."""
+        if self._names is None:
+            self._names = name_directory(self.db_path, self.league_id)
+        return self._names
+
     def _query_franchise_name(self, fid: str) -> str:
-        """Query franchise_directory for a name by ID."""
-        with DatabaseSession(self.db_path) as conn:
-            row = conn.execute(
-                """
-                SELECT name
-                FROM franchise_directory
-                WHERE league_id = ?
-                  AND season = ?
-                  AND franchise_id = ?
-                LIMIT 1
-                """,
-                (self.league_id, self.season, fid),
-            ).fetchone()
-        return "" if row is None else (row["name"] or "")
+        """Look up a franchise name by ID in franchise_directory."""
+        return self._directory().franchises(self.season).get(fid, ("", ""))[0]
 
     def _query_player_name(self, pid: str) -> str:
-        """Query player_directory for a name by ID."""
-        with DatabaseSession(self.db_path) as conn:
-            row = conn.execute(
-                """
-                SELECT name
-                FROM player_directory
-                WHERE league_id = ?
-                  AND season = ?
-                  AND player_id = ?
-                LIMIT 1
-                """,
-                (self.league_id, self.season, pid),
-            ).fetchone()
-        return "" if row is None else (row["name"] or "")
+        """Look up a player name by ID in player_directory."""
+        return self._directory().players(self.season).get(pid, ("", "", ""))[0]
 
 
 def build_deterministic_facts_block_v1(
@@ -12,14 +12,25 @@ Contract:
 Safety:
 - If window is UNSAFE or missing boundaries, returns empty selection.
 - No inference; selection is purely DB-driven + allowlist.
+
+Batch form: select_season_recap_events_v1 returns the same SelectionResult
+per week for many weeks of a season from one lock lookup and one ordered
+scan of the season's allowlisted canonical events (plus one scan of the
+week-keyed fallback), instead of a session and two queries per week.
 """
 
 from __future__ import annotations
 
 import hashlib
+from bisect import bisect_left
+from collections.abc import Iterable
 from dataclasses import dataclass
 
-from squadvault.core.recaps.selection.weekly_windows_v1 import WeeklyWindow, window_for_week_index
+from squadvault.core.recaps.selection.weekly_windows_v1 import (
+    WeeklyWindow,
+    season_windows,
+    window_for_week_index,
+)
 from squadvault.core.storage.db_utils import row_to_dict as _row_to_dict
 from squadvault.core.storage.session import DatabaseSession
 
@@ -90,6 +101,51 @@ def _fingerprint_from_ids(ids: list[str]) -> str:
 # _db_connect removed — use DatabaseSession instead
 
 
+def _allowlist(allowlist_event_types: list[str] | None) -> list[str]:
+    """The effective allowlist: explicit, else configured, without blanks."""
+    allow = allowlist_event_types if allowlist_event_types is not None else _load_allowlist_event_types()
+    return [str(x) for x in allow if x]
+
+
+def _window_is_safe(window: WeeklyWindow) -> bool:
+    """True if the window has a usable, non-degenerate [start, end) boundary."""
+    return bool(
+        window.mode in _SAFE_WINDOW_MODES
+        and window.window_start
+        and window.window_end
+        and window.window_start != window.window_end
+    )
+
+
+def _selection_result(week_index: int, window: WeeklyWindow, rows: list[dict]) -> SelectionResult:
+    """Dedup, order, count and fingerprint one week's selected rows."""
+    # Dedup by canonical_id; deterministic order matching the prior SQL ordering
+    # (occurred_at, event_type, action_fingerprint). NULL occurred_at -> "" sorts
+    # first, ahead of any ISO-8601 timestamp.
+    seen: dict[str, dict] = {}
+    for r in rows:
+        cid = str(r["canonical_id"])
+        seen.setdefault(cid, r)
+    ordered = sorted(
+        seen.values(),
+        key=lambda r: (str(r.get("occurred_at") or ""), str(r.get("event_type") or ""), str(r["canonical_id"])),
+    )
+
+    canonical_ids: list[str] = [str(r["canonical_id"]) for r in ordered]
+    counts: dict[str, int] = {}
+    for r in ordered:
+        et = str(r.get("event_type") or "")
+        counts[et] = counts.get(et, 0) + 1
+
+    return SelectionResult(
+        week_index=week_index,
+        window=window,
+        canonical_ids=canonical_ids,
+        counts_by_type=counts,
+        fingerprint=_fingerprint_from_ids(canonical_ids),
+    )
+
+
 def select_weekly_recap_events_v1(
     db_path: str,
     league_id: str,
@@ -113,20 +169,11 @@ def select_weekly_recap_events_v1(
         season_end=season_end,
     )
 
-    allow = allowlist_event_types if allowlist_event_types is not None else _load_allowlist_event_types()
-    allow = [str(x) for x in allow if x]
+    allow = _allowlist(allowlist_event_types)
     if not allow:
-        return SelectionResult(
-            week_index=week_index, window=window, canonical_ids=[],
-            counts_by_type={}, fingerprint=_fingerprint_from_ids([]),
-        )
+        return _selection_result(week_index, window, [])
 
-    window_safe = (
-        window.mode in _SAFE_WINDOW_MODES
-        and window.window_start
-        and window.window_end
-        and window.window_start != window.window_end
-    )
+    window_safe = _window_is_safe(window)
 
     rows: list[dict] = []
     with DatabaseSession(db_path) as conn:
@@ -186,31 +233,84 @@ def select_weekly_recap_events_v1(
             )
             rows.extend(_row_to_dict(r) for r in cur.fetchall())
 
-    # Dedup by canonical_id; deterministic order matching the prior SQL ordering
-    # (occurred_at, event_type, action_fingerprint). NULL occurred_at -> "" sorts
-    # first, ahead of any ISO-8601 timestamp.
-    seen: dict[str, dict] = {}
-    for r in rows:
-        cid = str(r["canonical_id"])
-        seen.setdefault(cid, r)
-    ordered = sorted(
-        seen.values(),
-        key=lambda r: (str(r.get("occurred_at") or ""), str(r.get("event_type") or ""), str(r["canonical_id"])),
-    )
+    return _selection_result(week_index, window, rows)
 
-    canonical_ids: list[str] = [str(r["canonical_id"]) for r in ordered]
-    counts: dict[str, int] = {}
-    for r in ordered:
-        et = str(r.get("event_type") or "")
-        counts[et] = counts.get(et, 0) + 1
 
-    return SelectionResult(
-        week_index=week_index,
-        window=window,
-        canonical_ids=canonical_ids,
-        counts_by_type=counts,
-        fingerprint=_fingerprint_from_ids(canonical_ids),
-    )
+def select_season_recap_events_v1(
+    db_path: str,
+    league_id: str,
+    season: int,
+    *,
+    weeks: Iterable[int] | None = None,
+    allowlist_event_types: list[str] | None = None,
+    season_end: str | None = None,
+) -> list[SelectionResult]:
+    """
+    Select every given week of a season (default: one per lock) in one pass.
 
+    Result i is exactly select_weekly_recap_events_v1 for the i-th week:
+    timestamped events are read in one ordered scan and sliced per window;
+    week-keyed fallback events (see Path 2 there) in one scan grouped by
+    their payload week.
+    """
+    lid, yr = str(league_id), int(season)
+    windows = season_windows(db_path, lid, yr, weeks=weeks, season_end=season_end)
+    allow = _allowlist(allowlist_event_types)
+    if not allow:
+        return [_selection_result(w.week_index, w, []) for w in windows]
 
-__all__ = ["SelectionResult", "select_weekly_recap_events_v1"]
+    placeholders = ",".join(["?"] * len(allow))
+    by_week: dict[int, list[dict]] = {}
+    with DatabaseSession(db_path) as conn:
+        scan = [
+            _row_to_dict(r)
+            for r in conn.execute(
+                f"""
+                SELECT action_fingerprint AS canonical_id, occurred_at, event_type
+                FROM canonical_events
+                WHERE league_id = ?
+                  AND season = ?
+                  AND occurred_at IS NOT NULL
+                  AND event_type IN ({placeholders})
+                ORDER BY occurred_at
+                """,
+                [lid, yr, *allow],
+            ).fetchall()
+        ]
+        # Week-keyed fallback types: only those with no timestamped event this season.
+        timestamped = {str(r["event_type"]) for r in scan}
+        fallback = [t for t in allow if t in WEEK_KEYED_EVENT_TYPES and t not in timestamped]
+        if fallback:
+            marks = ",".join(["?"] * len(fallback))
+            for r in conn.execute(
+                f"""
+                SELECT ce.action_fingerprint AS canonical_id, ce.occurred_at, ce.event_type,
+                       CAST(json_extract(me.payload_json, '$.week') AS INTEGER) AS week
+                FROM canonical_events ce
+                JOIN memory_events me ON ce.best_memory_event_id = me.id
+                WHERE ce.league_id = ?
+                  AND ce.season = ?
+                  AND ce.occurred_at IS NULL
+                  AND ce.event_type IN ({marks})
+                """,
+                [lid, yr, *fallback],
+            ).fetchall():
+                row = _row_to_dict(r)
+                week = row.pop("week")
+                if week is not None:
+                    by_week.setdefault(int(week), []).append(row)
+
+    times = [str(r["occurred_at"]) for r in scan]
+    results: list[SelectionResult] = []
+    for window in windows:
+        rows: list[dict] = []
+        if _window_is_safe(window):
+            lo = bisect_left(times, str(window.window_start))
+            hi = bisect_left(times, str(window.window_end), lo)
+            rows.extend(scan[lo:hi])
+        rows.extend(by_week.get(window.week_index, []))
+        results.append(_selection_result(window.week_index, window, rows))
+    return results
+
+
+__all__ = ["SelectionResult", "select_season_recap_events_v1", "select_weekly_recap_events_v1"]
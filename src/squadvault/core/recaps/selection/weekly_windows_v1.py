@@ -13,13 +13,25 @@ End-of-season fallback (deterministic, safe):
   Window is [start_lock, start_lock + 7 days)
 
 If no safe boundary can be computed, the window is UNSAFE.
+
+Lock index: a season's distinct lock times are memoized per (database,
+league, season) and reused while the scope's lock version
+(_lock_index_version) is unchanged; canonicalize moves it on every write
+to the scope. season_windows() returns every week's window from one
+lookup. Edits to canonical_events that bypass canonicalize (repair
+scripts) must call lock_index_cache().clear() before reading windows in
+the same process.
 """
 
 from __future__ import annotations
 
 import datetime as dt
 import sqlite3
+import threading
+from collections import OrderedDict
+from collections.abc import Iterable
 from dataclasses import dataclass
+from typing import Any
 
 from squadvault.core.storage.session import DatabaseSession
 
@@ -76,6 +88,94 @@ def _fetch_lock_times(conn: sqlite3.Connection, league_id: str, season: int) ->
     return [str(r["occurred_at"]) for r in rows]
 
 
+def _lock_index_version(conn: sqlite3.Connection, league_id: str, season: int) -> tuple[Any, ...]:
+    """Cheap version of a scope's lock rows: index-only lock count/max id plus scope state.
+
+    Every canonicalize run that writes the scope rewrites its
+    canonical_scope_state row; inserted lock rows also raise the count or
+    max id. All three reads are index lookups.
+    """
+    locks = conn.execute(
+        """
+        SELECT COUNT(*), MAX(id)
+        FROM canonical_events
+        WHERE league_id=? AND season=? AND event_type=?
+        """,
+        (league_id, season, LOCK_EVENT_TYPE),
+    ).fetchone()
+    try:
+        state = conn.execute(
+            """
+            SELECT last_memory_event_id, canonical_count, updated_at
+            FROM canonical_scope_state
+            WHERE league_id=? AND season=?
+            """,
+            (league_id, season),
+        ).fetchone()
+    except sqlite3.OperationalError:
+        state = None  # pre-0011 database: no scope state
+    return (*locks, *(state or (None, None, None)))
+
+
+class LockIndexCache:
+    """LRU of distinct lock times per (database, league, season), checked per lookup.
+
+    lock_times() recomputes the scope's lock version and returns the
+    memoized lock times only while it still matches.
+
+    max_entries=0 disables caching (every lookup reads the locks).
+    """
+
+    def __init__(self, max_entries: int = 64) -> None:
+        """Create an empty index holding at most max_entries seasons."""
+        self.max_entries = int(max_entries)
+        self.hits = 0
+        self.misses = 0
+        self.stale = 0
+        self._entries: OrderedDict[tuple[str, str, int], tuple[tuple[Any, ...], tuple[str, ...]]] = (
+            OrderedDict()
+        )
+        self._lock = threading.Lock()
+
+    def clear(self) -> None:
+        """Drop every entry and reset the counters."""
+        with self._lock:
+            self._entries.clear()
+            self.hits = self.misses = self.stale = 0
+
+    def lock_times(self, db_path: str, league_id: str, season: int) -> tuple[str, ...]:
+        """Distinct lock timestamps of the season, in order."""
+        scope = (str(db_path), str(league_id), int(season))
+        with DatabaseSession(db_path) as conn:
+            version = _lock_index_version(conn, scope[1], scope[2])
+            with self._lock:
+                cached = self._entries.get(scope)
+                if cached is not None and cached[0] == version:
+                    self.hits += 1
+                    self._entries.move_to_end(scope)
+                    return cached[1]
+            locks = tuple(_fetch_lock_times(conn, scope[1], scope[2]))
+        with self._lock:
+            self.misses += 1
+            if scope in self._entries:
+                self.stale += 1
+                del self._entries[scope]
+            if self.max_entries > 0:
+                self._entries[scope] = (version, locks)
+                while len(self._entries) > self.max_entries:
+                    self._entries.popitem(last=False)
+        return locks
+
+
+# Process-wide index used by window_for_week_index() and season_windows().
+_LOCK_INDEX = LockIndexCache()
+
+
+def lock_index_cache() -> LockIndexCache:
+    """The process-wide lock index."""
+    return _LOCK_INDEX
+
+
 def window_for_week_index(
     db_path: str,
     league_id: str,
@@ -97,7 +197,33 @@ def window_for_week_index(
     - else season_end if provided
     - else +7 days from start_lock
     """
+    if week_index <= 0:
+        return _window_from_locks((), week_index, season_end)
+    locks = _LOCK_INDEX.lock_times(db_path, str(league_id), int(season))
+    return _window_from_locks(locks, week_index, season_end)
+
+
+def season_windows(
+    db_path: str,
+    league_id: str,
+    season: int,
+    *,
+    weeks: Iterable[int] | None = None,
+    season_end: str | None = None,
+) -> list[WeeklyWindow]:
+    """Windows of the given weeks (default: one per lock) from one lock lookup.
+
+    Each window equals window_for_week_index for that week.
+    """
+    locks = _LOCK_INDEX.lock_times(db_path, str(league_id), int(season))
+    week_list = list(weeks) if weeks is not None else list(range(1, len(locks) + 1))
+    return [_window_from_locks(locks, int(w), season_end) for w in week_list]
+
 
+def _window_from_locks(
+    locks: tuple[str, ...], week_index: int, season_end: str | None,
+) -> WeeklyWindow:
+    """The week's window given the season's distinct lock times in order."""
     if week_index <= 0:
         return WeeklyWindow(
             mode="UNSAFE",
@@ -109,9 +235,6 @@ def window_for_week_index(
             reason=WINDOW_UNSAFE_TO_COMPUTE,
         )
 
-    with DatabaseSession(db_path) as conn:
-        locks = _fetch_lock_times(conn, str(league_id), int(season))
-
     if len(locks) < week_index:
         return WeeklyWindow(
             mode="UNSAFE",
@@ -0,0 +1,273 @@
+"""Claim Scanner v1 — single-pass claim extraction for the recap verifier.
+
+Most verifier categories resolve a claim to the player or franchise named
+near it. Done per claim, that is a substring search for every known name
+(the player directory alone holds thousands) across every claim window,
+so a recap costs vocabulary x claims. NameIndex compiles a vocabulary
+once; scan() walks the text once and returns a MentionIndex holding every
+occurrence, which answers window queries by bisection.
+
+RecapClaims is the per-recap stage the checks share: the typed numbers of
+the text (matchup scores, integer scores, player scores, dollar amounts),
+each kind extracted once on first use, and the MentionIndex of every
+vocabulary scanned against it (player names, franchise aliases). Checks
+read their numbers and names from it instead of running their own pass
+over the text. Phrase-driven checks (superlatives, streak and snap
+phrases, streak inversion, record anchoring, series records, banned
+phrases, averages, the numeric sweep, player scoring streaks, the
+historical championship / N-M record phrases and the verbatim score
+strings) still match their own patterns: their claims are defined by the
+wording around the number, not by the number.
+
+Contract:
+- Exact: every occurrence is indexed, overlapping ones included, so
+  queries return what str.find / str.rfind over the same text would.
+  Typed numbers are exactly what their pattern's finditer over the whole
+  text yields.
+- Case-agnostic: the index matches code points as given. Callers pass
+  text in the same form they would have searched (usually lowercased).
+- Read-only: indexes are immutable after construction and safe to share
+  between checks and cached verification passes.
+"""
+
+from __future__ import annotations
+
+import re
+from bisect import bisect_left
+from collections.abc import Callable, Iterable
+from dataclasses import dataclass
+
+# Bucket width cap. Names are bucketed by their first few characters so a
+# text position is only compared against names that can start there.
+_MAX_PREFIX = 4
+
+# Number kinds of RecapClaims.numbers(), by the form they are written in.
+SCORE = "SCORE"                 # matchup score: "120.50" (2-3 digits, 2 decimals)
+INT_SCORE = "INT_SCORE"         # whole matchup score: "115" in "115-107.50"
+PLAYER_SCORE = "PLAYER_SCORE"   # player score: "24.50" (may sit inside "124.50")
+DOLLAR = "DOLLAR"               # "$45" / "$4.50" (FAAB bids, auction prices)
+
+NUMBER_PATTERNS: dict[str, re.Pattern[str]] = {
+    SCORE: re.compile(r"\b(\d{2,3}\.\d{2})\b"),
+    INT_SCORE: re.compile(r"(?<![\d.])(\d{2,3})(?![\d.])"),
+    PLAYER_SCORE: re.compile(r"(\d{1,2}\.\d{2})"),
+    DOLLAR: re.compile(r"\$(\d+(?:\.\d{1,2})?)"),
+}
+
+
+@dataclass(frozen=True)
+class Mention:
+    """One occurrence of a vocabulary name in scanned text."""
+    start: int
+    name: str
+
+    @property
+    def end(self) -> int:
+        """Exclusive end offset of the occurrence."""
+        return self.start + len(self.name)
+
+
+class MentionIndex:
+    """Every occurrence of an index vocabulary in one text, by position."""
+
+    __slots__ = ("_starts", "_names", "_rank", "_by_name")
+
+    def __init__(self, hits: list[tuple[int, str]], rank: dict[str, int]) -> None:
+        """Wrap (start, name) hits, already sorted by start."""
+        self._starts = [start for start, _ in hits]
+        self._names = [name for _, name in hits]
+        self._rank = rank
+        self._by_name: dict[str, list[int]] = {}
+        for start, name in hits:
+            self._by_name.setdefault(name, []).append(start)
+
+    def __len__(self) -> int:
+        """Number of indexed occurrences."""
+        return len(self._starts)
+
+    def __contains__(self, name: object) -> bool:
+        """True when name occurs anywhere in the text."""
+        return name in self._by_name
+
+    def names(self) -> list[str]:
+        """Names that occur in the text, in vocabulary order."""
+        return sorted(self._by_name, key=self._rank.__getitem__)
+
+    def positions(self, name: str) -> list[int]:
+        """Ascending start offsets of name (empty when absent)."""
+        return self._by_name.get(name, [])
+
+    def within(self, start: int, end: int) -> list[Mention]:
+        """Occurrences lying wholly inside text[start:end], in text order."""
+        found: list[Mention] = []
+        i = bisect_left(self._starts, start)
+        starts, names = self._starts, self._names
+        while i < len(starts) and starts[i] < end:
+            if starts[i] + len(names[i]) <= end:
+                found.append(Mention(starts[i], names[i]))
+            i += 1
+        return found
+
+    def first_within(self, start: int, end: int) -> dict[str, int]:
+        """name -> first start inside text[start:end] (as window.find).
+
+        Keys follow vocabulary order, matching a loop over the vocabulary.
+        """
+        first: dict[str, int] = {}
+        for m in self.within(start, end):
+            first.setdefault(m.name, m.start)
+        return dict(sorted(first.items(), key=lambda item: self._rank[item[0]]))
+
+    def last_within(self, start: int, end: int) -> dict[str, int]:
+        """name -> last start inside text[start:end] (as window.rfind)."""
+        return {m.name: m.start for m in self.within(start, end)}
+
+    def nearest(
+        self,
+        start: int,
+        end: int,
+        anchor: int,
+        *,
+        min_len: int = 0,
+    ) -> str | None:
+        """Name whose first in-window occurrence is closest to anchor.
+
+        Mirrors the verifier's scan "for name in vocabulary: idx =
+        window.find(name); keep if |idx - anchor| is strictly smaller":
+        ties go to the name earlier in vocabulary order. Names of
+        min_len characters or fewer are ignored.
+        """
+        best: tuple[int, int] | None = None
+        best_name: str | None = None
+        for name, pos in self.first_within(start, end).items():
+            if len(name) <= min_len:
+                continue
+            key = (abs(pos - anchor), self._rank[name])
+            if best is None or key < best:
+                best = key
+                best_name = name
+        return best_name
+
+    def closest_before(self, start: int, end: int) -> str | None:
+        """Name whose last occurrence in text[start:end] ends nearest end.
+
+        Mirrors "idx = window.rfind(name); dist = len(window) - idx -
+        len(name)" over the vocabulary, ties to vocabulary order.
+        """
+        best: tuple[int, int] | None = None
+        best_name: str | None = None
+        for name, pos in self.last_within(start, end).items():
+            key = (end - pos - len(name), self._rank[name])
+            if best is None or key < best:
+                best = key
+                best_name = name
+        return best_name
+
+
+class NameIndex:
+    """A fixed vocabulary of names, compiled for single-pass scanning."""
+
+    __slots__ = ("rank", "_width", "_buckets")
+
+    def __init__(self, names: Iterable[str]) -> None:
+        """Compile names; duplicates keep their first position (rank)."""
+        ordered = list(dict.fromkeys(n for n in names if n))
+        self.rank: dict[str, int] = {n: i for i, n in enumerate(ordered)}
+        self._width = min([_MAX_PREFIX, *(len(n) for n in ordered)])
+        self._buckets: dict[str, list[str]] = {}
+        for name in ordered:
+            self._buckets.setdefault(name[:self._width], []).append(name)
+
+    def __len__(self) -> int:
+        """Vocabulary size."""
+        return len(self.rank)
+
+    def scan(self, text: str) -> MentionIndex:
+        """Index every occurrence of every vocabulary name in text."""
+        hits: list[tuple[int, str]] = []
+        if self._buckets:
+            width = self._width
+            lookup = self._buckets.get
+            for pos in range(len(text) - width + 1):
+                bucket = lookup(text[pos:pos + width])
+                if bucket is None:
+                    continue
+                for name in bucket:
+                    if text.startswith(name, pos):
+                        hits.append((pos, name))
+        return MentionIndex(hits, self.rank)
+
+
+@dataclass(frozen=True)
+class NumberClaim:
+    """One number stated in a recap: where, as written, and its value."""
+    kind: str
+    start: int
+    end: int
+    text: str
+    value: float
+
+
+class RecapClaims:
+    """Typed claims of one recap text, extracted once and shared by the checks.
+
+    Numbers of each kind are extracted on first use; mentions() scans a
+    vocabulary against a folded form of the text once per recap.
+    """
+
+    __slots__ = ("text", "_numbers", "_starts", "_mentions")
+
+    def __init__(self, text: str) -> None:
+        """Wrap text; nothing is extracted until a check asks for it."""
+        self.text = text
+        self._numbers: dict[str, list[NumberClaim]] = {}
+        self._starts: dict[str, list[int]] = {}
+        self._mentions: dict[tuple[int, Callable[[str], str]], tuple[object, MentionIndex]] = {}
+
+    def numbers(self, kind: str) -> list[NumberClaim]:
+        """Every number of kind in the text, in text order."""
+        found = self._numbers.get(kind)
+        if found is None:
+            found = []
+            for m in NUMBER_PATTERNS[kind].finditer(self.text):
+                try:
+                    value = float(m.group(1))
+                except ValueError:
+                    continue
+                found.append(NumberClaim(kind, m.start(), m.end(), m.group(1), value))
+            self._numbers[kind] = found
+            self._starts[kind] = [n.start for n in found]
+        return found
+
+    def numbers_within(self, kind: str, start: int, end: int) -> list[NumberClaim]:
+        """Numbers of kind lying wholly inside text[start:end], in text order.
+
+        Numbers are read in the whole text, so one cut by a window edge is
+        not in the window (a finditer over the slice could match its stub).
+        """
+        found = self.numbers(kind)
+        i = bisect_left(self._starts[kind], start)
+        out: list[NumberClaim] = []
+        while i < len(found) and found[i].start < end:
+            if found[i].end <= end:
+                out.append(found[i])
+            i += 1
+        return out
+
+    def mentions(
+        self,
+        vocabulary: object,
+        index: Callable[[], NameIndex],
+        fold: Callable[[str], str] = str.lower,
+    ) -> MentionIndex:
+        """Occurrences of a vocabulary in fold(text), scanned once per recap.
+
+        vocabulary identifies the names (the map they come from); index
+        compiles them and is only called on the first scan.
+        """
+        key = (id(vocabulary), fold)
+        hit = self._mentions.get(key)
+        if hit is None or hit[0] is not vocabulary:
+            hit = (vocabulary, index().scan(fold(self.text)))
+            self._mentions[key] = hit
+        return hit[1]
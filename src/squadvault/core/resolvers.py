@@ -10,7 +10,7 @@ from collections.abc import Callable
 from pathlib import Path
 from typing import Any
 
-from squadvault.core.storage.session import DatabaseSession
+from squadvault.core.directory_cache_v1 import name_directory
 
 logger = logging.getLogger(__name__)
 # Lightweight name-resolver type used by angle detectors.
@@ -42,6 +42,9 @@ class PlayerResolver:
     """
     Resolve player_id -> "Name (Pos, Team)" using player_directory only.
     Fails safe: returns the raw id if not found.
+
+    Names come from the process-wide NameDirectory (directory_cache_v1),
+    so resolvers built per week share one load of the directory.
     """
 
     def __init__(self, db_path: Path | str, league_id: str, season: int) -> None:
@@ -76,48 +79,10 @@ class PlayerResolver:
             return
 
         try:
-            with DatabaseSession(str(self.db_path)) as conn:
-                cur = conn.cursor()
-                tables = {
-                    r["name"]
-                    for r in cur.execute(
-                        "SELECT name FROM sqlite_master WHERE type='table'"
-                    ).fetchall()
-                }
-                if "player_directory" not in tables:
-                    self._loaded = True
-                    return
-
-                ids_list = sorted(ids)
-                CHUNK = 900
-                for i in range(0, len(ids_list), CHUNK):
-                    chunk = ids_list[i : i + CHUNK]
-                    placeholders = ",".join(["?"] * len(chunk))
-                    rows = cur.execute(
-                        f"""
-                        SELECT player_id, name, position, team
-                        FROM player_directory
-                        WHERE league_id=? AND season=? AND player_id IN ({placeholders})
-                        """,
-                        [self.league_id, self.season, *chunk],
-                    ).fetchall()
-
-                    for r in rows:
-                        pid = str(r["player_id"]).strip()
-                        name = str(r["name"]).strip() if r["name"] is not None else ""
-                        pos = str(r["position"]).strip() if r["position"] is not None else ""
-                        team = str(r["team"]).strip() if r["team"] is not None else ""
-
-                        extra = []
-                        if pos:
-                            extra.append(pos)
-                        if team:
-                            extra.append(team)
-
-                        disp = f"{name} ({', '.join(extra)})" if (name and extra) else (name or pid)
-                        if pid:
-                            self._map[pid] = disp
-
+            players = name_directory(self.db_path, self.league_id).player_display_names(
+                self.season,
+            )
+            self._map = {pid: players[pid] for pid in ids if pid in players}
             self._resolved = len(self._map)
             self._loaded = True
 
@@ -175,38 +140,10 @@ class FranchiseResolver:
             return
 
         try:
-            with DatabaseSession(str(self.db_path)) as conn:
-                cur = conn.cursor()
-                tables = {
-                    r["name"]
-                    for r in cur.execute(
-                        "SELECT name FROM sqlite_master WHERE type='table'"
-                    ).fetchall()
-                }
-                if "franchise_directory" not in tables:
-                    self._loaded = True
-                    return
-
-                ids_list = sorted(ids)
-                CHUNK = 900
-                for i in range(0, len(ids_list), CHUNK):
-                    chunk = ids_list[i : i + CHUNK]
-                    placeholders = ",".join(["?"] * len(chunk))
-                    rows = cur.execute(
-                        f"""
-                        SELECT franchise_id, name
-                        FROM franchise_directory
-                        WHERE league_id=? AND season=? AND franchise_id IN ({placeholders})
-                        """,
-                        [self.league_id, self.season, *chunk],
-                    ).fetchall()
-
-                    for r in rows:
-                        fid = str(r["franchise_id"]).strip()
-                        name = str(r["name"]).strip() if r["name"] is not None else ""
-                        if fid:
-                            self._map[fid] = name or fid
-
+            franchises = name_directory(self.db_path, self.league_id).franchises(self.season)
+            self._map = {
+                fid: franchises[fid][0] or fid for fid in ids if fid in franchises
+            }
             self._resolved = len(self._map)
             self._loaded = True
 
@@ -232,16 +169,4 @@ def build_player_name_map(db_path: str, league_id: str) -> dict[str, str]:
     ORDER BY season DESC ensures the latest name wins when a player appears
     across multiple seasons. First occurrence is kept (most recent season).
     """
-    name_map: dict[str, str] = {}
-    with DatabaseSession(str(db_path)) as con:
-        rows = con.execute(
-            """SELECT player_id, name FROM player_directory
-               WHERE league_id = ? ORDER BY season DESC""",
-            (str(league_id),),
-        ).fetchall()
-    for row in rows:
-        pid = str(row[0]).strip()
-        name = str(row[1]).strip() if row[1] else ""
-        if pid and name and pid not in name_map:
-            name_map[pid] = name
-    return name_map
+    return dict(name_directory(db_path, league_id).latest_player_names())
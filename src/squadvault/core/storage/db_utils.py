@@ -41,3 +41,50 @@ def now_utc_iso() -> str:
         .isoformat()
         .replace("+00:00", "Z")
     )
+
+
+def ledger_fingerprint(con: sqlite3.Connection, league_id: str) -> tuple[Any, ...]:
+    """Cheap content fingerprint of a league's canonical facts and directories.
+
+    Canonicalization always rewrites canonical_events rows it touches: a
+    rebuild allocates new ids, a fold inserts rows or repoints
+    best_memory_event_id and stamps updated_at. The directory writers stamp
+    updated_at on every upsert. Row count, max id/updated_at and the sum of
+    best pointers therefore change whenever a derived fact can.
+    The fact_* tables are trigger-maintained from canonical_events and need
+    no term of their own.
+    """
+    lid = str(league_id)
+    canonical = con.execute(
+        """SELECT COUNT(*), MAX(id), MAX(updated_at), TOTAL(best_memory_event_id)
+           FROM canonical_events WHERE league_id = ?""",
+        (lid,),
+    ).fetchone()
+    return (*canonical, *directory_fingerprint(con, lid))
+
+
+DIRECTORY_TABLES = ("franchise_directory", "player_directory", "franchise_nicknames")
+
+
+def directory_fingerprint(con: sqlite3.Connection, league_id: str) -> tuple[Any, ...]:
+    """Row count and MAX(updated_at) of each name directory table for a league.
+
+    The directory writers stamp updated_at on every upsert, so the tuple
+    changes whenever a name, position, team, owner or nickname can. A
+    table without updated_at contributes MAX(rowid) instead; a missing
+    table contributes (None, None).
+    """
+    parts: list[Any] = []
+    for table in DIRECTORY_TABLES:
+        row: Any = (None, None)
+        for stamp in ("updated_at", "rowid"):
+            try:
+                row = con.execute(
+                    f"SELECT COUNT(*), MAX({stamp}) FROM {table} WHERE league_id = ?",
+                    (str(league_id),),
+                ).fetchone()
+                break
+            except sqlite3.OperationalError:
+                continue
+        parts.extend(row)
+    return tuple(parts)
@@ -11,6 +11,28 @@ from pathlib import Path
 MIGRATIONS_DIR = Path(__file__).parent / "migrations"
 SCHEMA_PATH = Path(__file__).parent / "schema.sql"
 
+# Migration 0012 cannot backfill its fact tables itself: the migration chain does
+# not own memory_events (schema.sql does), so the backfill runs here, once, when
+# init_and_migrate applies that migration to a full database.
+_FACT_TABLES_VERSION = "0012_add_typed_fact_tables"
+_FACT_TABLES_BACKFILL = """
+INSERT OR IGNORE INTO fact_matchup (
+  canonical_event_id, league_id, season, week, winner_franchise_id, loser_franchise_id,
+  winner_score, loser_score, is_tie, occurred_at
+)
+SELECT canonical_event_id, league_id, season, week, winner_franchise_id, loser_franchise_id,
+       winner_score, loser_score, is_tie, occurred_at
+FROM v_fact_matchup_source;
+
+INSERT OR IGNORE INTO fact_player_score (
+  canonical_event_id, league_id, season, week, franchise_id, player_id,
+  score, is_starter, should_start, occurred_at
+)
+SELECT canonical_event_id, league_id, season, week, franchise_id, player_id,
+       score, is_starter, should_start, occurred_at
+FROM v_fact_player_score_source;
+"""
+
 
 def _ensure_migrations_table(con: sqlite3.Connection) -> None:
     """Create the migrations tracking table if it doesn't exist."""
@@ -123,4 +145,12 @@ def init_and_migrate(db_path: str) -> None:
     finally:
         con.close()
 
-    apply_migrations(db_path)
+    newly_applied = apply_migrations(db_path)
+
+    if _FACT_TABLES_VERSION in newly_applied:
+        con = sqlite3.connect(db_path)
+        try:
+            con.executescript(_FACT_TABLES_BACKFILL)
+            con.commit()
+        finally:
+            con.close()
@@ -0,0 +1,21 @@
+-- 0011_add_canonical_scope_state.sql
+-- Adds the per-scope high-water mark for incremental canonicalization.
+--
+-- One row per (league_id, season): the highest memory_events.id already
+-- folded into canonical_events, plus the canonical row count the run left
+-- behind. canonicalize(..., incremental=True) folds only ledger rows above
+-- the mark; a missing row or a count that no longer matches the projection
+-- falls back to a full rebuild.
+--
+-- Derived bookkeeping only. Never a source of fact; safe to delete (the
+-- next run simply rebuilds the scope in full).
+
+CREATE TABLE IF NOT EXISTS canonical_scope_state (
+  league_id             TEXT    NOT NULL,
+  season                INTEGER NOT NULL,
+  last_memory_event_id  INTEGER NOT NULL,
+  canonical_count       INTEGER NOT NULL,
+  updated_at            TEXT    NOT NULL,
+
+  PRIMARY KEY (league_id, season)
+);
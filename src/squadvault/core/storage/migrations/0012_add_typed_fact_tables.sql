@@ -0,0 +1,192 @@
+-- 0012_add_typed_fact_tables.sql
+-- Adds typed fact tables projected from the canonical best events.
+--
+-- Week, franchise, player and score values otherwise live only inside
+-- memory_events.payload_json, so every reader decodes JSON and no SQL filter
+-- can use an index. fact_matchup (WEEKLY_MATCHUP_RESULT) and
+-- fact_player_score (WEEKLY_PLAYER_SCORE) hold one typed row per canonical
+-- event, keyed by canonical_event_id.
+--
+-- Maintenance: triggers on canonical_events re-derive the fact row whenever
+-- canonicalization inserts, repoints or deletes a canonical event, so the
+-- fact tables always match v_canonical_best_events. The v_fact_*_source
+-- views hold the single JSON -> column mapping (payload values are typed the
+-- way the Python readers coerce them; booleans use Python truthiness).
+--
+-- Existing canonical rows are backfilled by init_and_migrate when it applies
+-- this migration (memory_events is owned by schema.sql, not the migration
+-- chain, so the backfill cannot live here). Re-canonicalizing a scope
+-- rebuilds its facts as well.
+--
+-- Derived only. Never a source of fact; rebuilt by re-canonicalizing.
+
+CREATE TABLE IF NOT EXISTS fact_matchup (
+  canonical_event_id   INTEGER PRIMARY KEY,
+  league_id            TEXT    NOT NULL,
+  season               INTEGER NOT NULL,
+  week                 INTEGER NOT NULL,   -- 0 when the payload has no week
+  winner_franchise_id  TEXT    NOT NULL,
+  loser_franchise_id   TEXT    NOT NULL,
+  winner_score         REAL,
+  loser_score          REAL,
+  is_tie               INTEGER NOT NULL,
+  occurred_at          TEXT
+);
+
+CREATE INDEX IF NOT EXISTS idx_fact_matchup_scope_week
+ON fact_matchup (league_id, season, week, winner_franchise_id, loser_franchise_id,
+                 winner_score, loser_score, is_tie);
+
+CREATE TABLE IF NOT EXISTS fact_player_score (
+  canonical_event_id   INTEGER PRIMARY KEY,
+  league_id            TEXT    NOT NULL,
+  season               INTEGER NOT NULL,
+  week                 INTEGER,            -- NULL when the payload has no week
+  franchise_id         TEXT    NOT NULL,
+  player_id            TEXT    NOT NULL,
+  score                REAL,
+  is_starter           INTEGER NOT NULL,
+  should_start         INTEGER NOT NULL,
+  occurred_at          TEXT
+);
+
+CREATE INDEX IF NOT EXISTS idx_fact_player_score_scope_week
+ON fact_player_score (league_id, season, week, franchise_id, player_id,
+                      score, is_starter, should_start);
+
+CREATE INDEX IF NOT EXISTS idx_fact_player_score_starter_high
+ON fact_player_score (league_id, is_starter, season, score, week);
+
+DROP VIEW IF EXISTS v_fact_matchup_source;
+
+CREATE VIEW v_fact_matchup_source AS
+SELECT
+  canonical_event_id,
+  league_id,
+  season,
+  COALESCE(CAST(json_extract(p, '$.week') AS INTEGER), 0) AS week,
+  COALESCE(NULLIF(TRIM(json_extract(p, '$.winner_franchise_id')), ''),
+           NULLIF(TRIM(json_extract(p, '$.winner_team_id')), '')) AS winner_franchise_id,
+  COALESCE(NULLIF(TRIM(json_extract(p, '$.loser_franchise_id')), ''),
+           NULLIF(TRIM(json_extract(p, '$.loser_team_id')), '')) AS loser_franchise_id,
+  CAST(json_extract(p, '$.winner_score') AS REAL) AS winner_score,
+  CAST(json_extract(p, '$.loser_score') AS REAL) AS loser_score,
+  CASE json_type(p, '$.is_tie')
+    WHEN 'true' THEN 1
+    WHEN 'integer' THEN json_extract(p, '$.is_tie') <> 0
+    WHEN 'real' THEN json_extract(p, '$.is_tie') <> 0
+    WHEN 'text' THEN json_extract(p, '$.is_tie') <> ''
+    ELSE 0
+  END AS is_tie,
+  occurred_at
+FROM (
+  SELECT
+    ce.id AS canonical_event_id,
+    ce.league_id AS league_id,
+    ce.season AS season,
+    me.occurred_at AS occurred_at,
+    CASE WHEN json_valid(me.payload_json) THEN
+      CASE WHEN json_type(me.payload_json) = 'object' THEN me.payload_json END
+    END AS p
+  FROM canonical_events ce
+  JOIN memory_events me ON me.id = ce.best_memory_event_id
+  WHERE ce.event_type = 'WEEKLY_MATCHUP_RESULT'
+)
+WHERE p IS NOT NULL
+  AND COALESCE(NULLIF(TRIM(json_extract(p, '$.winner_franchise_id')), ''),
+               NULLIF(TRIM(json_extract(p, '$.winner_team_id')), '')) IS NOT NULL
+  AND COALESCE(NULLIF(TRIM(json_extract(p, '$.loser_franchise_id')), ''),
+               NULLIF(TRIM(json_extract(p, '$.loser_team_id')), '')) IS NOT NULL;
+
+DROP VIEW IF EXISTS v_fact_player_score_source;
+
+CREATE VIEW v_fact_player_score_source AS
+SELECT
+  canonical_event_id,
+  league_id,
+  season,
+  CAST(json_extract(p, '$.week') AS INTEGER) AS week,
+  COALESCE(TRIM(CAST(json_extract(p, '$.franchise_id') AS TEXT)), '') AS franchise_id,
+  COALESCE(TRIM(CAST(json_extract(p, '$.player_id') AS TEXT)), '') AS player_id,
+  CAST(json_extract(p, '$.score') AS REAL) AS score,
+  CASE json_type(p, '$.is_starter')
+    WHEN 'true' THEN 1
+    WHEN 'integer' THEN json_extract(p, '$.is_starter') <> 0
+    WHEN 'real' THEN json_extract(p, '$.is_starter') <> 0
+    WHEN 'text' THEN json_extract(p, '$.is_starter') <> ''
+    ELSE 0
+  END AS is_starter,
+  CASE json_type(p, '$.should_start')
+    WHEN 'true' THEN 1
+    WHEN 'integer' THEN json_extract(p, '$.should_start') <> 0
+    WHEN 'real' THEN json_extract(p, '$.should_start') <> 0
+    WHEN 'text' THEN json_extract(p, '$.should_start') <> ''
+    ELSE 0
+  END AS should_start,
+  occurred_at
+FROM (
+  SELECT
+    ce.id AS canonical_event_id,
+    ce.league_id AS league_id,
+    ce.season AS season,
+    me.occurred_at AS occurred_at,
+    CASE WHEN json_valid(me.payload_json) THEN
+      CASE WHEN json_type(me.payload_json) = 'object' THEN me.payload_json END
+    END AS p
+  FROM canonical_events ce
+  JOIN memory_events me ON me.id = ce.best_memory_event_id
+  WHERE ce.event_type = 'WEEKLY_PLAYER_SCORE'
+)
+WHERE p IS NOT NULL;
+
+CREATE TRIGGER IF NOT EXISTS trg_canonical_events_facts_insert
+AFTER INSERT ON canonical_events
+WHEN NEW.event_type IN ('WEEKLY_MATCHUP_RESULT', 'WEEKLY_PLAYER_SCORE')
+BEGIN
+  INSERT OR REPLACE INTO fact_matchup (
+    canonical_event_id, league_id, season, week, winner_franchise_id, loser_franchise_id,
+    winner_score, loser_score, is_tie, occurred_at
+  )
+  SELECT canonical_event_id, league_id, season, week, winner_franchise_id, loser_franchise_id,
+         winner_score, loser_score, is_tie, occurred_at
+  FROM v_fact_matchup_source WHERE canonical_event_id = NEW.id;
+
+  INSERT OR REPLACE INTO fact_player_score (
+    canonical_event_id, league_id, season, week, franchise_id, player_id,
+    score, is_starter, should_start, occurred_at
+  )
+  SELECT canonical_event_id, league_id, season, week, franchise_id, player_id,
+         score, is_starter, should_start, occurred_at
+  FROM v_fact_player_score_source WHERE canonical_event_id = NEW.id;
+END;
+
+CREATE TRIGGER IF NOT EXISTS trg_canonical_events_facts_update
+AFTER UPDATE OF league_id, season, event_type, best_memory_event_id ON canonical_events
+BEGIN
+  DELETE FROM fact_matchup WHERE canonical_event_id = OLD.id;
+  DELETE FROM fact_player_score WHERE canonical_event_id = OLD.id;
+
+  INSERT OR REPLACE INTO fact_matchup (
+    canonical_event_id, league_id, season, week, winner_franchise_id, loser_franchise_id,
+    winner_score, loser_score, is_tie, occurred_at
+  )
+  SELECT canonical_event_id, league_id, season, week, winner_franchise_id, loser_franchise_id,
+         winner_score, loser_score, is_tie, occurred_at
+  FROM v_fact_matchup_source WHERE canonical_event_id = NEW.id;
+
+  INSERT OR REPLACE INTO fact_player_score (
+    canonical_event_id, league_id, season, week, franchise_id, player_id,
+    score, is_starter, should_start, occurred_at
+  )
+  SELECT canonical_event_id, league_id, season, week, franchise_id, player_id,
+         score, is_starter, should_start, occurred_at
+  FROM v_fact_player_score_source WHERE canonical_event_id = NEW.id;
+END;
+
+CREATE TRIGGER IF NOT EXISTS trg_canonical_events_facts_delete
+AFTER DELETE ON canonical_events
+WHEN OLD.event_type IN ('WEEKLY_MATCHUP_RESULT', 'WEEKLY_PLAYER_SCORE')
+BEGIN
+  DELETE FROM fact_matchup WHERE canonical_event_id = OLD.id;
+  DELETE FROM fact_player_score WHERE canonical_event_id = OLD.id;
+END;
@@ -0,0 +1,23 @@
+-- 0013_add_prompt_context_cache.sql
+-- Adds the persisted prompt-context cache for weekly recap drafting.
+--
+-- One row per (league_id, season, week_index): the creative-layer prompt
+-- context last derived for that week, as JSON, plus the key it was derived
+-- under. The key hashes the selection fingerprint, window end, ledger
+-- fingerprint, the governed tone/voice/rules/bye/display tables and the
+-- context code version; a row whose key no longer matches is ignored and
+-- replaced by the next draft write.
+--
+-- Derived, non-authoritative context only. Never a source of fact; safe to
+-- delete (the next draft simply derives the context again).
+
+CREATE TABLE IF NOT EXISTS prompt_context_cache (
+  league_id     TEXT    NOT NULL,
+  season        INTEGER NOT NULL,
+  week_index    INTEGER NOT NULL,
+  cache_key     TEXT    NOT NULL,
+  context_json  TEXT    NOT NULL,
+  created_at    TEXT    NOT NULL,
+
+  PRIMARY KEY (league_id, season, week_index)
+);
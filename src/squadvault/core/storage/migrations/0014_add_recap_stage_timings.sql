@@ -0,0 +1,30 @@
+-- 0014_add_recap_stage_timings.sql
+-- Adds the lifecycle stage-timing observation sidecar.
+--
+-- One row per traced stage of one weekly recap draft run: wall time plus
+-- the SQL statements, rows, JSON payload columns and narrative angles the
+-- stage produced (see squadvault.recaps.lifecycle_trace_v1). Rows of one
+-- run share a trace_id; stage holds the '/'-joined stage path and seq its
+-- start order. Writes are env-gated on SQUADVAULT_LIFECYCLE_TRACE=1.
+--
+-- Observation only, append-only: never feeds back into facts, drafts or
+-- gating; safe to delete.
+
+CREATE TABLE IF NOT EXISTS recap_stage_timings (
+  id             INTEGER PRIMARY KEY AUTOINCREMENT,
+  trace_id       TEXT    NOT NULL,
+  captured_at    TEXT    NOT NULL,
+  league_id      TEXT    NOT NULL,
+  season         INTEGER NOT NULL,
+  week_index     INTEGER NOT NULL,
+  seq            INTEGER NOT NULL,
+  stage          TEXT    NOT NULL,
+  duration_ms    REAL    NOT NULL,
+  queries        INTEGER NOT NULL DEFAULT 0,
+  rows_read      INTEGER NOT NULL DEFAULT 0,
+  json_payloads  INTEGER NOT NULL DEFAULT 0,
+  angles         INTEGER NOT NULL DEFAULT 0
+);
+
+CREATE INDEX IF NOT EXISTS idx_recap_stage_timings_league_season
+  ON recap_stage_timings (league_id, season, week_index);
@@ -0,0 +1,26 @@
+-- 0015_add_fact_matchup_pair_index.sql
+-- Adds a head-to-head pair index over fact_matchup.
+--
+-- Rivalry chronicles ask for every meeting of one franchise pair; without
+-- an index keyed by the pair, each lookup decoded every WEEKLY_MATCHUP_RESULT
+-- of the season range. The key is (league, lower franchise id, higher
+-- franchise id), so either team order hits the same entries, and each
+-- entry points at its canonical event (fact_matchup.canonical_event_id).
+-- Readers must spell the key exactly as
+--   min(winner_franchise_id, loser_franchise_id),
+--   max(winner_franchise_id, loser_franchise_id)
+-- for SQLite to use the index (see chronicle/matchup_facts_v1). The raw
+-- franchise columns are appended so the index covers the pair lookup and
+-- the planner prefers it over idx_fact_matchup_scope_week without ANALYZE
+-- statistics.
+--
+-- Maintenance: fact_matchup is kept in step with canonical_events by the
+-- 0012 triggers, so canonicalization maintains the index as well.
+--
+-- Derived only. Never a source of fact; rebuilt by re-canonicalizing.
+
+CREATE INDEX IF NOT EXISTS idx_fact_matchup_pair
+ON fact_matchup (league_id,
+                 min(winner_franchise_id, loser_franchise_id),
+                 max(winner_franchise_id, loser_franchise_id),
+                 season, week, winner_franchise_id, loser_franchise_id);
@@ -79,6 +79,55 @@ CREATE TABLE IF NOT EXISTS canonical_membership (
   FOREIGN KEY(memory_event_id) REFERENCES memory_events(id)
 );
 
+-- Incremental canonicalization high-water mark (mirror of migration 0011).
+-- Derived bookkeeping: highest memory_events.id folded per scope plus the
+-- canonical row count left behind. Deleting a row forces a full rebuild.
+CREATE TABLE IF NOT EXISTS canonical_scope_state (
+  league_id             TEXT    NOT NULL,
+  season                INTEGER NOT NULL,
+  last_memory_event_id  INTEGER NOT NULL,
+  canonical_count       INTEGER NOT NULL,
+  updated_at            TEXT    NOT NULL,
+
+  PRIMARY KEY (league_id, season)
+);
+
+-- Persisted prompt-context cache (mirror of migration 0013).
+-- Derived, non-authoritative: the creative-layer prompt context last derived
+-- per week plus the key it was derived under. Safe to delete.
+CREATE TABLE IF NOT EXISTS prompt_context_cache (
+  league_id     TEXT    NOT NULL,
+  season        INTEGER NOT NULL,
+  week_index    INTEGER NOT NULL,
+  cache_key     TEXT    NOT NULL,
+  context_json  TEXT    NOT NULL,
+  created_at    TEXT    NOT NULL,
+
+  PRIMARY KEY (league_id, season, week_index)
+);
+
+-- Lifecycle stage timings (mirror of migration 0014).
+-- Observation-only, append-only sidecar: one row per traced stage of a
+-- weekly recap draft run. Written only when SQUADVAULT_LIFECYCLE_TRACE=1.
+CREATE TABLE IF NOT EXISTS recap_stage_timings (
+  id             INTEGER PRIMARY KEY AUTOINCREMENT,
+  trace_id       TEXT    NOT NULL,
+  captured_at    TEXT    NOT NULL,
+  league_id      TEXT    NOT NULL,
+  season         INTEGER NOT NULL,
+  week_index     INTEGER NOT NULL,
+  seq            INTEGER NOT NULL,
+  stage          TEXT    NOT NULL,
+  duration_ms    REAL    NOT NULL,
+  queries        INTEGER NOT NULL DEFAULT 0,
+  rows_read      INTEGER NOT NULL DEFAULT 0,
+  json_payloads  INTEGER NOT NULL DEFAULT 0,
+  angles         INTEGER NOT NULL DEFAULT 0
+);
+
+CREATE INDEX IF NOT EXISTS idx_recap_stage_timings_league_season
+  ON recap_stage_timings (league_id, season, week_index);
+
 -- Convenience view: best-selected memory event per canonical event
 DROP VIEW IF EXISTS v_canonical_best_events;
 
@@ -104,6 +153,190 @@ FROM canonical_events ce
 JOIN memory_events me
   ON me.id = ce.best_memory_event_id;
 
+-- Typed fact tables (mirror of migration 0012).
+-- One typed row per canonical WEEKLY_MATCHUP_RESULT / WEEKLY_PLAYER_SCORE event,
+-- kept in step with canonical_events by the triggers below so readers can filter
+-- on week / franchise / player with plain indexed SELECTs instead of decoding
+-- payload_json. Derived only; rebuilt by re-canonicalizing.
+CREATE TABLE IF NOT EXISTS fact_matchup (
+  canonical_event_id   INTEGER PRIMARY KEY,
+  league_id            TEXT    NOT NULL,
+  season               INTEGER NOT NULL,
+  week                 INTEGER NOT NULL,   -- 0 when the payload has no week
+  winner_franchise_id  TEXT    NOT NULL,
+  loser_franchise_id   TEXT    NOT NULL,
+  winner_score         REAL,
+  loser_score          REAL,
+  is_tie               INTEGER NOT NULL,
+  occurred_at          TEXT
+);
+
+CREATE INDEX IF NOT EXISTS idx_fact_matchup_scope_week
+ON fact_matchup (league_id, season, week, winner_franchise_id, loser_franchise_id,
+                 winner_score, loser_score, is_tie);
+
+-- Head-to-head pair index (mirror of migration 0015): (league, lower id,
+-- higher id) -> the pair's canonical matchups, maintained with fact_matchup.
+CREATE INDEX IF NOT EXISTS idx_fact_matchup_pair
+ON fact_matchup (league_id,
+                 min(winner_franchise_id, loser_franchise_id),
+                 max(winner_franchise_id, loser_franchise_id),
+                 season, week, winner_franchise_id, loser_franchise_id);
+
+CREATE TABLE IF NOT EXISTS fact_player_score (
+  canonical_event_id   INTEGER PRIMARY KEY,
+  league_id            TEXT    NOT NULL,
+  season               INTEGER NOT NULL,
+  week                 INTEGER,            -- NULL when the payload has no week
+  franchise_id         TEXT    NOT NULL,
+  player_id            TEXT    NOT NULL,
+  score                REAL,
+  is_starter           INTEGER NOT NULL,
+  should_start         INTEGER NOT NULL,
+  occurred_at          TEXT
+);
+
+CREATE INDEX IF NOT EXISTS idx_fact_player_score_scope_week
+ON fact_player_score (league_id, season, week, franchise_id, player_id,
+                      score, is_starter, should_start);
+
+CREATE INDEX IF NOT EXISTS idx_fact_player_score_starter_high
+ON fact_player_score (league_id, is_starter, season, score, week);
+
+DROP VIEW IF EXISTS v_fact_matchup_source;
+
+CREATE VIEW v_fact_matchup_source AS
+SELECT
+  canonical_event_id,
+  league_id,
+  season,
+  COALESCE(CAST(json_extract(p, '$.week') AS INTEGER), 0) AS week,
+  COALESCE(NULLIF(TRIM(json_extract(p, '$.winner_franchise_id')), ''),
+           NULLIF(TRIM(json_extract(p, '$.winner_team_id')), '')) AS winner_franchise_id,
+  COALESCE(NULLIF(TRIM(json_extract(p, '$.loser_franchise_id')), ''),
+           NULLIF(TRIM(json_extract(p, '$.loser_team_id')), '')) AS loser_franchise_id,
+  CAST(json_extract(p, '$.winner_score') AS REAL) AS winner_score,
+  CAST(json_extract(p, '$.loser_score') AS REAL) AS loser_score,
+  CASE json_type(p, '$.is_tie')
+    WHEN 'true' THEN 1
+    WHEN 'integer' THEN json_extract(p, '$.is_tie') <> 0
+    WHEN 'real' THEN json_extract(p, '$.is_tie') <> 0
+    WHEN 'text' THEN json_extract(p, '$.is_tie') <> ''
+    ELSE 0
+  END AS is_tie,
+  occurred_at
+FROM (
+  SELECT
+    ce.id AS canonical_event_id,
+    ce.league_id AS league_id,
+    ce.season AS season,
+    me.occurred_at AS occurred_at,
+    CASE WHEN json_valid(me.payload_json) THEN
+      CASE WHEN json_type(me.payload_json) = 'object' THEN me.payload_json END
+    END AS p
+  FROM canonical_events ce
+  JOIN memory_events me ON me.id = ce.best_memory_event_id
+  WHERE ce.event_type = 'WEEKLY_MATCHUP_RESULT'
+)
+WHERE p IS NOT NULL
+  AND COALESCE(NULLIF(TRIM(json_extract(p, '$.winner_franchise_id')), ''),
+               NULLIF(TRIM(json_extract(p, '$.winner_team_id')), '')) IS NOT NULL
+  AND COALESCE(NULLIF(TRIM(json_extract(p, '$.loser_franchise_id')), ''),
+               NULLIF(TRIM(json_extract(p, '$.loser_team_id')), '')) IS NOT NULL;
+
+DROP VIEW IF EXISTS v_fact_player_score_source;
+
+CREATE VIEW v_fact_player_score_source AS
+SELECT
+  canonical_event_id,
+  league_id,
+  season,
+  CAST(json_extract(p, '$.week') AS INTEGER) AS week,
+  COALESCE(TRIM(CAST(json_extract(p, '$.franchise_id') AS TEXT)), '') AS franchise_id,
+  COALESCE(TRIM(CAST(json_extract(p, '$.player_id') AS TEXT)), '') AS player_id,
+  CAST(json_extract(p, '$.score') AS REAL) AS score,
+  CASE json_type(p, '$.is_starter')
+    WHEN 'true' THEN 1
+    WHEN 'integer' THEN json_extract(p, '$.is_starter') <> 0
+    WHEN 'real' THEN json_extract(p, '$.is_starter') <> 0
+    WHEN 'text' THEN json_extract(p, '$.is_starter') <> ''
+    ELSE 0
+  END AS is_starter,
+  CASE json_type(p, '$.should_start')
+    WHEN 'true' THEN 1
+    WHEN 'integer' THEN json_extract(p, '$.should_start') <> 0
+    WHEN 'real' THEN json_extract(p, '$.should_start') <> 0
+    WHEN 'text' THEN json_extract(p, '$.should_start') <> ''
+    ELSE 0
+  END AS should_start,
+  occurred_at
+FROM (
+  SELECT
+    ce.id AS canonical_event_id,
+    ce.league_id AS league_id,
+    ce.season AS season,
+    me.occurred_at AS occurred_at,
+    CASE WHEN json_valid(me.payload_json) THEN
+      CASE WHEN json_type(me.payload_json) = 'object' THEN me.payload_json END
+    END AS p
+  FROM canonical_events ce
+  JOIN memory_events me ON me.id = ce.best_memory_event_id
+  WHERE ce.event_type = 'WEEKLY_PLAYER_SCORE'
+)
+WHERE p IS NOT NULL;
+
+CREATE TRIGGER IF NOT EXISTS trg_canonical_events_facts_insert
+AFTER INSERT ON canonical_events
+WHEN NEW.event_type IN ('WEEKLY_MATCHUP_RESULT', 'WEEKLY_PLAYER_SCORE')
+BEGIN
+  INSERT OR REPLACE INTO fact_matchup (
+    canonical_event_id, league_id, season, week, winner_franchise_id, loser_franchise_id,
+    winner_score, loser_score, is_tie, occurred_at
+  )
+  SELECT canonical_event_id, league_id, season, week, winner_franchise_id, loser_franchise_id,
+         winner_score, loser_score, is_tie, occurred_at
+  FROM v_fact_matchup_source WHERE canonical_event_id = NEW.id;
+
+  INSERT OR REPLACE INTO fact_player_score (
+    canonical_event_id, league_id, season, week, franchise_id, player_id,
+    score, is_starter, should_start, occurred_at
+  )
+  SELECT canonical_event_id, league_id, season, week, franchise_id, player_id,
+         score, is_starter, should_start, occurred_at
+  FROM v_fact_player_score_source WHERE canonical_event_id = NEW.id;
+END;
+
+CREATE TRIGGER IF NOT EXISTS trg_canonical_events_facts_update
+AFTER UPDATE OF league_id, season, event_type, best_memory_event_id ON canonical_events
+BEGIN
+  DELETE FROM fact_matchup WHERE canonical_event_id = OLD.id;
+  DELETE FROM fact_player_score WHERE canonical_event_id = OLD.id;
+
+  INSERT OR REPLACE INTO fact_matchup (
+    canonical_event_id, league_id, season, week, winner_franchise_id, loser_franchise_id,
+    winner_score, loser_score, is_tie, occurred_at
+  )
+  SELECT canonical_event_id, league_id, season, week, winner_franchise_id, loser_franchise_id,
+         winner_score, loser_score, is_tie, occurred_at
+  FROM v_fact_matchup_source WHERE canonical_event_id = NEW.id;
+
+  INSERT OR REPLACE INTO fact_player_score (
+    canonical_event_id, league_id, season, week, franchise_id, player_id,
+    score, is_starter, should_start, occurred_at
+  )
+  SELECT canonical_event_id, league_id, season, week, franchise_id, player_id,
+         score, is_starter, should_start, occurred_at
+  FROM v_fact_player_score_source WHERE canonical_event_id = NEW.id;
+END;
+
+CREATE TRIGGER IF NOT EXISTS trg_canonical_events_facts_delete
+AFTER DELETE ON canonical_events
+WHEN OLD.event_type IN ('WEEKLY_MATCHUP_RESULT', 'WEEKLY_PLAYER_SCORE')
+BEGIN
+  DELETE FROM fact_matchup WHERE canonical_event_id = OLD.id;
+  DELETE FROM fact_player_score WHERE canonical_event_id = OLD.id;
+END;
+
 -- =========================
 -- Directory tables (name resolution)
 -- =========================
@@ -2,11 +2,323 @@
 
 Provides a thin context manager for sqlite3 connections.
 Not an ORM. Not an abstraction layer. Just consistent open/commit/close.
+
+Opt-in pooling: inside `with pooled_sessions():` every DatabaseSession in
+this process reuses per-thread connections (keyed by db_path) instead of
+opening a new one. Pooled connections are tuned once when opened (WAL
+journal, larger page cache, mmap, in-memory temp store) and keep their
+parsed schema and prepared-statement cache across sessions. A session's
+semantics do not change: commit on success, rollback on error, and a
+nested session on the same thread gets its own connection.
+
+Read snapshots: inside `with read_snapshot(db_path):` every DatabaseSession
+for that database in the current context (thread) reads through one
+read-only connection (mode=ro URI, large mmap) holding a single read
+transaction, so everything read in the block sees one point-in-time state
+of the database while other connections keep writing. Writes through it
+fail. The snapshot relies on WAL, which a read never switches on by
+itself: call enable_wal(db_path) once (the journal mode is stored in the
+database file and outlives the process) or pass wal=True. immutable=True
+instead declares the file frozen (an archive copy) and skips locking
+entirely.
+
+Observation: inside `with observe_sessions(observer):` every connection a
+DatabaseSession hands out in the current context is passed to observer
+first (lifecycle stage tracing installs its statement and row counters
+this way); the session undoes the observer's trace callback and row
+factory when it ends. Outside such a block sessions skip it entirely.
 """
 from __future__ import annotations
 
+import os
 import sqlite3
+import threading
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import asdict, dataclass
 from pathlib import Path
+from typing import Any
+
+from squadvault.errors import ConfigError
+
+
+@dataclass
+class SessionCounters:
+    """Connection and statement counts, process-wide or per pool."""
+
+    sessions: int = 0
+    connections_opened: int = 0
+    statements: int = 0
+
+    def as_dict(self) -> dict[str, int]:
+        """Counter values keyed by name."""
+        return asdict(self)
+
+
+_COUNTERS = SessionCounters()
+_COUNTERS_LOCK = threading.Lock()
+
+
+def session_counters() -> dict[str, int]:
+    """Process-wide DatabaseSession counts (statements: pooled sessions only)."""
+    with _COUNTERS_LOCK:
+        return _COUNTERS.as_dict()
+
+
+def _count(*, sessions: int = 0, connections_opened: int = 0) -> None:
+    """Add to the process-wide counters."""
+    with _COUNTERS_LOCK:
+        _COUNTERS.sessions += sessions
+        _COUNTERS.connections_opened += connections_opened
+
+
+class SessionPool:
+    """Per-thread idle connections per db_path, tuned once when opened.
+
+    Connections are handed out by acquire() and returned by release(); a
+    thread that already holds one for a db_path (a nested session) gets
+    another. close() closes every connection the pool opened and must only
+    be called once no session is active.
+
+    The pool leaves the journal mode alone unless journal_mode is given:
+    that PRAGMA is persistent, so switching a database to WAL is the
+    caller's explicit step (enable_wal), not a side effect of pooling.
+    """
+
+    def __init__(
+        self,
+        *,
+        journal_mode: str | None = None,
+        cache_size_kib: int = 65536,
+        mmap_size: int = 256 * 1024 * 1024,
+        cached_statements: int = 512,
+    ) -> None:
+        """Create an empty pool; PRAGMAs apply to every connection it opens."""
+        self.journal_mode = journal_mode
+        self.cache_size_kib = int(cache_size_kib)
+        self.mmap_size = int(mmap_size)
+        self.cached_statements = int(cached_statements)
+        self.counters = SessionCounters()
+        self.pid = os.getpid()
+        self._local = threading.local()
+        self._all: list[sqlite3.Connection] = []
+        self._lock = threading.Lock()
+
+    def _idle(self) -> dict[str, list[sqlite3.Connection]]:
+        """This thread's idle connections by db_path."""
+        idle: dict[str, list[sqlite3.Connection]] | None = getattr(self._local, "idle", None)
+        if idle is None:
+            idle = self._local.idle = {}
+        return idle
+
+    def _count_statement(self, _sql: str) -> None:
+        """Trace callback: one statement executed on a pooled connection."""
+        with self._lock:
+            self.counters.statements += 1
+        with _COUNTERS_LOCK:
+            _COUNTERS.statements += 1
+
+    def _open(self, db_path: str) -> sqlite3.Connection:
+        """Open and tune a new pooled connection."""
+        con = sqlite3.connect(
+            db_path, cached_statements=self.cached_statements, check_same_thread=False,
+        )
+        if self.journal_mode:
+            try:
+                con.execute(f"PRAGMA journal_mode={self.journal_mode}")
+            except sqlite3.DatabaseError:
+                pass  # read-only or in-memory databases keep their journal mode
+        con.execute(f"PRAGMA cache_size=-{self.cache_size_kib}")
+        con.execute(f"PRAGMA mmap_size={self.mmap_size}")
+        con.execute("PRAGMA temp_store=MEMORY")
+        con.set_trace_callback(self._count_statement)
+        with self._lock:
+            self._all.append(con)
+            self.counters.connections_opened += 1
+        _count(connections_opened=1)
+        return con
+
+    def acquire(self, db_path: str) -> sqlite3.Connection:
+        """An idle connection to db_path for this thread, opening one if none."""
+        idle = self._idle().setdefault(db_path, [])
+        con = idle.pop() if idle else self._open(db_path)
+        con.row_factory = sqlite3.Row
+        with self._lock:
+            self.counters.sessions += 1
+        return con
+
+    def release(self, db_path: str, con: sqlite3.Connection, *, commit: bool) -> None:
+        """End the session's transaction and return the connection to this thread."""
+        if commit:
+            con.commit()
+        else:
+            con.rollback()
+        # Undo per-session settings a caller may have changed.
+        con.execute("PRAGMA foreign_keys = OFF")
+        con.set_trace_callback(self._count_statement)
+        self._idle().setdefault(db_path, []).append(con)
+
+    def close(self) -> None:
+        """Close every connection this pool opened."""
+        with self._lock:
+            conns, self._all = self._all, []
+        for con in conns:
+            con.close()
+        self._local = threading.local()
+
+    def stats(self) -> dict[str, int]:
+        """This pool's session, connection and statement counts."""
+        with self._lock:
+            return self.counters.as_dict()
+
+
+_ACTIVE_POOL: SessionPool | None = None
+
+
+def active_pool() -> SessionPool | None:
+    """The pool DatabaseSession uses in this process, if any."""
+    pool = _ACTIVE_POOL
+    # A forked worker must never touch its parent's connections.
+    if pool is not None and pool.pid != os.getpid():
+        return None
+    return pool
+
+
+@contextmanager
+def pooled_sessions(**pool_options: Any) -> Iterator[SessionPool]:
+    """Pool every DatabaseSession in this process for the duration of the block.
+
+    Reentrant: an inner block reuses the active pool. pool_options are
+    SessionPool keyword arguments.
+    """
+    global _ACTIVE_POOL
+    existing = active_pool()
+    if existing is not None:
+        yield existing
+        return
+    pool = SessionPool(**pool_options)
+    _ACTIVE_POOL = pool
+    try:
+        yield pool
+    finally:
+        _ACTIVE_POOL = None
+        pool.close()
+
+
+class _SnapshotConnection(sqlite3.Connection):
+    """Read-only snapshot connection; commit/rollback never end its transaction."""
+
+    def commit(self) -> None:
+        """No-op: the snapshot ends when read_snapshot exits."""
+
+    def rollback(self) -> None:
+        """No-op: the snapshot ends when read_snapshot exits."""
+
+
+# Active read snapshots of this context: real db path -> snapshot connection.
+_SNAPSHOTS: ContextVar[dict[str, sqlite3.Connection]] = ContextVar("_SNAPSHOTS", default={})
+
+
+def _snapshot_key(db_path: str | Path) -> str:
+    """Normalized path under which a database's snapshot is registered."""
+    return os.path.realpath(str(db_path))
+
+
+def enable_wal(db_path: str | Path) -> None:
+    """Switch an existing database to WAL journaling.
+
+    Persistent: the mode is recorded in the database file, so every later
+    connection (in any process) uses WAL until someone switches it back.
+    """
+    key = _snapshot_key(db_path)
+    if not os.path.isfile(key):
+        raise ConfigError(f"Database not found: {db_path}")
+    rw = sqlite3.connect(key)
+    try:
+        mode = rw.execute("PRAGMA journal_mode").fetchone()[0]
+        if str(mode).lower() != "wal":
+            rw.execute("PRAGMA journal_mode=WAL")
+    finally:
+        rw.close()
+
+
+@contextmanager
+def read_snapshot(
+    db_path: str | Path,
+    *,
+    immutable: bool = False,
+    wal: bool = False,
+    mmap_size: int = 1024 * 1024 * 1024,
+) -> Iterator[sqlite3.Connection]:
+    """Serve every DatabaseSession read of db_path in this context from one snapshot.
+
+    Reentrant: an inner block for the same database reuses the outer
+    snapshot. Other threads and contexts are unaffected.
+
+    The database must exist and, unless immutable, already use WAL (a read
+    transaction blocks writers under a rollback journal); otherwise
+    ConfigError. wal=True calls enable_wal(db_path) first.
+    """
+    key = _snapshot_key(db_path)
+    active = _SNAPSHOTS.get()
+    if key in active:
+        yield active[key]
+        return
+    if not os.path.isfile(key):
+        raise ConfigError(f"Database not found: {db_path}")
+    if wal and not immutable:
+        enable_wal(key)
+    uri = Path(key).as_uri() + "?mode=ro" + ("&immutable=1" if immutable else "")
+    con = sqlite3.connect(
+        uri, uri=True, isolation_level=None, check_same_thread=False,
+        factory=_SnapshotConnection,
+    )
+    _count(connections_opened=1)
+    con.row_factory = sqlite3.Row
+    if not immutable and str(con.execute("PRAGMA journal_mode").fetchone()[0]).lower() != "wal":
+        con.close()
+        raise ConfigError(
+            f"read_snapshot needs WAL journaling on {db_path}; "
+            "call enable_wal() first or pass wal=True"
+        )
+    con.execute(f"PRAGMA mmap_size={int(mmap_size)}")
+    # Pin the snapshot: a read transaction is only opened by the first read.
+    con.execute("BEGIN")
+    con.execute("SELECT COUNT(*) FROM sqlite_master").fetchone()
+    token = _SNAPSHOTS.set({**active, key: con})
+    try:
+        yield con
+    finally:
+        _SNAPSHOTS.reset(token)
+        con.close()
+
+
+def active_snapshot(db_path: str | Path) -> sqlite3.Connection | None:
+    """The read snapshot DatabaseSession uses for db_path in this context, if any."""
+    active = _SNAPSHOTS.get()
+    if not active:
+        return None
+    return active.get(_snapshot_key(db_path))
+
+
+SessionObserver = Callable[[sqlite3.Connection], None]
+
+_OBSERVER: ContextVar[SessionObserver | None] = ContextVar("_OBSERVER", default=None)
+
+
+@contextmanager
+def observe_sessions(observer: SessionObserver) -> Iterator[None]:
+    """Pass every DatabaseSession connection of this context to observer.
+
+    The observer may install a trace callback and a row factory; both are
+    reset when the session ends. An inner block replaces the outer observer.
+    """
+    token = _OBSERVER.set(observer)
+    try:
+        yield
+    finally:
+        _OBSERVER.reset(token)
 
 
 class DatabaseSession:
@@ -21,18 +333,53 @@ class DatabaseSession:
         """Initialize with path to SQLite database."""
         self.db_path = str(db_path)
         self._conn: sqlite3.Connection | None = None
+        self._pool: SessionPool | None = None
+        self._snapshot = False
+        self._observed: sqlite3.Connection | None = None
 
     def __enter__(self) -> sqlite3.Connection:
         """Open connection with Row factory enabled."""
+        con = self._open()
+        observer = _OBSERVER.get()
+        if observer is not None:
+            observer(con)
+            self._observed = con
+        return con
+
+    def _open(self) -> sqlite3.Connection:
+        """The session's connection: snapshot, pooled or newly opened."""
+        _count(sessions=1)
+        snapshot = active_snapshot(self.db_path)
+        if snapshot is not None:
+            self._snapshot = True
+            return snapshot
+        self._pool = active_pool()
+        if self._pool is not None:
+            self._conn = self._pool.acquire(self.db_path)
+            return self._conn
         self._conn = sqlite3.connect(self.db_path)
         self._conn.row_factory = sqlite3.Row
+        _count(connections_opened=1)
         return self._conn
 
     def __exit__(self, exc_type, exc_val, exc_tb):
-        """Commit on success, close always."""
+        """Commit on success, close always (pooled: return to the pool)."""
+        if self._observed is not None:
+            # A pooled connection gets its own trace callback back on release.
+            self._observed.set_trace_callback(None)
+            self._observed.row_factory = sqlite3.Row
+            self._observed = None
+        if self._snapshot:
+            # The snapshot's read transaction outlives the session.
+            self._snapshot = False
+            return False
         if self._conn:
-            if exc_type is None:
-                self._conn.commit()
-            self._conn.close()
+            if self._pool is not None:
+                self._pool.release(self.db_path, self._conn, commit=exc_type is None)
+            else:
+                if exc_type is None:
+                    self._conn.commit()
+                self._conn.close()
             self._conn = None
+            self._pool = None
         return False
@@ -3,17 +3,52 @@
 
 import json
 import sqlite3
+from collections.abc import Iterable
 from dataclasses import dataclass
 from datetime import UTC, datetime
+from itertools import islice
 from pathlib import Path
 from typing import Any
 
+# Rows per executemany call in append_events.
+APPEND_CHUNK_SIZE = 5000
+
+# Bound parameters per duplicate probe; stays under SQLITE_MAX_VARIABLE_NUMBER
+# (999 before SQLite 3.32).
+_PROBE_CHUNK_SIZE = 900
+
+# Canonical payload encoding (compact, sorted keys); one shared encoder
+# instead of a new one per json.dumps call.
+_encode_payload = json.JSONEncoder(separators=(",", ":"), sort_keys=True).encode
+
 
 def _now_iso_z() -> str:
     """Return current UTC time as ISO-8601 string."""
     return datetime.now(UTC).replace(microsecond=0).isoformat().replace("+00:00", "Z")
 
 
+def _stored_source_ids(
+    conn: sqlite3.Connection, chunk: list[dict[str, Any]],
+) -> set[tuple[Any, Any]]:
+    """(external_source, external_id) pairs of chunk already in memory_events."""
+    by_source: dict[Any, set[Any]] = {}
+    for e in chunk:
+        by_source.setdefault(e["external_source"], set()).add(e["external_id"])
+    stored: set[tuple[Any, Any]] = set()
+    for source, ids in by_source.items():
+        id_list = list(ids)
+        for i in range(0, len(id_list), _PROBE_CHUNK_SIZE):
+            part = id_list[i:i + _PROBE_CHUNK_SIZE]
+            placeholders = ",".join("?" * len(part))
+            rows = conn.execute(
+                f"SELECT external_id FROM memory_events"
+                f" WHERE external_source = ? AND external_id IN ({placeholders})",
+                (source, *part),
+            ).fetchall()
+            stored.update((source, r[0]) for r in rows)
+    return stored
+
+
 @dataclass(frozen=True)
 class SQLiteStore:
     db_path: Path
@@ -30,28 +65,47 @@ class SQLiteStore:
             conn.executescript(schema_sql)
             conn.commit()
 
-    def append_events(self, events: list[dict[str, Any]]) -> tuple[int, int]:
+    def append_events(self, events: Iterable[dict[str, Any]]) -> tuple[int, int]:
         """
         Append-only insert. Idempotent by (external_source, external_id).
         Returns (inserted_count, skipped_count).
+
+        One transaction per call: rows go in through executemany in chunks
+        of APPEND_CHUNK_SIZE, all stamped with the same ingested_at. Rows
+        that violate a constraint (a duplicate source id above all) are
+        skipped by the database; the counts come from total_changes.
         """
+        ingested_at = _now_iso_z()
+        seen = 0
         inserted = 0
-        skipped = 0
 
         with self.connect() as conn:
-            for e in events:
-                try:
-                    conn.execute(
-                        """
-                        INSERT INTO memory_events (
-                          league_id, season,
-                          external_source, external_id,
-                          event_type,
-                          occurred_at, ingested_at,
-                          payload_json
-                        )
-                        VALUES (?, ?, ?, ?, ?, ?, ?, ?)
-                        """,
+            conn.execute("BEGIN IMMEDIATE")
+            before = conn.total_changes
+            it = iter(events)
+            while chunk := list(islice(it, APPEND_CHUNK_SIZE)):
+                seen += len(chunk)
+                # Drop rows already in the ledger before encoding them; a
+                # re-ingest of a stored season is then one indexed probe per
+                # chunk instead of an encode-and-insert attempt per row.
+                stored = _stored_source_ids(conn, chunk)
+                if stored:
+                    chunk = [
+                        e for e in chunk
+                        if (e["external_source"], e["external_id"]) not in stored
+                    ]
+                conn.executemany(
+                    """
+                    INSERT OR IGNORE INTO memory_events (
+                      league_id, season,
+                      external_source, external_id,
+                      event_type,
+                      occurred_at, ingested_at,
+                      payload_json
+                    )
+                    VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+                    """,
+                    [
                         (
                             e["league_id"],
                             int(e["season"]),
@@ -59,17 +113,16 @@ class SQLiteStore:
                             e["external_id"],
                             e["event_type"],
                             e.get("occurred_at"),
-                            _now_iso_z(),
-                            json.dumps(e["payload"], separators=(",", ":"), sort_keys=True),
-                        ),
-                    )
-                    inserted += 1
-                except sqlite3.IntegrityError:
-                    skipped += 1
-
+                            ingested_at,
+                            _encode_payload(e["payload"]),
+                        )
+                        for e in chunk
+                    ],
+                )
+            inserted = conn.total_changes - before
             conn.commit()
 
-        return inserted, skipped
+        return inserted, seen - inserted
 
     # IMPORTANT:
     # Downstream consumers must read from canonical (v_canonical_best_events).
@@ -38,3 +38,13 @@ class ConfigError(SquadVaultError):
 class SchemaError(SquadVaultError):
     """Database schema is missing required tables or columns."""
     pass
+
+
+class CanonicalizationError(SquadVaultError):
+    """Canonical projection diverged from a full rebuild of the memory ledger."""
+    pass
+
+
+class OfflineCacheMissError(SquadVaultError):
+    """Offline replay needed a platform response that is not in the response cache."""
+    pass
@@ -19,6 +19,13 @@ Usage (manual range — probes each year on the same server):
     --end-year 2023 \
     --expected-franchises 10
 
+Usage (replay cached responses without HTTP, e.g. after a deriver fix):
+  ./scripts/py -u src/squadvault/mfl/_run_historical_ingest.py \
+    --db .local_squadvault.sqlite \
+    --league-id 70985 \
+    --response-cache .local_mfl_cache \
+    --offline
+
 Usage (specific categories only):
   ./scripts/py -u src/squadvault/mfl/_run_historical_ingest.py \
     --db .local_squadvault.sqlite \
@@ -33,13 +40,23 @@ import argparse
 import os
 from pathlib import Path
 
-from squadvault.core.canonicalize.run_canonicalize import canonicalize
+from squadvault.core.canonicalize.run_canonicalize import canonicalize_all
 from squadvault.core.storage.sqlite_store import SQLiteStore
-from squadvault.mfl.discovery import discover_mfl_league, discover_mfl_league_via_history
+from squadvault.mfl.discovery import (
+    DiscoveryReport,
+    discover_mfl_league,
+    discover_mfl_league_via_history,
+)
 from squadvault.mfl.historical_ingest import ingest_mfl_seasons
+from squadvault.mfl.response_cache import MflResponseCache
 
 SCHEMA_PATH = Path("src/squadvault/core/storage/schema.sql")
 
+# The discovery report is kept in the response cache next to the exports so
+# --offline can replay a run without re-probing MFL. It has no year or week.
+_DISCOVERY_EXPORT = "discovery"
+_DISCOVERY_YEAR = 0
+
 ALL_CATEGORIES = [
     "FRANCHISE_INFO",
     "MATCHUP_RESULTS",
@@ -112,6 +129,12 @@ def main(argv: list[str] | None = None) -> int:
         action="store_true",
         help="Skip canonicalization after ingestion",
     )
+    ap.add_argument(
+        "--canonicalize-workers",
+        type=int,
+        default=os.cpu_count() or 1,
+        help="Processes computing season projections in parallel (default: CPU count)",
+    )
     ap.add_argument(
         "--discovery-only",
         action="store_true",
@@ -145,8 +168,26 @@ def main(argv: list[str] | None = None) -> int:
         default=os.environ.get("MFL_PASSWORD"),
         help="MFL password (optional, for private leagues)",
     )
+    ap.add_argument(
+        "--response-cache",
+        default=os.environ.get("SQUADVAULT_MFL_CACHE"),
+        help="Directory of cached MFL responses. Every response is stored; "
+        "closed past seasons are replayed instead of fetched again.",
+    )
+    ap.add_argument(
+        "--offline",
+        action="store_true",
+        help="Replay discovery and every export from --response-cache "
+        "without any HTTP (no rate-limit delays)",
+    )
     args = ap.parse_args(argv)
 
+    if args.offline and not args.response_cache:
+        ap.error("--offline requires --response-cache")
+    response_cache = (
+        MflResponseCache(args.response_cache) if args.response_cache else None
+    )
+
     db_path = Path(args.db)
     league_id = str(args.league_id)
 
@@ -161,6 +202,9 @@ def main(argv: list[str] | None = None) -> int:
         print(f"  Range    : {args.start_year}--{args.end_year}")
     print(f"  Server   : {args.known_server}")
     print(f"  Delay    : {args.delay}s")
+    if response_cache is not None:
+        mode = "offline replay" if args.offline else "read/write"
+        print(f"  Cache    : {response_cache.root} ({mode})")
     if args.categories:
         print(f"  Categories: {', '.join(args.categories)}")
     else:
@@ -172,7 +216,13 @@ def main(argv: list[str] | None = None) -> int:
     print("Phase 1: Discovery")
     print("-" * 40)
 
-    if args.use_history_chain:
+    if response_cache is not None and args.offline:
+        cached = response_cache.get(league_id, _DISCOVERY_EXPORT, _DISCOVERY_YEAR)
+        if cached is None:
+            print(f"No cached discovery report for league {league_id}; run online first.")
+            return 1
+        report = DiscoveryReport.from_dict(cached.body)
+    elif args.use_history_chain:
         report = discover_mfl_league_via_history(
             league_id=league_id,
             known_server=args.known_server,
@@ -190,6 +240,12 @@ def main(argv: list[str] | None = None) -> int:
             expected_league_name=args.expected_name,
         )
 
+    if response_cache is not None and not args.offline:
+        response_cache.put(
+            league_id, _DISCOVERY_EXPORT, _DISCOVERY_YEAR, None,
+            report.to_dict(), source_url="discovery",
+        )
+
     report.print_summary()
 
     if not report.seasons:
@@ -224,6 +280,8 @@ def main(argv: list[str] | None = None) -> int:
         request_delay_s=args.delay,
         username=args.mfl_username,
         password=args.mfl_password,
+        response_cache=response_cache,
+        offline=args.offline,
     )
 
     # ── Phase 3: Canonicalization (optional) ─────────────────────────
@@ -232,21 +290,15 @@ def main(argv: list[str] | None = None) -> int:
         print("\nPhase 3: Canonicalization")
         print("-" * 40)
 
-        for season_result in results:
-            if season_result.total_inserted > 0:
-                print(f"  Canonicalizing season {season_result.season}...")
-                try:
-                    canonicalize(
-                        league_id=league_id,
-                        season=season_result.season,
-                        db_path=str(db_path),
-                    )
-                except TypeError:
-                    # Backward-compatible call
-                    canonicalize(
-                        league_id=league_id,
-                        season=season_result.season,
-                    )
+        seasons = [r.season for r in results if r.total_inserted > 0]
+        if seasons:
+            print(f"  Canonicalizing seasons {', '.join(str(s) for s in sorted(seasons))}...")
+            canonicalize_all(
+                league_id=league_id,
+                seasons=seasons,
+                db_path=str(db_path),
+                workers=args.canonicalize_workers,
+            )
     else:
         print("\nSkipping canonicalization (--skip-canonicalize)")
 
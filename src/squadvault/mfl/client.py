@@ -7,10 +7,20 @@ from typing import Any
 
 import requests
 
+from squadvault.errors import ConfigError, OfflineCacheMissError
+from squadvault.mfl.response_cache import MflResponseCache, season_is_closed
 from squadvault.utils.http import http_request_with_retries
 
 logger = logging.getLogger(__name__)
 
+# Response-cache league key for NFL-wide exports (api.myfantasyleague.com).
+_NFL_CACHE_KEY = "_nfl"
+
+
+def _is_cacheable(body: Any) -> bool:
+    """True for export bodies worth keeping: a JSON object without MFL's top-level error."""
+    return isinstance(body, dict) and "error" not in body
+
 
 class MflClient:
     """
@@ -25,6 +35,11 @@ class MflClient:
       All forms are normalized safely.
     - Host discovery via redirect is intentionally NOT implemented yet
       (explicit config is the current contract).
+    - With a `response_cache`, every response is stored on disk and closed
+      past seasons are served from it instead of being fetched again.
+      Bodies carrying MFL's top-level `error` are never stored, so a
+      failed export is fetched again next time. `offline=True` serves everything from the cache and never touches
+      the network; a missing entry raises OfflineCacheMissError.
     """
 
     def __init__(
@@ -33,11 +48,18 @@ class MflClient:
         league_id: str,
         username: str | None = None,
         password: str | None = None,
+        *,
+        response_cache: MflResponseCache | None = None,
+        offline: bool = False,
     ) -> None:
+        if offline and response_cache is None:
+            raise ConfigError("MflClient offline mode requires a response_cache")
         self.server = server
         self.league_id = league_id
         self.username = username
         self.password = password
+        self.response_cache = response_cache
+        self.offline = offline
         self.session = requests.Session()
 
     # ----------------------------
@@ -73,6 +95,52 @@ class MflClient:
 
         return f"{raw}.myfantasyleague.com"
 
+    def _get_export(
+        self,
+        year: int,
+        export_type: str,
+        url: str,
+        *,
+        week: int | None = None,
+        cache_league_id: str | None = None,
+        login: bool = True,
+    ) -> tuple[dict[str, Any], str]:
+        """
+        Fetch one export, going through the response cache when configured.
+
+        v1 behavior on the network path:
+        - Attempt unauthenticated request first
+        - If non-200, login is allowed and creds exist, log in and retry once
+        """
+        cache = self.response_cache
+        cache_league_id = cache_league_id or self.league_id
+        if cache is not None and (self.offline or season_is_closed(year)):
+            cached = cache.get(cache_league_id, export_type, year, week)
+            if cached is not None and (self.offline or _is_cacheable(cached.body)):
+                return cached.body, cached.source_url
+        if self.offline:
+            raise OfflineCacheMissError(
+                f"No cached MFL {export_type} response for league "
+                f"{cache_league_id} year {year}"
+                + (f" week {week}" if week is not None else "")
+            )
+
+        resp = http_request_with_retries(self.session, "GET", url)
+
+        if resp.status_code != 200 and login and self.username and self.password:
+            logger.info(
+                "MFL unauthenticated request failed (%s); attempting login then retry.",
+                resp.status_code,
+            )
+            self._login(year)
+            resp = http_request_with_retries(self.session, "GET", url)
+
+        resp.raise_for_status()
+        body = resp.json()
+        if cache is not None and _is_cacheable(body):
+            cache.put(cache_league_id, export_type, year, week, body, url)
+        return body, url
+
     # ----------------------------
     # URL builders
     # ----------------------------
@@ -103,18 +171,7 @@ class MflClient:
         - If non-200 and creds exist, attempt login and retry once
         """
         url = self.export_url(year, "transactions")
-        resp = http_request_with_retries(self.session, "GET", url)
-
-        if resp.status_code != 200 and self.username and self.password:
-            logger.info(
-                "MFL unauthenticated request failed (%s); attempting login then retry.",
-                resp.status_code,
-            )
-            self._login(year)
-            resp = http_request_with_retries(self.session, "GET", url)
-
-        resp.raise_for_status()
-        return resp.json(), url
+        return self._get_export(year, "transactions", url)
 
     def get_weekly_results(self, year: int, week: int) -> tuple[dict[str, Any], str]:
         """
@@ -124,18 +181,7 @@ class MflClient:
         v1 behavior: same auth pattern as get_transactions.
         """
         url = self.export_url(year, "weeklyResults") + f"&W={week}"
-        resp = http_request_with_retries(self.session, "GET", url)
-
-        if resp.status_code != 200 and self.username and self.password:
-            logger.info(
-                "MFL unauthenticated request failed (%s); attempting login then retry.",
-                resp.status_code,
-            )
-            self._login(year)
-            resp = http_request_with_retries(self.session, "GET", url)
-
-        resp.raise_for_status()
-        return resp.json(), url
+        return self._get_export(year, "weeklyResults", url, week=week)
 
     def get_league_info(self, year: int) -> tuple[dict[str, Any], str]:
         """
@@ -144,18 +190,7 @@ class MflClient:
         v1 behavior: same auth pattern as get_transactions.
         """
         url = self.export_url(year, "league")
-        resp = http_request_with_retries(self.session, "GET", url)
-
-        if resp.status_code != 200 and self.username and self.password:
-            logger.info(
-                "MFL unauthenticated request failed (%s); attempting login then retry.",
-                resp.status_code,
-            )
-            self._login(year)
-            resp = http_request_with_retries(self.session, "GET", url)
-
-        resp.raise_for_status()
-        return resp.json(), url
+        return self._get_export(year, "league", url)
 
     def get_players(self, year: int) -> tuple[dict[str, Any], str]:
         """
@@ -164,18 +199,7 @@ class MflClient:
         v1 behavior: same auth pattern as get_transactions.
         """
         url = self.export_url(year, "players")
-        resp = http_request_with_retries(self.session, "GET", url)
-
-        if resp.status_code != 200 and self.username and self.password:
-            logger.info(
-                "MFL unauthenticated request failed (%s); attempting login then retry.",
-                resp.status_code,
-            )
-            self._login(year)
-            resp = http_request_with_retries(self.session, "GET", url)
-
-        resp.raise_for_status()
-        return resp.json(), url
+        return self._get_export(year, "players", url)
 
     def get_player_scores(self, year: int, week: int) -> tuple[dict[str, Any], str]:
         """
@@ -188,18 +212,7 @@ class MflClient:
         v1 behavior: same auth pattern as get_transactions.
         """
         url = self.export_url(year, "playerScores") + f"&W={week}"
-        resp = http_request_with_retries(self.session, "GET", url)
-
-        if resp.status_code != 200 and self.username and self.password:
-            logger.info(
-                "MFL unauthenticated request failed (%s); attempting login then retry.",
-                resp.status_code,
-            )
-            self._login(year)
-            resp = http_request_with_retries(self.session, "GET", url)
-
-        resp.raise_for_status()
-        return resp.json(), url
+        return self._get_export(year, "playerScores", url, week=week)
 
     def get_rosters(self, year: int, week: int) -> tuple[dict[str, Any], str]:
         """
@@ -212,18 +225,7 @@ class MflClient:
         v1 behavior: same auth pattern as get_transactions.
         """
         url = self.export_url(year, "rosters") + f"&W={week}"
-        resp = http_request_with_retries(self.session, "GET", url)
-
-        if resp.status_code != 200 and self.username and self.password:
-            logger.info(
-                "MFL unauthenticated request failed (%s); attempting login then retry.",
-                resp.status_code,
-            )
-            self._login(year)
-            resp = http_request_with_retries(self.session, "GET", url)
-
-        resp.raise_for_status()
-        return resp.json(), url
+        return self._get_export(year, "rosters", url, week=week)
 
     # ----------------------------
     # NFL-wide API calls (api.myfantasyleague.com)
@@ -253,9 +255,9 @@ class MflClient:
             {"id": "KCC", "bye_week": "6"}, ...]}}
         """
         url = self._api_export_url(year, "nflByeWeeks")
-        resp = http_request_with_retries(self.session, "GET", url)
-        resp.raise_for_status()
-        return resp.json(), url
+        return self._get_export(
+            year, "nflByeWeeks", url, cache_league_id=_NFL_CACHE_KEY, login=False,
+        )
 
     # ----------------------------
     # League-specific metadata
@@ -271,18 +273,7 @@ class MflClient:
         Used by Dimension 11 (Scoring Rules Context) of Narrative Angles v2.
         """
         url = self.export_url(year, "rules")
-        resp = http_request_with_retries(self.session, "GET", url)
-
-        if resp.status_code != 200 and self.username and self.password:
-            logger.info(
-                "MFL unauthenticated request failed (%s); attempting login then retry.",
-                resp.status_code,
-            )
-            self._login(year)
-            resp = http_request_with_retries(self.session, "GET", url)
-
-        resp.raise_for_status()
-        return resp.json(), url
+        return self._get_export(year, "rules", url)
 
     def _login(self, year: int) -> None:
         """
@@ -12,7 +12,7 @@ from __future__ import annotations
 
 import logging
 import time
-from dataclasses import dataclass, field
+from dataclasses import asdict, dataclass, field
 from typing import Any
 from urllib.parse import urlparse
 
@@ -99,6 +99,21 @@ class DiscoveryReport:
                 return s.mfl_league_id
         return None
 
+    def to_dict(self) -> dict[str, Any]:
+        """JSON-serializable form, for replaying ingestion offline."""
+        return asdict(self)
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> DiscoveryReport:
+        """Rebuild a report from to_dict() output."""
+        return cls(
+            league_id=str(data["league_id"]),
+            platform=str(data.get("platform", "MFL")),
+            seasons=[SeasonAvailability(**s) for s in data.get("seasons", [])],
+            probed_range=tuple(data.get("probed_range", (0, 0))),
+            errors=list(data.get("errors", [])),
+        )
+
     def print_summary(self) -> None:
         """Print a human-readable discovery summary."""
         good = [s for s in self.seasons if not s.suspect]
@@ -43,6 +43,7 @@ from squadvault.ingest.waiver_bids import (
 )
 from squadvault.mfl.client import MflClient
 from squadvault.mfl.discovery import DiscoveryReport
+from squadvault.mfl.response_cache import MflResponseCache
 
 logger = logging.getLogger(__name__)
 
@@ -78,6 +79,37 @@ class SeasonIngestResult:
         return sum(c.skipped for c in self.categories)
 
 
+class _WeeklyResults:
+    """weeklyResults documents for one client, fetched at most once per week.
+
+    MATCHUP_RESULTS and PLAYER_SCORES both derive from the same weekly
+    document. Sharing one instance across both categories halves the
+    requests (and rate-limit delays) of a season ingest. Failed fetches are
+    not kept, so a later category retries them.
+    """
+
+    def __init__(self, client: MflClient) -> None:
+        """Create an empty per-week store that fetches through client."""
+        self._client = client
+        self._responses: dict[tuple[int, int], tuple[dict[str, Any], str]] = {}
+        self.requests = 0
+
+    def is_cached(self, season: int, week: int) -> bool:
+        """True when the (season, week) document is already held."""
+        return (season, week) in self._responses
+
+    def get(self, season: int, week: int) -> tuple[dict[str, Any], str]:
+        """Return (raw_json, source_url), fetching only on first use."""
+        key = (season, week)
+        cached = self._responses.get(key)
+        if cached is not None:
+            return cached
+        self.requests += 1
+        response = self._client.get_weekly_results(year=season, week=week)
+        self._responses[key] = response
+        return response
+
+
 # ── Category ingest functions ────────────────────────────────────────
 
 
@@ -201,28 +233,30 @@ def _ingest_matchup_results(
     season: int,
     max_weeks: int = 18,
     request_delay_s: float = 3.0,
+    weekly: _WeeklyResults | None = None,
 ) -> CategoryResult:
     """Ingest weekly matchup results for a season.
 
     Probes weeks 1 through max_weeks. Stops early on consecutive empty
     weeks. Skips weeks where all scores are 0.00 (unplayed).
 
-    Adapts delay when 429 rate limits are encountered.
+    Adapts delay when 429 rate limits are encountered. Weeks already held
+    by weekly are reused without a request or delay.
     """
     result = CategoryResult(category="MATCHUP_RESULTS")
     consecutive_empty = 0
     current_delay = request_delay_s
+    if weekly is None:
+        weekly = _WeeklyResults(client)
 
     try:
         for week in range(1, max_weeks + 1):
             # Always delay between requests (including after failures)
-            if week > 1:
+            if week > 1 and not weekly.is_cached(season, week):
                 time.sleep(current_delay)
 
             try:
-                raw_json, source_url = client.get_weekly_results(
-                    year=season, week=week
-                )
+                raw_json, source_url = weekly.get(season, week)
             except Exception as e:
                 err_str = str(e)
                 # Detect 429 from the exception message and increase delay
@@ -345,27 +379,28 @@ def _ingest_player_scores(
     season: int,
     max_weeks: int = 18,
     request_delay_s: float = 3.0,
+    weekly: _WeeklyResults | None = None,
 ) -> CategoryResult:
     """Ingest per-player weekly scores for a season.
 
     Uses the weeklyResults endpoint (same as matchup results) which
     includes per-player scoring and lineup status within each franchise.
     Follows the same probing and rate-limit adaptation pattern as
-    _ingest_matchup_results.
+    _ingest_matchup_results, and reuses weeks already fetched into weekly.
     """
     result = CategoryResult(category="PLAYER_SCORES")
     consecutive_empty = 0
     current_delay = request_delay_s
+    if weekly is None:
+        weekly = _WeeklyResults(client)
 
     try:
         for week in range(1, max_weeks + 1):
-            if week > 1:
+            if week > 1 and not weekly.is_cached(season, week):
                 time.sleep(current_delay)
 
             try:
-                raw_json, source_url = client.get_weekly_results(
-                    year=season, week=week
-                )
+                raw_json, source_url = weekly.get(season, week)
             except Exception as e:
                 err_str = str(e)
                 if "429" in err_str:
@@ -527,6 +562,8 @@ def ingest_mfl_season(
     username: str | None = None,
     password: str | None = None,
     league_json: dict[str, Any] | None = None,
+    response_cache: MflResponseCache | None = None,
+    offline: bool = False,
 ) -> SeasonIngestResult:
     """
     Ingest one MFL season across selected data categories.
@@ -547,9 +584,15 @@ def ingest_mfl_season(
         username: MFL username (optional, for private leagues)
         password: MFL password (optional, for private leagues)
         league_json: Cached TYPE=league response from discovery (optional)
+        response_cache: On-disk MFL response cache (optional). Responses are
+            stored in it, and closed past seasons are replayed from it.
+        offline: Replay every response from response_cache without HTTP.
+            Rate-limit delays are skipped.
     """
     # MFL league ID for API calls may differ from SquadVault league ID
     api_league_id = mfl_league_id or league_id
+    if offline:
+        request_delay_s = 0.0
 
     if categories is None:
         categories = list(_ALL_CATEGORIES)
@@ -563,10 +606,16 @@ def ingest_mfl_season(
         league_id=api_league_id,
         username=username,
         password=password,
+        response_cache=response_cache,
+        offline=offline,
     )
 
     store = SQLiteStore(Path(db_path))
 
+    # weeklyResults feeds both MATCHUP_RESULTS and PLAYER_SCORES; each week
+    # is downloaded once per season and released with it.
+    weekly = _WeeklyResults(client)
+
     # 1. FRANCHISE_INFO (must be first — required for name resolution)
     if "FRANCHISE_INFO" in categories:
         cat_result = _ingest_franchise_info(
@@ -585,6 +634,7 @@ def ingest_mfl_season(
             season,
             max_weeks=max_weeks,
             request_delay_s=request_delay_s,
+            weekly=weekly,
         )
         result.categories.append(cat_result)
         _log_category(season, cat_result)
@@ -615,8 +665,8 @@ def ingest_mfl_season(
         result.categories.append(cat_result)
         _log_category(season, cat_result)
 
-    # 5. PLAYER_SCORES (uses weeklyResults endpoint — same as matchup results
-    #    but extracts per-player scoring and lineup status)
+    # 5. PLAYER_SCORES (reuses the weeklyResults documents fetched for
+    #    matchup results; extracts per-player scoring and lineup status)
     if "PLAYER_SCORES" in categories:
         cat_result = _ingest_player_scores(
             client,
@@ -625,6 +675,7 @@ def ingest_mfl_season(
             season,
             max_weeks=max_weeks,
             request_delay_s=request_delay_s,
+            weekly=weekly,
         )
         result.categories.append(cat_result)
         _log_category(season, cat_result)
@@ -667,6 +718,8 @@ def ingest_mfl_seasons(
     request_delay_s: float = 1.5,
     username: str | None = None,
     password: str | None = None,
+    response_cache: MflResponseCache | None = None,
+    offline: bool = False,
 ) -> list[SeasonIngestResult]:
     """
     Ingest multiple MFL seasons using a discovery report.
@@ -689,6 +742,8 @@ def ingest_mfl_seasons(
         request_delay_s: Delay between API calls
         username: MFL username (optional)
         password: MFL password (optional)
+        response_cache: On-disk MFL response cache (optional)
+        offline: Replay from response_cache only; no HTTP, no cooldowns
     """
     if seasons is None:
         seasons = discovery.available_seasons()
@@ -735,6 +790,8 @@ def ingest_mfl_seasons(
             username=username,
             password=password,
             league_json=league_json,
+            response_cache=response_cache,
+            offline=offline,
         )
 
         results.append(season_result)
@@ -744,6 +801,9 @@ def ingest_mfl_seasons(
             f" skipped={season_result.total_skipped}"
         )
 
+        if offline:
+            continue
+
         # Inter-season cooldown (longer than inter-request to let rate limits reset)
         inter_season_wait = max(request_delay_s * 3, 5.0)
         print(f"  (cooling down {inter_season_wait:.0f}s before next season)")
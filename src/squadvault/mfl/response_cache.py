@@ -0,0 +1,142 @@
+"""Content-addressed on-disk cache of MFL export responses.
+
+Historical MFL exports never change once a season is closed, yet every
+re-ingest (including reruns after an envelope-deriver fix) downloaded them
+again. MflClient can write each response here and replay it later.
+
+Layout under the cache root:
+    objects/<sha[:2]>/<sha>.json.gz
+        Response body as canonical JSON (sorted keys), gzip-compressed.
+        Addressed by the SHA-256 of the uncompressed JSON, so identical
+        bodies are stored once.
+    index/<league>/<year>/<export_type>[-W<week>].json
+        {"sha256", "source_url", "fetched_at"} for the latest fetch of
+        that (league, export type, year, week).
+
+Writes are atomic (temp file + rename), so an interrupted ingest never
+leaves a truncated entry. The cache only holds platform responses; it is
+never a source of fact for the memory ledger.
+"""
+
+from __future__ import annotations
+
+import gzip
+import hashlib
+import json
+import os
+import tempfile
+from dataclasses import dataclass
+from datetime import UTC, datetime
+from pathlib import Path
+from typing import Any
+
+# NFL seasons end in early February; a season is closed from March 1 of
+# the following year, after which MFL no longer revises its exports.
+_SEASON_CLOSE_MONTH = 3
+
+
+@dataclass(frozen=True)
+class CachedResponse:
+    """One cached export response."""
+
+    body: dict[str, Any]
+    source_url: str
+    fetched_at: str
+    sha256: str
+
+
+def season_is_closed(year: int, now: datetime | None = None) -> bool:
+    """True when the MFL season for year can no longer change."""
+    now = now or datetime.now(UTC)
+    return (now.year, now.month) >= (year + 1, _SEASON_CLOSE_MONTH)
+
+
+def _atomic_write(path: Path, data: bytes) -> None:
+    """Write data to path via a temp file and rename."""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    fd, tmp = tempfile.mkstemp(dir=path.parent, prefix=".tmp-")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(data)
+        os.replace(tmp, path)
+    except BaseException:
+        Path(tmp).unlink(missing_ok=True)
+        raise
+
+
+class MflResponseCache:
+    """Export responses keyed by (league, export type, year, week)."""
+
+    def __init__(self, root: str | Path) -> None:
+        self.root = Path(root)
+        self.hits = 0
+        self.writes = 0
+
+    def _index_path(
+        self, league_id: str, export_type: str, year: int, week: int | None,
+    ) -> Path:
+        """Index entry path for one request key."""
+        name = export_type if week is None else f"{export_type}-W{week:02d}"
+        return self.root / "index" / league_id / str(year) / f"{name}.json"
+
+    def _object_path(self, sha256: str) -> Path:
+        """Blob path for one body digest."""
+        return self.root / "objects" / sha256[:2] / f"{sha256}.json.gz"
+
+    def get(
+        self,
+        league_id: str,
+        export_type: str,
+        year: int,
+        week: int | None = None,
+    ) -> CachedResponse | None:
+        """Return the cached response for a request key, or None."""
+        index_path = self._index_path(league_id, export_type, year, week)
+        try:
+            entry = json.loads(index_path.read_text(encoding="utf-8"))
+            raw = gzip.decompress(self._object_path(entry["sha256"]).read_bytes())
+        except (OSError, ValueError, KeyError):
+            return None
+        if hashlib.sha256(raw).hexdigest() != entry["sha256"]:
+            return None  # corrupt blob: treat as a miss and refetch
+        self.hits += 1
+        return CachedResponse(
+            body=json.loads(raw),
+            source_url=str(entry.get("source_url", "")),
+            fetched_at=str(entry.get("fetched_at", "")),
+            sha256=entry["sha256"],
+        )
+
+    def put(
+        self,
+        league_id: str,
+        export_type: str,
+        year: int,
+        week: int | None,
+        body: dict[str, Any],
+        source_url: str,
+        fetched_at: str | None = None,
+    ) -> str:
+        """Store a response body and point its request key at it.
+
+        Returns the body's SHA-256 digest.
+        """
+        raw = json.dumps(
+            body, sort_keys=True, separators=(",", ":"), ensure_ascii=False,
+        ).encode("utf-8")
+        sha256 = hashlib.sha256(raw).hexdigest()
+        object_path = self._object_path(sha256)
+        if not object_path.exists():
+            _atomic_write(object_path, gzip.compress(raw, mtime=0))
+        entry = {
+            "sha256": sha256,
+            "source_url": source_url,
+            "fetched_at": fetched_at
+            or datetime.now(UTC).strftime("%Y-%m-%dT%H:%M:%SZ"),
+        }
+        _atomic_write(
+            self._index_path(league_id, export_type, year, week),
+            json.dumps(entry, sort_keys=True).encode("utf-8"),
+        )
+        self.writes += 1
+        return sha256
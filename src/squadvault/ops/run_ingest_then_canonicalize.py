@@ -140,6 +140,17 @@ def parse_args() -> argparse.Namespace:
         help="Max chars to store for raw_json (default: env RAW_JSON_TRUNCATE_CHARS or 2000)",
     )
 
+    p.add_argument(
+        "--full-rebuild",
+        action="store_true",
+        help="Rebuild the season's canonical projection from scratch instead of folding only new ledger rows",
+    )
+    p.add_argument(
+        "--verify-canonical",
+        action="store_true",
+        help="After canonicalizing, prove the projection is identical to a full rebuild",
+    )
+
     # Optional auth; required only if your client needs it.
     p.add_argument("--mfl-username", default=os.environ.get("MFL_USERNAME"), help="MFL username (optional)")
     p.add_argument("--mfl-password", default=os.environ.get("MFL_PASSWORD"), help="MFL password (optional)")
@@ -217,13 +228,15 @@ def main() -> int:
     print("ingest_status =", "no_new_rows" if inserted == 0 else "appended_rows")
 
     print("\n=== Canonicalize ===")
-    # NOTE: canonicalize() uses the default DB in its implementation. If it supports a db_path,
-    # pass it through. If not, we rely on canonicalize reading the same DB from env/config.
-    try:
-        canonicalize(league_id=league_id, season=season, db_path=str(db_path))  # type: ignore[arg-type]
-    except TypeError:
-        # Backward compatible call signature
-        canonicalize(league_id=league_id, season=season)
+    # Incremental by default: a daily ingest appends a handful of rows, so only the
+    # ledger tail above the season's high-water mark is folded in.
+    canonicalize(
+        league_id=league_id,
+        season=season,
+        db_path=str(db_path),
+        incremental=not args.full_rebuild,
+        verify=args.verify_canonical,
+    )
 
     print("\n=== Post-run checks (SQLite) ===")
     with DatabaseSession(str(db_path)) as conn:
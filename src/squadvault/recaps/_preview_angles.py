@@ -39,11 +39,9 @@ from squadvault.core.recaps.context.bye_week_context_v1 import (
 from squadvault.core.recaps.context.franchise_deep_angles_v1 import (
     detect_franchise_deep_angles_v1,
 )
-from squadvault.core.recaps.context.league_history_v1 import (
-    build_cross_season_name_resolver,
-    compute_franchise_tenures,
-    derive_league_history_v1,
-    load_all_matchups,
+from squadvault.core.recaps.context.league_history_cache_v1 import (
+    LeagueHistoryCache,
+    league_history_cache,
 )
 from squadvault.core.recaps.context.league_rules_context_v1 import (
     detect_scoring_rules_angles_v1,
@@ -58,7 +56,6 @@ from squadvault.core.recaps.context.player_narrative_angles_v1 import (
 from squadvault.core.recaps.context.season_context_v1 import (
     derive_season_context_v1,
 )
-from squadvault.core.resolvers import build_player_name_map
 from squadvault.core.resolvers import identity as _identity
 from squadvault.core.storage.session import DatabaseSession
 
@@ -82,9 +79,15 @@ def detect_all_angles(
 
     module_counts: dict[str, int | str] = {}
 
-    # Shared context
+    # Shared context: league-wide history loads once per ledger state, so
+    # --all-weeks pays for it once.
     try:
-        tenure_map = compute_franchise_tenures(db_path, league_id)
+        league = league_history_cache(db_path, league_id)
+    except Exception as exc:
+        logger.debug("%s", exc)
+        league = LeagueHistoryCache(db_path, league_id)
+    try:
+        tenure_map = league.tenure_map()
     except Exception as exc:
         logger.debug("%s", exc)
         tenure_map = None
@@ -101,12 +104,7 @@ def detect_all_angles(
         # Scoped to (season, week) per the Weekly Recap Context Temporal
         # Scoping Addendum (v1.0). Mirrors the production recap pipeline
         # so preview output reflects what the real recap would consume.
-        history_ctx = derive_league_history_v1(
-            db_path=db_path,
-            league_id=league_id,
-            as_of_season=season,
-            as_of_week=week,
-        )
+        history_ctx = league.league_history_as_of(season, week)
     except Exception as exc:
         logger.debug("%s", exc)
         history_ctx = None
@@ -115,12 +113,7 @@ def detect_all_angles(
         # Scoped to the same approved window as history_ctx above, so
         # the narrative angle detector receives the same inputs it would
         # receive inside the production recap pipeline.
-        all_matchups = load_all_matchups(
-            db_path,
-            league_id,
-            as_of_season=season,
-            as_of_week=week,
-        )
+        all_matchups = league.matchups_as_of(season, week)
     except Exception as exc:
         logger.debug("%s", exc)
         all_matchups = None
@@ -149,6 +142,8 @@ def detect_all_angles(
             db_path=db_path, league_id=league_id, season=season, week=week,
             tenure_map=tenure_map,
             pname=pname, fname=fname,
+            score_store=league.player_score_store(),
+            alltime_zero_count=league.starter_zero_count(),
         )
         module_counts["player_narrative"] = len(angles)
         all_angles.extend(angles)
@@ -172,6 +167,8 @@ def detect_all_angles(
             db_path=db_path, league_id=league_id, season=season, week=week,
             tenure_map=tenure_map,
             pname=pname, fname=fname,
+            score_store=league.player_score_store(),
+            all_matchups=league.matchups_as_of(season, week),
         )
         module_counts["franchise_deep"] = len(angles)
         all_angles.extend(angles)
@@ -233,8 +230,9 @@ def render_angle(a: NarrativeAngle) -> str:
 
 def preview_week(db_path: str, league_id: str, season: int, week: int) -> None:
     """Print the full angle preview for a single week."""
-    name_map = build_cross_season_name_resolver(db_path, league_id)
-    player_name_map = build_player_name_map(db_path, league_id)
+    league = league_history_cache(db_path, league_id)
+    name_map = league.name_map()
+    player_name_map = league.player_name_map()
 
     all_angles, module_counts = detect_all_angles(
         db_path, league_id, season, week,
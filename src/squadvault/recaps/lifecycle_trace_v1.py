@@ -0,0 +1,314 @@
+"""Lifecycle Stage Trace v1 — per-stage timings and counters for recap drafting.
+
+Observation sidecar for generate_weekly_recap_draft and the range runner:
+each lifecycle stage (facts render, EAL, prompt-context derivations, each
+angle-detector family, _budget_angles, every creative-layer call and
+verification attempt, the write stage) is recorded as one StageTiming with
+
+- duration_ms: wall time (time.perf_counter)
+- queries: SQL statements executed through DatabaseSession
+- rows_read: rows fetched through DatabaseSession (sqlite3.Row factory)
+- json_payloads: non-NULL *_json columns among those rows (the payloads
+  the stage goes on to parse)
+- angles: narrative angles the stage emitted (detector and budget stages)
+
+Counts are inclusive: a stage's numbers include its nested stages, whose
+names are path-joined ("prepare/prompt_context/angles.player").
+
+Enabled by SQUADVAULT_LIFECYCLE_TRACE=1; anything else is a no-op. When
+disabled, stage() returns a shared no-op span after one ContextVar lookup
+and DatabaseSession installs nothing. write_weekly_recap_draft persists a
+week's records to recap_stage_timings (migration 0014); like prompt_audit,
+the table is observation-only, append-only and never feeds back into facts.
+Persistence failures are swallowed (debug-logged).
+
+Summarize a season with:
+    python -m squadvault.consumers.recap_stage_timings --db ... --league-id ... --season ...
+"""
+
+from __future__ import annotations
+
+import logging
+import os
+import sqlite3
+import time
+import uuid
+from collections.abc import Iterable, Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass
+from typing import Any
+
+from squadvault.core.storage.db_utils import now_utc_iso
+from squadvault.core.storage.session import DatabaseSession, observe_sessions
+
+logger = logging.getLogger(__name__)
+
+TRACE_ENV_VAR = "SQUADVAULT_LIFECYCLE_TRACE"
+
+
+def lifecycle_trace_enabled() -> bool:
+    """True when SQUADVAULT_LIFECYCLE_TRACE=1."""
+    return os.environ.get(TRACE_ENV_VAR) == "1"
+
+
+@dataclass(frozen=True)
+class StageTiming:
+    """One completed lifecycle stage of one week."""
+
+    seq: int
+    stage: str
+    duration_ms: float
+    queries: int = 0
+    rows_read: int = 0
+    json_payloads: int = 0
+    angles: int = 0
+
+
+class _NoopSpan:
+    """Span handed out while tracing is off; records nothing."""
+
+    def __enter__(self) -> _NoopSpan:
+        """Enter without timing."""
+        return self
+
+    def __exit__(self, *exc: object) -> None:
+        """Exit without recording."""
+
+    def add_angles(self, count: int) -> None:
+        """No-op."""
+
+
+_NOOP_SPAN = _NoopSpan()
+
+
+class _Span:
+    """An open stage of a StageTrace."""
+
+    def __init__(self, trace: StageTrace, name: str) -> None:
+        """Create a span for name under the trace's current stage."""
+        self.trace = trace
+        self.name = name
+        self.angles = 0
+
+    def __enter__(self) -> _Span:
+        """Start timing and take the trace's running counters."""
+        trace = self.trace
+        self.path = "/".join([*trace.open_stages, self.name])
+        self.seq = trace.next_seq()
+        trace.open_stages.append(self.name)
+        self.start_counts = (trace.queries, trace.rows_read, trace.json_payloads)
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc: object) -> None:
+        """Record the stage, even if it raised."""
+        elapsed = time.perf_counter() - self.start
+        trace = self.trace
+        trace.open_stages.pop()
+        queries, rows, payloads = self.start_counts
+        trace.records.append(StageTiming(
+            seq=self.seq,
+            stage=self.path,
+            duration_ms=round(elapsed * 1000.0, 3),
+            queries=trace.queries - queries,
+            rows_read=trace.rows_read - rows,
+            json_payloads=trace.json_payloads - payloads,
+            angles=self.angles,
+        ))
+
+    def add_angles(self, count: int) -> None:
+        """Count angles this stage emitted."""
+        self.angles += int(count)
+
+
+class StageTrace:
+    """Stage records and running DB counters of one traced lifecycle run."""
+
+    def __init__(self, seq_start: int = 0) -> None:
+        """Create an empty trace numbering stages from seq_start."""
+        self.records: list[StageTiming] = []
+        self.open_stages: list[str] = []
+        self.queries = 0
+        self.rows_read = 0
+        self.json_payloads = 0
+        self._seq = seq_start
+
+    def next_seq(self) -> int:
+        """Sequence number of the next stage to start."""
+        seq = self._seq
+        self._seq += 1
+        return seq
+
+    def stage(self, name: str) -> _Span:
+        """A span timing one stage nested under the currently open one."""
+        return _Span(self, name)
+
+    def _on_statement(self, _sql: str) -> None:
+        """Trace callback: one statement executed."""
+        self.queries += 1
+
+    def _row(self, cursor: sqlite3.Cursor, row: tuple[Any, ...]) -> sqlite3.Row:
+        """Row factory: count the row and its JSON payload columns."""
+        self.rows_read += 1
+        for i, col in enumerate(cursor.description):
+            if row[i] is not None and col[0].endswith("_json"):
+                self.json_payloads += 1
+        return sqlite3.Row(cursor, row)
+
+    def observe(self, con: sqlite3.Connection) -> None:
+        """DatabaseSession observer: count the session's statements and rows."""
+        con.set_trace_callback(self._on_statement)
+        con.row_factory = self._row
+
+
+_ACTIVE: ContextVar[StageTrace | None] = ContextVar("_ACTIVE_STAGE_TRACE", default=None)
+
+
+def stage(name: str) -> _Span | _NoopSpan:
+    """Span for name in the active trace; the shared no-op span if none."""
+    trace = _ACTIVE.get()
+    if trace is None:
+        return _NOOP_SPAN
+    return trace.stage(name)
+
+
+@contextmanager
+def stage_trace(
+    root: str, *, seq_start: int = 0, enabled: bool | None = None,
+) -> Iterator[StageTrace | None]:
+    """Trace every stage run in the block under one root stage.
+
+    Yields the trace, or None (tracing nothing) unless enabled, which
+    defaults to lifecycle_trace_enabled(). Reentrant: an inner block opens
+    root as a nested stage of the outer trace and yields None, leaving its
+    records to the outer block's owner.
+    """
+    outer = _ACTIVE.get()
+    if outer is not None:
+        with outer.stage(root):
+            yield None
+        return
+    if not (lifecycle_trace_enabled() if enabled is None else enabled):
+        yield None
+        return
+    trace = StageTrace(seq_start)
+    token = _ACTIVE.set(trace)
+    try:
+        with observe_sessions(trace.observe), trace.stage(root):
+            yield trace
+    finally:
+        _ACTIVE.reset(token)
+
+
+def store_stage_timings(
+    db_path: str,
+    *,
+    league_id: str,
+    season: int,
+    week_index: int,
+    records: Iterable[StageTiming],
+    trace_id: str | None = None,
+) -> str | None:
+    """Append one traced run's stage records; returns its trace_id (None if none)."""
+    rows = sorted(records, key=lambda r: r.seq)
+    if not rows:
+        return None
+    trace_id = trace_id or uuid.uuid4().hex
+    captured_at = now_utc_iso()
+    try:
+        with DatabaseSession(db_path) as con:
+            con.executemany(
+                """INSERT INTO recap_stage_timings
+                     (trace_id, captured_at, league_id, season, week_index, seq, stage,
+                      duration_ms, queries, rows_read, json_payloads, angles)
+                   VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)""",
+                [
+                    (
+                        trace_id, captured_at, str(league_id), int(season), int(week_index),
+                        r.seq, r.stage, r.duration_ms, r.queries, r.rows_read,
+                        r.json_payloads, r.angles,
+                    )
+                    for r in rows
+                ],
+            )
+    except sqlite3.Error as e:
+        logger.debug("Stage timing store failed: %s", e)
+        return None
+    return trace_id
+
+
+def summarize_stage_timings(
+    db_path: str,
+    *,
+    league_id: str,
+    season: int,
+    latest_only: bool = True,
+) -> list[dict[str, Any]]:
+    """Per-stage aggregates for a season, slowest total first.
+
+    latest_only keeps each week's most recent traced run, so regenerating
+    a week does not count it twice.
+    """
+    latest = (
+        """AND t.trace_id IN (
+             SELECT trace_id FROM (
+               SELECT trace_id, ROW_NUMBER() OVER (
+                 PARTITION BY week_index ORDER BY MAX(captured_at) DESC, MAX(id) DESC
+               ) AS rn
+               FROM recap_stage_timings
+               WHERE league_id = ? AND season = ?
+               GROUP BY week_index, trace_id
+             ) WHERE rn = 1)"""
+        if latest_only else ""
+    )
+    params: tuple[Any, ...] = (str(league_id), int(season))
+    if latest_only:
+        params += params
+    with DatabaseSession(db_path) as con:
+        rows = con.execute(
+            f"""SELECT t.stage,
+                       COUNT(*) AS runs,
+                       COUNT(DISTINCT t.week_index) AS weeks,
+                       SUM(t.duration_ms) AS total_ms,
+                       AVG(t.duration_ms) AS mean_ms,
+                       MAX(t.duration_ms) AS max_ms,
+                       SUM(t.queries) AS queries,
+                       SUM(t.rows_read) AS rows_read,
+                       SUM(t.json_payloads) AS json_payloads,
+                       SUM(t.angles) AS angles
+                FROM recap_stage_timings t
+                WHERE t.league_id = ? AND t.season = ? {latest}
+                GROUP BY t.stage
+                ORDER BY total_ms DESC, t.stage""",
+            params,
+        ).fetchall()
+        slowest = {
+            r[0]: r[1]
+            for r in con.execute(
+                f"""SELECT stage, week_index FROM (
+                      SELECT t.stage, t.week_index, ROW_NUMBER() OVER (
+                        PARTITION BY t.stage ORDER BY t.duration_ms DESC, t.week_index
+                      ) AS rn
+                      FROM recap_stage_timings t
+                      WHERE t.league_id = ? AND t.season = ? {latest})
+                    WHERE rn = 1""",
+                params,
+            ).fetchall()
+        }
+    return [
+        {
+            "stage": r[0],
+            "runs": int(r[1]),
+            "weeks": int(r[2]),
+            "total_ms": round(float(r[3]), 3),
+            "mean_ms": round(float(r[4]), 3),
+            "max_ms": round(float(r[5]), 3),
+            "slowest_week": slowest.get(r[0]),
+            "queries": int(r[6]),
+            "rows_read": int(r[7]),
+            "json_payloads": int(r[8]),
+            "angles": int(r[9]),
+        }
+        for r in rows
+    ]
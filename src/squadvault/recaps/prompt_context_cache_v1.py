@@ -0,0 +1,202 @@
+"""Prompt Context Cache v1 — persisted creative-layer prompt context per week.
+
+Contract:
+- Derived-only: a cached context is byte-for-byte what
+  _derive_prompt_context returned for the same inputs; it never feeds facts.
+- Keyed, not timed: the cache key hashes everything the derivation reads —
+  selection fingerprint, window end, ledger fingerprint
+  (db_utils.ledger_fingerprint), the governed tone/voice/rules/bye/display
+  rows of the league — plus the context code version. Any change to one of
+  them is a different key, so a stale row is never served.
+- Non-authoritative: rows live in prompt_context_cache (migration 0013) and
+  are safe to delete; lookups and stores fail silent (debug-logged), and a
+  failed lookup is a miss.
+
+Regenerating a week (recap_artifact_regenerate, regenerate_season, a
+verification retry in a new process) used to re-derive season context,
+league history, player highlights, every angle detector and the tone/voice
+lookups although nothing they read had changed. prepare_weekly_recap_draft
+now looks the context up by key; write_weekly_recap_draft stores it on a
+miss, so the write stage stays the only writer.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+import sqlite3
+from functools import lru_cache
+from pathlib import Path
+from typing import Any
+
+import squadvault
+from squadvault.core.storage.db_utils import ledger_fingerprint, now_utc_iso
+from squadvault.core.storage.session import DatabaseSession
+
+logger = logging.getLogger(__name__)
+
+# League-scoped governed tables read by the context derivation besides the
+# canonical ledger and directories (which ledger_fingerprint covers):
+# table -> (key columns, hashed columns), selected and ordered by name so the
+# key never depends on column positions.
+_GOVERNED_TABLES: dict[str, tuple[tuple[str, ...], tuple[str, ...]]] = {
+    "league_tone_profiles": (
+        ("id",), ("tone_preset", "set_by", "notes", "created_at"),
+    ),
+    "league_voice_profiles": (
+        (), ("profile_text", "approved_by", "approved_at", "updated_at"),
+    ),
+    "league_scoring_rules": (
+        ("season",), ("rules_json", "updated_at"),
+    ),
+    "nfl_bye_weeks": (
+        ("season", "nfl_team"), ("bye_week", "updated_at"),
+    ),
+    "franchise_display_overrides": (
+        ("id",),
+        (
+            "franchise_id", "season_from", "season_to", "display_name_override",
+            "suppressed", "memorial_flag", "narrative_excluded", "override_reason",
+            "set_by", "set_at",
+        ),
+    ),
+}
+
+# Source trees whose code shapes the derived context, including the render
+# helpers the context text is formatted through. Test-enforced: every module
+# these import is hashed or explicitly exempted.
+_CODE_PATHS = (
+    "core/recaps/context",
+    "core/recaps/render/score_strings_v1.py",
+    "core/recaps/render/streak_strings_v1.py",
+    "core/tone",
+    "core/directory_cache_v1.py",
+    "core/resolvers.py",
+    "recaps/weekly_recap_lifecycle.py",
+)
+
+
+@lru_cache(maxsize=1)
+def context_code_version() -> str:
+    """sha256 over the source of every module that shapes the prompt context."""
+    root = Path(squadvault.__file__).parent
+    digest = hashlib.sha256()
+    for rel in _CODE_PATHS:
+        path = root / rel
+        files = sorted(path.glob("*.py")) if path.is_dir() else [path]
+        for f in files:
+            digest.update(f.relative_to(root).as_posix().encode("utf-8"))
+            digest.update(f.read_bytes())
+    return digest.hexdigest()
+
+
+def _governed_rows(con: sqlite3.Connection, league_id: str) -> list[Any]:
+    """Every governed row of the league, in a deterministic order.
+
+    A table not created yet (a database short of its migration) contributes
+    no rows. Any other read error, such as a renamed column, propagates:
+    dropping the table from the key would let a stale context be served.
+    """
+    rows: list[Any] = []
+    for table, (keys, columns) in _GOVERNED_TABLES.items():
+        order = f" ORDER BY {', '.join(keys)}" if keys else ""
+        try:
+            found = con.execute(
+                f"SELECT {', '.join(keys + columns)} FROM {table} WHERE league_id = ?{order}",
+                (league_id,),
+            ).fetchall()
+        except sqlite3.OperationalError as e:
+            if not str(e).startswith("no such table"):
+                raise
+            found = []
+        rows.append([table, [list(r) for r in found]])
+    return rows
+
+
+def prompt_context_cache_key(
+    *,
+    db_path: str,
+    league_id: str,
+    season: int,
+    week_index: int,
+    selection_fingerprint: str,
+    window_end: str | None,
+) -> str | None:
+    """Key of the prompt context derived for this week at the current ledger state.
+
+    None when the key inputs cannot be read; the caller then derives the
+    context afresh and stores nothing.
+    """
+    try:
+        with DatabaseSession(db_path) as con:
+            parts = {
+                "league_id": str(league_id),
+                "season": int(season),
+                "week_index": int(week_index),
+                "selection_fingerprint": selection_fingerprint,
+                "window_end": window_end,
+                "ledger": list(ledger_fingerprint(con, str(league_id))),
+                "governed": _governed_rows(con, str(league_id)),
+                "code": context_code_version(),
+            }
+    except sqlite3.Error as e:
+        logger.debug("Prompt context cache key unavailable: %s", e)
+        return None
+    blob = json.dumps(parts, sort_keys=True, separators=(",", ":"), default=str)
+    return hashlib.sha256(blob.encode("utf-8")).hexdigest()
+
+
+def load_cached_prompt_context(
+    *,
+    db_path: str,
+    league_id: str,
+    season: int,
+    week_index: int,
+    cache_key: str,
+) -> dict[str, Any] | None:
+    """Cached context JSON for the week if it was stored under cache_key, else None."""
+    try:
+        with DatabaseSession(db_path) as con:
+            row = con.execute(
+                """SELECT context_json FROM prompt_context_cache
+                   WHERE league_id = ? AND season = ? AND week_index = ? AND cache_key = ?""",
+                (str(league_id), int(season), int(week_index), cache_key),
+            ).fetchone()
+        if row is None:
+            return None
+        data = json.loads(row[0])
+    except (sqlite3.Error, ValueError) as e:
+        logger.debug("Prompt context cache lookup failed: %s", e)
+        return None
+    return data if isinstance(data, dict) else None
+
+
+def store_prompt_context(
+    *,
+    db_path: str,
+    league_id: str,
+    season: int,
+    week_index: int,
+    cache_key: str,
+    context: dict[str, Any],
+) -> None:
+    """Store the week's context under cache_key, replacing any older row."""
+    try:
+        with DatabaseSession(db_path) as con:
+            con.execute(
+                """INSERT INTO prompt_context_cache
+                     (league_id, season, week_index, cache_key, context_json, created_at)
+                   VALUES (?, ?, ?, ?, ?, ?)
+                   ON CONFLICT(league_id, season, week_index) DO UPDATE SET
+                     cache_key = excluded.cache_key,
+                     context_json = excluded.context_json,
+                     created_at = excluded.created_at""",
+                (
+                    str(league_id), int(season), int(week_index), cache_key,
+                    json.dumps(context, sort_keys=True, ensure_ascii=False),
+                    now_utc_iso(),
+                ),
+            )
+    except sqlite3.Error as e:
+        logger.debug("Prompt context cache store failed: %s", e)
@@ -6,7 +6,10 @@ import hashlib
 import json
 import logging
 import sqlite3
-from dataclasses import dataclass, field
+from collections.abc import Callable
+from contextlib import nullcontext
+from dataclasses import asdict, dataclass, field, replace
+from typing import Any
 
 from squadvault.ai.creative_layer_v1 import draft_narrative_v1
 from squadvault.core.eal.consume_v1 import EALDirectivesV1, load_eal_directives_v1
@@ -20,11 +23,11 @@ from squadvault.core.recaps.context.bye_week_context_v1 import (
 from squadvault.core.recaps.context.franchise_deep_angles_v1 import (
     detect_franchise_deep_angles_v1,
 )
+from squadvault.core.recaps.context.league_history_cache_v1 import (
+    LeagueHistoryCache,
+    league_history_cache,
+)
 from squadvault.core.recaps.context.league_history_v1 import (
-    build_cross_season_name_resolver,
-    compute_franchise_tenures,
-    derive_league_history_v1,
-    load_all_matchups,
     render_league_history_for_prompt,
 )
 from squadvault.core.recaps.context.league_rules_context_v1 import (
@@ -74,12 +77,23 @@ from squadvault.core.recaps.verification.recap_verifier_v1 import (
     VerificationResult,
     verify_recap_v1,
 )
-from squadvault.core.resolvers import FranchiseResolver, PlayerResolver, build_player_name_map
-from squadvault.core.storage.session import DatabaseSession
+from squadvault.core.resolvers import FranchiseResolver, PlayerResolver
+from squadvault.core.storage.session import DatabaseSession, read_snapshot
 from squadvault.core.tone.tone_profile_v1 import get_tone_preset
 from squadvault.core.tone.voice_profile_v1 import get_voice_profile
 from squadvault.errors import RecapDataError, RecapNotFoundError, RecapStateError
+from squadvault.recaps.lifecycle_trace_v1 import (
+    StageTiming,
+    stage,
+    stage_trace,
+    store_stage_timings,
+)
 from squadvault.recaps.preflight import check_duplicate_matchup_week
+from squadvault.recaps.prompt_context_cache_v1 import (
+    load_cached_prompt_context,
+    prompt_context_cache_key,
+    store_prompt_context,
+)
 from squadvault.recaps.writing_room.prompt_audit_v1 import maybe_capture_attempt
 
 ARTIFACT_TYPE_WEEKLY_RECAP = "WEEKLY_RECAP"
@@ -623,6 +637,26 @@ class _PromptContext:
     all_angles: list[NarrativeAngle] = field(default_factory=list)
     budgeted: list[NarrativeAngle] = field(default_factory=list)
 
+    def to_json(self) -> dict[str, Any]:
+        """JSON-ready form, for the persisted prompt-context cache."""
+        return asdict(self)
+
+    @classmethod
+    def from_json(cls, data: dict[str, Any]) -> _PromptContext:
+        """Rebuild a context from to_json output (angle franchise_ids as tuples)."""
+        def _angles(items: list[dict[str, Any]]) -> list[NarrativeAngle]:
+            """NarrativeAngle list from its JSON form."""
+            return [
+                NarrativeAngle(**{**a, "franchise_ids": tuple(a["franchise_ids"])})
+                for a in items
+            ]
+
+        return cls(**{
+            **data,
+            "all_angles": _angles(data.get("all_angles", [])),
+            "budgeted": _angles(data.get("budgeted", [])),
+        })
+
 
 def _budget_angles(
     _all_angles: list[NarrativeAngle],
@@ -792,30 +826,41 @@ def _derive_prompt_context(
     _all_angles: list[NarrativeAngle] = []
     budgeted: list[NarrativeAngle] = []
 
-    # -- Name resolution --
+    # -- League-wide history --
+    # Loaded once per ledger state and shared by every week of a range run;
+    # each block below reads it as of (season, week_index).
     try:
-        _name_map = build_cross_season_name_resolver(db_path, league_id)
+        _league = league_history_cache(db_path, league_id)
     except Exception as e:
-        logger.debug("Cross-season name resolver failed: %s", e)
-        _name_map = {}
+        logger.debug("League history cache lookup failed: %s", e)
+        _league = LeagueHistoryCache(db_path, league_id)
 
+    # -- Name resolution --
     _player_name_map: dict[str, str] = {}
-    try:
-        _player_name_map = build_player_name_map(db_path, league_id)
-    except Exception as e:
-        logger.debug("Player name map failed: %s", e)
+    with stage("context.names"):
+        try:
+            _name_map = _league.name_map()
+        except Exception as e:
+            logger.debug("Cross-season name resolver failed: %s", e)
+            _name_map = {}
+
+        try:
+            _player_name_map = _league.player_name_map()
+        except Exception as e:
+            logger.debug("Player name map failed: %s", e)
 
     # -- Season context --
-    try:
-        _season_ctx = derive_season_context_v1(
-            db_path=db_path, league_id=league_id, season=season, week_index=week_index,
-        )
-        season_context_text = render_season_context_for_prompt(
-            _season_ctx, team_resolver=lambda fid: _name_map.get(fid, fid),
-        )
-    except Exception as e:
-        logger.debug("Season context derivation failed: %s", e)
-        _season_ctx = None
+    with stage("context.season"):
+        try:
+            _season_ctx = derive_season_context_v1(
+                db_path=db_path, league_id=league_id, season=season, week_index=week_index,
+            )
+            season_context_text = render_season_context_for_prompt(
+                _season_ctx, team_resolver=lambda fid: _name_map.get(fid, fid),
+            )
+        except Exception as e:
+            logger.debug("Season context derivation failed: %s", e)
+            _season_ctx = None
 
     # -- Player season high/low reference data --
     # Data-layer fix: the model sees high player scores and guesses they're
@@ -824,38 +869,34 @@ def _derive_prompt_context(
     # verified data; withhold it and it invents.
     # Filtered to starters only — bench scores don't count toward
     # "season high individual score" by fantasy convention.
-    try:
-        with DatabaseSession(db_path) as _psh_con:
-            _psh_row = _psh_con.execute(
-                """SELECT json_extract(payload_json, '$.player_id'),
-                          json_extract(payload_json, '$.score'),
-                          json_extract(payload_json, '$.week'),
-                          json_extract(payload_json, '$.franchise_id')
-                   FROM v_canonical_best_events
-                   WHERE league_id = ? AND season = ?
-                     AND event_type = 'WEEKLY_PLAYER_SCORE'
-                     AND CAST(json_extract(payload_json, '$.is_starter') AS INTEGER) = 1
-                     AND CAST(json_extract(payload_json, '$.week') AS INTEGER) <= ?
-                   ORDER BY CAST(json_extract(payload_json, '$.score') AS REAL) DESC
-                   LIMIT 1""",
-                (league_id, season, week_index),
-            ).fetchone()
-            if _psh_row and _psh_row[0] and season_context_text:
-                _psh_pid = str(_psh_row[0])
-                _psh_score = float(_psh_row[1])
-                _psh_week = int(_psh_row[2])
-                _psh_fid = str(_psh_row[3])
-                _psh_pname = _player_name_map.get(_psh_pid, _psh_pid)
-                _psh_fname = _name_map.get(_psh_fid, _psh_fid)
-                season_context_text = season_context_text.rstrip() + (
-                    f"\n  Player season high (starters only):"
-                    f" {_psh_pname} ({_psh_fname})"
-                    f" — {_psh_score:.2f} (Week {_psh_week})"
-                    f"\n  ANY CLAIM THAT A DIFFERENT STARTER SCORED HIGHER"
-                    f" THIS SEASON IS FALSE.\n"
-                )
-    except Exception as e:
-        logger.debug("Player season high enrichment failed: %s", e)
+    with stage("context.player_season_high"):
+        try:
+            with DatabaseSession(db_path) as _psh_con:
+                _psh_row = _psh_con.execute(
+                    """SELECT player_id, score, week, franchise_id
+                       FROM fact_player_score
+                       WHERE league_id = ? AND is_starter = 1 AND season = ?
+                         AND week <= ?
+                       ORDER BY score DESC
+                       LIMIT 1""",
+                    (league_id, season, week_index),
+                ).fetchone()
+                if _psh_row and _psh_row[0] and season_context_text:
+                    _psh_pid = str(_psh_row[0])
+                    _psh_score = float(_psh_row[1])
+                    _psh_week = int(_psh_row[2])
+                    _psh_fid = str(_psh_row[3])
+                    _psh_pname = _player_name_map.get(_psh_pid, _psh_pid)
+                    _psh_fname = _name_map.get(_psh_fid, _psh_fid)
+                    season_context_text = season_context_text.rstrip() + (
+                        f"\n  Player season high (starters only):"
+                        f" {_psh_pname} ({_psh_fname})"
+                        f" — {_psh_score:.2f} (Week {_psh_week})"
+                        f"\n  ANY CLAIM THAT A DIFFERENT STARTER SCORED HIGHER"
+                        f" THIS SEASON IS FALSE.\n"
+                    )
+        except Exception as e:
+            logger.debug("Player season high enrichment failed: %s", e)
 
     # -- League history --
     # Scoped to the recap's approved window per the Weekly Recap Context
@@ -864,99 +905,114 @@ def _derive_prompt_context(
     # week's approved end — inclusive of that week, exclusive of every
     # subsequent week. Regenerating a prior week's recap against a grown
     # ledger yields the same LEAGUE_HISTORY block as the original.
-    try:
-        _history_ctx = derive_league_history_v1(
-            db_path=db_path,
-            league_id=league_id,
-            as_of_season=season,
-            as_of_week=week_index,
-        )
-        _tenure_map = compute_franchise_tenures(db_path, league_id)
-        league_history_text = render_league_history_for_prompt(
-            _history_ctx, name_map=_name_map, tenure_map=_tenure_map,
-        )
-    except Exception as e:
-        logger.debug("League history context failed: %s", e)
-        _history_ctx = None
+    with stage("context.league_history"):
+        try:
+            _history_ctx = _league.league_history_as_of(season, week_index)
+            _tenure_map = _league.tenure_map()
+            league_history_text = render_league_history_for_prompt(
+                _history_ctx, name_map=_name_map, tenure_map=_tenure_map,
+            )
+        except Exception as e:
+            logger.debug("League history context failed: %s", e)
+            _history_ctx = None
 
     # -- Historical matchups --
     # Scoped to the same approved window as LEAGUE_HISTORY above; this
     # list is consumed by detect_narrative_angles_v1 below, which is
     # itself part of the recap's derived context for (season, week_index).
-    try:
-        _all_matchups = load_all_matchups(
-            db_path,
-            league_id,
-            as_of_season=season,
-            as_of_week=week_index,
-        )
-    except Exception as e:
-        logger.debug("Load all matchups failed: %s", e)
-        _all_matchups = None
+    with stage("context.matchups"):
+        try:
+            _all_matchups = _league.matchups_as_of(season, week_index)
+        except Exception as e:
+            logger.debug("Load all matchups failed: %s", e)
+            _all_matchups = None
 
     # -- Narrative angle detection (all 6 modules → unified budget) --
     try:
         if _season_ctx is not None:
-            _cl_angles = detect_narrative_angles_v1(
-                season_ctx=_season_ctx,
-                history_ctx=_history_ctx,
-                all_matchups=_all_matchups,
-                tenure_map=_tenure_map,
-                fname=lambda fid: _name_map.get(fid, fid),
-            )
+            with stage("angles.narrative") as _span:
+                _cl_angles = detect_narrative_angles_v1(
+                    season_ctx=_season_ctx,
+                    history_ctx=_history_ctx,
+                    all_matchups=_all_matchups,
+                    tenure_map=_tenure_map,
+                    fname=lambda fid: _name_map.get(fid, fid),
+                )
+                _span.add_angles(len(_cl_angles.angles))
             _all_angles.extend(_cl_angles.angles)
 
-        try:
-            _all_angles.extend(detect_player_narrative_angles_v1(
-                db_path=db_path, league_id=league_id, season=season, week=week_index,
-                tenure_map=_tenure_map,
-                pname=lambda pid: _player_name_map.get(pid, pid),
-                fname=lambda fid: _name_map.get(fid, fid),
-            ))
-        except Exception as e:
-            logger.debug("Player narrative angles failed: %s", e)
+        with stage("angles.player") as _span:
+            try:
+                _found = detect_player_narrative_angles_v1(
+                    db_path=db_path, league_id=league_id, season=season, week=week_index,
+                    tenure_map=_tenure_map,
+                    pname=lambda pid: _player_name_map.get(pid, pid),
+                    fname=lambda fid: _name_map.get(fid, fid),
+                    score_store=_league.player_score_store(),
+                    alltime_zero_count=_league.starter_zero_count(),
+                )
+                _span.add_angles(len(_found))
+                _all_angles.extend(_found)
+            except Exception as e:
+                logger.debug("Player narrative angles failed: %s", e)
 
-        try:
-            _all_angles.extend(detect_auction_draft_angles_v1(
-                db_path=db_path, league_id=league_id, season=season, week=week_index,
-                pname=lambda pid: _player_name_map.get(pid, pid),
-                fname=lambda fid: _name_map.get(fid, fid),
-            ))
-        except Exception as e:
-            logger.debug("Auction draft angles failed: %s", e)
+        with stage("angles.auction_draft") as _span:
+            try:
+                _found = detect_auction_draft_angles_v1(
+                    db_path=db_path, league_id=league_id, season=season, week=week_index,
+                    pname=lambda pid: _player_name_map.get(pid, pid),
+                    fname=lambda fid: _name_map.get(fid, fid),
+                )
+                _span.add_angles(len(_found))
+                _all_angles.extend(_found)
+            except Exception as e:
+                logger.debug("Auction draft angles failed: %s", e)
 
-        try:
-            _all_angles.extend(detect_franchise_deep_angles_v1(
-                db_path=db_path, league_id=league_id, season=season, week=week_index,
-                tenure_map=_tenure_map,
-                pname=lambda pid: _player_name_map.get(pid, pid),
-                fname=lambda fid: _name_map.get(fid, fid),
-            ))
-        except Exception as e:
-            logger.debug("Franchise deep angles failed: %s", e)
+        with stage("angles.franchise_deep") as _span:
+            try:
+                _found = detect_franchise_deep_angles_v1(
+                    db_path=db_path, league_id=league_id, season=season, week=week_index,
+                    tenure_map=_tenure_map,
+                    pname=lambda pid: _player_name_map.get(pid, pid),
+                    fname=lambda fid: _name_map.get(fid, fid),
+                    score_store=_league.player_score_store(),
+                    all_matchups=_league.matchups_as_of(season, week_index),
+                )
+                _span.add_angles(len(_found))
+                _all_angles.extend(_found)
+            except Exception as e:
+                logger.debug("Franchise deep angles failed: %s", e)
 
-        try:
-            _all_angles.extend(detect_bye_week_angles_v1(
-                db_path=db_path, league_id=league_id, season=season, week=week_index,
-                all_matchups=_all_matchups,
-                fname=lambda fid: _name_map.get(fid, fid),
-            ))
-        except Exception as e:
-            logger.debug("Bye week angles failed: %s", e)
+        with stage("angles.bye_week") as _span:
+            try:
+                _found = detect_bye_week_angles_v1(
+                    db_path=db_path, league_id=league_id, season=season, week=week_index,
+                    all_matchups=_all_matchups,
+                    fname=lambda fid: _name_map.get(fid, fid),
+                )
+                _span.add_angles(len(_found))
+                _all_angles.extend(_found)
+            except Exception as e:
+                logger.debug("Bye week angles failed: %s", e)
 
-        try:
-            _all_angles.extend(detect_scoring_rules_angles_v1(
-                db_path=db_path, league_id=league_id, season=season, week=week_index,
-            ))
-        except Exception as e:
-            logger.debug("Scoring rules angles failed: %s", e)
+        with stage("angles.scoring_rules") as _span:
+            try:
+                _found = detect_scoring_rules_angles_v1(
+                    db_path=db_path, league_id=league_id, season=season, week=week_index,
+                )
+                _span.add_angles(len(_found))
+                _all_angles.extend(_found)
+            except Exception as e:
+                logger.debug("Scoring rules angles failed: %s", e)
 
         _all_angles.sort(key=lambda a: (-a.strength, a.category, a.headline))
 
         if _all_angles:
-            budgeted = _budget_angles(
-                _all_angles, season=season, week_index=week_index,
-            )
+            with stage("angles.budget") as _span:
+                budgeted = _budget_angles(
+                    _all_angles, season=season, week_index=week_index,
+                )
+                _span.add_angles(len(budgeted))
 
             lines: list[str] = [
                 f"Narrative angles for Week {week_index} (what's interesting):",
@@ -1023,97 +1079,101 @@ def _derive_prompt_context(
         logger.debug("Narrative angle rendering failed: %s", e)
 
     # -- Writer room context (scoring deltas + FAAB) --
-    try:
-        _deltas = derive_scoring_deltas(
-            db_path=db_path, league_id=league_id, season=season, week_index=week_index,
-        )
-        _faab = derive_faab_spending(
-            db_path=db_path, league_id=league_id, season=season, week_index=week_index,
-            through_occurred_at=window_end,
-        )
-        _acquisitions = derive_faab_acquisitions(
-            db_path=db_path, league_id=league_id, season=season, week_index=week_index,
-            through_occurred_at=window_end,
-        )
-        # Phase C: FAAB ROI — load player season history for post-acquisition pts
-        _roi_season_history = _load_season_player_history_for_roi(
-            db_path, league_id, season, week_index,
-        )
-        _roi = derive_faab_roi(
-            _acquisitions,
-            player_season_history=_roi_season_history,
-            current_week=week_index,
-        )
-        writer_room_text = render_writer_room_context_for_prompt(
-            deltas=_deltas, faab=_faab,
-            acquisitions=_acquisitions,
-            roi=_roi,
-            name_map=_name_map,
-            player_name_map=_player_name_map,
-        )
-    except Exception as e:
-        logger.debug("Writer room context failed: %s", e)
+    with stage("context.writer_room"):
+        try:
+            _deltas = derive_scoring_deltas(
+                db_path=db_path, league_id=league_id, season=season, week_index=week_index,
+            )
+            _faab = derive_faab_spending(
+                db_path=db_path, league_id=league_id, season=season, week_index=week_index,
+                through_occurred_at=window_end,
+            )
+            _acquisitions = derive_faab_acquisitions(
+                db_path=db_path, league_id=league_id, season=season, week_index=week_index,
+                through_occurred_at=window_end,
+            )
+            # Phase C: FAAB ROI — load player season history for post-acquisition pts
+            _roi_season_history = _load_season_player_history_for_roi(
+                db_path, league_id, season, week_index,
+            )
+            _roi = derive_faab_roi(
+                _acquisitions,
+                player_season_history=_roi_season_history,
+                current_week=week_index,
+            )
+            writer_room_text = render_writer_room_context_for_prompt(
+                deltas=_deltas, faab=_faab,
+                acquisitions=_acquisitions,
+                roi=_roi,
+                name_map=_name_map,
+                player_name_map=_player_name_map,
+            )
+        except Exception as e:
+            logger.debug("Writer room context failed: %s", e)
 
     # -- Player highlights (per-franchise starter/bench scoring) --
     player_highlights_text = ""
-    try:
-        _player_ctx = derive_player_week_context_v1(
-            db_path=db_path, league_id=league_id, season=season, week=week_index,
-        )
-        if _player_ctx.has_data:
-            _ph_pres = PlayerResolver(db_path, league_id, season)
-            _ph_fres = FranchiseResolver(db_path, league_id, season)
-            _ph_pids: set[str] = set()
-            _ph_fids: set[str] = set()
-            for _fc in _player_ctx.franchises:
-                _ph_fids.add(_fc.franchise_id)
-                for _ps in _fc.starters:
-                    _ph_pids.add(_ps.player_id)
-                for _ps in _fc.bench:
-                    _ph_pids.add(_ps.player_id)
-            if _ph_pids:
-                _ph_pres.load_for_ids(_ph_pids)
-            if _ph_fids:
-                _ph_fres.load_for_ids(_ph_fids)
-            # Extract matchup pairings from season context for grouped rendering
-            _matchup_pairs: list[tuple[str, str]] | None = None
-            if _season_ctx is not None and _season_ctx.has_this_week_data:
-                _matchup_pairs = [
-                    (wm.winner_id, wm.loser_id)
-                    for wm in _season_ctx.week_matchups
-                ]
-            player_highlights_text = render_player_highlights_for_prompt(
-                _player_ctx,
-                team_resolver=_ph_fres.one,
-                player_resolver=_ph_pres.one,
-                matchup_pairings=_matchup_pairs or None,
+    with stage("context.player_highlights"):
+        try:
+            _player_ctx = derive_player_week_context_v1(
+                db_path=db_path, league_id=league_id, season=season, week=week_index,
             )
-    except Exception as e:
-        logger.debug("Player highlights derivation failed: %s", e)
+            if _player_ctx.has_data:
+                _ph_pres = PlayerResolver(db_path, league_id, season)
+                _ph_fres = FranchiseResolver(db_path, league_id, season)
+                _ph_pids: set[str] = set()
+                _ph_fids: set[str] = set()
+                for _fc in _player_ctx.franchises:
+                    _ph_fids.add(_fc.franchise_id)
+                    for _ps in _fc.starters:
+                        _ph_pids.add(_ps.player_id)
+                    for _ps in _fc.bench:
+                        _ph_pids.add(_ps.player_id)
+                if _ph_pids:
+                    _ph_pres.load_for_ids(_ph_pids)
+                if _ph_fids:
+                    _ph_fres.load_for_ids(_ph_fids)
+                # Extract matchup pairings from season context for grouped rendering
+                _matchup_pairs: list[tuple[str, str]] | None = None
+                if _season_ctx is not None and _season_ctx.has_this_week_data:
+                    _matchup_pairs = [
+                        (wm.winner_id, wm.loser_id)
+                        for wm in _season_ctx.week_matchups
+                    ]
+                player_highlights_text = render_player_highlights_for_prompt(
+                    _player_ctx,
+                    team_resolver=_ph_fres.one,
+                    player_resolver=_ph_pres.one,
+                    matchup_pairings=_matchup_pairs or None,
+                )
+        except Exception as e:
+            logger.debug("Player highlights derivation failed: %s", e)
 
     # -- Tone & voice --
-    tone_preset = ""
-    try:
-        tone_preset = get_tone_preset(db_path, league_id)
-    except Exception as e:
-        logger.debug("Tone preset lookup failed: %s", e)
+    with stage("context.tone_voice"):
+        tone_preset = ""
+        try:
+            tone_preset = get_tone_preset(db_path, league_id)
+        except Exception as e:
+            logger.debug("Tone preset lookup failed: %s", e)
 
-    voice_profile = ""
-    try:
-        voice_profile = get_voice_profile(db_path, league_id) or ""
-    except Exception as e:
-        logger.debug("Voice profile lookup failed: %s", e)
+        voice_profile = ""
+        try:
+            voice_profile = get_voice_profile(db_path, league_id) or ""
+        except Exception as e:
+            logger.debug("Voice profile lookup failed: %s", e)
 
     # Phase D Arc 2: manager identity (owner short-forms for insider voice)
-    manager_identity_text = ""
-    try:
-        _mgr_identities = derive_manager_identities(
-            db_path=db_path, league_id=league_id, season=season,
-            name_map=_name_map,
-        )
-        manager_identity_text = render_manager_identities_for_prompt(_mgr_identities)
-    except Exception as e:
-        logger.debug("Manager identity derivation failed: %s", e)
+    with stage("context.manager_identity"):
+        manager_identity_text = ""
+        try:
+            _mgr_identities = derive_manager_identities(
+                db_path=db_path, league_id=league_id, season=season,
+                name_map=_name_map,
+            )
+            manager_identity_text = render_manager_identities_for_prompt(_mgr_identities)
+        except Exception as e:
+            logger.debug("Manager identity derivation failed: %s", e)
 
     return _PromptContext(
         season_context_text=season_context_text,
@@ -1132,22 +1192,82 @@ def _derive_prompt_context(
     )
 
 
-def generate_weekly_recap_draft(
+@dataclass(frozen=True)
+class PreparedRecapDraft:
+    """Deterministic inputs of one week's draft, derived before any API call.
+
+    Built by prepare_weekly_recap_draft from canonical data only; picklable,
+    so range generation can derive weeks in worker processes.
+    """
+
+    db_path: str
+    league_id: str
+    season: int
+    week_index: int
+    rendered_text: str
+    selection_fingerprint: str
+    window_start: str | None
+    window_end: str | None
+    editorial_attunement_v1: str
+    skip_creative: bool
+    creative_bullets: list[str] = field(default_factory=list)
+    prompt_context: _PromptContext | None = None
+    # Key of prompt_context in prompt_context_cache; prompt_context_cached
+    # says whether it was served from there (else the write stage stores it).
+    prompt_context_key: str | None = None
+    prompt_context_cached: bool = False
+    # Traced stages of this stage (SQUADVAULT_LIFECYCLE_TRACE=1 only).
+    stage_timings: tuple[StageTiming, ...] = ()
+
+
+@dataclass(frozen=True)
+class DraftedRecapText:
+    """Creative-layer outcome of one week: final text plus verification trace.
+
+    audit_attempts holds the maybe_capture_attempt keyword arguments of each
+    verified attempt; write_weekly_recap_draft records them.
+    """
+
+    rendered_text: str
+    verification_result: VerificationResult | None = None
+    verification_attempts: int = 0
+    audit_attempts: tuple[dict[str, Any], ...] = ()
+    stage_timings: tuple[StageTiming, ...] = ()
+
+
+def prepare_weekly_recap_draft(
     *,
     db_path: str,
     league_id: str,
     season: int,
     week_index: int,
-    reason: str,
-    force: bool = False,
-    created_by: str = "system",
-) -> GenerateDraftResult:
+) -> PreparedRecapDraft:
     """
-    Canonical entrypoint: mint a WEEKLY_RECAP DRAFT artifact version.
+    Deterministic stage of generate_weekly_recap_draft: read-only.
 
-    Renders from recap_runs data directly (canonical path, no recaps table needed).
-    Raises RecapDataError if recap_runs has insufficient data for rendering.
+    Renders the facts block, evaluates the EAL directive, and derives the
+    creative-layer bullets and prompt context. Writes nothing; the prompt
+    context is served from prompt_context_cache when its key still matches.
+    Raises RecapNotFoundError / RecapDataError like generate_weekly_recap_draft.
+    With SQUADVAULT_LIFECYCLE_TRACE=1 the result carries its stage timings.
     """
+    with stage_trace("prepare") as trace:
+        prepared = _prepare_weekly_recap_draft(
+            db_path=db_path, league_id=league_id, season=season, week_index=week_index,
+        )
+    if trace is None:
+        return prepared
+    return replace(prepared, stage_timings=tuple(trace.records))
+
+
+def _prepare_weekly_recap_draft(
+    *,
+    db_path: str,
+    league_id: str,
+    season: int,
+    week_index: int,
+) -> PreparedRecapDraft:
+    """Body of prepare_weekly_recap_draft."""
     state = get_recap_run_state(db_path, league_id, season, week_index)
     if state is None:
         raise RecapNotFoundError("No recap_runs row found for that week.")
@@ -1159,10 +1279,11 @@ def generate_weekly_recap_draft(
     )
 
     # Canonical path: render directly from recap_runs (no recaps table dependency)
-    rendered_text = _render_text_from_recap_runs(
-        db_path, league_id, season, week_index,
-        eal_directives=eal_directives,
-    )
+    with stage("render_facts"):
+        rendered_text = _render_text_from_recap_runs(
+            db_path, league_id, season, week_index,
+            eal_directives=eal_directives,
+        )
 
     if rendered_text is None:
         raise RecapDataError(
@@ -1180,7 +1301,7 @@ def generate_weekly_recap_draft(
     included_count = None
     _is_playoff = False
     # Read canonical_ids_json from recap_runs for deterministic included_count.
-    with DatabaseSession(db_path) as _eal_con:
+    with stage("eal"), DatabaseSession(db_path) as _eal_con:
         _eal_row = _eal_con.execute(
             "SELECT canonical_ids_json FROM recap_runs WHERE league_id=? AND season=? AND week_index=?",
             (league_id, season, week_index),
@@ -1231,16 +1352,6 @@ def generate_weekly_recap_draft(
         is_playoff=_is_playoff,
     )
     editorial_attunement_v1 = evaluate_editorial_attunement_v1(meta)
-
-
-    # SV_EAL_RECAP_RUNS_PERSIST_V1_CALL: persist directive into recap_runs (additive metadata)
-    _persist_editorial_attunement_v1_to_recap_runs(
-        db_path=db_path,
-        league_id=league_id,
-        season=season,
-        week_index=week_index,
-        directive=editorial_attunement_v1,
-    )
     # SV_EAL_V1_END
 
     # SV_CREATIVE_LAYER_V1_BEGIN
@@ -1254,7 +1365,8 @@ def generate_weekly_recap_draft(
 
     # Duplicate matchup gate: skip creative layer if all matchups duplicate the prior week.
     # MFL sometimes records championship results in multiple week slots.
-    _dup_verdict = check_duplicate_matchup_week(db_path, league_id, season, week_index)
+    with stage("duplicate_gate"):
+        _dup_verdict = check_duplicate_matchup_week(db_path, league_id, season, week_index)
     _skip_creative = False
     if _dup_verdict is not None:
         logger.debug(
@@ -1270,27 +1382,12 @@ def generate_weekly_recap_draft(
         _skip_creative = True
 
     _creative_bullets: list[str] = []
-
-    # Maximum verification retry attempts before falling back to facts-only.
-    # Each attempt is an independent LLM call — stochastic output means
-    # different drafts may pass verification even with identical inputs.
-    _MAX_VERIFICATION_RETRIES = 3
-
-    # Phase C: Tier-aware retry policy.
-    # Tier 1 — retry-eligible: model can self-correct with feedback.
-    #   SERIES, PLAYER_FRANCHISE, PLAYER_SCORE
-    # Tier 2 — no-retry: same context produces same hallucination.
-    #   FAAB_CLAIM: fabricated dollar amounts recur because the model
-    #   synthesizes from cumulative FAAB totals regardless of feedback.
-    #   NUMERIC_UNANCHORED: aggregate counts not in context recur for
-    #   the same reason — correction feedback doesn't supply the data.
-    #   Retry wastes API calls. The fix is A2/A3 context + verifier, not retries.
-    _NO_RETRY_CATEGORIES: frozenset[str] = frozenset({"FAAB_CLAIM", "NUMERIC_UNANCHORED"})
-    _verification_result: VerificationResult | None = None
-    _verification_attempts = 0
+    _ctx: _PromptContext | None = None
+    _ctx_key: str | None = None
+    _ctx_cached = False
 
     if not _skip_creative:
-        with DatabaseSession(db_path) as _cl_con:
+        with stage("creative_bullets"), DatabaseSession(db_path) as _cl_con:
             _cl_row = _cl_con.execute(
                 "SELECT canonical_ids_json FROM recap_runs"
                 " WHERE league_id=? AND season=? AND week_index=?",
@@ -1318,14 +1415,97 @@ def generate_weekly_recap_draft(
                     logger.debug("Creative bullets rendering failed: %s", e)
                     _creative_bullets = []
 
-        _ctx = _derive_prompt_context(
-            db_path=db_path, league_id=league_id, season=season,
-            week_index=week_index, window_end=window_end,
-        )
+        with stage("prompt_context.cache_lookup"):
+            _ctx_key = prompt_context_cache_key(
+                db_path=db_path, league_id=league_id, season=season,
+                week_index=week_index, selection_fingerprint=selection_fingerprint,
+                window_end=window_end,
+            )
+            _cached = None if _ctx_key is None else load_cached_prompt_context(
+                db_path=db_path, league_id=league_id, season=season,
+                week_index=week_index, cache_key=_ctx_key,
+            )
+            if _cached is not None:
+                try:
+                    _ctx = _PromptContext.from_json(_cached)
+                    _ctx_cached = True
+                except (TypeError, KeyError) as e:
+                    logger.debug("Cached prompt context unreadable: %s", e)
+        if _ctx is None:
+            with stage("prompt_context") as _span:
+                _ctx = _derive_prompt_context(
+                    db_path=db_path, league_id=league_id, season=season,
+                    week_index=week_index, window_end=window_end,
+                )
+                _span.add_angles(len(_ctx.budgeted))
+
+    return PreparedRecapDraft(
+        db_path=db_path,
+        league_id=league_id,
+        season=season,
+        week_index=week_index,
+        rendered_text=rendered_text,
+        selection_fingerprint=selection_fingerprint,
+        window_start=window_start,
+        window_end=window_end,
+        editorial_attunement_v1=editorial_attunement_v1,
+        skip_creative=_skip_creative,
+        creative_bullets=_creative_bullets,
+        prompt_context=_ctx,
+        prompt_context_key=_ctx_key,
+        prompt_context_cached=_ctx_cached,
+    )
+
+
+def draft_weekly_recap_narrative(
+    prepared: PreparedRecapDraft,
+    *,
+    before_call: Callable[[], None] | None = None,
+) -> DraftedRecapText:
+    """
+    Creative stage of generate_weekly_recap_draft: draft, verify, retry.
+
+    Falls back to the prepared facts-only text whenever the creative layer
+    is skipped, produces nothing, or fails verification. Writes nothing;
+    before_call (if given) runs before every creative-layer call so range
+    generation can pace them. Traced like prepare_weekly_recap_draft.
+    """
+    rendered_text = prepared.rendered_text
+    _ctx = prepared.prompt_context
+    if prepared.skip_creative or _ctx is None:
+        return DraftedRecapText(rendered_text=rendered_text)
+
+    db_path = prepared.db_path
+    league_id = prepared.league_id
+    season = prepared.season
+    week_index = prepared.week_index
+    _creative_bullets = prepared.creative_bullets
+    editorial_attunement_v1 = prepared.editorial_attunement_v1
 
-        # Save pre-narrative rendered text — reset to this on each retry
-        _base_rendered_text = rendered_text
+    # Maximum verification retry attempts before falling back to facts-only.
+    # Each attempt is an independent LLM call — stochastic output means
+    # different drafts may pass verification even with identical inputs.
+    _MAX_VERIFICATION_RETRIES = 3
 
+    # Phase C: Tier-aware retry policy.
+    # Tier 1 — retry-eligible: model can self-correct with feedback.
+    #   SERIES, PLAYER_FRANCHISE, PLAYER_SCORE
+    # Tier 2 — no-retry: same context produces same hallucination.
+    #   FAAB_CLAIM: fabricated dollar amounts recur because the model
+    #   synthesizes from cumulative FAAB totals regardless of feedback.
+    #   NUMERIC_UNANCHORED: aggregate counts not in context recur for
+    #   the same reason — correction feedback doesn't supply the data.
+    #   Retry wastes API calls. The fix is A2/A3 context + verifier, not retries.
+    _NO_RETRY_CATEGORIES: frozenset[str] = frozenset({"FAAB_CLAIM", "NUMERIC_UNANCHORED"})
+    _verification_result: VerificationResult | None = None
+    _verification_attempts = 0
+    _audit_attempts: list[dict[str, Any]] = []
+
+    # Save pre-narrative rendered text — reset to this on each retry
+    _base_rendered_text = rendered_text
+
+    _trace_seq = len(prepared.stage_timings)
+    with stage_trace("draft", seq_start=_trace_seq) as _trace:
         # SV_VERIFICATION_RETRY_LOOP_BEGIN
         _retry_feedback = ""  # Verification corrections for retry attempts
         # Temperature decay: reduce temperature on retries to make the model
@@ -1345,25 +1525,28 @@ def generate_weekly_recap_draft(
             # are visible in the captured prompt for that attempt.
             _prompt_capture: list[str] = []
 
-            _narrative_draft = draft_narrative_v1(
-                facts_bullets=_creative_bullets,
-                eal_directive=editorial_attunement_v1,
-                league_id=league_id,
-                season=season,
-                week_index=week_index,
-                season_context=_ctx.season_context_text,
-                league_history=_ctx.league_history_text,
-                narrative_angles=_ctx.narrative_angles_text,
-                writer_room_context=_ctx.writer_room_text,
-                player_highlights=_ctx.player_highlights_text,
-                manager_identity=_ctx.manager_identity_text,
-                tone_preset=_ctx.tone_preset,
-                voice_profile=_ctx.voice_profile,
-                seasons_count=_ctx.seasons_count,
-                verification_feedback=_retry_feedback,
-                temperature_override=_temp_override,
-                prompt_capture=_prompt_capture,
-            )
+            if before_call is not None:
+                before_call()
+            with stage("creative_call"):
+                _narrative_draft = draft_narrative_v1(
+                    facts_bullets=_creative_bullets,
+                    eal_directive=editorial_attunement_v1,
+                    league_id=league_id,
+                    season=season,
+                    week_index=week_index,
+                    season_context=_ctx.season_context_text,
+                    league_history=_ctx.league_history_text,
+                    narrative_angles=_ctx.narrative_angles_text,
+                    writer_room_context=_ctx.writer_room_text,
+                    player_highlights=_ctx.player_highlights_text,
+                    manager_identity=_ctx.manager_identity_text,
+                    tone_preset=_ctx.tone_preset,
+                    voice_profile=_ctx.voice_profile,
+                    seasons_count=_ctx.seasons_count,
+                    verification_feedback=_retry_feedback,
+                    temperature_override=_temp_override,
+                    prompt_capture=_prompt_capture,
+                )
 
             if not _narrative_draft:
                 # No narrative produced (API key missing, EAL silence, etc.)
@@ -1379,21 +1562,23 @@ def generate_weekly_recap_draft(
 
             # Verify the draft against canonical data
             try:
-                _verification_result = verify_recap_v1(
-                    rendered_text,
-                    db_path=db_path,
-                    league_id=league_id,
-                    season=season,
-                    week=week_index,
-                    narrative_angles_text=_ctx.narrative_angles_text,
-                )
+                with stage("verify"):
+                    _verification_result = verify_recap_v1(
+                        rendered_text,
+                        db_path=db_path,
+                        league_id=league_id,
+                        season=season,
+                        week=week_index,
+                        narrative_angles_text=_ctx.narrative_angles_text,
+                    )
             except Exception as e:
                 logger.debug("Verification V1 failed on attempt %d: %s", _attempt, e)
                 _verification_result = None
                 break  # Verification error — keep this draft, don't retry
 
             # SV_PROMPT_AUDIT_V1_HOOK — observation sidecar (edit B).
-            # Writes one row per prompt attempt when SQUADVAULT_PROMPT_AUDIT=1.
+            # Collects one row per prompt attempt; write_weekly_recap_draft writes
+            # them when SQUADVAULT_PROMPT_AUDIT=1.
             # Env-gated no-op by default; all exceptions are swallowed inside
             # the hook so the draft pipeline cannot be blocked or mutated by
             # audit failures. Observation-only: never feeds back into facts.
@@ -1403,8 +1588,7 @@ def generate_weekly_recap_draft(
             # prompt_capture sink). Empty string fallback if the sink was
             # not populated, which would indicate a control-flow change in
             # creative_layer_v1 worth investigating.
-            maybe_capture_attempt(
-                db_path,
+            _audit_attempts.append(dict(
                 league_id=league_id,
                 season=season,
                 week_index=week_index,
@@ -1415,7 +1599,7 @@ def generate_weekly_recap_draft(
                 narrative_draft=_narrative_draft,
                 verification_result=_verification_result,
                 prompt_text=_prompt_capture[0] if _prompt_capture else "",
-            )
+            ))
 
             if _verification_result.passed:
                 logger.debug(
@@ -1490,7 +1674,88 @@ def generate_weekly_recap_draft(
                     + "output — silence over fabrication.\n"
                 )
         # SV_VERIFICATION_RETRY_LOOP_END
-    # SV_CREATIVE_LAYER_V1_END
+        # SV_CREATIVE_LAYER_V1_END
+
+    return DraftedRecapText(
+        rendered_text=rendered_text,
+        verification_result=_verification_result,
+        verification_attempts=_verification_attempts,
+        audit_attempts=tuple(_audit_attempts),
+        stage_timings=tuple(_trace.records) if _trace is not None else (),
+    )
+
+
+def write_weekly_recap_draft(
+    prepared: PreparedRecapDraft,
+    drafted: DraftedRecapText,
+    *,
+    reason: str,
+    force: bool = False,
+    created_by: str = "system",
+) -> GenerateDraftResult:
+    """
+    Write stage of generate_weekly_recap_draft: the only stage that writes.
+
+    Persists the EAL directive, prompt-audit rows and a freshly derived
+    prompt context, mints the DRAFT artifact version and syncs recap_runs
+    state. Range generation calls
+    this from a single writer so version numbering stays deterministic.
+    Traced stages of all three stages go to recap_stage_timings.
+    """
+    seq_start = len(prepared.stage_timings) + len(drafted.stage_timings)
+    with stage_trace("write", seq_start=seq_start) as trace:
+        result = _write_weekly_recap_draft(
+            prepared, drafted, reason=reason, force=force, created_by=created_by,
+        )
+    timings = prepared.stage_timings + drafted.stage_timings
+    if trace is not None:
+        timings += tuple(trace.records)
+    if timings:
+        store_stage_timings(
+            prepared.db_path, league_id=prepared.league_id, season=prepared.season,
+            week_index=prepared.week_index, records=timings,
+        )
+    return result
+
+
+def _write_weekly_recap_draft(
+    prepared: PreparedRecapDraft,
+    drafted: DraftedRecapText,
+    *,
+    reason: str,
+    force: bool,
+    created_by: str,
+) -> GenerateDraftResult:
+    """Body of write_weekly_recap_draft."""
+    db_path = prepared.db_path
+    league_id = prepared.league_id
+    season = prepared.season
+    week_index = prepared.week_index
+
+    # SV_EAL_RECAP_RUNS_PERSIST_V1_CALL: persist directive into recap_runs (additive metadata)
+    _persist_editorial_attunement_v1_to_recap_runs(
+        db_path=db_path,
+        league_id=league_id,
+        season=season,
+        week_index=week_index,
+        directive=prepared.editorial_attunement_v1,
+    )
+
+    # SV_PROMPT_AUDIT_V1_HOOK — env-gated no-op by default (see
+    # draft_weekly_recap_narrative); exceptions are swallowed inside.
+    for _audit in drafted.audit_attempts:
+        maybe_capture_attempt(db_path, **_audit)
+
+    if (
+        prepared.prompt_context is not None
+        and prepared.prompt_context_key is not None
+        and not prepared.prompt_context_cached
+    ):
+        store_prompt_context(
+            db_path=db_path, league_id=league_id, season=season,
+            week_index=week_index, cache_key=prepared.prompt_context_key,
+            context=prepared.prompt_context.to_json(),
+        )
 
     prev_approved = latest_approved_version(db_path, league_id, season, week_index)
 
@@ -1499,10 +1764,10 @@ def generate_weekly_recap_draft(
         league_id=league_id,
         season=season,
         week_index=week_index,
-        selection_fingerprint=selection_fingerprint,
-        window_start=window_start,
-        window_end=window_end,
-        rendered_text=rendered_text,
+        selection_fingerprint=prepared.selection_fingerprint,
+        window_start=prepared.window_start,
+        window_end=prepared.window_end,
+        rendered_text=drafted.rendered_text,
         created_by=created_by,
         supersedes_version=None,
         force=force,
@@ -1513,14 +1778,46 @@ def generate_weekly_recap_draft(
     return GenerateDraftResult(
         version=v,
         created_new=created_new,
-        selection_fingerprint=selection_fingerprint,
-        window_start=window_start,
-        window_end=window_end,
+        selection_fingerprint=prepared.selection_fingerprint,
+        window_start=prepared.window_start,
+        window_end=prepared.window_end,
         prev_approved_version=prev_approved,
         synced_recap_run_state=synced_state,
         reason=reason,
-        verification_result=_verification_result,
-        verification_attempts=_verification_attempts,
+        verification_result=drafted.verification_result,
+        verification_attempts=drafted.verification_attempts,
+    )
+
+
+def generate_weekly_recap_draft(
+    *,
+    db_path: str,
+    league_id: str,
+    season: int,
+    week_index: int,
+    reason: str,
+    force: bool = False,
+    created_by: str = "system",
+    snapshot: bool = False,
+) -> GenerateDraftResult:
+    """
+    Canonical entrypoint: mint a WEEKLY_RECAP DRAFT artifact version.
+
+    Renders from recap_runs data directly (canonical path, no recaps table needed).
+    Raises RecapDataError if recap_runs has insufficient data for rendering.
+    Runs the prepare, creative and write stages in sequence; see
+    squadvault.recaps.weekly_recap_range_v1 for the pipelined range form.
+    snapshot=True runs prepare and creative (derivation and verification)
+    against one read-only point-in-time view of the database; it switches
+    the database to WAL journaling first (persistent, see enable_wal).
+    """
+    with read_snapshot(db_path, wal=True) if snapshot else nullcontext():
+        prepared = prepare_weekly_recap_draft(
+            db_path=db_path, league_id=league_id, season=season, week_index=week_index,
+        )
+        drafted = draft_weekly_recap_narrative(prepared)
+    return write_weekly_recap_draft(
+        prepared, drafted, reason=reason, force=force, created_by=created_by,
     )
 
 
@@ -0,0 +1,178 @@
+"""Weekly recap range generation v1 — pipelined DRAFT generation for many weeks.
+
+generate_weekly_recap_draft runs three stages per week (see
+weekly_recap_lifecycle): prepare (selection trace, facts block, EAL
+directive, prompt context and angle detection — deterministic and
+read-only), draft (creative-layer calls plus verification retries) and
+write (EAL metadata, prompt-audit rows, DRAFT artifact, recap_runs sync).
+
+A range run overlaps them:
+
+- prepare runs in up to `workers` processes (workers <= 1: in the creative
+  threads);
+- draft runs in a bounded pool of `concurrency` threads, with creative-layer
+  call starts spaced at least `min_call_interval` seconds apart; each
+  thread's verification passes share the process-wide (locked)
+  VerificationFactCache, which may hold fewer weeks than the range;
+- write runs in the calling thread only, in ascending week order, so
+  DRAFT/APPROVED version numbering is the same as a serial run.
+
+pooled=True runs the whole range inside core.storage.session.pooled_sessions,
+so the calling process reuses tuned per-thread connections instead of
+opening one per DatabaseSession (prepare worker processes keep their own).
+snapshot=True reads each week through core.storage.session.read_snapshot:
+prepare and draft (with verification) of a week see one point-in-time view
+while the writer, or an ingest in another process, keeps writing. With
+workers > 1 a week's prepare and draft read separate snapshots. Either
+option first switches the database to WAL journaling (enable_wal); the
+mode is persistent and outlives the run.
+
+Regenerating a season is then bounded by its slowest week rather than by
+the sum of every week's API calls. Per-week failures are reported in the
+outcome list and never stop the other weeks.
+"""
+
+from __future__ import annotations
+
+import threading
+import time
+from collections.abc import Callable, Iterable
+from concurrent.futures import Future, ProcessPoolExecutor, ThreadPoolExecutor
+from contextlib import ExitStack, nullcontext
+from dataclasses import dataclass
+
+from squadvault.core.storage.session import enable_wal, pooled_sessions, read_snapshot
+from squadvault.recaps.weekly_recap_lifecycle import (
+    DraftedRecapText,
+    GenerateDraftResult,
+    PreparedRecapDraft,
+    draft_weekly_recap_narrative,
+    prepare_weekly_recap_draft,
+    write_weekly_recap_draft,
+)
+
+
+@dataclass(frozen=True)
+class WeekDraftOutcome:
+    """One week of a range run: its draft result, or the error that stopped it."""
+
+    week_index: int
+    result: GenerateDraftResult | None = None
+    error: Exception | None = None
+
+
+class _CallSpacing:
+    """Spaces call starts at least min_interval seconds apart across threads."""
+
+    def __init__(
+        self,
+        min_interval: float,
+        *,
+        clock: Callable[[], float] = time.monotonic,
+        sleep: Callable[[float], None] = time.sleep,
+    ) -> None:
+        """Create a spacing gate; min_interval <= 0 never waits."""
+        self.min_interval = max(0.0, float(min_interval))
+        self._clock = clock
+        self._sleep = sleep
+        self._next_start: float | None = None
+        self._lock = threading.Lock()
+
+    def wait(self) -> None:
+        """Block until this caller's reserved start slot."""
+        if self.min_interval <= 0:
+            return
+        with self._lock:
+            now = self._clock()
+            start = now if self._next_start is None else max(now, self._next_start)
+            self._next_start = start + self.min_interval
+        if start > now:
+            self._sleep(start - now)
+
+
+def _prepare_week(
+    *, db_path: str, league_id: str, season: int, week_index: int, snapshot: bool,
+) -> PreparedRecapDraft:
+    """prepare_weekly_recap_draft, inside a read snapshot if asked (picklable)."""
+    with read_snapshot(db_path) if snapshot else nullcontext():
+        return prepare_weekly_recap_draft(
+            db_path=db_path, league_id=league_id, season=season, week_index=week_index,
+        )
+
+
+def generate_weekly_recap_drafts_v1(
+    *,
+    db_path: str,
+    league_id: str,
+    season: int,
+    week_indices: Iterable[int],
+    reason: str,
+    force: bool = False,
+    created_by: str = "system",
+    workers: int = 1,
+    concurrency: int = 4,
+    min_call_interval: float = 0.0,
+    on_outcome: Callable[[WeekDraftOutcome], None] | None = None,
+    pooled: bool = False,
+    snapshot: bool = False,
+) -> list[WeekDraftOutcome]:
+    """Mint a WEEKLY_RECAP DRAFT for every week in week_indices, pipelined.
+
+    Each week's artifact is what generate_weekly_recap_draft would write for
+    it; outcomes come back (and on_outcome is called) in ascending week
+    order as each week is written.
+    """
+    weeks = sorted({int(w) for w in week_indices})
+    spacing = _CallSpacing(min_call_interval)
+    outcomes: list[WeekDraftOutcome] = []
+    if not weeks:
+        return outcomes
+
+    if pooled or snapshot:
+        enable_wal(db_path)
+    with ExitStack() as stack:
+        if pooled:
+            stack.enter_context(pooled_sessions())
+        prepared_futures: dict[int, Future[PreparedRecapDraft]] = {}
+        if workers > 1 and len(weeks) > 1:
+            prepare_pool = stack.enter_context(
+                ProcessPoolExecutor(max_workers=min(workers, len(weeks)))
+            )
+            for week in weeks:
+                prepared_futures[week] = prepare_pool.submit(
+                    _prepare_week,
+                    db_path=db_path, league_id=league_id, season=season, week_index=week,
+                    snapshot=snapshot,
+                )
+
+        def _draft(week: int) -> tuple[PreparedRecapDraft, DraftedRecapText]:
+            """Prepare (or collect the prepared) week, then run its creative stage."""
+            with read_snapshot(db_path) if snapshot else nullcontext():
+                if week in prepared_futures:
+                    prepared = prepared_futures[week].result()
+                else:
+                    prepared = prepare_weekly_recap_draft(
+                        db_path=db_path, league_id=league_id, season=season, week_index=week,
+                    )
+                return prepared, draft_weekly_recap_narrative(prepared, before_call=spacing.wait)
+
+        creative_pool = stack.enter_context(
+            ThreadPoolExecutor(max_workers=max(1, min(concurrency, len(weeks))))
+        )
+        drafted_futures = {week: creative_pool.submit(_draft, week) for week in weeks}
+
+        # Single writer: weeks are written in order while later weeks are
+        # still being prepared and drafted.
+        for week in weeks:
+            try:
+                prepared, drafted = drafted_futures[week].result()
+                outcome = WeekDraftOutcome(week, result=write_weekly_recap_draft(
+                    prepared, drafted, reason=reason, force=force, created_by=created_by,
+                ))
+            except Exception as e:
+                outcome = WeekDraftOutcome(week, error=e)
+            outcomes.append(outcome)
+            if on_outcome is not None:
+                on_outcome(outcome)
+
+    return outcomes
@@ -0,0 +1,263 @@
+"""Recap pipeline benchmark v1 — end-to-end timings on a synthetic league.
+
+Builds a synthetic league (synthetic_league_v1), then times each pipeline
+stage per call:
+
+- synthesize / append_events: ledger generation and ingest
+- canonicalize: one call per season
+- select_weekly_recap_events_v1: one call per week of every season
+- select_season_recap_events_v1: one batch call per season (same weeks)
+- derive_prompt_context: _derive_prompt_context per derived week
+- verify_recap_v1: one call per derived week, on a stub narrative built
+  from the week's matchups (the creative layer is never called)
+
+Results are one JSON document (schema squadvault.benchmark.v1); pass an
+earlier result as baseline to print per-stage ratios for regression checks.
+
+Usage:
+    python -m squadvault.testing.benchmark_v1 --teams 20 --seasons 25 \\
+        --out bench.json [--baseline old.json]
+"""
+
+from __future__ import annotations
+
+import argparse
+import contextlib
+import io
+import json
+import platform
+import sqlite3
+import statistics
+import sys
+import tempfile
+import time
+from collections.abc import Iterator
+from dataclasses import asdict, fields
+from pathlib import Path
+from typing import Any
+
+from squadvault.core.canonicalize.run_canonicalize import canonicalize
+from squadvault.core.recaps.recap_runs import RecapRunRecord, upsert_recap_run
+from squadvault.core.recaps.selection.weekly_selection_v1 import (
+    select_season_recap_events_v1,
+    select_weekly_recap_events_v1,
+)
+from squadvault.core.recaps.verification.recap_verifier_v1 import verify_recap_v1
+from squadvault.core.storage.migrate import init_and_migrate
+from squadvault.core.storage.session import DatabaseSession
+from squadvault.core.storage.sqlite_store import SQLiteStore
+from squadvault.recaps.weekly_recap_lifecycle import _derive_prompt_context
+from squadvault.testing.synthetic_league_v1 import (
+    SyntheticLeagueSpec,
+    synthesize_league_events,
+    write_synthetic_directories,
+)
+
+SCHEMA = "squadvault.benchmark.v1"
+
+
+class StageTimer:
+    """Wall-clock samples per named stage."""
+
+    def __init__(self) -> None:
+        """Create an empty timer."""
+        self.samples: dict[str, list[float]] = {}
+
+    @contextlib.contextmanager
+    def stage(self, name: str) -> Iterator[None]:
+        """Time the block as one sample of stage name."""
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.samples.setdefault(name, []).append(time.perf_counter() - start)
+
+    def summary(self) -> dict[str, dict[str, float]]:
+        """count / total / mean / p50 / p95 / max seconds per stage."""
+        out: dict[str, dict[str, float]] = {}
+        for name, xs in self.samples.items():
+            ordered = sorted(xs)
+            out[name] = {
+                "count": len(xs),
+                "total_s": round(sum(xs), 6),
+                "mean_s": round(statistics.fmean(xs), 6),
+                "p50_s": round(statistics.median(xs), 6),
+                "p95_s": round(ordered[min(len(xs) - 1, int(0.95 * len(xs)))], 6),
+                "max_s": round(ordered[-1], 6),
+            }
+        return out
+
+
+def _stub_narrative(db_path: str, league_id: str, season: int, week: int) -> str:
+    """Deterministic stand-in for the creative layer: one line per matchup."""
+    with DatabaseSession(db_path) as con:
+        rows = con.execute(
+            """SELECT COALESCE(w.name, m.winner_franchise_id), COALESCE(l.name, m.loser_franchise_id),
+                      m.winner_score, m.loser_score
+               FROM fact_matchup m
+               LEFT JOIN franchise_directory w
+                 ON w.league_id = m.league_id AND w.season = m.season AND w.franchise_id = m.winner_franchise_id
+               LEFT JOIN franchise_directory l
+                 ON l.league_id = m.league_id AND l.season = m.season AND l.franchise_id = m.loser_franchise_id
+               WHERE m.league_id = ? AND m.season = ? AND m.week = ?
+               ORDER BY m.winner_franchise_id""",
+            (league_id, season, week),
+        ).fetchall()
+    return "\n".join(
+        f"{w} beat {lo} {float(ws):.2f} to {float(ls):.2f}." for w, lo, ws, ls in rows
+    )
+
+
+def _window_end(db_path: str, league_id: str, season: int, week: int) -> str | None:
+    """The week's window end as recorded on its recap_runs row."""
+    with DatabaseSession(db_path) as con:
+        row = con.execute(
+            "SELECT window_end FROM recap_runs WHERE league_id=? AND season=? AND week_index=?",
+            (league_id, season, week),
+        ).fetchone()
+    return row[0] if row else None
+
+
+def run_benchmark(
+    spec: SyntheticLeagueSpec,
+    *,
+    db_path: str | None = None,
+    derive_seasons: int = 1,
+) -> dict[str, Any]:
+    """Build spec's league in db_path (a temp file if None) and time every stage.
+
+    Prompt context derivation and verification run for every week of the
+    last derive_seasons seasons.
+    """
+    timer = StageTimer()
+    with contextlib.ExitStack() as stack:
+        if db_path is None:
+            tmp = stack.enter_context(tempfile.TemporaryDirectory())
+            db_path = str(Path(tmp) / "benchmark.sqlite")
+        # canonicalize reports on stdout; keep the JSON output clean.
+        stack.enter_context(contextlib.redirect_stdout(io.StringIO()))
+        lid = spec.league_id
+
+        init_and_migrate(db_path)
+        write_synthetic_directories(db_path, spec)
+        with timer.stage("synthesize"):
+            events = list(synthesize_league_events(spec))
+        with timer.stage("append_events"):
+            inserted, skipped = SQLiteStore(db_path=Path(db_path)).append_events(events)
+
+        for season in spec.season_years:
+            with timer.stage("canonicalize"):
+                canonicalize(league_id=lid, season=season, db_path=db_path)
+
+        for season in spec.season_years:
+            for week in range(1, spec.weeks + 1):
+                with timer.stage("select_weekly_recap_events_v1"):
+                    sel = select_weekly_recap_events_v1(
+                        db_path=db_path, league_id=lid, season=season, week_index=week,
+                    )
+                upsert_recap_run(db_path, RecapRunRecord(
+                    league_id=lid, season=season, week_index=week, state="ELIGIBLE",
+                    window_mode=sel.window.mode, window_start=sel.window.window_start,
+                    window_end=sel.window.window_end, selection_fingerprint=sel.fingerprint,
+                    canonical_ids=[str(c) for c in sel.canonical_ids],
+                    counts_by_type=sel.counts_by_type,
+                ))
+            with timer.stage("select_season_recap_events_v1"):
+                select_season_recap_events_v1(
+                    db_path, lid, season, weeks=range(1, spec.weeks + 1),
+                )
+
+        hard_failures = 0
+        derived = spec.season_years[-derive_seasons:] if derive_seasons > 0 else []
+        for season in derived:
+            for week in range(1, spec.weeks + 1):
+                window_end = _window_end(db_path, lid, season, week)
+                with timer.stage("derive_prompt_context"):
+                    ctx = _derive_prompt_context(
+                        db_path=db_path, league_id=lid, season=season,
+                        week_index=week, window_end=window_end,
+                    )
+                text = _stub_narrative(db_path, lid, season, week)
+                with timer.stage("verify_recap_v1"):
+                    result = verify_recap_v1(
+                        text, db_path=db_path, league_id=lid, season=season, week=week,
+                        narrative_angles_text=ctx.narrative_angles_text,
+                    )
+                hard_failures += len(result.hard_failures)
+
+        with DatabaseSession(db_path) as con:
+            canonical = con.execute(
+                "SELECT COUNT(*) FROM canonical_events WHERE league_id = ?", (lid,),
+            ).fetchone()[0]
+
+    return {
+        "schema": SCHEMA,
+        "spec": asdict(spec),
+        "derive_seasons": derive_seasons,
+        "environment": {
+            "python": platform.python_version(),
+            "sqlite": sqlite3.sqlite_version,
+            "platform": platform.platform(),
+        },
+        "counts": {
+            "memory_events": inserted,
+            "memory_events_skipped": skipped,
+            "canonical_events": canonical,
+            "verify_hard_failures": hard_failures,
+        },
+        "stages": timer.summary(),
+    }
+
+
+def compare_to_baseline(
+    result: dict[str, Any], baseline: dict[str, Any],
+) -> dict[str, float | None]:
+    """Per-stage ratio of mean time, result over baseline (None if not comparable)."""
+    out: dict[str, float | None] = {}
+    for name, stats in result["stages"].items():
+        base = baseline.get("stages", {}).get(name)
+        out[name] = (
+            round(stats["mean_s"] / base["mean_s"], 3)
+            if base and base.get("mean_s") else None
+        )
+    return out
+
+
+def main(argv: list[str] | None = None) -> int:
+    """CLI entrypoint: run the benchmark and write its JSON result."""
+    p = argparse.ArgumentParser(description="Benchmark the recap pipeline on a synthetic league.")
+    defaults = SyntheticLeagueSpec()
+    for f in fields(SyntheticLeagueSpec):
+        p.add_argument("--" + f.name.replace("_", "-"), type=type(getattr(defaults, f.name)),
+                       default=getattr(defaults, f.name))
+    p.add_argument("--derive-seasons", type=int, default=1,
+                   help="Latest seasons whose weeks get context derivation + verification")
+    p.add_argument("--db", default=None, help="Keep the built league here (default: temp file)")
+    p.add_argument("--out", default=None, help="Write the JSON result here (default: stdout)")
+    p.add_argument("--baseline", default=None, help="Earlier result to compare against")
+    args = p.parse_args(argv)
+
+    spec = SyntheticLeagueSpec(**{f.name: getattr(args, f.name) for f in fields(SyntheticLeagueSpec)})
+    result = run_benchmark(spec, db_path=args.db, derive_seasons=args.derive_seasons)
+    if args.baseline:
+        baseline = json.loads(Path(args.baseline).read_text(encoding="utf-8"))
+        result["baseline_ratio"] = compare_to_baseline(result, baseline)
+
+    text = json.dumps(result, indent=2, sort_keys=True)
+    if args.out:
+        Path(args.out).write_text(text + "\n", encoding="utf-8")
+    else:
+        print(text)
+    for name, stats in sorted(result["stages"].items(), key=lambda kv: -kv[1]["total_s"]):
+        ratio = result.get("baseline_ratio", {}).get(name)
+        print(
+            f"{name:32s} n={stats['count']:5d} total={stats['total_s']:9.3f}s"
+            f" mean={stats['mean_s'] * 1000:9.2f}ms"
+            + (f" x{ratio}" if ratio is not None else ""),
+            file=sys.stderr,
+        )
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,319 @@
+"""Synthetic League v1 — deterministic MFL-shaped ledgers at any league size.
+
+Builds fake MFL API responses (weeklyResults, transactions) for a league of
+configurable size, season count and roster depth, and runs them through the
+real ingest derivations (squadvault.ingest.*), so every memory_events row
+has exactly the envelope shape a live ingest writes: matchup results,
+player scores, lock events, FAAB awards, free-agent moves, trades and
+auction draft picks. Franchise and player directories are filled the same
+way the directory ingests do.
+
+Deterministic: one spec (including its seed) always yields the same events.
+Synthetic data only; never point it at a production database.
+"""
+
+from __future__ import annotations
+
+import random
+from collections.abc import Iterator
+from dataclasses import dataclass, field
+from datetime import UTC, datetime, timedelta
+from pathlib import Path
+from typing import Any
+
+from squadvault.core.canonicalize.run_canonicalize import canonicalize
+from squadvault.core.storage.migrate import init_and_migrate
+from squadvault.core.storage.session import DatabaseSession
+from squadvault.core.storage.sqlite_store import SQLiteStore
+from squadvault.ingest.auction_draft import derive_auction_event_envelopes_from_transactions
+from squadvault.ingest.matchup_results import derive_matchup_result_envelopes
+from squadvault.ingest.player_scores import derive_player_score_envelopes
+from squadvault.ingest.transactions import derive_transaction_event_envelopes
+from squadvault.ingest.waiver_bids import derive_waiver_bid_event_envelopes_from_transactions
+from squadvault.utils.time import unix_seconds_to_iso_z
+
+SOURCE_URL = "synthetic://squadvault/synthetic_league_v1"
+
+# position -> (share of the player pool, mean weekly score)
+_POSITIONS = {"QB": (0.12, 18.0), "RB": (0.25, 11.0), "WR": (0.30, 10.0),
+              "TE": (0.13, 7.0), "PK": (0.10, 8.0), "DEF": (0.10, 7.5)}
+_NFL_TEAMS = ("ARI", "ATL", "BAL", "BUF", "CAR", "CHI", "CIN", "CLE", "DAL", "DEN",
+              "DET", "GBP", "HOU", "IND", "JAC", "KCC", "LVR", "LAC", "LAR", "MIA",
+              "MIN", "NEP", "NOS", "NYG", "NYJ", "PHI", "PIT", "SFO", "SEA", "TBB",
+              "TEN", "WAS")
+
+
+@dataclass(frozen=True)
+class SyntheticLeagueSpec:
+    """Size and shape of a synthetic league."""
+
+    league_id: str = "SYNTH"
+    teams: int = 12
+    seasons: int = 3
+    last_season: int = 2025
+    regular_weeks: int = 14
+    playoff_weeks: int = 3
+    roster_size: int = 22
+    starters: int = 9
+    faab_claims_per_week: int = 3
+    free_agent_moves_per_week: int = 2
+    trades_per_season: int = 4
+    seed: int = 0
+
+    @property
+    def season_years(self) -> list[int]:
+        """Seasons covered, oldest first."""
+        return list(range(self.last_season - self.seasons + 1, self.last_season + 1))
+
+    @property
+    def weeks(self) -> int:
+        """Weeks per season, playoffs included."""
+        return self.regular_weeks + self.playoff_weeks
+
+
+@dataclass
+class _Player:
+    """One synthetic NFL player."""
+
+    player_id: str
+    name: str
+    position: str
+    team: str
+    mean: float
+
+
+@dataclass
+class _Season:
+    """Mutable state of one synthetic season."""
+
+    year: int
+    rosters: dict[str, list[str]] = field(default_factory=dict)
+    wins: dict[str, int] = field(default_factory=dict)
+    points: dict[str, float] = field(default_factory=dict)
+
+
+def _franchise_ids(spec: SyntheticLeagueSpec) -> list[str]:
+    """MFL-style franchise ids 0001..NNNN."""
+    return [f"{i:04d}" for i in range(1, spec.teams + 1)]
+
+
+def _player_pool(spec: SyntheticLeagueSpec, rng: random.Random) -> list[_Player]:
+    """Enough players to fill every roster with a free-agent pool to spare."""
+    size = spec.teams * spec.roster_size * 2
+    pool: list[_Player] = []
+    positions = list(_POSITIONS)
+    weights = [share for share, _ in _POSITIONS.values()]
+    for i in range(size):
+        pos = rng.choices(positions, weights)[0]
+        mean = max(1.0, rng.gauss(_POSITIONS[pos][1], _POSITIONS[pos][1] * 0.35))
+        pool.append(_Player(str(10000 + i), f"Player{i:05d}, Synth", pos,
+                            rng.choice(_NFL_TEAMS), round(mean, 2)))
+    return pool
+
+
+def _lock_unix(year: int, week: int) -> int:
+    """Kickoff lock of a week: Thursday evenings from early September."""
+    kickoff = datetime(year, 9, 5, 23, 0, tzinfo=UTC)
+    return int((kickoff + timedelta(days=7 * (week - 1))).timestamp())
+
+
+def _pairings(fids: list[str], rng: random.Random) -> list[tuple[str, str]]:
+    """A random full round of head-to-head pairings (odd team out sits)."""
+    order = fids[:]
+    rng.shuffle(order)
+    return [(order[i], order[i + 1]) for i in range(0, len(order) - 1, 2)]
+
+
+def _playoff_pairings(season: _Season, round_index: int) -> list[tuple[str, str]]:
+    """Seeded bracket among the top teams, shrinking each round (min one game)."""
+    seeds = sorted(season.wins, key=lambda f: (-season.wins[f], -season.points[f], f))
+    size = max(2, 2 ** max(1, 3 - round_index))
+    top = seeds[:min(size, len(seeds))]
+    return [(top[i], top[-1 - i]) for i in range(len(top) // 2)]
+
+
+def _franchise_result(
+    fid: str, roster: list[str], players: dict[str, _Player], spec: SyntheticLeagueSpec,
+    rng: random.Random,
+) -> tuple[dict[str, Any], float]:
+    """One franchise's weeklyResults entry and its score."""
+    scored = {pid: max(0.0, round(rng.gauss(players[pid].mean, players[pid].mean * 0.6), 2))
+              for pid in roster}
+    by_mean = sorted(roster, key=lambda p: (-players[p].mean, p))
+    starters = set(by_mean[:spec.starters])
+    optimal = set(sorted(roster, key=lambda p: (-scored[p], p))[:spec.starters])
+    total = round(sum(scored[p] for p in starters), 2)
+    entry = {
+        "id": fid,
+        "score": f"{total:.2f}",
+        "starters": ",".join(sorted(starters)) + ",",
+        "player": [
+            {"id": pid, "status": "starter" if pid in starters else "nonstarter",
+             "score": f"{scored[pid]:.2f}", "shouldStart": "1" if pid in optimal else "0"}
+            for pid in sorted(roster)
+        ],
+    }
+    return entry, total
+
+
+def _week_results(
+    spec: SyntheticLeagueSpec, season: _Season, week: int, players: dict[str, _Player],
+    rng: random.Random,
+) -> dict[str, Any]:
+    """MFL weeklyResults response for one week."""
+    fids = sorted(season.rosters)
+    if week <= spec.regular_weeks:
+        pairs = _pairings(fids, rng)
+    else:
+        pairs = _playoff_pairings(season, week - spec.regular_weeks - 1)
+    matchups = []
+    for a, b in pairs:
+        ea, sa = _franchise_result(a, season.rosters[a], players, spec, rng)
+        eb, sb = _franchise_result(b, season.rosters[b], players, spec, rng)
+        ea["result"], eb["result"] = ("W", "L") if sa >= sb else ("L", "W")
+        if week <= spec.regular_weeks:
+            season.wins[a if sa >= sb else b] += 1
+            season.points[a] += sa
+            season.points[b] += sb
+        matchups.append({"franchise": [ea, eb]})
+    return {"weeklyResults": {"week": str(week), "matchup": matchups}}
+
+
+def _draft_transactions(
+    spec: SyntheticLeagueSpec, season: _Season, pool: list[_Player], rng: random.Random,
+) -> list[dict[str, Any]]:
+    """Auction draft: fill every roster, AUCTION_WON per pick."""
+    ts = _lock_unix(season.year, 1) - 7 * 86400
+    available = sorted(pool, key=lambda p: -p.mean)
+    txns = []
+    fids = sorted(season.rosters)
+    for pick in range(spec.roster_size * len(fids)):
+        fid = fids[pick % len(fids)] if (pick // len(fids)) % 2 == 0 else fids[-1 - pick % len(fids)]
+        player = available.pop(rng.randrange(min(4, len(available))))
+        season.rosters[fid].append(player.player_id)
+        bid = max(1, int(player.mean * rng.uniform(1.5, 4.0)) - pick // len(fids))
+        txns.append({"type": "AUCTION_WON", "franchise": fid, "timestamp": str(ts + pick * 60),
+                     "transaction": f"{player.player_id}|{bid}|"})
+    return txns
+
+
+def _week_transactions(
+    spec: SyntheticLeagueSpec, season: _Season, week: int, pool: list[_Player],
+    rng: random.Random, trade_weeks: set[int],
+) -> list[dict[str, Any]]:
+    """Lock, FAAB, free-agent and trade transactions of one week; updates rosters."""
+    lock = _lock_unix(season.year, week)
+    txns: list[dict[str, Any]] = [
+        {"type": "LOCK_ALL_PLAYERS", "franchise": "0000", "timestamp": str(lock)},
+    ]
+    rostered = {p for r in season.rosters.values() for p in r}
+    free = [p.player_id for p in pool if p.player_id not in rostered]
+    rng.shuffle(free)
+    fids = sorted(season.rosters)
+    means = {p.player_id: p.mean for p in pool}
+    moves = ([("BBID_WAIVER", i) for i in range(spec.faab_claims_per_week)]
+             + [("FREE_AGENT", i) for i in range(spec.free_agent_moves_per_week)])
+    for n, (kind, _) in enumerate(moves):
+        if not free:
+            break
+        fid = rng.choice(fids)
+        add = free.pop()
+        drop = min(season.rosters[fid], key=lambda p: (means[p], p))
+        season.rosters[fid].remove(drop)
+        season.rosters[fid].append(add)
+        ts = str(lock + 3 * 86400 + n * 60)  # Sunday night, inside the week's window
+        if kind == "BBID_WAIVER":
+            bid = f"{rng.randint(1, 40)}.00"
+            txns.append({"type": kind, "franchise": fid, "timestamp": ts,
+                         "transaction": f"{add},|{bid}|{drop},"})
+        else:
+            txns.append({"type": kind, "franchise": fid, "timestamp": ts,
+                         "transaction": f"{add},|{drop},"})
+    if week in trade_weeks and len(fids) >= 2:
+        a, b = rng.sample(fids, 2)
+        pa, pb = rng.choice(season.rosters[a]), rng.choice(season.rosters[b])
+        season.rosters[a].remove(pa)
+        season.rosters[b].remove(pb)
+        season.rosters[a].append(pb)
+        season.rosters[b].append(pa)
+        txns.append({"type": "TRADE", "franchise": a, "franchise2": b,
+                     "timestamp": str(lock + 2 * 86400),
+                     "franchise1_gave_up": f"{pa},", "franchise2_gave_up": f"{pb},",
+                     "comments": "", "expires": str(lock + 4 * 86400)})
+    return txns
+
+
+def synthesize_league_events(spec: SyntheticLeagueSpec) -> Iterator[dict[str, Any]]:
+    """Every memory_events envelope of the league, season by season, week by week."""
+    rng = random.Random(spec.seed)
+    pool = _player_pool(spec, rng)
+    players = {p.player_id: p for p in pool}
+    fids = _franchise_ids(spec)
+    lid = spec.league_id
+    for year in spec.season_years:
+        season = _Season(year, rosters={f: [] for f in fids},
+                         wins=dict.fromkeys(fids, 0), points=dict.fromkeys(fids, 0.0))
+        draft = _draft_transactions(spec, season, pool, rng)
+        yield from derive_auction_event_envelopes_from_transactions(
+            year=year, league_id=lid, transactions=draft, source_url=SOURCE_URL,
+        )
+        trade_weeks = set(rng.sample(range(2, spec.regular_weeks + 1),
+                                     min(spec.trades_per_season, spec.regular_weeks - 1)))
+        for week in range(1, spec.weeks + 1):
+            txns = _week_transactions(spec, season, week, pool, rng, trade_weeks)
+            yield from derive_transaction_event_envelopes(
+                year=year, league_id=lid, transactions=txns, source_url=SOURCE_URL,
+            )
+            yield from derive_waiver_bid_event_envelopes_from_transactions(
+                year=year, league_id=lid, transactions=txns, source_url=SOURCE_URL,
+            )
+            results = _week_results(spec, season, week, players, rng)
+            occurred_at = unix_seconds_to_iso_z(_lock_unix(year, week))
+            for derive in (derive_matchup_result_envelopes, derive_player_score_envelopes):
+                yield from derive(
+                    year=year, week=week, league_id=lid, weekly_results_json=results,
+                    source_url=SOURCE_URL, occurred_at=occurred_at,
+                )
+        # The season's closing lock bounds the last week's window.
+        yield from derive_transaction_event_envelopes(
+            year=year, league_id=lid, source_url=SOURCE_URL,
+            transactions=[{"type": "LOCK_ALL_PLAYERS", "franchise": "0000",
+                           "timestamp": str(_lock_unix(year, spec.weeks + 1))}],
+        )
+
+
+def write_synthetic_directories(db_path: str, spec: SyntheticLeagueSpec) -> None:
+    """Franchise and player directory rows for every season of the league."""
+    rng = random.Random(spec.seed)
+    pool = _player_pool(spec, rng)
+    now = unix_seconds_to_iso_z(_lock_unix(spec.last_season, 1))
+    with DatabaseSession(db_path) as con:
+        for year in spec.season_years:
+            con.executemany(
+                """INSERT OR REPLACE INTO franchise_directory
+                   (league_id, season, franchise_id, name, owner_name, raw_json, updated_at)
+                   VALUES (?, ?, ?, ?, ?, NULL, ?)""",
+                [(spec.league_id, year, fid, f"Synthetic Team {fid}", f"Owner {fid}", now)
+                 for fid in _franchise_ids(spec)],
+            )
+            con.executemany(
+                """INSERT OR REPLACE INTO player_directory
+                   (league_id, season, player_id, name, position, team, raw_json, updated_at)
+                   VALUES (?, ?, ?, ?, ?, ?, NULL, ?)""",
+                [(spec.league_id, year, p.player_id, p.name, p.position, p.team, now)
+                 for p in pool],
+            )
+
+
+def build_synthetic_league(
+    db_path: str | Path, spec: SyntheticLeagueSpec, *, canonicalize_seasons: bool = True,
+) -> tuple[int, int]:
+    """Create (or extend) db_path with the synthetic league; returns append counts."""
+    db = str(db_path)
+    init_and_migrate(db)
+    write_synthetic_directories(db, spec)
+    counts = SQLiteStore(db_path=Path(db)).append_events(synthesize_league_events(spec))
+    if canonicalize_seasons:
+        for year in spec.season_years:
+            canonicalize(league_id=spec.league_id, season=year, db_path=db)
+    return counts